@@ -0,0 +1,55 @@
+# Benchmark of the PreComp section-properties kernel on the NREL 5MW and IEA 15MW blades.
+# Times one properties() call per spanwise station against a single properties_batch() call
+# over all stations, and reports the largest difference from the reference (Fortran PreComp)
+# results stored with the unit tests.
+
+import os
+import time
+import pickle
+
+import numpy as np
+
+import wisdem
+import wisdem.precomp.properties as prop
+
+n_repeat = 5
+test_dir = os.path.join(os.path.dirname(wisdem.__file__), "test", "test_precomp")
+
+
+def load_sections(fname):
+    sections = []
+    results = []
+    with open(os.path.join(test_dir, fname), "rb") as f:
+        nsec = pickle.load(f)
+        for _ in range(nsec):
+            sections.append([pickle.load(f) for _ in range(30)])
+            results.append(pickle.load(f))
+    return sections, np.array(results)
+
+
+def timed(fun):
+    t = []
+    for _ in range(n_repeat):
+        s = time.perf_counter()
+        out = fun()
+        t.append(time.perf_counter() - s)
+    return np.array(out, dtype=float), min(t)
+
+
+for fname in ["section_dump_nrel5mw.pkl", "section_dump_iea15mw.pkl"]:
+    sections, ref = load_sections(fname)
+
+    # Material properties are shared by all stations, every other input is stacked per station
+    args = [list(arg) for arg in zip(*sections)]
+    for i in range(6, 11):
+        args[i] = args[i][0]
+
+    out_loop, t_loop = timed(lambda: [prop.properties(*s) for s in sections])
+    out_batch, t_batch = timed(lambda: prop.properties_batch(*args))
+    out_batch = out_batch.T
+
+    scale = np.maximum(np.abs(ref).max(axis=0), 1e-30)
+    print(f"{fname}, {len(sections)} stations")
+    for label, out, t in [("per-station", out_loop, t_loop), ("batched", out_batch, t_batch)]:
+        diff = np.max(np.abs(out - ref) / scale)
+        print(f"    {label:<12s}: {t:8.4f} s  ({t_loop / t:5.1f}x)  max relative difference from reference: {diff:.2e}")
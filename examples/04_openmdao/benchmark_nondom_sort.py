@@ -0,0 +1,33 @@
+# Benchmark of the vectorized non-dominated sorting and crowding distance of the NSGA2 driver.
+# Times the sorting of random populations with two and three objectives for increasing
+# population sizes, against the reference double loop on the smaller populations, and checks
+# that both give the same fronts.
+
+import time
+
+import numpy as np
+
+from wisdem.optimization_drivers.nsga2.fast_nondom_sort import fast_nondom_sort
+from wisdem.optimization_drivers.nsga2.crowding_distance_assignment import crowding_distance_assignment
+
+n_reference_max = 2000
+
+
+def timed(fun, *args):
+    s = time.perf_counter()
+    out = fun(*args)
+    return out, time.perf_counter() - s
+
+
+rng = np.random.default_rng(0)
+for n_obj in [2, 3]:
+    for n_pop in [1000, 2000, 5000, 10000, 20000]:
+        objs = rng.random((n_pop, n_obj))
+        fronts, t_sort = timed(fast_nondom_sort, objs)
+        _, t_crowd = timed(lambda: [crowding_distance_assignment(objs[f, :]) for f in fronts])
+        msg = f"{n_obj} objectives, {n_pop:6d} individuals: {len(fronts):4d} fronts, sort {t_sort:8.3f} s, crowding {t_crowd:8.3f} s"
+        if n_pop <= n_reference_max:
+            fronts_ref, t_ref = timed(fast_nondom_sort.function_nojit, list(map(tuple, objs)))
+            assert fronts == fronts_ref
+            msg += f", reference sort {t_ref:8.3f} s ({t_ref / t_sort:6.1f}x)"
+        print(msg)
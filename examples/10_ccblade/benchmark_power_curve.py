@@ -0,0 +1,146 @@
+# Benchmark of the batched (vectorized) CCBlade solver on a 200-point power curve sweep.
+# Times ComputePowerCurve and a raw CCBlade.evaluate sweep with the default
+# one-root-find-per-station solver, with the vectorized solver, and with the vectorized
+# solver reading tabulated airfoil polars, and reports the largest difference from the
+# default results.
+
+import os
+import time
+
+import numpy as np
+import openmdao.api as om
+
+import wisdem
+from wisdem.ccblade.ccblade import CCBlade, CCAirfoil
+from wisdem.rotorse.rotor_power import ComputePowerCurve
+
+n_pc = 200
+n_repeat = 3
+
+# NREL 5MW blade and polars used by the RotorSE unit tests
+npzfile = np.load(os.path.join(os.path.dirname(wisdem.__file__), "test", "test_rotorse", "debug.npz"))
+n_span, n_aoa, n_Re = npzfile["airfoils_cl"].shape
+
+
+def build_problem(vectorized, table):
+    modeling_options = {}
+    modeling_options["WISDEM"] = {}
+    modeling_options["WISDEM"]["RotorSE"] = {}
+    modeling_options["WISDEM"]["RotorSE"]["n_span"] = n_span
+    modeling_options["WISDEM"]["RotorSE"]["n_aoa"] = n_aoa
+    modeling_options["WISDEM"]["RotorSE"]["n_Re"] = n_Re
+    modeling_options["WISDEM"]["RotorSE"]["regulation_reg_III"] = True
+    modeling_options["WISDEM"]["RotorSE"]["fix_pitch_regI12"] = False
+    modeling_options["WISDEM"]["RotorSE"]["n_pc"] = n_pc
+    modeling_options["WISDEM"]["RotorSE"]["n_pc_spline"] = n_pc
+    modeling_options["WISDEM"]["RotorSE"]["vectorized_bem"] = vectorized
+    modeling_options["WISDEM"]["RotorSE"]["airfoil_lookup_table"] = table
+
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem("powercurve", ComputePowerCurve(modeling_options=modeling_options), promotes=["*"])
+    prob.setup()
+    for k in npzfile.files:
+        if k in ["generator_efficiency", "lss_rpm"]:
+            continue
+        prob[k] = npzfile[k]
+
+    prob.set_val("v_min", 4.0, units="m/s")
+    prob.set_val("v_max", 25.0, units="m/s")
+    prob.set_val("rated_power", 5e6, units="W")
+    prob.set_val("omega_min", 0.0, units="rpm")
+    prob.set_val("omega_max", 100.0, units="rpm")
+    prob.set_val("max_allowable_blade_tip_speed", 90.0, units="m/s")
+    prob.set_val("tsr_operational", 10.0)
+    prob.set_val("control_pitch", 0.0, units="deg")
+    prob.set_val("gearbox_efficiency", 0.975)
+    prob.set_val("drivetrainType", "GEARED")
+    prob.set_val("Rhub", 1.0, units="m")
+    prob.set_val("Rtip", 70.0, units="m")
+    prob.set_val("hub_height", 100.0, units="m")
+    prob.set_val("precone", 0.0, units="deg")
+    prob.set_val("tilt", 0.0, units="deg")
+    prob.set_val("yaw", 0.0, units="deg")
+    prob.set_val("shearExp", 0.25)
+    prob.set_val("nSector", 4)
+    prob.set_val("tiploss", True)
+    prob.set_val("hubloss", True)
+    prob.set_val("wakerotation", True)
+    prob.set_val("usecd", True)
+    return prob
+
+
+def timed(fun):
+    t = []
+    for _ in range(n_repeat):
+        s = time.perf_counter()
+        out = fun()
+        t.append(time.perf_counter() - s)
+    return out, min(t)
+
+
+# --- raw CCBlade.evaluate on the 200 wind speeds ---
+Uinf = np.linspace(4.0, 25.0, n_pc)
+Omega = np.minimum(Uinf * 10.0 / 70.0 * 30.0 / np.pi, 90.0 / 70.0 * 30.0 / np.pi)
+pitch = np.maximum(0.0, 1.6 * (Uinf - 11.4))
+
+cases = [(False, False), (True, False), (True, True)]
+labels = ["per-station brentq", "vectorized", "vectorized + table"]
+
+results = {}
+for vectorized, table in cases:
+    af = [
+        CCAirfoil(
+            npzfile["airfoils_aoa"],
+            npzfile["airfoils_Re"],
+            npzfile["airfoils_cl"][i, :, :],
+            npzfile["airfoils_cd"][i, :, :],
+            npzfile["airfoils_cm"][i, :, :],
+        )
+        for i in range(n_span)
+    ]
+    if table:
+        for afi in af:
+            afi.compile_table()
+    rotor = CCBlade(
+        npzfile["r"],
+        npzfile["chord"],
+        npzfile["theta"],
+        af,
+        1.0,
+        70.0,
+        3,
+        1.225,
+        1.81e-5,
+        0.0,
+        0.0,
+        0.0,
+        shearExp=0.25,
+        hubHt=100.0,
+        nSector=4,
+        vectorized=vectorized,
+    )
+    results[vectorized, table] = timed(lambda: rotor.evaluate(Uinf, Omega, pitch)[0])
+
+
+def report(keys):
+    ref, t_ref = results[cases[0]]
+    for case, label in zip(cases, labels):
+        out, t = results[case]
+        diff = max(np.max(np.abs(out[k] - ref[k])) / np.max(np.abs(ref[k])) for k in keys)
+        print(
+            f"    {label:<20s}: {t:8.3f} s  ({t_ref / t:5.1f}x)  max relative difference in {', '.join(keys)}: {diff:.2e}"
+        )
+
+
+print(f"CCBlade.evaluate, {n_pc} conditions x 4 sectors x {n_span} stations")
+report("PTQ")
+
+# --- full ComputePowerCurve component ---
+results = {}
+for vectorized, table in cases:
+    prob = build_problem(vectorized, table)
+    _, t = timed(prob.run_model)
+    results[vectorized, table] = ({k: prob.get_val(k).copy() for k in ["P", "T", "Omega", "pitch"]}, t)
+
+print(f"ComputePowerCurve, n_pc = {n_pc}")
+report(["P", "T"])
@@ -0,0 +1,80 @@
+# Benchmark of the skyline (sparse) stiffness matrix option of pyFrame3DD on a braced lattice
+# tower with scrambled node numbering, the worst case for the full-matrix solver.
+# Times Frame.run() with the full and the skyline stiffness matrix for increasing tower
+# heights (linear analysis), and reports the largest difference in the displacements and reactions.
+
+import time
+
+import numpy as np
+
+from wisdem.pyframe3dd import Frame, Options, NodeData, ElementData, ReactionData, StaticLoadCase
+
+n_repeat = 3
+
+
+def build_frame(nlev, sparse):
+    xy = np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0]])
+    xyz = np.array([[xy[k, 0], xy[k, 1], 3.0 * i] for i in range(nlev) for k in range(4)])
+    perm = np.random.default_rng(1).permutation(len(xyz))
+    num = np.empty(len(xyz), dtype=int)
+    num[perm] = np.arange(1, len(xyz) + 1)
+
+    nodes = NodeData(np.arange(1, len(xyz) + 1), xyz[perm, 0], xyz[perm, 1], xyz[perm, 2], np.zeros(len(xyz)))
+    reactions = ReactionData(num[:4], np.ones(4), np.ones(4), np.ones(4), np.ones(4), np.ones(4), np.ones(4), 1)
+
+    N1, N2 = [], []
+    for i in range(nlev):
+        for k in range(4):
+            a, b = 4 * i + k, 4 * i + (k + 1) % 4
+            N1.append(num[a])
+            N2.append(num[b])
+            if i > 0:
+                N1 += [num[a - 4], num[a - 4]]
+                N2 += [num[a], num[b]]
+    nE = len(N1)
+    one = np.ones(nE)
+    elements = ElementData(
+        np.arange(1, nE + 1),
+        np.array(N1),
+        np.array(N2),
+        0.01 * one,
+        0.005 * one,
+        0.005 * one,
+        2e-4 * one,
+        1e-4 * one,
+        1e-4 * one,
+        2e11 * one,
+        8e10 * one,
+        np.zeros(nE),
+        7850.0 * one,
+    )
+    frame = Frame(nodes, reactions, elements, Options(True, False, -1, sparse))
+
+    top = num[-4:]
+    load = StaticLoadCase(0.0, 0.0, -9.81)
+    load.changePointLoads(top, 1e4 * np.ones(4), 5e3 * np.ones(4), -1e5 * np.ones(4), 0 * top, 0 * top, 0 * top)
+    frame.addLoadCase(load)
+    return frame
+
+
+def timed(frame):
+    t = []
+    for _ in range(n_repeat):
+        s = time.perf_counter()
+        out = frame.run()
+        t.append(time.perf_counter() - s)
+    return out, min(t)
+
+
+for nlev in [25, 50, 100, 200]:
+    (disp_f, _, react_f, *_), t_full = timed(build_frame(nlev, False))
+    (disp_s, _, react_s, *_), t_sky = timed(build_frame(nlev, True))
+    diff = max(
+        np.max(np.abs(getattr(disp_s, k) - getattr(disp_f, k))) / np.max(np.abs(getattr(disp_f, k)))
+        for k in "dx dy dz".split()
+    )
+    diff = max(diff, np.max(np.abs(react_s.Fz - react_f.Fz)) / np.max(np.abs(react_f.Fz)))
+    print(
+        f"{4 * nlev:4d} nodes: full {t_full:8.3f} s, skyline {t_sky:8.3f} s ({t_full / t_sky:6.1f}x), "
+        f"max relative difference {diff:.1e}"
+    )
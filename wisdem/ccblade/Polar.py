@@ -2,6 +2,8 @@
   - Polar: class to represent a polar (computes steady/unsteady parameters, corrections etc.)
   - blend: function to blend two polars
   - thicknessinterp_from_one_set: interpolate polars at different thickeness based on one set of polars 
+  - correction3D_batch: 3D rotational correction of a stack of polars at once
+  - stall_angles_batch: f=0.7 stall angles of a stack of polars at once
 """
 
 import os
@@ -1252,6 +1254,185 @@ def thicknessinterp_from_one_set(thickness, polarList, polarThickness):
     return polars
 
 
+def correction3D_batch(
+    alpha,
+    cl,
+    cd,
+    r_over_R,
+    chord_over_r,
+    tsr,
+    lift_method="DuSelig",
+    drag_method="None",
+    max_cl_corr=0.25,
+    cl_slope=None,
+    alpha0=None,
+):
+    """Applies the 3-D rotational correction of Polar.correction3D to a stack of polars at once.
+
+    The polars share the angles of attack and have their linear region found as in
+    Polar.correction3D, then the correction is blended in with the default
+    'linear_25_45' method.
+
+    Parameters
+    ----------
+    alpha : ndarray (deg)
+        angles of attack, shared by all polars
+    cl, cd : ndarray
+        lift and drag coefficients of the polars, shape (..., len(alpha))
+    r_over_R, chord_over_r : float or ndarray
+        local radial position / rotor radius and local chord / local radial position,
+        broadcast together with the polars, i.e. with cl.shape[:-1]
+    tsr : float
+        tip-speed ratio
+    lift_method : string, optional
+        'DuSelig' or 'Snel'
+    drag_method : string, optional
+        'Eggers' or 'None'
+    max_cl_corr : float, optional
+        maximum correction allowed
+    cl_slope, alpha0 : ndarray, optional
+        lift slope (1/deg) and zero-lift angle (deg) of each polar, as found by
+        Polar.linear_region, if already known
+
+    Returns
+    -------
+    cl_3d, cd_3d : ndarray
+        corrected lift and drag coefficients, of the broadcast shape followed by len(alpha)
+    """
+    alpha = np.asarray(alpha, dtype=float)
+    cl_2d = np.asarray(cl, dtype=float)
+    cd_2d = np.asarray(cd, dtype=float)
+    if cl_slope is None or alpha0 is None:
+        cl_slope = np.zeros(cl_2d.shape[:-1])
+        alpha0 = np.zeros(cl_2d.shape[:-1])
+        for k in np.ndindex(cl_slope.shape):
+            cl_slope[k], alpha0[k] = cl_linear_slope(alpha, cl_2d[k], method="optim")
+
+    # parameters in Du-Selig model
+    shape = np.broadcast_shapes(cl_2d.shape[:-1], np.shape(r_over_R), np.shape(chord_over_r))
+    cl_2d = np.broadcast_to(cl_2d, shape + alpha.shape)
+    cd_2d = np.broadcast_to(cd_2d, shape + alpha.shape)
+    cl_slope = np.broadcast_to(cl_slope, shape)
+    alpha0 = np.broadcast_to(alpha0, shape)
+    r_over_R = np.broadcast_to(r_over_R, shape)
+    chord_over_r = np.broadcast_to(chord_over_r, shape)
+    lam = tsr / (1 + tsr**2) ** 0.5  # modified tip speed ratio
+    expon = 1.0 / lam / np.where(np.abs(r_over_R) > 1e-4, r_over_R, 1e-4)
+    cl_slope = np.degrees(cl_slope)
+    alpha0 = np.radians(alpha0)
+
+    if lift_method == "DuSelig":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fcl = (
+                1.0
+                / cl_slope
+                * (1.6 * chord_over_r / 0.1267 * (1 - chord_over_r**expon) / (1 + chord_over_r**expon) - 1)
+            )
+        fcl = np.where(fcl < 0.0, 0.0, fcl)
+        fcl = np.where(np.abs(cl_slope) > 1e-4, fcl, 0.0)
+    elif lift_method == "Snel":
+        fcl = 3.0 * chord_over_r**2.0
+    else:
+        raise Exception("The keyword argument lift_method (3d correction for lift) can only be DuSelig or Snel.")
+
+    # 3D correction for lift, bounded to +/- max_cl_corr and blended in between +/- 25 deg, linearly to +/- 45
+    alpha_rad = np.radians(alpha)
+    cl_linear = cl_slope[..., None] * (alpha_rad - alpha0[..., None])
+    cl_corr = np.clip(fcl[..., None] * (cl_linear - cl_2d), -max_cl_corr, max_cl_corr)
+    adj = np.interp(alpha_rad, np.radians([-180, -45, -25, 25, 45, 180]), [0, 0, 1, 1, 0, 0])
+    cl_3d = cl_2d + cl_corr * adj
+
+    # Eggers 2003 correction for drag
+    if drag_method == "Eggers":
+        sina = np.sin(alpha_rad)
+        cosa = np.cos(alpha_rad)
+        cd_3d = cd_2d + cl_corr * (sina - 0.12 * cosa) / (cosa + 0.12 * sina) * adj
+    elif drag_method == "None":
+        cd_3d = cd_2d.copy()
+    else:
+        raise Exception("The keyword argument darg_method (3d correction for drag) can only be Eggers or None.")
+
+    return cl_3d, cd_3d
+
+
+def stall_angles_batch(alpha, cl, cd, nMin=720):
+    """Computes the f=0.7 stall angles and normal force slope of Polar.unsteadyParams for a stack of polars at once.
+
+    Only the steps of Polar.unsteadyParams leading to alpha1, alpha2 and cnSlope are
+    carried out: the interpolation to at least nMin angles, the zero of cn, the least
+    square slope of cn and the intersections of cn with the f=0.7 line.  The polars
+    share the angles of attack, so all curves are evaluated on the same grid and the
+    intersections reduce to sign changes of their difference.
+
+    Parameters
+    ----------
+    alpha : ndarray (deg)
+        increasing angles of attack, shared by all polars
+    cl, cd : ndarray
+        lift and drag coefficients of the polars, shape (..., len(alpha))
+    nMin : int, optional
+        minimum number of angles of attack, as in Polar.unsteadyParams
+
+    Returns
+    -------
+    alpha1, alpha2 : ndarray (deg)
+        angles of attack at f=0.7 above and below the zero of cn, of shape cl.shape[:-1]
+        (alpha2 without the adjustment of Polar.unsteadyParams when it exceeds alpha0)
+    cnSlope : ndarray (1/rad)
+        slope of the normal force coefficient curve
+    Polars with a constant cl, or with no intersection with the f=0.7 line, get zeros.
+    """
+    alpha = np.asarray(alpha, dtype=float)
+    shape = np.shape(cl)[:-1]
+    cl = np.array(cl, dtype=float).reshape((-1, alpha.size))
+    cd = np.array(cd, dtype=float).reshape((-1, alpha.size))
+    cl[np.abs(cl) < 1e-10] = 0
+
+    if alpha.size < nMin:
+        alpha_lin = np.linspace(np.min(alpha), np.max(alpha), nMin)
+        alpha_new = np.unique(np.sort(np.concatenate((alpha, alpha_lin))))
+        cl = np.array([np.interp(alpha_new, alpha, y) for y in cl])
+        cd = np.array([np.interp(alpha_new, alpha, y) for y in cd])
+        alpha = alpha_new
+    cn = cl * np.cos(alpha * np.pi / 180) + cd * np.sin(alpha * np.pi / 180)
+    alpha0cn = _find_alpha0_batch(alpha, cn, [-20, 20])
+
+    # least square slope through the zero of cn, on a uniform grid restricted to [-5, 10] deg around it
+    alpha_ = np.linspace(alpha[0], alpha[-1], max(721, alpha.size))
+    dx = alpha_ - alpha0cn[:, None]
+    dx[(alpha_ < alpha0cn[:, None] - 5) | (alpha_ > alpha0cn[:, None] + 10)] = 0.0
+    cn_ = np.array([np.interp(alpha_, alpha, y) for y in cn])
+    cnSlope = np.sum(dx * cn_, axis=1) / np.sum(dx**2, axis=1)
+
+    # intersections of cn with the f=0.7 line, as found by _intersections on the common grid
+    cn_f = cnSlope[:, None] * (alpha - alpha0cn[:, None]) * ((1 + np.sqrt(0.7)) / 2) ** 2
+    d = cn_f - cn
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = d[:, :-1] / (d[:, :-1] - d[:, 1:])
+    irow, iseg = np.nonzero((t >= 0) & (t <= 1))
+    t = t[irow, iseg]
+    x_inter = alpha[iseg] + t * np.diff(alpha)[iseg]
+    y_inter = cn[irow, iseg] + t * (cn[irow, iseg + 1] - cn[irow, iseg])
+
+    alpha1 = np.zeros(cl.shape[0])
+    alpha2 = np.zeros(cl.shape[0])
+    for k in range(cl.shape[0]):
+        if np.all(np.isclose(cl[k], cl[k, 0], atol=1e-9)):
+            cnSlope[k] = 0.0
+            continue
+        # remove duplicates as _intersections does
+        kept = []
+        for p in zip(x_inter[irow == k], y_inter[irow == k]):
+            if all(np.hypot(p[0] - q[0], p[1] - q[1]) > 1e-6 for q in kept):
+                kept.append(p)
+        if len(kept) == 3:
+            alpha1[k], alpha2[k] = kept[2][0], kept[0][0]
+        elif len(kept) > 0:
+            alpha1[k], alpha2[k] = abs(kept[0][0]), -abs(kept[0][0])
+
+    return alpha1.reshape(shape), alpha2.reshape(shape), np.degrees(cnSlope).reshape(shape)
+
+
 def _alpha_window_in_bounds(alpha, window):
     """Ensures that the window of alpha values is within the bounds of alpha
     Example: alpha in [-30,30], window=[-20,20] => window=[-20,20]
@@ -1311,6 +1492,34 @@ def _find_alpha0(alpha, coeff, window, direction='up', value_if_constant = np.na
     return alpha0
 
 
+def _find_alpha0_batch(alpha, coeff, window, value_if_constant=0.0):
+    """Zero up-crossing of each row of coeff(alpha) within a window, as found by _find_alpha0 for one row.
+    The second crossing is used when there are several, and 0 when there are none.
+    """
+    alpha0 = np.where(coeff[:, 0] == 0, 0.0, value_if_constant)
+    constant = np.all(coeff - coeff[:, :1] < 1e-8, axis=1)
+
+    window = _alpha_window_in_bounds(alpha, window)
+    iwindow = (alpha >= window[0]) & (alpha <= window[1])
+    x = alpha[iwindow]
+    y = coeff[:, iwindow]
+
+    # up-crossings between two points, and at points exactly 0 with neighbors of opposite sign
+    y0, y1 = y[:, :-1], y[:, 1:]
+    cross = (y0 * y1 < 0.0) & (y1 > y0)
+    zero = np.zeros_like(cross)
+    zero[:, 1:] = (y0[:, 1:] == 0.0) & (y[:, :-2] * y1[:, 1:] < 0.0) & (y1[:, 1:] > 0.0)
+    up = cross | zero
+    n_up = np.sum(up, axis=1)
+    i = np.argmax(np.cumsum(up, axis=1) == np.minimum(n_up, 2)[:, None], axis=1)
+    rows = np.arange(len(y))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_zc = np.where(
+            zero[rows, i], x[i], x[i] - y[rows, i] * (x[i + 1] - x[i]) / (y[rows, i + 1] - y[rows, i])
+        )
+    return np.where(constant, alpha0, np.where(n_up > 0, x_zc, 0.0))
+
+
 def _find_TSE_region(alpha, coeff, slope, alpha0, deviation):
     """Find the Trailing Edge Separation points, when the coefficient separates from its linear region
     These points are defined as the points where the difference is equal to +/- `deviation`
@@ -1755,29 +1964,38 @@ def _find_linear_region(x, y, nMin, x0=None):
         iStart: index of start of linear region
         iEnd  : index of end of linear region
     """
+    x = np.asarray(x, dtype=float).ravel()
+    y = np.asarray(y, dtype=float).ravel()
     if x0 is not None:
-        x = x.reshape((-1, 1)) - x0
-        y = y.reshape((-1, 1))
+        x = x - x0
     n = len(x) - nMin + 1
     err = np.zeros((n, n)) * np.nan
     slp = np.zeros((n, n)) * np.nan
     off = np.zeros((n, n)) * np.nan
     spn = np.zeros((n, n)) * np.nan
     for iStart in range(n):
-        for j in range(iStart, n):
-            iEnd = j + nMin
-            if x0 is not None:
-                sl = np.linalg.lstsq(x[iStart:iEnd], y[iStart:iEnd], rcond=None)[0][0]
-                slp[iStart, j] = sl[0]
-                off[iStart, j] = x0
-                y_lin = x[iStart:iEnd] * sl
-            else:
-                coefs = np.polyfit(x[iStart:iEnd], y[iStart:iEnd], 1)
-                slp[iStart, j] = coefs[0]
-                off[iStart, j] = -coefs[1] / coefs[0]
-                y_lin = x[iStart:iEnd] * coefs[0] + coefs[1]
-            err[iStart, j] = np.mean((y[iStart:iEnd] - y_lin) ** 2)
-            spn[iStart, j] = iEnd - iStart
+        # All the regions starting at iStart at once, one row per end point
+        xs = x[iStart:]
+        ys = y[iStart:]
+        nPts = np.arange(iStart, n) + nMin - iStart
+        inside = np.arange(len(xs)) < nPts[:, None]
+        if x0 is not None:
+            sxx = np.sum(inside * xs**2, axis=1)
+            sl = np.divide(np.sum(inside * xs * ys, axis=1), sxx, out=np.zeros(len(nPts)), where=sxx > 0)
+            slp[iStart, iStart:] = sl
+            off[iStart, iStart:] = x0
+            y_lin = xs * sl[:, None]
+        else:
+            xm = np.sum(inside * xs, axis=1) / nPts
+            ym = np.sum(inside * ys, axis=1) / nPts
+            dx = inside * (xs - xm[:, None])
+            a = np.sum(dx * (ys - ym[:, None]), axis=1) / np.sum(dx**2, axis=1)
+            b = ym - a * xm
+            slp[iStart, iStart:] = a
+            off[iStart, iStart:] = -b / a
+            y_lin = xs * a[:, None] + b[:, None]
+        err[iStart, iStart:] = np.sum(inside * (ys - y_lin) ** 2, axis=1) / nPts
+        spn[iStart, iStart:] = nPts
     spn = 1 / (spn - nMin + 1)
     err = (err) / (np.nanmax(err))
     obj = np.multiply(spn, err)
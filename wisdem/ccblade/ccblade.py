@@ -21,8 +21,11 @@ limitations under the License.
 """
 
 import os
+import math
+import hashlib
 import warnings
 import multiprocessing as mp
+from collections import OrderedDict
 
 import numpy as np
 from scipy.optimize import brentq
@@ -30,6 +33,444 @@ from scipy.interpolate import RectBivariateSpline, bisplev
 
 import wisdem.ccblade._bem as _bem
 
+# ------------------
+#  Array versions of the BEM residual (mirror bem.f90)
+# ------------------
+
+
+def _inductionfactors(r, chord, Rhub, Rtip, phi, cl, cd, B, Vx, Vy, usecd=True, hubloss=True, tiploss=True, wakerotation=True):
+    """Array version of _bem.inductionfactors, evaluated element-wise over all inputs.
+    See inductionFactors in src/bem.f90 for the reference implementation."""
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        sigma_p = B / 2.0 / np.pi * chord / r
+        sphi = np.sin(phi)
+        cphi = np.cos(phi)
+
+        # resolve into normal and tangential forces
+        if usecd:
+            cn = cl * cphi + cd * sphi
+            ct = cl * sphi - cd * cphi
+        else:
+            cn = cl * cphi
+            ct = cl * sphi
+
+        # Prandtl's tip and hub loss factor
+        Ftip = 1.0
+        if tiploss:
+            factortip = B / 2.0 * (Rtip - r) / (r * sphi)
+            Ftip = 2.0 / np.pi * np.arccos(np.exp(-factortip))
+
+        Fhub = 1.0
+        if hubloss:
+            factorhub = B / 2.0 * (r - Rhub) / (Rhub * sphi)
+            Fhub = 2.0 / np.pi * np.arccos(np.exp(-factorhub))
+
+        F = Ftip * Fhub
+
+        # bem parameters
+        k = sigma_p * cn / 4.0 / F / sphi / sphi
+        kp = sigma_p * ct / 4.0 / F / sphi / cphi
+
+        # axial induction factor: momentum state, Glauert(Buhl) correction, propeller brake region
+        g1 = 2.0 * F * k - (10.0 / 9 - F)
+        g2 = 2.0 * F * k - (4.0 / 3 - F) * F
+        g3 = 2.0 * F * k - (25.0 / 9 - 2 * F)
+        a_buhl = np.where(np.abs(g3) < 1e-6, 1.0 - 1.0 / 2.0 / np.sqrt(g2), (g1 - np.sqrt(g2)) / g3)
+        a_momentum = np.where(k <= 2.0 / 3.0, k / (1 + k), a_buhl)
+        a_brake = np.where(k > 1, k / (k - 1), 0.0)
+        a = np.where(phi > 0, a_momentum, a_brake)
+
+        # tangential induction factor
+        if wakerotation:
+            ap = kp / (1 - kp)
+        else:
+            ap = np.zeros_like(kp)
+            kp = np.zeros_like(kp)
+
+        # error function
+        lambda_r = Vy / Vx
+        fzero = np.where(
+            phi > 0,
+            sphi / (1 - a) - cphi / lambda_r * (1 - kp),
+            sphi * (1 - k) - cphi / lambda_r * (1 - kp),
+        )
+
+    return fzero, a, ap
+
+
+def _relativewind(phi, a, ap, Vx, Vy, pitch, chord, theta, rho, mu):
+    """Array version of _bem.relativewind, evaluated element-wise over all inputs.
+    See relativeWind in src/bem.f90 for the reference implementation."""
+
+    alpha = phi - (theta + pitch)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        W = np.where(
+            np.abs(a) > 10,
+            Vy * (1 + ap) / np.cos(phi),
+            np.where(np.abs(ap) > 10, Vx * (1 - a) / np.sin(phi), np.sqrt((Vx * (1 - a)) ** 2 + (Vy * (1 + ap)) ** 2)),
+        )
+
+    Re = rho * W * chord / mu
+
+    return alpha, W, Re
+
+
+def _definecurvature(r, precurve, presweep, precone):
+    """Array version of defineCurvature in src/bem.f90"""
+
+    # coordinate in azimuthal coordinate system
+    x_az = -r * np.sin(precone) + precurve * np.cos(precone)
+    z_az = r * np.cos(precone) + precurve * np.sin(precone)
+    y_az = presweep
+
+    # compute total coning angle for purposes of relative velocity
+    cone_seg = np.arctan2(-np.diff(x_az), np.diff(z_az))
+    cone = np.r_[cone_seg[0], 0.5 * (cone_seg[:-1] + cone_seg[1:]), cone_seg[-1]]
+
+    # total path length of blade
+    s = np.r_[0.0, np.cumsum(np.sqrt(np.diff(precurve) ** 2 + np.diff(presweep) ** 2 + np.diff(r) ** 2))]
+
+    return x_az, y_az, z_az, cone, s
+
+
+def _windcomponents(r, precurve, presweep, precone, yaw, tilt, azimuth, Uinf, OmegaRPM, hubHt, shearExp):
+    """Array version of _bem.windcomponents.  azimuth, Uinf and OmegaRPM may be arrays that broadcast
+    against the radial stations (e.g. shape (npts, nsec, 1)).  See windComponents in src/bem.f90."""
+
+    sy = np.sin(yaw)
+    cy = np.cos(yaw)
+    st = np.sin(tilt)
+    ct = np.cos(tilt)
+    sa = np.sin(azimuth)
+    ca = np.cos(azimuth)
+    Omega = OmegaRPM * np.pi / 30.0
+
+    x_az, y_az, z_az, cone, _ = _definecurvature(r, precurve, presweep, precone)
+    sc = np.sin(cone)
+    cc = np.cos(cone)
+
+    # get section heights in wind-aligned coordinate system
+    heightFromHub = (y_az * sa + z_az * ca) * ct - x_az * st
+
+    # velocity with shear
+    V = Uinf * (1 + heightFromHub / hubHt) ** shearExp
+
+    # transform wind to blade c.s.
+    Vwind_x = V * ((cy * st * ca + sy * sa) * sc + cy * ct * cc)
+    Vwind_y = V * (cy * st * sa - sy * ca)
+
+    # wind from rotation to blade c.s.
+    Vrot_x = -Omega * y_az * sc
+    Vrot_y = Omega * z_az
+
+    # total velocity
+    return Vwind_x + Vrot_x, Vwind_y + Vrot_y
+
+
+def _thrusttorque(Np, Tp, r, precurve, presweep, precone, Rhub, Rtip, precurveTip, presweepTip):
+    """Array version of _bem.thrusttorque, integrating over the last axis of Np and Tp so that any
+    number of leading (condition, azimuth) dimensions are handled at once.  See thrustTorque in src/bem.f90."""
+
+    # add hub/tip for complete integration.  loads go to zero at hub/tip.
+    rfull = np.r_[Rhub, r, Rtip]
+    curvefull = np.r_[0.0, precurve, precurveTip]
+    sweepfull = np.r_[0.0, presweep, presweepTip]
+    pad = [(0, 0)] * (np.ndim(Np) - 1) + [(1, 1)]
+    Npfull = np.pad(Np, pad)
+    Tpfull = np.pad(Tp, pad)
+
+    # get z_az and total cone angle
+    _, _, z_az, cone, s = _definecurvature(rfull, curvefull, sweepfull, precone)
+    ds = np.diff(s)
+
+    # integrate Thrust and Torque (trapezoidal)
+    def trapz(f):
+        return np.sum(0.5 * (f[..., :-1] + f[..., 1:]) * ds, axis=-1)
+
+    T = trapz(Npfull * np.cos(cone))
+    Y = trapz(Tpfull)
+    Z = trapz(Npfull * np.sin(cone))
+    Q = trapz(Tpfull * z_az)
+    M = trapz(Npfull * z_az)
+
+    return T, Y, Z, Q, M
+
+
+def _brentq_vec(f, xa, xb, xtol=2e-12, rtol=4 * np.finfo(float).eps, maxiter=100, fa=None, fb=None):
+    """Vectorized Brent's method over independent scalar root-finding problems.
+
+    Follows the same iteration as scipy.optimize.brentq (inverse quadratic / secant
+    steps safeguarded by bisection) so every element converges to the root brentq would
+    return for the same bracket.  Only the elements that have not yet converged are
+    passed to ``f`` on each iteration.
+
+    Parameters
+    ----------
+    f : callable
+        f(x, idx) returning the residuals at x for the problems with indices idx
+    xa, xb : array_like
+        brackets for each problem, f(xa) and f(xb) must have opposite signs
+    fa, fb : array_like, optional
+        f(xa) and f(xb) if already known, to save the first two evaluations
+
+    Returns
+    -------
+    x : ndarray
+        roots
+    bracketed : ndarray (bool)
+        False for problems without a sign change in the supplied bracket (x is not meaningful there)
+    """
+
+    xpre = np.array(xa, dtype=float)
+    xcur = np.array(xb, dtype=float)
+    n = xpre.size
+    idx_all = np.arange(n)
+    fpre = f(xpre, idx_all) if fa is None else np.array(fa, dtype=float)
+    fcur = f(xcur, idx_all) if fb is None else np.array(fb, dtype=float)
+
+    root = np.zeros(n)
+    done = np.zeros(n, dtype=bool)
+    bracketed = np.ones(n, dtype=bool)
+
+    hit = fpre == 0.0
+    root[hit] = xpre[hit]
+    done |= hit
+    hit = ~done & (fcur == 0.0)
+    root[hit] = xcur[hit]
+    done |= hit
+    bad = ~done & (np.signbit(fpre) == np.signbit(fcur))
+    bracketed[bad] = False
+    done |= bad
+
+    xblk = np.zeros(n)
+    fblk = np.zeros(n)
+    spre = np.zeros(n)
+    scur = np.zeros(n)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for _ in range(maxiter):
+            act = ~done
+            if not act.any():
+                break
+
+            flip = act & (fpre != 0) & (fcur != 0) & (np.signbit(fpre) != np.signbit(fcur))
+            xblk = np.where(flip, xpre, xblk)
+            fblk = np.where(flip, fpre, fblk)
+            spre = np.where(flip, xcur - xpre, spre)
+            scur = np.where(flip, xcur - xpre, scur)
+
+            swap = act & (np.abs(fblk) < np.abs(fcur))
+            xpre, xcur, xblk = (np.where(swap, xcur, xpre), np.where(swap, xblk, xcur), np.where(swap, xcur, xblk))
+            fpre, fcur, fblk = (np.where(swap, fcur, fpre), np.where(swap, fblk, fcur), np.where(swap, fcur, fblk))
+
+            delta = (xtol + rtol * np.abs(xcur)) / 2
+            sbis = (xblk - xcur) / 2
+            conv = act & ((fcur == 0) | (np.abs(sbis) < delta))
+            root[conv] = xcur[conv]
+            done |= conv
+            act &= ~conv
+            if not act.any():
+                break
+
+            # interpolate (secant) or extrapolate (inverse quadratic)
+            interp = xpre == xblk
+            stry_interp = -fcur * (xcur - xpre) / (fcur - fpre)
+            dpre = (fpre - fcur) / (xpre - xcur)
+            dblk = (fblk - fcur) / (xblk - xcur)
+            stry_extrap = -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            stry = np.where(interp, stry_interp, stry_extrap)
+
+            try_step = (np.abs(spre) > delta) & (np.abs(fcur) < np.abs(fpre))
+            good = try_step & (2 * np.abs(stry) < np.minimum(np.abs(spre), 3 * np.abs(sbis) - delta))
+            spre_new = np.where(good, scur, sbis)
+            scur_new = np.where(good, stry, sbis)
+            spre = np.where(act, spre_new, spre)
+            scur = np.where(act, scur_new, scur)
+
+            xpre = np.where(act, xcur, xpre)
+            fpre = np.where(act, fcur, fpre)
+            step = np.where(np.abs(scur) > delta, scur, np.where(sbis > 0, delta, -delta))
+            xcur = np.where(act, xcur + step, xcur)
+
+            iact = idx_all[act]
+            fcur[iact] = f(xcur[iact], iact)
+
+    # return last iterate for anything that hit maxiter, as brentq(disp=False) does
+    root[~done] = xcur[~done]
+
+    return root, bracketed
+
+
+def _bspline_basis(t, nt, k, x):
+    """Nonzero B-spline basis functions of degree k at x (fpbspl from FITPACK), one knot vector per row.
+
+    t is (m, max_nt) padded with +inf past the nt[m] actual knots.  Returns the knot span
+    index l (0-based, t[l] <= x < t[l+1]) and the (m, k+1) basis function values."""
+
+    rows = np.arange(len(x))[:, np.newaxis]
+
+    # clamp to the spline domain and locate the knot span as FITPACK does
+    x = np.minimum(np.maximum(x, t[rows[:, 0], k]), t[rows[:, 0], nt - k - 1])
+    l = np.minimum(np.maximum((t <= x[:, np.newaxis]).sum(axis=1) - 1, k), nt - k - 2)
+
+    # knots t[l-k+1], ..., t[l+k] surrounding the span
+    tw = t[rows, l[:, np.newaxis] + np.arange(1 - k, k + 1)]
+
+    h = [np.ones(len(x))]
+    for j in range(1, k + 1):
+        hh = h
+        h = [np.zeros(len(x))] * (j + 1)
+        for i in range(1, j + 1):
+            tli = tw[:, i + k - 1]
+            tlj = tw[:, i - j + k - 1]
+            den = tli - tlj
+            f = np.divide(hh[i - 1], den, out=np.zeros(len(x)), where=den != 0.0)
+            h[i - 1] = h[i - 1] + f * (tli - x)
+            h[i] = f * (x - tlj)
+
+    return l, np.column_stack(h)
+
+
+class _BivariateSplineStack(object):
+    """Evaluate a list of RectBivariateSpline objects (one per radial station) with a single vectorized
+    call.  Uses the same knots and coefficients, so values match RectBivariateSpline.ev to round-off."""
+
+    def __init__(self, splines):
+        self.kx, self.ky = splines[0].degrees
+        tcks = [spl.tck for spl in splines]
+        self.nx = np.array([len(tck[0]) for tck in tcks])
+        self.ny = np.array([len(tck[1]) for tck in tcks])
+
+        self.tx = np.full((len(tcks), self.nx.max()), np.inf)
+        self.ty = np.full((len(tcks), self.ny.max()), np.inf)
+        self.c = np.zeros((len(tcks), (self.nx.max() - self.kx - 1) * (self.ny.max() - self.ky - 1)))
+        for i, (tx, ty, c) in enumerate(tcks):
+            self.tx[i, : len(tx)] = tx
+            self.ty[i, : len(ty)] = ty
+            self.c[i, : len(c)] = c
+
+    def ev(self, x, y, idx):
+        """spline values at points (x, y) using the splines at station indices idx"""
+
+        lx, hx = _bspline_basis(self.tx[idx], self.nx[idx], self.kx, x)
+        ly, hy = _bspline_basis(self.ty[idx], self.ny[idx], self.ky, y)
+
+        # flattened coefficient index (FITPACK ordering)
+        nky1 = self.ny[idx] - self.ky - 1
+        ix = lx[:, np.newaxis] - self.kx + np.arange(self.kx + 1)
+        iy = ly[:, np.newaxis] - self.ky + np.arange(self.ky + 1)
+        ic = ix[:, :, np.newaxis] * nky1[:, np.newaxis, np.newaxis] + iy[:, np.newaxis, :]
+        c = self.c[idx[:, np.newaxis, np.newaxis], ic]
+
+        return np.einsum("mij,mi,mj->m", c, hx, hy)
+
+
+class _HermiteTable(object):
+    """Bicubic Hermite lookup table of one or more smooth functions of (alpha, Re).
+
+    Values and first/cross derivatives are tabulated on a uniform grid in alpha and log10(Re),
+    so the interpolant is C1 continuous.  f has shape (nfun, 4, nalpha, nRe) holding
+    [f, df/dalpha, df/dlog10Re, d2f/dalpha/dlog10Re].  Points outside the grid are clamped
+    to it (values and derivatives), as FITPACK does for the splines the table is built from.
+    """
+
+    def __init__(self, alpha0, dalpha, logRe0, dlogRe, f):
+        self.alpha0 = float(alpha0)
+        self.dalpha = float(dalpha)
+        self.logRe0 = float(logRe0)
+        self.dlogRe = float(dlogRe)
+        self.f = f
+        # flattened grid nodes, one contiguous array per tabulated quantity, for fast gathers,
+        # and the four quantities side by side for single-point lookups
+        self._nodes = [np.ascontiguousarray(f[:, m].ravel()) for m in range(4)]
+        self._cells = np.ascontiguousarray(np.moveaxis(f, 1, -1))
+
+    def grid(self):
+        na, nr = self.f.shape[-2:]
+        return (self.alpha0, self.dalpha, na, self.logRe0, self.dlogRe, nr)
+
+    @staticmethod
+    def _basis(s, h, deriv):
+        # Hermite basis (value and slope at each end of the cell), or its derivative
+        s2 = s * s
+        if deriv:
+            return ((6 * s2 - 6 * s) / h, 3 * s2 - 4 * s + 1, (6 * s - 6 * s2) / h, 3 * s2 - 2 * s)
+        s3 = s2 * s
+        return (2 * s3 - 3 * s2 + 1, h * (s3 - 2 * s2 + s), 3 * s2 - 2 * s3, h * (s3 - s2))
+
+    def ev(self, alpha, Re, ifun, dx=0, dy=0):
+        """interpolated function(s) ifun (or derivative dx in alpha, dy in Re) at the points (alpha, Re)
+
+        ifun is a function index (or array of indices broadcast against the points); a tuple
+        of indices returns a tuple of results sharing the same cell lookup.
+        """
+
+        na, nr = self.f.shape[-2:]
+        funcs = ifun if isinstance(ifun, tuple) else (ifun,)
+        scalar = isinstance(alpha, (float, int)) and isinstance(Re, (float, int))
+        scalar = scalar and all(isinstance(fi, int) for fi in funcs)
+
+        # cell index and local coordinate, clamped to the table
+        if scalar:
+            alpha = float(alpha)
+            Re = float(Re)
+            logRe = math.log10(Re)
+            xa = min(max((alpha - self.alpha0) / self.dalpha, 0.0), na - 1)
+            xr = min(max((logRe - self.logRe0) / self.dlogRe, 0.0), nr - 1)
+            i = min(int(xa), na - 2)
+            j = min(int(xr), nr - 2)
+        else:
+            logRe = np.log10(Re)
+            xa = np.clip((alpha - self.alpha0) / self.dalpha, 0.0, na - 1)
+            xr = np.clip((logRe - self.logRe0) / self.dlogRe, 0.0, nr - 1)
+            i = np.minimum(xa.astype(int), na - 2)
+            j = np.minimum(xr.astype(int), nr - 2)
+
+        A0, Ad0, A1, Ad1 = self._basis(xa - i, self.dalpha, dx)
+        B0, Bd0, B1, Bd1 = self._basis(xr - j, self.dlogRe, dy)
+
+        # chain rule from log10(Re) to Re
+        scale = 1.0 / (Re * math.log(10.0)) if dy else 1.0
+
+        if scalar:
+            # plain floats are much faster than numpy scalars for a single point
+            if funcs == tuple(range(funcs[0], funcs[-1] + 1)):
+                cells = self._cells[funcs[0] : funcs[-1] + 1, i : i + 2, j : j + 2].tolist()
+            else:
+                cells = [self._cells[fi, i : i + 2, j : j + 2].tolist() for fi in funcs]
+            out = []
+            for (c00, c01), (c10, c11) in cells:
+                out.append(
+                    scale
+                    * (
+                        A0 * (B0 * c00[0] + Bd0 * c00[2] + B1 * c01[0] + Bd1 * c01[2])
+                        + Ad0 * (B0 * c00[1] + Bd0 * c00[3] + B1 * c01[1] + Bd1 * c01[3])
+                        + A1 * (B0 * c10[0] + Bd0 * c10[2] + B1 * c11[0] + Bd1 * c11[2])
+                        + Ad1 * (B0 * c10[1] + Bd0 * c10[3] + B1 * c11[1] + Bd1 * c11[3])
+                    )
+                )
+            return tuple(out) if isinstance(ifun, tuple) else out[0]
+
+        corners = [(0, A0, Ad0, B0, Bd0), (1, A0, Ad0, B1, Bd1), (nr, A1, Ad1, B0, Bd0), (nr + 1, A1, Ad1, B1, Bd1)]
+        f0, fa, fr, far = self._nodes
+        out = []
+        for fi in funcs:
+            k = (fi * na + i) * nr + j
+            val = 0.0
+            for offset, A, Ad, B, Bd in corners:
+                ko = k + offset
+                val = (
+                    val
+                    + A * (B * np.take(f0, ko) + Bd * np.take(fr, ko))
+                    + Ad * (B * np.take(fa, ko) + Bd * np.take(far, ko))
+                )
+            out.append(val * scale)
+
+        return tuple(out) if isinstance(ifun, tuple) else out[0]
+
+
 # ------------------
 #  Airfoil Class
 # ------------------
@@ -92,6 +533,66 @@ class CCAirfoil(object):
         if self.use_cm > 0:
             self.cm_spline = RectBivariateSpline(alpha, Re, cm, kx=kx, ky=ky, s=0.0001)
 
+        self.table = None
+        self.table_error = None
+
+    def compile_table(self, n_alpha=1441, n_Re=16):
+        """Tabulate the airfoil splines on a dense grid for fast, vectorized evaluation.
+
+        cl, cd, cm and their slopes with respect to alpha and log10(Re) are precomputed from the
+        splines on a uniform grid and interpolated with bicubic Hermite polynomials, which keeps
+        the lookup C1 continuous.  Once compiled, ``evaluate`` and ``derivatives`` use the table,
+        and CCBlade's vectorized solver evaluates all radial stations with a single lookup.
+
+        Parameters
+        ----------
+        n_alpha : int, optional
+            number of angles of attack spanning the polar (1441 gives 0.25 deg over 360 deg)
+        n_Re : int, optional
+            number of Reynolds numbers, log-spaced over the polar range (2 if not Reynolds number dependent)
+
+        Returns
+        -------
+        table_error : dict
+            maximum absolute difference between the table and the splines for 'cl', 'cd' (and 'cm'),
+            sampled at the cell centers and edge midpoints where the interpolation error peaks
+        """
+
+        splines = [self.cl_spline, self.cd_spline]
+        names = ["cl", "cd"]
+        if self.use_cm:
+            splines.append(self.cm_spline)
+            names.append("cm")
+
+        kx, ky = self.cl_spline.degrees
+        tx, ty = self.cl_spline.tck[:2]
+        alpha = np.linspace(tx[kx], tx[-kx - 1], n_alpha)
+        if self.one_Re:
+            n_Re = 2
+        logRe = np.linspace(np.log10(ty[ky]), np.log10(ty[-ky - 1]), n_Re)
+        Re = 10.0**logRe
+        dRe_dlogRe = Re * np.log(10.0)
+
+        f = np.zeros((len(splines), 4, n_alpha, n_Re))
+        for k, spl in enumerate(splines):
+            f[k, 0] = spl(alpha, Re)
+            f[k, 1] = spl(alpha, Re, dx=1)
+            if not self.one_Re:
+                f[k, 2] = spl(alpha, Re, dy=1) * dRe_dlogRe
+                f[k, 3] = spl(alpha, Re, dx=1, dy=1) * dRe_dlogRe
+
+        self.table = _HermiteTable(alpha[0], alpha[1] - alpha[0], logRe[0], logRe[1] - logRe[0], f)
+
+        # error estimate against the splines where cubic Hermite interpolation error peaks
+        alpha_mid = np.sort(np.r_[alpha, 0.5 * (alpha[:-1] + alpha[1:])])
+        Re_mid = 10.0 ** np.sort(np.r_[logRe, 0.5 * (logRe[:-1] + logRe[1:])])
+        A, R = np.meshgrid(alpha_mid, Re_mid, indexing="ij")
+        self.table_error = {}
+        for k, (name, spl) in enumerate(zip(names, splines)):
+            self.table_error[name] = np.max(np.abs(self.table.ev(A, R, k) - spl(alpha_mid, Re_mid)))
+
+        return self.table_error
+
     def max_eff(self, Re):
         # Get the angle of attack, cl and cd at max airfoil efficiency. For a cylinder, set the angle of attack to 0
 
@@ -102,16 +603,14 @@ class CCAirfoil(object):
         aoa_end = 40
 
         alpha = np.deg2rad(np.linspace(aoa_start, aoa_end, num=201))
-        cl = np.array([self.cl_spline.ev(aoa, Re) for aoa in alpha])
-        cd = np.array([self.cd_spline.ev(aoa, Re) for aoa in alpha])
+        cl, cd = self.evaluate(alpha, Re * np.ones_like(alpha))
 
         if np.max(cl) < 1.e-3:  # Cylinder
             alpha_Emax = 0.
-            cl_Emax = self.cl_spline.ev(alpha_Emax, Re)
-            cd_Emax = self.cd_spline.ev(alpha_Emax, Re)
+            cl_Emax, cd_Emax = self.evaluate(alpha_Emax, Re)
             Emax = cl_Emax / cd_Emax
         else:
-            Eff = [cli / cdi for cli, cdi, in zip(cl, cd)]
+            Eff = cl / cd
             i_max = np.argmax(Eff)
             alpha_Emax = alpha[i_max]
             cl_Emax = cl[i_max]
@@ -138,15 +637,13 @@ class CCAirfoil(object):
 
         else:
             alpha = np.deg2rad(np.linspace(aoa_start, aoa_end, num=201))
-            cl = [self.cl_spline.ev(aoa, Re) for aoa in alpha]
-            cd = [self.cd_spline.ev(aoa, Re) for aoa in alpha]
+            cl, _ = self.evaluate(alpha, Re * np.ones_like(alpha))
 
             i_stall = np.argmax(cl)
             alpha_stall = alpha[i_stall]
             alpha_op = alpha_stall - np.deg2rad(margin)
 
-        cl_op = self.cl_spline.ev(alpha_op, Re)
-        cd_op = self.cd_spline.ev(alpha_op, Re)
+        cl_op, cd_op = self.evaluate(alpha_op, Re)
         Eff_op = cl_op / cd_op
 
         # print Emax, np.deg2rad(alpha_Emax), cl_Emax, cd_Emax
@@ -173,8 +670,14 @@ class CCAirfoil(object):
         -----
         This method uses a spline so that the output is continuously differentiable, and
         also uses a small amount of smoothing to help remove spurious multiple solutions.
+        If ``compile_table`` has been called, the tabulated spline is used instead.
         """
 
+        if self.table is not None:
+            if self.use_cm and return_cm:
+                return self.table.ev(alpha, Re, (0, 1, 2))
+            return self.table.ev(alpha, Re, (0, 1))
+
         cl = self.cl_spline.ev(alpha, Re)
         cd = self.cd_spline.ev(alpha, Re)
 
@@ -185,6 +688,13 @@ class CCAirfoil(object):
             return cl, cd
 
     def derivatives(self, alpha, Re):
+        if self.table is not None:
+            dcl_dalpha, dcd_dalpha = self.table.ev(alpha, Re, (0, 1), dx=1)
+            if self.one_Re:
+                return dcl_dalpha, 0.0, dcd_dalpha, 0.0
+            dcl_dRe, dcd_dRe = self.table.ev(alpha, Re, (0, 1), dy=1)
+            return dcl_dalpha, dcl_dRe, dcd_dalpha, dcd_dRe
+
         # note: direct call to bisplev will be unnecessary with latest scipy update (add derivative method)
         tck_cl = self.cl_spline.tck[:3] + self.cl_spline.degrees  # concatenate lists
         tck_cd = self.cd_spline.tck[:3] + self.cd_spline.degrees
@@ -434,6 +944,127 @@ class CCAirfoil(object):
             os.remove(NUL_fname)
 
 
+def content_key(*arrays):
+    """hash of the values and shapes of the arrays, as float64"""
+    h = hashlib.sha1()
+    for x in arrays:
+        x = np.ascontiguousarray(x, dtype=np.float64)
+        h.update(str(x.shape).encode())
+        h.update(x.tobytes())
+    return h.hexdigest()
+
+
+class KeyedLRUCache(object):
+    """Least-recently-used cache of values derived from array data, keyed e.g. on content_key.
+
+    The cache holds at most maxsize entries and, if max_bytes is given, at most max_bytes of
+    data as measured by sizeof (the newest entry is always kept).  The cached values are shared
+    with the callers, so they must be treated as read-only.
+    """
+
+    def __init__(self, maxsize=512, max_bytes=None):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._nbytes = {}
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def peek(self, key):
+        """value of a cached key, without counting the lookup or marking the entry as used"""
+        return self._data[key]
+
+    def lookup(self, key, build):
+        """value of key, computed as build() only on a cache miss"""
+
+        if key in self._data:
+            self.hits += 1
+            self._data.move_to_end(key)
+            return self._data[key]
+
+        self.misses += 1
+        value = build()
+        self.put(key, value)
+        return value
+
+    def put(self, key, value):
+        """store value as the most recently used entry, evicting the least recently used ones beyond the limits"""
+        self._data.pop(key, None)
+        self.nbytes -= self._nbytes.pop(key, 0)
+        self._data[key] = value
+        self._nbytes[key] = self.sizeof(value)
+        self.nbytes += self._nbytes[key]
+        while len(self._data) > 1 and (
+            len(self._data) > self.maxsize or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            old, _ = self._data.popitem(last=False)
+            self.nbytes -= self._nbytes.pop(old)
+
+    def sizeof(self, value):
+        """size of a cached value in bytes, counted against max_bytes (not measured by default)"""
+        return 0
+
+    def clear(self):
+        """empty the cache and reset the counters"""
+        self._data.clear()
+        self._nbytes.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+class AirfoilCache(KeyedLRUCache):
+    """Least-recently-used cache of CCAirfoil objects keyed on a hash of their polar data.
+
+    Building a CCAirfoil fits two or three RectBivariateSpline surfaces, which WISDEM components
+    would otherwise repeat for every blade station on every call even when the polars have not
+    changed.  The cached objects are shared, so they must be treated as read-only.
+    """
+
+    @staticmethod
+    def key(alpha, Re, cl, cd, cm=[], table=False):
+        """content hash of the polar data"""
+        return content_key(alpha, Re, cl, cd, cm), table
+
+    def sizeof(self, af):
+        """bytes of the spline coefficients and lookup table of a CCAirfoil"""
+        arrays = []
+        for name in ["cl_spline", "cd_spline", "cm_spline"]:
+            if hasattr(af, name):
+                arrays.extend(getattr(af, name).tck)
+        if af.table is not None:
+            arrays.extend([af.table.f, af.table._cells] + af.table._nodes)
+        return sum(np.asarray(a).nbytes for a in arrays)
+
+    def get(self, alpha, Re, cl, cd, cm=[], table=False):
+        """CCAirfoil for the polar data (arguments as for CCAirfoil), built only on a cache miss
+
+        If table is True, the returned airfoil has a compiled lookup table (see
+        CCAirfoil.compile_table); airfoils with and without tables are cached separately.
+        """
+
+        def build():
+            af = CCAirfoil(alpha, Re, cl, cd, cm)
+            if table:
+                af.compile_table()
+            return af
+
+        return self.lookup(self.key(alpha, Re, cl, cd, cm, table), build)
+
+
+# shared by the CCBlade-based components in ccblade_component.py and rotorse, with room for the
+# stations of a few designs; a lookup table takes 4-6 MB with the default grid, so the cache is
+# bounded in bytes as well
+airfoil_cache = AirfoilCache(maxsize=128, max_bytes=512 * 2**20)
+
+
 # ------------------
 #  Main Class: CCBlade
 # ------------------
@@ -467,6 +1098,7 @@ class CCBlade(object):
         usecd=True,
         iterRe=1,
         derivatives=False,
+        vectorized=False,
     ):
         """Constructor for aerodynamic rotor analysis
 
@@ -530,6 +1162,12 @@ class CCBlade(object):
             should not be necessary.  Gradients have only been implemented for the case iterRe=1.
         derivatives : boolean, optional
             if True, derivatives along with function values will be returned for the various methods
+        vectorized : boolean, optional
+            if True, the inflow angle at all radial stations is bracketed and solved simultaneously
+            with a vectorized Brent's method instead of one brentq call per station.  Results match
+            the default solver to within the root-finding tolerance.  Without derivatives, ``evaluate``
+            also solves all operating conditions and azimuthal sectors in a single batched pass.
+            Not used for inverse analysis.
         """
         r = np.array(r)
         self.r = r.copy()
@@ -549,6 +1187,7 @@ class CCBlade(object):
         self.bemoptions = dict(usecd=usecd, tiploss=tiploss, hubloss=hubloss, wakerotation=wakerotation)
         self.iterRe = iterRe
         self.derivatives = derivatives
+        self.vectorized = vectorized
 
         # check if no precurve / presweep
         if precurve is None:
@@ -849,6 +1488,164 @@ class CCBlade(object):
 
         return Vx, Vy, dVx_dw, dVy_dw, dVx_dcurve, dVy_dcurve
 
+    def __evaluateAirfoils(self, alpha, Re, idx):
+        """lift and drag coefficients at the radial stations idx"""
+
+        # all stations in one call, from the lookup tables if every airfoil has one on a common
+        # grid, otherwise from the splines when they share spline degrees
+        afids = [(id(af), id(af.table)) for af in self.af]
+        if getattr(self, "_af_stack_ids", None) != afids:
+            self._af_stack_ids = afids
+            self._af_stack = None
+            self._af_table = None
+            if all(af.table is not None for af in self.af) and len(set(af.table.grid() for af in self.af)) == 1:
+                # stacked as [cl, cd] per station
+                t0 = self.af[0].table
+                f = np.concatenate([af.table.f[:2] for af in self.af])
+                self._af_table = _HermiteTable(t0.alpha0, t0.dalpha, t0.logRe0, t0.dlogRe, f)
+            elif len(set(af.cl_spline.degrees + af.cd_spline.degrees for af in self.af)) == 1:
+                self._af_stack = (
+                    _BivariateSplineStack([af.cl_spline for af in self.af]),
+                    _BivariateSplineStack([af.cd_spline for af in self.af]),
+                )
+
+        if self._af_table is not None:
+            idx = np.asarray(idx)
+            return self._af_table.ev(alpha, Re, (2 * idx, 2 * idx + 1))
+
+        if self._af_stack is not None:
+            idx = np.asarray(idx)
+            return self._af_stack[0].ev(alpha, Re, idx), self._af_stack[1].ev(alpha, Re, idx)
+
+        cl = np.zeros(len(idx))
+        cd = np.zeros(len(idx))
+        for k, i in enumerate(idx):
+            cl[k], cd[k] = self.af[i].evaluate(alpha[k], Re[k])
+
+        return cl, cd
+
+    def __runBEM_vec(self, phi, idx, ist, Vx, Vy, pitch):
+        """residual of BEM method and other corresponding variables at entries idx of flattened
+        (condition, station) arrays, where ist holds the radial station index of each entry"""
+
+        ist = ist[idx]
+        r = self.r[ist]
+        chord = self.chord[ist]
+        theta = self.theta[ist]
+        Vx = Vx[idx]
+        Vy = Vy[idx]
+        pitch = pitch[idx]
+
+        a = np.zeros(len(idx))
+        ap = np.zeros(len(idx))
+
+        for i in range(self.iterRe):
+            alpha, W, Re = _relativewind(phi, a, ap, Vx, Vy, pitch, chord, theta, self.rho, self.mu)
+            cl, cd = self.__evaluateAirfoils(alpha, Re, ist)
+
+            fzero, a, ap = _inductionfactors(
+                r, chord, self.Rhub, self.Rtip, phi, cl, cd, self.B, Vx, Vy, **self.bemoptions
+            )
+
+        return fzero, a, ap, cl, cd
+
+    def __solveInflow(self, Vx, Vy, ist, pitch):
+        """inflow angle for all entries of flattened (condition, station) arrays of a rotating blade,
+        bracketed and solved together"""
+
+        phi_star = np.zeros(len(ist))
+
+        # sections without relative velocity carry no load (see __loads)
+        active = np.flatnonzero((Vx != 0.0) & (Vy != 0.0))
+        nact = len(active)
+        if nact == 0:
+            return phi_star
+
+        def errf(phi, idx):
+            return self.__runBEM_vec(phi, active[idx], ist, Vx, Vy, pitch)[0]
+
+        # ------ BEM solution method see (Ning, doi:10.1002/we.1636) ------
+
+        # set standard limits
+        epsilon = 1e-6
+        idx = np.arange(nact)
+        phi_lower = epsilon * np.ones(nact)
+        phi_upper = 0.5 * np.pi * np.ones(nact)
+
+        # an uncommon but possible case
+        flip = idx[errf(phi_lower, idx) * errf(phi_upper, idx) > 0]
+        if len(flip) > 0:
+            neg = (errf(-0.25 * np.pi * np.ones(len(flip)), flip) < 0) & (errf(-epsilon * np.ones(len(flip)), flip) > 0)
+            phi_lower[flip] = np.where(neg, -0.25 * np.pi, 0.5 * np.pi)
+            phi_upper[flip] = np.where(neg, -epsilon, np.pi - epsilon)
+
+        phi, bracketed = _brentq_vec(errf, phi_lower, phi_upper)
+
+        if not np.all(bracketed):
+            warnings.warn("error.  check input values.")
+            phi[~bracketed] = 0.0
+
+        phi_star[active] = phi
+
+        return phi_star
+
+    def __loads_vec(self, phi, rotating, Vx, Vy, ist, pitch):
+        """normal and tangential loads (no derivatives) for all entries of flattened (condition, station)
+        arrays, where rotating flags the entries with nonzero rotor speed"""
+
+        m = len(ist)
+        a = np.zeros(m)
+        ap = np.zeros(m)
+        alpha = np.zeros(m)
+        cl = np.zeros(m)
+        cd = np.zeros(m)
+        Np = np.zeros(m)
+        Tp = np.zeros(m)
+        cn = np.zeros(m)
+        ct = np.zeros(m)
+        W = np.zeros(m)
+        Re = np.zeros(m)
+
+        idx = np.flatnonzero((Vx != 0.0) & (Vy != 0.0))
+        if len(idx) == 0:
+            return a, ap, Np, Tp, alpha, cl, cd, cn, ct, W, Re
+
+        irot = idx[rotating[idx]]
+        if len(irot) > 0:
+            _, a[irot], ap[irot], cl[irot], cd[irot] = self.__runBEM_vec(phi[irot], irot, ist, Vx, Vy, pitch)
+
+        chord = self.chord[ist[idx]]
+        alpha_rad, W[idx], Re[idx] = _relativewind(
+            phi[idx], a[idx], ap[idx], Vx[idx], Vy[idx], pitch[idx], chord, self.theta[ist[idx]], self.rho, self.mu
+        )
+
+        istill = np.flatnonzero(~rotating[idx])
+        if len(istill) > 0:
+            cl[idx[istill]], cd[idx[istill]] = self.__evaluateAirfoils(
+                alpha_rad[istill], Re[idx[istill]], ist[idx[istill]]
+            )
+
+        cphi = np.cos(phi[idx])
+        sphi = np.sin(phi[idx])
+        cn[idx] = cl[idx] * cphi + cd[idx] * sphi  # these expressions should always contain drag
+        ct[idx] = cl[idx] * sphi - cd[idx] * cphi
+
+        q = 0.5 * self.rho * W[idx] ** 2
+        Np[idx] = cn[idx] * q * chord
+        Tp[idx] = ct[idx] * q * chord
+        alpha[idx] = np.rad2deg(alpha_rad)
+
+        inan = np.flatnonzero(np.isnan(Np))
+        if len(inan) > 0:
+            print(f"NaNs at {ist[inan]}/{len(self.r)}: {phi[inan]}")
+            a[inan] = 0.0
+            ap[inan] = 0.0
+            Np[inan] = 0.0
+            Tp[inan] = 0.0
+            alpha[inan] = 0.0
+
+        return a, ap, Np, Tp, alpha, cl, cd, cn, ct, W, Re
+
     def distributedAeroLoads(self, Uinf, Omega, pitch, azimuth):
         """Compute distributed aerodynamic loads along blade.
 
@@ -933,15 +1730,35 @@ class CCBlade(object):
             errf = self.__errorFunction
         rotating = Omega != 0.0
 
+        # ---------------- solve all stations at once ------------------
+        vectorized = self.vectorized and not self.inverse_analysis
+        if vectorized:
+            ist = np.arange(n)
+            pitch_all = self.pitch * np.ones(n)
+            if rotating:
+                phi_all = self.__solveInflow(Vx, Vy, ist, pitch_all)
+            else:
+                phi_all = 0.5 * np.pi * np.ones(n)
+
+            if not self.derivatives:
+                a, ap, Np, Tp, alpha, cl, cd, cn, ct, W, Re = self.__loads_vec(
+                    phi_all, np.full(n, rotating), Vx, Vy, ist, pitch_all
+                )
+
         # ---------------- loop across blade ------------------
-        for i in range(n):
+        # (only needed for the derivatives when the vectorized solver is used)
+        loop_stations = [] if vectorized and not self.derivatives else range(n)
+        for i in loop_stations:
             # index dependent arguments
             if self.inverse_analysis == True:
                 args = (self.r[i], self.chord[i], self.cl[i], self.cd[i], self.af[i], Vx[i], Vy[i])
             else:
                 args = (self.r[i], self.chord[i], self.theta[i], self.af[i], Vx[i], Vy[i])
 
-            if not rotating:  # non-rotating
+            if vectorized:
+                phi_star = phi_lower = phi_upper = phi_all[i]
+
+            elif not rotating:  # non-rotating
                 phi_star = np.pi / 2.0
 
             else:
@@ -1120,6 +1937,133 @@ class CCBlade(object):
 
         return loads, derivs
 
+    def distributedAeroLoadsSweep(self, Uinf, Omega, pitch, azimuth=0.0):
+        """Compute distributed aerodynamic loads along blade at several operating conditions.
+
+        Gives the same loads as calling distributedAeroLoads(Uinf[k], Omega[k], pitch[k], azimuth)
+        for each condition k, but all conditions and radial stations are solved together with the
+        vectorized solver.  Derivatives are not computed and inverse analysis is not supported.
+
+        Parameters
+        ----------
+        Uinf : array_like (m/s)
+            hub height wind speed
+        Omega : array_like (RPM)
+            rotor rotation speed
+        pitch : array_like (deg)
+            blade pitch setting
+        azimuth : float (deg)
+            the azimuth angle where aerodynamic loads should be computed at
+
+        Returns
+        -------
+        loads : dict
+            Same keys as in distributedAeroLoads, each an array of shape (len(Uinf), len(r))
+        """
+
+        Uinf = np.atleast_1d(np.asarray(Uinf, dtype=float))
+        Omega = np.atleast_1d(np.asarray(Omega, dtype=float))
+        pitch = np.atleast_1d(np.asarray(pitch, dtype=float))
+
+        Vx, Vy = _windcomponents(
+            self.r,
+            self.precurve,
+            self.presweep,
+            self.precone,
+            self.yaw,
+            self.tilt,
+            np.deg2rad(azimuth),
+            Uinf[:, np.newaxis],
+            Omega[:, np.newaxis],
+            self.hubHt,
+            self.shearExp,
+        )
+        shape = Vx.shape
+
+        # flatten into independent problems, one per (condition, station)
+        Vx = Vx.ravel()
+        Vy = Vy.ravel()
+        ist = np.tile(np.arange(shape[1]), shape[0])
+        pitch_all = np.broadcast_to(np.deg2rad(pitch)[:, np.newaxis], shape).ravel()
+        rotating = np.broadcast_to((Omega != 0.0)[:, np.newaxis], shape).ravel()
+
+        phi = 0.5 * np.pi * np.ones(Vx.size)
+        irot = np.flatnonzero(rotating)
+        if len(irot) > 0:
+            phi[irot] = self.__solveInflow(Vx[irot], Vy[irot], ist[irot], pitch_all[irot])
+
+        keys = ["a", "ap", "Np", "Tp", "alpha", "Cl", "Cd", "Cn", "Ct", "W", "Re"]
+        values = self.__loads_vec(phi, rotating, Vx, Vy, ist, pitch_all)
+        loads = {key: val.reshape(shape) for key, val in zip(keys, values)}
+
+        return loads
+
+    def __evaluate_vec(self, Uinf, Omega, pitch, azimuth):
+        """integrated rotor quantities for all operating conditions and azimuthal sectors
+        (no derivatives), solving the whole (condition, azimuth, station) problem at once"""
+
+        n = len(self.r)
+        nsec = len(azimuth)
+
+        # component of velocity at each condition, azimuth, and radial station
+        Vx, Vy = _windcomponents(
+            self.r,
+            self.precurve,
+            self.presweep,
+            self.precone,
+            self.yaw,
+            self.tilt,
+            azimuth[np.newaxis, :, np.newaxis],
+            Uinf[:, np.newaxis, np.newaxis],
+            Omega[:, np.newaxis, np.newaxis],
+            self.hubHt,
+            self.shearExp,
+        )
+        shape = Vx.shape
+
+        # flatten into independent problems, one per (condition, azimuth, station)
+        Vx = Vx.ravel()
+        Vy = Vy.ravel()
+        ist = np.tile(np.arange(n), Vx.size // n)
+        pitch_all = np.broadcast_to(np.deg2rad(pitch)[:, np.newaxis, np.newaxis], shape).ravel()
+        rotating = np.broadcast_to((Omega != 0.0)[:, np.newaxis, np.newaxis], shape).ravel()
+
+        phi = 0.5 * np.pi * np.ones(Vx.size)
+        irot = np.flatnonzero(rotating)
+        if len(irot) > 0:
+            phi[irot] = self.__solveInflow(Vx[irot], Vy[irot], ist[irot], pitch_all[irot])
+
+        _, _, Np, Tp, _, _, _, _, _, W, _ = self.__loads_vec(phi, rotating, Vx, Vy, ist, pitch_all)
+
+        Tsub, Ysub, Zsub, Qsub, Msub = _thrusttorque(
+            Np.reshape(shape),
+            Tp.reshape(shape),
+            self.r,
+            self.precurve,
+            self.presweep,
+            self.precone,
+            self.Rhub,
+            self.Rtip,
+            self.precurveTip,
+            self.presweepTip,
+        )
+
+        # Scale rotor quantities (thrust & torque) by num blades.  Keep blade root moment as is
+        ca = np.cos(azimuth)
+        sa = np.sin(azimuth)
+        T = self.B * Tsub.sum(axis=1) / nsec
+        Y = self.B * (Ysub * ca - Zsub * sa).sum(axis=1) / nsec
+        Z = self.B * (Zsub * ca + Ysub * sa).sum(axis=1) / nsec
+        Q = self.B * Qsub.sum(axis=1) / nsec
+        My = self.B * (Msub * ca).sum(axis=1) / nsec
+        Mz = self.B * (Msub * sa).sum(axis=1) / nsec
+        Mb = Msub.sum(axis=1) / nsec
+
+        # relative velocity along the blade at the last condition and azimuth (as returned by the loop)
+        W = W.reshape(shape)[-1, -1, :]
+
+        return T, Y, Z, Q, My, Mz, Mb, W
+
     def evaluate(self, Uinf, Omega, pitch, coefficients=False):
         """Run the aerodynamic analysis at the specified conditions.
 
@@ -1236,60 +2180,65 @@ class CCBlade(object):
             dMb_dv = np.zeros((npts, 5, nr))
 
         azimuth_angles = np.linspace(0.0, 2 * np.pi, nsec + 1)[:-1]
-        for i in range(npts):  # iterate across conditions
-            for azimuth in azimuth_angles:  # integrate across azimuth
-                ca = np.cos(azimuth)
-                sa = np.sin(azimuth)
-
-                # contribution from this azimuthal location
-                loads, derivs = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], np.rad2deg(azimuth))
-                Np, Tp, W = (loads["Np"], loads["Tp"], loads["W"])
-
-                Tsub, Ysub, Zsub, Qsub, Msub = _bem.thrusttorque(Np, Tp, *args)
-
-                # Scale rotor quantities (thrust & torque) by num blades.  Keep blade root moment as is
-                T[i] += self.B * Tsub / nsec
-                Y[i] += self.B * (Ysub * ca - Zsub * sa) / nsec
-                Z[i] += self.B * (Zsub * ca + Ysub * sa) / nsec
-                Q[i] += self.B * Qsub / nsec
-                My[i] += self.B * Msub * ca / nsec
-                Mz[i] += self.B * Msub * sa / nsec
-                Mb[i] += Msub / nsec
-
-                if self.derivatives:
-                    # dNp = derivs["dNp"]
-                    # dTp = derivs["dTp"]
-
-                    (
-                        dT_ds_sub,
-                        dY_ds_sub,
-                        dZ_ds_sub,
-                        dQ_ds_sub,
-                        dM_ds_sub,
-                        dT_dv_sub,
-                        dY_dv_sub,
-                        dZ_dv_sub,
-                        dQ_dv_sub,
-                        dM_dv_sub,
-                    ) = self.__thrustTorqueDeriv(
-                        Np, Tp, self._dNp_dX, self._dTp_dX, self._dNp_dprecurve, self._dTp_dprecurve, *args
-                    )
+        if self.vectorized and not self.derivatives:
+            # all conditions and azimuthal sectors in one pass
+            T, Y, Z, Q, My, Mz, Mb, W = self.__evaluate_vec(Uinf, Omega, pitch, azimuth_angles)
 
-                    dT_ds[i, :] += self.B * dT_ds_sub / nsec
-                    dY_ds[i, :] += self.B * (dY_ds_sub * ca - dZ_ds_sub * sa) / nsec
-                    dZ_ds[i, :] += self.B * (dZ_ds_sub * ca + dY_ds_sub * sa) / nsec
-                    dQ_ds[i, :] += self.B * dQ_ds_sub / nsec
-                    dMy_ds[i, :] += self.B * dM_ds_sub * ca / nsec
-                    dMz_ds[i, :] += self.B * dM_ds_sub * sa / nsec
-                    dMb_ds[i, :] += dM_ds_sub / nsec
-
-                    dT_dv[i, :, :] += self.B * dT_dv_sub / nsec
-                    dY_dv[i, :, :] += self.B * (dY_dv_sub * ca - dZ_dv_sub * sa) / nsec
-                    dZ_dv[i, :, :] += self.B * (dZ_dv_sub * ca + dY_dv_sub * sa) / nsec
-                    dQ_dv[i, :, :] += self.B * dQ_dv_sub / nsec
-                    dMy_dv[i, :, :] += self.B * dM_dv_sub * ca / nsec
-                    dMz_dv[i, :, :] += self.B * dM_dv_sub * sa / nsec
-                    dMb_dv[i, :, :] += dM_dv_sub / nsec
+        else:
+            for i in range(npts):  # iterate across conditions
+                for azimuth in azimuth_angles:  # integrate across azimuth
+                    ca = np.cos(azimuth)
+                    sa = np.sin(azimuth)
+
+                    # contribution from this azimuthal location
+                    loads, derivs = self.distributedAeroLoads(Uinf[i], Omega[i], pitch[i], np.rad2deg(azimuth))
+                    Np, Tp, W = (loads["Np"], loads["Tp"], loads["W"])
+
+                    Tsub, Ysub, Zsub, Qsub, Msub = _bem.thrusttorque(Np, Tp, *args)
+
+                    # Scale rotor quantities (thrust & torque) by num blades.  Keep blade root moment as is
+                    T[i] += self.B * Tsub / nsec
+                    Y[i] += self.B * (Ysub * ca - Zsub * sa) / nsec
+                    Z[i] += self.B * (Zsub * ca + Ysub * sa) / nsec
+                    Q[i] += self.B * Qsub / nsec
+                    My[i] += self.B * Msub * ca / nsec
+                    Mz[i] += self.B * Msub * sa / nsec
+                    Mb[i] += Msub / nsec
+
+                    if self.derivatives:
+                        # dNp = derivs["dNp"]
+                        # dTp = derivs["dTp"]
+
+                        (
+                            dT_ds_sub,
+                            dY_ds_sub,
+                            dZ_ds_sub,
+                            dQ_ds_sub,
+                            dM_ds_sub,
+                            dT_dv_sub,
+                            dY_dv_sub,
+                            dZ_dv_sub,
+                            dQ_dv_sub,
+                            dM_dv_sub,
+                        ) = self.__thrustTorqueDeriv(
+                            Np, Tp, self._dNp_dX, self._dTp_dX, self._dNp_dprecurve, self._dTp_dprecurve, *args
+                        )
+
+                        dT_ds[i, :] += self.B * dT_ds_sub / nsec
+                        dY_ds[i, :] += self.B * (dY_ds_sub * ca - dZ_ds_sub * sa) / nsec
+                        dZ_ds[i, :] += self.B * (dZ_ds_sub * ca + dY_ds_sub * sa) / nsec
+                        dQ_ds[i, :] += self.B * dQ_ds_sub / nsec
+                        dMy_ds[i, :] += self.B * dM_ds_sub * ca / nsec
+                        dMz_ds[i, :] += self.B * dM_ds_sub * sa / nsec
+                        dMb_ds[i, :] += dM_ds_sub / nsec
+
+                        dT_dv[i, :, :] += self.B * dT_dv_sub / nsec
+                        dY_dv[i, :, :] += self.B * (dY_dv_sub * ca - dZ_dv_sub * sa) / nsec
+                        dZ_dv[i, :, :] += self.B * (dZ_dv_sub * ca + dY_dv_sub * sa) / nsec
+                        dQ_dv[i, :, :] += self.B * dQ_dv_sub / nsec
+                        dMy_dv[i, :, :] += self.B * dM_dv_sub * ca / nsec
+                        dMz_dv[i, :, :] += self.B * dM_dv_sub * sa / nsec
+                        dMb_dv[i, :, :] += dM_dv_sub / nsec
 
         # Power
         P = Q * Omega * np.pi / 30.0  # RPM to rad/s
@@ -2,7 +2,7 @@ import numpy as np
 from openmdao.api import ExplicitComponent
 from scipy.interpolate import PchipInterpolator
 
-from wisdem.ccblade.ccblade import CCBlade, CCAirfoil
+from wisdem.ccblade.ccblade import CCBlade, airfoil_cache
 from wisdem.commonse.csystem import DirectionVector
 
 class CCBladeLoads(ExplicitComponent):
@@ -215,7 +215,7 @@ class CCBladeLoads(ExplicitComponent):
         # airfoil files
         af = [None] * self.n_span
         for i in range(self.n_span):
-            af[i] = CCAirfoil(
+            af[i] = airfoil_cache.get(
                 inputs["airfoils_aoa"],
                 inputs["airfoils_Re"],
                 inputs["airfoils_cl"][i, :, :],
@@ -449,7 +449,7 @@ class CCBladeTwist(ExplicitComponent):
         # Create Airfoil class instances
         af = [None] * self.n_span
         for i in range(self.n_span):
-            af[i] = CCAirfoil(
+            af[i] = airfoil_cache.get(
                 inputs["airfoils_aoa"],
                 inputs["airfoils_Re"],
                 inputs["airfoils_cl"][i, :, :],
@@ -708,7 +708,7 @@ class CCBladeEvaluate(ExplicitComponent):
         # airfoil files
         af = [None] * self.n_span
         for i in range(self.n_span):
-            af[i] = CCAirfoil(
+            af[i] = airfoil_cache.get(
                 inputs["airfoils_aoa"],
                 inputs["airfoils_Re"],
                 inputs["airfoils_cl"][i, :, :],
@@ -786,7 +786,7 @@ class CCBladeEvaluate(ExplicitComponent):
         # airfoil files
         af = [None] * self.n_span
         for i in range(self.n_span):
-            af[i] = CCAirfoil(
+            af[i] = airfoil_cache.get(
                 inputs["airfoils_aoa"],
                 inputs["airfoils_Re"],
                 inputs["airfoils_cl"][i, :, :],
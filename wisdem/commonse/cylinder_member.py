@@ -2918,19 +2918,9 @@ class CylinderPostFrame(om.ExplicitComponent):
             hoop_euro = util_euro.hoopStressEurocode(d_sec, t, L_buckling, hoop_stress)
             outputs["hoop_stress_euro"] = hoop_euro
 
-            for k in range(n_dlc):
-                shell_buckling[:, k] = util_euro.shellBucklingEurocode(
-                    d[:, k],
-                    t[:, k],
-                    axial_stress[:, k],
-                    hoop_euro[:, k],
-                    shear_stress[:, k],
-                    L_buckling[:, k],
-                    E[:, k],
-                    sigma_y[:, k],
-                    gamma_f,
-                    gamma_b,
-                )
+            shell_buckling = util_euro.shellBucklingEurocode(
+                d, t, axial_stress, hoop_euro, shear_stress, L_buckling, E, sigma_y, gamma_f, gamma_b
+            )
 
             h_cyl = inputs["bending_height"]
             global_buckling = util_euro.bucklingGL(d_sec, t, Fz, M, h_cyl, E, sigma_y, gamma_f, gamma_b)
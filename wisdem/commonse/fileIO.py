@@ -1,33 +1,37 @@
 import os
+import ast
 import pickle
+import struct
+import zipfile
+from fnmatch import fnmatchcase
+
 import openmdao
 import numpy as np
 import pandas as pd
 import scipy.io as sio
 from openmdao.utils.mpi import MPI
 
-def get_variable_list(prob, rank_0=False):
+def get_variable_list(prob, rank_0=False, includes=None, excludes=None):
 
-    # Get all OpenMDAO inputs and outputs into a dictionary
-    input_dict = prob.model.list_inputs(prom_name=True, units=True, desc=True, out_stream=None) # is_indep_var=True
+    # Get all OpenMDAO inputs and outputs into a dictionary, optionally filtered
+    # by glob patterns of the promoted or absolute variable names
+    input_dict = prob.model.list_inputs(prom_name=True, units=True, desc=True, includes=includes, excludes=excludes,
+                                        out_stream=None) # is_indep_var=True
     # If MPI, share input dictionary from rank 0 to all other ranks, which would otherwise be empty
     if MPI and rank_0 == False:
         input_dict = MPI.COMM_WORLD.bcast(input_dict, root=0) 
     for k in range(len(input_dict)):
         input_dict[k][1]["type"] = "input"
 
-    inter_dict = prob.model.list_inputs(prom_name=True, units=True, desc=True, out_stream=None) # is_indep_var=False
-    # If MPI, share intermediate dictionary from rank 0 to all other ranks, which would otherwise be empty
-    if MPI and rank_0 == False:
-        inter_dict = MPI.COMM_WORLD.bcast(inter_dict, root=0)
-    for k in range(len(inter_dict)):
-        inter_dict[k][1]["type"] = "intermediate"
+    # Same listing as the inputs, so copy it rather than asking OpenMDAO again
+    inter_dict = [(name, dict(meta, type="intermediate")) for name, meta in input_dict] # is_indep_var=False
 
     #var_dict = prob.model.list_inputs(prom_name=True, units=True, desc=True, out_stream=None)
     #for k in range(len(var_dict)):
     #    var_dict[k][1]["type"] = "output"
 
-    out_dict = prob.model.list_outputs(prom_name=True, units=True, desc=True, out_stream=None)
+    out_dict = prob.model.list_outputs(prom_name=True, units=True, desc=True, includes=includes, excludes=excludes,
+                                       out_stream=None)
     # If MPI, share output dictionary from rank 0 to all other ranks, which would otherwise be empty
     if MPI and rank_0 == False:
         out_dict = MPI.COMM_WORLD.bcast(out_dict, root=0)
@@ -40,6 +44,29 @@ def get_variable_list(prob, rank_0=False):
     return input_dict, out_dict, var_dict
 
 
+def get_variable_names(prob, rank_0=False):
+    # Promoted names of all the variables of a problem, without gathering their values
+    names = [meta["prom_name"] for _, meta in prob.model.list_inputs(val=False, prom_name=True, out_stream=None)]
+    names += [meta["prom_name"] for _, meta in prob.model.list_outputs(val=False, prom_name=True, out_stream=None)]
+    # If MPI, share the names from rank 0 to all other ranks, which would otherwise be empty
+    if MPI and rank_0 == False:
+        names = MPI.COMM_WORLD.bcast(names, root=0)
+    return set(names)
+
+
+def match_names(names, includes=None, excludes=None):
+    """
+    Filter variable names by glob patterns, e.g. "rotorse.rp.*" for all names with that prefix.
+    """
+    if includes is not None:
+        includes = [includes] if isinstance(includes, str) else includes
+        names = [k for k in names if any(fnmatchcase(k, pattern) for pattern in includes)]
+    if excludes is not None:
+        excludes = [excludes] if isinstance(excludes, str) else excludes
+        names = [k for k in names if not any(fnmatchcase(k, pattern) for pattern in excludes)]
+    return list(names)
+
+
 def variable_dict2df(var_dict):
     data = {}
     data["variables"] = []
@@ -79,9 +106,34 @@ def variable_dict2df(var_dict):
     return pd.DataFrame(data)
 
 
-def save_data(fname, prob, npz_file=True, mat_file=False, xls_file=True):
+def _value2array(value):
+    # Convert a variable value to something numpy can save, None if it cannot
+    if type(value) in [type(np.array([])), type(0.0), type(0), np.float64, np.int64]:
+        return value
+    elif type(value) == type(True):
+        return np.bool_(value)
+    elif type(value) == type(""):
+        return np.str_(value)
+    elif type(value) == type([]):
+        temp_val = np.empty(len(value), dtype=object)
+        temp_val[:] = value[:]
+        return temp_val
+    return None
+
+
+def save_data(fname, prob, npz_file=True, mat_file=False, xls_file=True, col_file=False, includes=None, excludes=None):
+    """
+    Save the values of the problem variables.
+
+    A pickle of the variable table is always written. The npz, mat, xlsx/csv and
+    column files are optional. The column file (froot + "-columns.npz") stores one
+    uncompressed array per promoted variable name, along with the units,
+    descriptions and types, so it is fast to write and each variable can be read
+    on its own with ColumnArchive. includes and excludes are glob patterns of the
+    promoted or absolute variable names to limit what is saved.
+    """
     # Get the variables
-    _, _, var_dict = get_variable_list(prob, rank_0 = True)
+    _, _, var_dict = get_variable_list(prob, rank_0 = True, includes=includes, excludes=excludes)
     df = variable_dict2df(var_dict)
     
     # Remove file extension
@@ -97,23 +149,11 @@ def save_data(fname, prob, npz_file=True, mat_file=False, xls_file=True):
             unit_str = "_" + unit_str
 
         iname = var_dict[k][1]["prom_name"] + unit_str
-        value = var_dict[k][1]["val"]
+        value = _value2array(var_dict[k][1]["val"])
 
-        if iname in array_dict:
+        if iname in array_dict or value is None:
             continue
-
-        if type(value) in [type(np.array([])), type(0.0), type(0), np.float64, np.int64]:
-            array_dict[iname] = value
-        elif type(value) == type(True):
-            array_dict[iname] = np.bool_(value)
-        elif type(value) == type(""):
-            array_dict[iname] = np.str_(value)
-        elif type(value) == type([]):
-            temp_val = np.empty(len(value), dtype=object)
-            temp_val[:] = value[:]
-            array_dict[iname] = temp_val
-        # else:
-        #    print(var_dict[k])
+        array_dict[iname] = value
 
     # Pickle the full archive so that we can load it back in if we need
     df.to_pickle(froot + ".pkl")
@@ -131,10 +171,154 @@ def save_data(fname, prob, npz_file=True, mat_file=False, xls_file=True):
         df.to_excel(froot + ".xlsx", index=False)
         df.to_csv(froot + ".csv", index=False)
 
+    if col_file:
+        save_columns(froot + COLUMN_SUFFIX, var_dict)
+
+
+# Column archive: an uncompressed npz with one member per variable plus the
+# variable table, so that single variables can be read without loading the rest
+COLUMN_SUFFIX = "-columns.npz"
+_COLUMN_TABLE = ["__variables__", "__type__", "__units__", "__description__"]
+
+
+def save_columns(fname, var_dict):
+    columns = {}
+    table = {key: [] for key in _COLUMN_TABLE}
+    for k in range(len(var_dict)):
+        meta = var_dict[k][1]
+        iname = meta["prom_name"]
+        if iname in columns:
+            if meta["type"] == "output":
+                table["__type__"][table["__variables__"].index(iname)] = "output"
+            continue
+        value = _value2array(meta["val"])
+        if value is None:
+            continue
+        columns[iname] = value
+        table["__variables__"].append(iname)
+        table["__type__"].append(meta["type"])
+        table["__units__"].append("" if meta["units"] is None else meta["units"])
+        table["__description__"].append(meta["desc"])
+
+    for key in _COLUMN_TABLE:
+        columns[key] = np.array(table[key], dtype=str)
+    np.savez(fname, **columns)
+
+
+def _stored_member_offsets(fname):
+    # File offsets of the data of the uncompressed members of a zip file, by member name
+    offsets = {}
+    with zipfile.ZipFile(fname) as zf, open(fname, "rb") as f:
+        for info in zf.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                continue
+            # the local file header is 30 bytes plus the file name and extra field
+            f.seek(info.header_offset + 26)
+            name_len, extra_len = struct.unpack("<HH", f.read(4))
+            offsets[info.filename] = info.header_offset + 30 + name_len + extra_len
+    return offsets
+
+
+class ColumnArchive:
+    """
+    Lazy reader of a column archive written by save_data(..., col_file=True).
+
+    Only the variable table is read on opening; each variable is read from
+    the file when it is first accessed. With mmap_mode (as for np.load),
+    numeric arrays are memory-mapped from the file instead of read.
+    """
+
+    def __init__(self, fname, mmap_mode=None):
+        self.fname = fname
+        self.mmap_mode = mmap_mode
+        self._npz = np.load(fname, allow_pickle=True)
+        self.variables = self._npz["__variables__"].tolist()
+        self._index = {name: k for k, name in enumerate(self.variables)}
+        self._type = self._npz["__type__"]
+        self._units = self._npz["__units__"]
+        self._description = self._npz["__description__"]
+        self._offsets = _stored_member_offsets(fname) if mmap_mode is not None else {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        self._npz.close()
+
+    def __contains__(self, name):
+        return name in self._index
+
+    def __len__(self):
+        return len(self.variables)
+
+    def keys(self):
+        return list(self.variables)
+
+    def select(self, includes=None, excludes=None):
+        """
+        Names of the stored variables matching the glob patterns.
+        """
+        return match_names(self.variables, includes, excludes)
+
+    def _memmap(self, name):
+        # Memory-map a stored numeric array, None if it cannot be mapped
+        offset = self._offsets.get(name + ".npy")
+        if offset is None:
+            return None
+        with open(self.fname, "rb") as f:
+            f.seek(offset)
+            version = np.lib.format.read_magic(f)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+            elif version == (2, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+            else:
+                return None
+            offset = f.tell()
+        if dtype.hasobject or len(shape) == 0 or 0 in shape:
+            return None
+        return np.memmap(
+            self.fname, dtype=dtype, mode=self.mmap_mode, offset=offset, shape=shape, order="F" if fortran_order else "C"
+        )
+
+    def __getitem__(self, name):
+        if name not in self._index:
+            raise KeyError(f"{name} is not in the column archive")
+        value = self._memmap(name) if self.mmap_mode is not None else None
+        if value is not None:
+            return value
+        value = self._npz[name]
+        if value.dtype == object:
+            return value.tolist()
+        if value.ndim == 0:
+            return value.item()
+        return value
+
+    def units(self, name):
+        return str(self._units[self._index[name]])
+
+    def description(self, name):
+        return str(self._description[self._index[name]])
+
+    def type(self, name):
+        return str(self._type[self._index[name]])
+
+    def to_df(self, names=None):
+        names = self.variables if names is None else names
+        data = {}
+        data["variables"] = list(names)
+        data["type"] = [self.type(k) for k in names]
+        data["units"] = [self.units(k) for k in names]
+        data["values"] = [self[k] for k in names]
+        data["description"] = [self.description(k) for k in names]
+        return pd.DataFrame(data)
 
     
         
-def transfer_data(prob_from, prob_to, prefix_append=None, prefix_remove=None):
+def transfer_data(prob_from, prob_to, prefix_append=None, prefix_remove=None, includes=None, excludes=None):
 
     if prefix_append is None:
         prefix_append = ''
@@ -145,32 +329,51 @@ def transfer_data(prob_from, prob_to, prefix_append=None, prefix_remove=None):
     # Get FROM data as DF
     if isinstance(prob_from, pd.DataFrame):
         var_df_from = prob_from
+    elif isinstance(prob_from, ColumnArchive):
+        var_df_from = None
     elif isinstance(prob_from, openmdao.core.problem.Problem):
         _, _, var_dict_from = get_variable_list(prob_from)
         var_df_from = variable_dict2df(var_dict_from)
     
-    # Get TO data as DF
+    # Get TO variable names, as a set for quick lookups
     if isinstance(prob_to, pd.DataFrame):
-        var_df_to = prob_to
+        valid_vars_to = set(prob_to["variables"])
     else:
-        _, _, var_dict_to = get_variable_list(prob_to)
-        var_df_to = variable_dict2df(var_dict_to)
-    valid_vars_to = list(var_df_to["variables"])
+        valid_vars_to = get_variable_names(prob_to)
 
-    # Set the variables
-    for k in range(len(var_df_from)):
-        # Guess at the proper variable name
-        invar_name = var_df_from["variables"].iloc[k]
-        invar_units = var_df_from["units"].iloc[k]
+    # Map the FROM names to the TO names, guessing at the proper variable name
+    if var_df_from is None:
+        names_from = prob_from.variables
+        units_from = [prob_from.units(k) for k in names_from]
+    else:
+        names_from = var_df_from["variables"].tolist()
+        units_from = var_df_from["units"].tolist()
+    name_map = {}
+    for k, (invar_name, invar_units) in enumerate(zip(names_from, units_from)):
         local_name = prefix_append + invar_name.replace(prefix_remove,"")
         local_name2 = local_name.replace(f"_{invar_units}", "")
+        if local_name in valid_vars_to:
+            name_map[local_name] = k
+        elif local_name2 in valid_vars_to:
+            name_map[local_name2] = k
+
+    # Only restore the requested variables
+    if includes is not None or excludes is not None:
+        name_map = {name: name_map[name] for name in match_names(name_map, includes, excludes)}
 
+    # Set the variables
+    if var_df_from is not None:
+        values_from = var_df_from["values"].tolist()
+    for local_name, k in name_map.items():
         # Restore the type of the input data
-        ival = var_df_from["values"].iloc[k]
+        ival = prob_from[names_from[k]] if var_df_from is None else values_from[k]
         if isinstance(ival, (np.ndarray, float, int, list, dict)):
             pass
         elif isinstance(ival, str) and (ival.startswith('[') or ival.startswith('{')):
-            ival = eval(ival)
+            try:
+                ival = ast.literal_eval(ival)
+            except (ValueError, SyntaxError):
+                continue  # e.g. tables written as text to csv or xlsx, which cannot be restored
         else:
             try:
                 ival = float(ival)
@@ -178,15 +381,18 @@ def transfer_data(prob_from, prob_to, prefix_append=None, prefix_remove=None):
                 pass
 
         # Store the value
-        if local_name in valid_vars_to:
-            prob_to[local_name] = ival
-        elif local_name2 in valid_vars_to:
-            prob_to[local_name2] = ival
+        prob_to[local_name] = ival
 
     return prob_to
 
 
-def load_data(fname, prob, prefix_append=None, prefix_remove=None):
+def load_data(fname, prob, prefix_append=None, prefix_remove=None, includes=None, excludes=None):
+    """
+    Restore the problem variables from a file written by save_data, or from
+    another problem or table. includes and excludes are glob patterns of the
+    variable names to restore, e.g. "rotorse.*". Column archives are read
+    lazily, so only the restored variables are read from the file.
+    """
 
     # Extracting from npz
     def npz2df(obj):
@@ -194,7 +400,7 @@ def load_data(fname, prob, prefix_append=None, prefix_remove=None):
         data["variables"] = []
         data["units"] = []
         data["values"] = []
-        for k in range(len(wt_obj.files)):
+        for k in range(len(obj.files)):
             iname = obj.files[k]
             iunit = iname.split('_')[-1]
             ival = obj[iname]
@@ -212,6 +418,14 @@ def load_data(fname, prob, prefix_append=None, prefix_remove=None):
     elif isinstance(fname, str) and fname.endswith(".csv"):
         mydf = pd.read_csv(fname)
         
+    elif isinstance(fname, str) and fname.endswith(COLUMN_SUFFIX):
+        with ColumnArchive(fname) as archive:
+            return transfer_data(archive, prob, prefix_append=prefix_append, prefix_remove=prefix_remove,
+                                 includes=includes, excludes=excludes)
+
+    elif isinstance(fname, ColumnArchive):
+        mydf = fname
+
     elif isinstance(fname, str) and fname.endswith(".npz"):
         wt_obj = np.load(fname, allow_pickle=True)
         mydf = npz2df(wt_obj)
@@ -226,6 +440,7 @@ def load_data(fname, prob, prefix_append=None, prefix_remove=None):
         mydf = fname
 
     else:
-        raise Exception(f"Unknown file type, {fname}.  Expected xlsx or csv or npz or pkl")
+        raise Exception(f"Unknown file type, {fname}.  Expected xlsx or csv or npz or pkl or {COLUMN_SUFFIX}")
     
-    return transfer_data(mydf, prob, prefix_append=prefix_append, prefix_remove=prefix_remove)
+    return transfer_data(mydf, prob, prefix_append=prefix_append, prefix_remove=prefix_remove,
+                         includes=includes, excludes=excludes)
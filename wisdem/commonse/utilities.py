@@ -777,8 +777,32 @@ def sectional2nodal(x):
 
 
 def cubic_spline_eval(x1, x2, f1, f2, g1, g2, x):
-    spline = CubicSplineSegment(x1, x2, f1, f2, g1, g2)
-    return spline.eval(x)
+    """Cubic through (x1, f1) and (x2, f2) with slopes g1 and g2, evaluated at x.
+    All arguments broadcast together, so that many segments can be evaluated at once."""
+    if np.ndim(x1) == np.ndim(x2) == np.ndim(f1) == np.ndim(f2) == np.ndim(g1) == np.ndim(g2) == 0:
+        spline = CubicSplineSegment(x1, x2, f1, f2, g1, g2)
+        return spline.eval(x)
+
+    args = [np.asarray(v, dtype=np.float64) for v in [x1, x2, f1, f2, g1, g2, x]]
+    x1, x2, f1, f2, g1, g2, x = np.broadcast_arrays(*args)
+    one, zero = np.ones_like(x1), np.zeros_like(x1)
+    A = np.stack(
+        [
+            np.stack([x1**3, x1**2, x1, one], axis=-1),
+            np.stack([x2**3, x2**2, x2, one], axis=-1),
+            np.stack([3 * x1**2, 2 * x1, one, zero], axis=-1),
+            np.stack([3 * x2**2, 2 * x2, one, zero], axis=-1),
+        ],
+        axis=-2,
+    )
+    b = np.stack([f1, f2, g1, g2], axis=-1)
+    coeff = np.linalg.solve(A, b[..., np.newaxis])[..., 0]
+
+    # Horner's scheme, in the same order as CubicSplineSegment.eval
+    y = coeff[..., 0]
+    for k in range(1, 4):
+        y = coeff[..., k] + y * x
+    return y
 
 
 class CubicSplineSegment(object):
@@ -87,6 +87,9 @@ def shellBucklingEurocode(d, t, sigma_z, sigma_t, tau_zt, L_reinforced, E, sigma
     gamma_f - safety factor for stresses
     gamma_b - safety factor for buckling
 
+    All section arrays may carry trailing dimensions (e.g. one column per load case), in which
+    case d has one more row than t and the whole grid is evaluated in one call.
+
     Returns:
     z
     EU_utilization: - array of shell buckling utilizations evaluted at (z[0] at npt locations, \n
@@ -94,36 +97,22 @@ def shellBucklingEurocode(d, t, sigma_z, sigma_t, tau_zt, L_reinforced, E, sigma
                       Each utilization must be < 1 to avoid failure.
     """
 
+    d = np.asarray(d, dtype=float)
+    t = np.asarray(t, dtype=float)
     n = len(t)
-    EU_utilization = np.zeros(n)
-    sigma_z_sh = np.zeros(n)
-    sigma_t_sh = np.zeros(n)
-    tau_zt_sh = np.zeros(n)
-
-    for i in range(n):
-        h = L_reinforced[i]
 
-        r1 = d[i] / 2.0 - t[i] / 2.0
-        r2 = d[i + 1] / 2.0 - t[i] / 2.0
+    r1 = d[:n] / 2.0 - t / 2.0
+    r2 = d[1 : n + 1] / 2.0 - t / 2.0
 
-        sigma_z_shell = sigma_z[i]
-        sigma_t_shell = sigma_t[i]
-        tau_zt_shell = tau_zt[i]
+    # TODO: the following is non-smooth, although in general its probably OK
+    # change to magnitudes and add safety factor
+    sigma_z_shell = gamma_f * np.abs(sigma_z)
+    sigma_t_shell = gamma_f * np.abs(sigma_t)
+    tau_zt_shell = gamma_f * np.abs(tau_zt)
 
-        # TODO: the following is non-smooth, although in general its probably OK
-        # change to magnitudes and add safety factor
-        sigma_z_shell = gamma_f * abs(sigma_z_shell)
-        sigma_t_shell = gamma_f * abs(sigma_t_shell)
-        tau_zt_shell = gamma_f * abs(tau_zt_shell)
-
-        EU_utilization[i] = _shellBucklingOneSection(
-            h, r1, r2, t[i], gamma_b, sigma_z_shell, sigma_t_shell, tau_zt_shell, E[i], sigma_y[i]
-        )
-
-        # make them into vectors
-        sigma_z_sh[i] = sigma_z_shell
-        sigma_t_sh[i] = sigma_t_shell
-        tau_zt_sh[i] = tau_zt_shell
+    EU_utilization = _shellBucklingOneSection(
+        L_reinforced, r1, r2, t, gamma_b, sigma_z_shell, sigma_t_shell, tau_zt_shell, E, sigma_y
+    )
 
     return EU_utilization  # this is utilization must be <1
 
@@ -141,69 +130,62 @@ def _cxsmooth(omega, rovert):
     ptL3 = (0.5 + Cxb) * rovert - 1.0
     ptR3 = (0.5 + Cxb) * rovert + 1.0
 
-    if omega < ptL1:
-        Cx = constant - 1.83 / omega + 2.07 / omega**2
-
-    elif omega >= ptL1 and omega <= ptR1:
-        fL = constant - 1.83 / ptL1 + 2.07 / ptL1**2
-        fR = 1.0
-        gL = 1.83 / ptL1**2 - 4.14 / ptL1**3
-        gR = 0.0
-        Cx = cubic_spline_eval(ptL1, ptR1, fL, fR, gL, gR, omega)
-
-    elif omega > ptR1 and omega < ptL2:
-        Cx = 1.0
-
-    elif omega >= ptL2 and omega <= ptR2:
-        fL = 1.0
-        fR = 1 + 0.2 / Cxb * (1 - 2.0 * ptR2 / rovert)
-        gL = 0.0
-        gR = -0.4 / Cxb / rovert
-        Cx = cubic_spline_eval(ptL2, ptR2, fL, fR, gL, gR, omega)
-
-    elif omega > ptR2 and omega < ptL3:
-        Cx = 1 + 0.2 / Cxb * (1 - 2.0 * omega / rovert)
-
-    elif omega >= ptL3 and omega <= ptR3:
-        fL = 1 + 0.2 / Cxb * (1 - 2.0 * ptL3 / rovert)
-        fR = 0.6
-        gL = -0.4 / Cxb / rovert
-        gR = 0.0
-        Cx = cubic_spline_eval(ptL3, ptR3, fL, fR, gL, gR, omega)
-
-    else:
-        Cx = 0.6
+    fL1 = constant - 1.83 / ptL1 + 2.07 / ptL1**2
+    gL1 = 1.83 / ptL1**2 - 4.14 / ptL1**3
+    fR2 = 1 + 0.2 / Cxb * (1 - 2.0 * ptR2 / rovert)
+    gR2 = -0.4 / Cxb / rovert
+    fL3 = 1 + 0.2 / Cxb * (1 - 2.0 * ptL3 / rovert)
+    gL3 = -0.4 / Cxb / rovert
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Cx = np.select(
+            [
+                omega < ptL1,
+                omega <= ptR1,
+                omega < ptL2,
+                omega <= ptR2,
+                omega < ptL3,
+                omega <= ptR3,
+            ],
+            [
+                constant - 1.83 / omega + 2.07 / omega**2,
+                cubic_spline_eval(ptL1, ptR1, fL1, 1.0, gL1, 0.0, omega),
+                1.0,
+                cubic_spline_eval(ptL2, ptR2, 1.0, fR2, 0.0, gR2, omega),
+                1 + 0.2 / Cxb * (1 - 2.0 * omega / rovert),
+                cubic_spline_eval(ptL3, ptR3, fL3, 0.6, gL3, 0.0, omega),
+            ],
+            0.6,
+        )
 
     return Cx
 
 
 def _sigmasmooth(omega, E, rovert):
     Ctheta = 1.5  # clamped-clamped
+    alpha1 = 0.92 / 1.63 - 2.03 / 1.63**4
 
     ptL = 1.63 * rovert * Ctheta - 1
     ptR = 1.63 * rovert * Ctheta + 1
 
-    if omega < 20.0 * Ctheta:
+    with np.errstate(divide="ignore", invalid="ignore"):
         offset = 10.0 / (20 * Ctheta) ** 2 - 5 / (20 * Ctheta) ** 3
         Cthetas = 1.5 + 10.0 / omega**2 - 5 / omega**3 - offset
-        sigma = 0.92 * E * Cthetas / omega / rovert
-
-    elif omega >= 20.0 * Ctheta and omega < ptL:
-        sigma = 0.92 * E * Ctheta / omega / rovert
-
-    elif omega >= ptL and omega <= ptR:
-        alpha1 = 0.92 / 1.63 - 2.03 / 1.63**4
 
         fL = 0.92 * E * Ctheta / ptL / rovert
         fR = E * (1.0 / rovert) ** 2 * (alpha1 + 2.03 * (Ctheta / ptR * rovert) ** 4)
         gL = -0.92 * E * Ctheta / rovert / ptL**2
         gR = -E * (1.0 / rovert) * 2.03 * 4 * (Ctheta / ptR * rovert) ** 3 * Ctheta / ptR**2
 
-        sigma = cubic_spline_eval(ptL, ptR, fL, fR, gL, gR, omega)
-
-    else:
-        alpha1 = 0.92 / 1.63 - 2.03 / 1.63**4
-        sigma = E * (1.0 / rovert) ** 2 * (alpha1 + 2.03 * (Ctheta / omega * rovert) ** 4)
+        sigma = np.select(
+            [omega < 20.0 * Ctheta, omega < ptL, omega <= ptR],
+            [
+                0.92 * E * Cthetas / omega / rovert,
+                0.92 * E * Ctheta / omega / rovert,
+                cubic_spline_eval(ptL, ptR, fL, fR, gL, gR, omega),
+            ],
+            E * (1.0 / rovert) ** 2 * (alpha1 + 2.03 * (Ctheta / omega * rovert) ** 4),
+        )
 
     return sigma
 
@@ -215,35 +197,27 @@ def _tausmooth(omega, rovert):
     ptL2 = 8.7 * rovert - 1
     ptR2 = 8.7 * rovert + 1
 
-    if omega < ptL1:
-        C_tau = np.sqrt(1.0 + 42.0 / omega**3 - 42.0 / 10**3)
-
-    elif omega >= ptL1 and omega <= ptR1:
-        fL = np.sqrt(1.0 + 42.0 / ptL1**3 - 42.0 / 10**3)
-        fR = 1.0
-        gL = -63.0 / ptL1**4 / fL
-        gR = 0.0
-        C_tau = cubic_spline_eval(ptL1, ptR1, fL, fR, gL, gR, omega)
-
-    elif omega > ptR1 and omega < ptL2:
-        C_tau = 1.0
-
-    elif omega >= ptL2 and omega <= ptR2:
-        fL = 1.0
-        fR = 1.0 / 3.0 * np.sqrt(ptR2 / rovert) + 1 - np.sqrt(8.7) / 3
-        gL = 0.0
-        gR = 1.0 / 6 / np.sqrt(ptR2 * rovert)
-        C_tau = cubic_spline_eval(ptL2, ptR2, fL, fR, gL, gR, omega)
-
-    else:
-        C_tau = 1.0 / 3.0 * np.sqrt(omega / rovert) + 1 - np.sqrt(8.7) / 3
+    fL1 = np.sqrt(1.0 + 42.0 / ptL1**3 - 42.0 / 10**3)
+    fR2 = 1.0 / 3.0 * np.sqrt(ptR2 / rovert) + 1 - np.sqrt(8.7) / 3
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        C_tau = np.select(
+            [omega < ptL1, omega <= ptR1, omega < ptL2, omega <= ptR2],
+            [
+                np.sqrt(1.0 + 42.0 / omega**3 - 42.0 / 10**3),
+                cubic_spline_eval(ptL1, ptR1, fL1, 1.0, -63.0 / ptL1**4 / fL1, 0.0, omega),
+                1.0,
+                cubic_spline_eval(ptL2, ptR2, 1.0, fR2, 0.0, 1.0 / 6 / np.sqrt(ptR2 * rovert), omega),
+            ],
+            1.0 / 3.0 * np.sqrt(omega / rovert) + 1 - np.sqrt(8.7) / 3,
+        )
 
     return C_tau
 
 
 def _shellBucklingOneSection(h, r1, r2, t, gamma_b, sigma_z, sigma_t, tau_zt, E, sigma_y):
     """
-    Estimate shell buckling for one tapered cylindrical shell section.
+    Estimate shell buckling for tapered cylindrical shell sections, elementwise on arrays.
 
     Arguments:
     h - height of conical section
@@ -397,23 +371,23 @@ def _buckling_reduction_factor(alpha, beta, eta, lambda_0, lambda_bar):
     ptL = 0.9 * lambda_0
     ptR = 1.1 * lambda_0
 
-    if lambda_bar < ptL:
-        chi = 1.0
-
-    elif lambda_bar >= ptL and lambda_bar <= ptR:  # cubic spline section
-        fracR = (ptR - lambda_0) / (lambda_p - lambda_0)
-        fL = 1.0
-        fR = 1 - beta * fracR**eta
-        gL = 0.0
-        gR = -beta * eta * fracR ** (eta - 1) / (lambda_p - lambda_0)
-
-        chi = cubic_spline_eval(ptL, ptR, fL, fR, gL, gR, lambda_bar)
-
-    elif lambda_bar > ptR and lambda_bar < lambda_p:
-        chi = 1.0 - beta * ((lambda_bar - lambda_0) / (lambda_p - lambda_0)) ** eta
-
-    else:
-        chi = alpha / lambda_bar**2
+    # cubic spline section
+    fracR = (ptR - lambda_0) / (lambda_p - lambda_0)
+    fL = 1.0
+    fR = 1 - beta * fracR**eta
+    gL = 0.0
+    gR = -beta * eta * fracR ** (eta - 1) / (lambda_p - lambda_0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        chi = np.select(
+            [lambda_bar < ptL, lambda_bar <= ptR, lambda_bar < lambda_p],
+            [
+                1.0,
+                cubic_spline_eval(ptL, ptR, fL, fR, gL, gR, lambda_bar),
+                1.0 - beta * ((lambda_bar - lambda_0) / (lambda_p - lambda_0)) ** eta,
+            ],
+            alpha / lambda_bar**2,
+        )
 
     # if (lambda_bar <= lambda_0):
     #     chi = 1.0
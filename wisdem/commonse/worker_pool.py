@@ -0,0 +1,130 @@
+"""
+Local worker pools shared by the parallel evaluations of WISDEM.
+
+All pools follow the same policy.  No pool is used under MPI, where the
+ranks already share the work.  Worker processes are forked from the calling
+process, so they inherit its state, e.g. a set-up model, and process pools
+are only used where processes can be forked.  Where a pool cannot be used,
+or fails to start or loses a worker, the caller evaluates serially instead;
+a failed pool is reported with a warning.  Exceptions raised by the
+evaluated functions themselves propagate to the caller.
+"""
+
+import multiprocessing
+from concurrent.futures import BrokenExecutor, ThreadPoolExecutor, ProcessPoolExecutor
+
+from openmdao.utils.mpi import MPI
+
+# function and state of fork_map, inherited by the forked workers
+_fork_state = None
+
+
+def pools_available(threads=False):
+    """
+    True if a local pool of worker processes, or of threads, can be used.
+    """
+    if MPI:
+        return False
+    return threads or "fork" in multiprocessing.get_all_start_methods()
+
+
+class WorkerPool:
+    """
+    Pool of forked worker processes, or of threads, alive until shut down.
+
+    The pool is unavailable, and map returns None, under MPI or where
+    processes cannot be forked.
+
+    Parameters
+    ----------
+    n_workers : int
+        Number of worker processes or threads.
+    name : str
+        Name of the pool in the warnings.
+    threads : bool
+        Use threads instead of processes.
+    initializer, initargs :
+        As for concurrent.futures.ProcessPoolExecutor, called once in each worker.
+    """
+
+    def __init__(self, n_workers, name, threads=False, initializer=None, initargs=()):
+        self.name = name
+        self.executor = None
+        if not pools_available(threads):
+            return
+        if threads:
+            self.executor = ThreadPoolExecutor(max_workers=n_workers, initializer=initializer, initargs=initargs)
+        else:
+            self.executor = ProcessPoolExecutor(
+                max_workers=n_workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=initializer,
+                initargs=initargs,
+            )
+
+    @property
+    def available(self):
+        """whether the pool can evaluate, i.e. it is neither unavailable, failed nor shut down"""
+        return self.executor is not None
+
+    def map(self, func, *iterables):
+        """
+        Results of func over the iterables, evaluated on the workers one item at a time.
+
+        Returns
+        -------
+        list or None
+            results in the order of the items, or None if the pool is not
+            available or has failed, in which case the caller evaluates serially
+        """
+        if self.executor is None:
+            return None
+        try:
+            futures = [self.executor.submit(func, *args) for args in zip(*iterables)]
+            return [f.result() for f in futures]
+        except (OSError, BrokenExecutor) as err:
+            print(f" WARNING** {self.name} pool failed ({err}); running serially")
+            self.shutdown(wait=False, cancel_futures=True)
+            return None
+
+    def shutdown(self, wait=True, cancel_futures=False):
+        """
+        Stop the workers, the pool is unavailable afterwards.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+            self.executor = None
+
+
+def _run_forked(i):
+    # run on a forked worker
+    func, state = _fork_state
+    return func(state, i)
+
+
+def fork_map(func, state, n_tasks, n_workers, name):
+    """
+    Results of func(state, i) for i in range(n_tasks), on a temporary pool of forked workers.
+
+    The state is inherited by the workers rather than pickled, so it may hold
+    e.g. a set-up OpenMDAO model, and the workers' changes to it are not seen
+    by the calling process.  Only the results of func are pickled.
+
+    Returns
+    -------
+    list or None
+        results in the order of the tasks, or None if n_workers < 2 or under
+        the conditions of WorkerPool.map, in which case the caller evaluates serially
+    """
+    global _fork_state
+
+    n_workers = min(n_workers, n_tasks)
+    if n_workers < 2 or not pools_available():
+        return None
+    pool = WorkerPool(n_workers, name)
+    _fork_state = (func, state)
+    try:
+        return pool.map(_run_forked, range(n_tasks))
+    finally:
+        _fork_state = None
+        pool.shutdown()
@@ -420,11 +420,9 @@ class ComputeFrame3DD(om.ExplicitComponent):
 
         # ------ options ------------
         dx = -1.0
-        options = pyframe3dd.Options(
-            mod_opt["WISDEM"]["FixedBottomSE"]["frame3dd"]["shear"],
-            mod_opt["WISDEM"]["FixedBottomSE"]["frame3dd"]["geom"],
-            dx,
-        )
+        frame3dd_opt = mod_opt["WISDEM"]["FixedBottomSE"]["frame3dd"]
+        sparse = frame3dd_opt["sparse"] if "sparse" in frame3dd_opt else False
+        options = pyframe3dd.Options(frame3dd_opt["shear"], frame3dd_opt["geom"], dx, sparse)
         # -----------------------------------
 
         # initialize frame3dd object
@@ -512,7 +512,8 @@ class MonopileFrame(om.ExplicitComponent):
 
         # ------ options ------------
         dx = -1.0
-        options = pyframe3dd.Options(frame3dd_opt["shear"], frame3dd_opt["geom"], dx)
+        sparse = frame3dd_opt["sparse"] if "sparse" in frame3dd_opt else False
+        options = pyframe3dd.Options(frame3dd_opt["shear"], frame3dd_opt["geom"], dx, sparse)
         # -----------------------------------
 
         # initialize frame3dd object
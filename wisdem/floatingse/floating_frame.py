@@ -217,7 +217,8 @@ class FrameAnalysis(om.ExplicitComponent):
         react_obj = pyframe3dd.ReactionData(rid + 1, Rx, Ry, Rz, Rxx, Ryy, Rzz, rigid=RIGID)
 
         frame3dd_opt = opt["WISDEM"]["FloatingSE"]["frame3dd"]
-        opt_obj = pyframe3dd.Options(frame3dd_opt["shear"], frame3dd_opt["geom"], -1.0)
+        sparse = frame3dd_opt["sparse"] if "sparse" in frame3dd_opt else False
+        opt_obj = pyframe3dd.Options(frame3dd_opt["shear"], frame3dd_opt["geom"], -1.0, sparse)
 
         myframe = pyframe3dd.Frame(node_obj, react_obj, elem_obj, opt_obj)
 
@@ -435,7 +436,8 @@ class TowerModal(om.ExplicitComponent):
 
         # ------ options ------------
         dx = -1.0
-        options = pyframe3dd.Options(frame3dd_opt["shear"], frame3dd_opt["geom"], dx)
+        sparse = frame3dd_opt["sparse"] if "sparse" in frame3dd_opt else False
+        options = pyframe3dd.Options(frame3dd_opt["shear"], frame3dd_opt["geom"], dx, sparse)
         # -----------------------------------
 
         # initialize frame3dd object
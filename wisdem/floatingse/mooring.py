@@ -1,3 +1,5 @@
+import os
+
 import numpy as np
 import openmdao.api as om
 
@@ -5,10 +7,179 @@ import moorpy as mp
 import moorpy.MoorProps as props
 from moorpy.helpers import getLineProps
 
+from wisdem.commonse.worker_pool import fork_map
+
 NLINES_MAX = 15
 NPTS_PLOT = 101
 
 
+def mooring_symmetry(ms, tol=1e-6):
+    """
+    Symmetry of the mooring lines of a MoorPy system about the vertical axis through the origin.
+
+    Lines match when their end points coincide after the transformation, within
+    tol relative to the size of the layout, and they have the same length, line
+    type and ends attached to the bodies.
+
+    Parameters
+    ----------
+    ms : moorpy.System
+        initialized mooring system, with the bodies at their neutral position
+    tol : float
+        relative tolerance on the positions of the line ends
+
+    Returns
+    -------
+    n_rot : int
+        order of the rotational symmetry, the lines map onto themselves under rotations by 2*pi/n_rot
+    mirror : bool
+        whether the lines also map onto themselves when mirrored about the x-z plane
+    """
+    body_ends = set()
+    for body in ms.bodyList:
+        for ip in body.attachedP:
+            point = ms.pointList[ip - 1]
+            body_ends.update(zip(point.attached, point.attachedEndB))
+    ends = np.array([np.r_[line.rA, line.rB] for line in ms.lineList])
+    lineprops = [
+        (line.L, line.type["name"], (line.number, 0) in body_ends, (line.number, 1) in body_ends)
+        for line in ms.lineList
+    ]
+    tol *= max(1.0, np.abs(ends).max())
+
+    def maps_onto(T):
+        moved = np.c_[ends[:, :3] @ T.T, ends[:, 3:] @ T.T]
+        for k in range(len(moved)):
+            close = np.flatnonzero(np.abs(ends - moved[k]).max(axis=1) < tol)
+            if not any(lineprops[j] == lineprops[k] for j in close):
+                return False
+        return True
+
+    n_lines = len(ms.lineList)
+    n_rot = 1
+    for n in range(n_lines, 1, -1):
+        if n_lines % n == 0:
+            c, s = np.cos(2 * np.pi / n), np.sin(2 * np.pi / n)
+            if maps_onto(np.array([[c, -s, 0.0], [s, c, 0.0], [0.0, 0.0, 1.0]])):
+                n_rot = n
+                break
+    mirror = maps_onto(np.diag([1.0, -1.0, 1.0]))
+    return n_rot, mirror
+
+
+def _sweep_block(ms, offset, headings):
+    # Solve the offset headings in order, each catenary solve starting from the line forces of the previous heading
+    Frestore = np.zeros(len(headings))
+    Tmax = np.zeros(len(headings))
+    for ia, a in enumerate(headings):
+        # Unit vector and offset in x-y components
+        idir = np.array([np.cos(a), np.sin(a)])
+        fbody = ms.mooringEq([offset * idir[0], offset * idir[1], 0, 0, 0, 0], DOFtype="coupled")
+        Frestore[ia] = np.dot(fbody[:2], idir)
+        Tmax[ia] = max(max(line.TA, line.TB) for line in ms.lineList)
+    return Frestore, Tmax
+
+
+def _sweep_worker(state, i):
+    # run on a forked worker holding a copy of the mooring system
+    ms, offset, blocks = state
+    return _sweep_block(ms, offset, blocks[i])
+
+
+def sweep_offsets(ms, offset, headings, n_workers=1):
+    """
+    Restoring force and largest line tension with the coupled body offset at each heading.
+
+    The headings are solved in the order given, warm starting every catenary
+    solve from the previous heading, so neighbouring headings should follow
+    each other.  With n_workers > 1 the headings are split in contiguous
+    blocks solved on forked worker processes, each block starting from the
+    current state of the system.  The sweep runs serially under MPI and
+    where processes cannot be forked.
+
+    Parameters
+    ----------
+    ms : moorpy.System
+        mooring system with a single coupled body
+    offset : float, [m]
+        horizontal offset of the body
+    headings : numpy array, [rad]
+        directions of the offset
+    n_workers : int
+        number of worker processes
+
+    Returns
+    -------
+    Frestore : numpy array, [N]
+        mooring force on the body along the offset direction
+    Tmax : numpy array, [N]
+        largest end tension of all lines
+    """
+    headings = np.asarray(headings, dtype=np.float64)
+    n_workers = min(n_workers, len(headings))
+    if n_workers > 1:
+        blocks = np.array_split(headings, n_workers)
+        results = fork_map(_sweep_worker, (ms, offset, blocks), n_workers, n_workers, "Mooring sweep")
+        if results is not None:
+            return tuple(np.concatenate(out) for out in zip(*results))
+
+    return _sweep_block(ms, offset, headings)
+
+
+def mooring_offset_sweep(ms, offset, resolution=5.0, refinement=0, symmetry=True, n_workers=1):
+    """
+    Sweep the offset of the coupled body around all headings for the weakest restoring force and largest line tension.
+
+    When the line pattern is symmetric, only the headings of one symmetry
+    sector are solved: 2*pi/n_rot for a rotational symmetry of order n_rot,
+    half of that if the pattern is also mirror symmetric.  The sector is
+    sampled at the requested resolution, then the heading step around the
+    weakest restoring force is halved refinement times.
+
+    Parameters
+    ----------
+    ms : moorpy.System
+        mooring system with a single coupled body at its neutral position
+    offset : float, [m]
+        horizontal offset of the body
+    resolution : float, [deg]
+        largest heading step of the sweep
+    refinement : int
+        number of bisections of the heading step around the weakest restoring force
+    symmetry : bool
+        whether to reduce the sweep to one symmetry sector of the line pattern
+    n_workers : int
+        number of worker processes for the sweep, see sweep_offsets
+
+    Returns
+    -------
+    headings : numpy array, [rad]
+        headings solved, in increasing order
+    Frestore : numpy array, [N]
+        mooring force on the body along the offset direction at each heading
+    Tmax : numpy array, [N]
+        largest end tension of all lines at each heading
+    """
+    n_rot, mirror = mooring_symmetry(ms) if symmetry else (1, False)
+    sector = (np.pi if mirror else 2 * np.pi) / n_rot
+    n_steps = max(1, int(np.ceil(np.rad2deg(sector) / resolution - 1e-6)))
+    step = sector / n_steps
+    headings = step * np.arange(n_steps + 1 if mirror else n_steps)
+    Frestore, Tmax = sweep_offsets(ms, offset, headings, n_workers)
+
+    for _ in range(refinement):
+        step *= 0.5
+        a_min = headings[np.argmin(np.abs(Frestore))]
+        new_headings = np.array([a_min - step, a_min + step])
+        new_Frestore, new_Tmax = sweep_offsets(ms, offset, new_headings)
+        headings = np.r_[headings, new_headings]
+        Frestore = np.r_[Frestore, new_Frestore]
+        Tmax = np.r_[Tmax, new_Tmax]
+
+    isort = np.argsort(headings)
+    return headings[isort], Frestore[isort], Tmax[isort]
+
+
 class Mooring(om.ExplicitComponent):
     """
     Sets mooring line properties then writes MAP input file and executes MAP.
@@ -287,31 +458,24 @@ class Mooring(om.ExplicitComponent):
         )
         outputs["constr_anchor_vertical"] = inputs["anchor_max_vertical_load"] - F_anch[:, -1] * gamma
 
-        # Get angles by which to find the weakest line
-        dangle = 5.0
-        angles = np.deg2rad(np.arange(0.0, 360.0, dangle))
-        nangles = angles.size
-
-        # Get restoring force at weakest line at maximum allowable offset
-        # Will global minimum always be along mooring angle?
-        Frestore = np.zeros(nangles)
-        Tmax = np.zeros(nangles)
-        Fa = np.zeros(n_lines)
-        # Loop around all angles to find weakest point
-        for ia, a in enumerate(angles):
-            # Unit vector and offset in x-y components
-            idir = np.array([np.cos(a), np.sin(a)])
-            surge = offset * idir[0]
-            sway = offset * idir[1]
-
-            # Get restoring force of offset at this angle
-            fbody = ms.mooringEq([surge, sway, 0, 0, 0, 0], DOFtype="coupled")
-            Frestore[ia] = np.dot(fbody[:2], idir)
-            for k in range(n_lines):
-                f = ms.lineList[0].TB
-                Fa[k] = np.sqrt(np.sum(f**2))
-
-            Tmax[ia] = np.abs(Fa).max()
+        # Sweep the maximum allowable offset around the headings to find the weakest restoring force
+        sweep_options = {"heading_resolution": 5.0, "heading_refinement": 0, "heading_symmetry": True, "n_workers": 1}
+        for k in sweep_options:
+            if k in self.options["options"]:
+                sweep_options[k] = self.options["options"][k]
+        n_workers = sweep_options["n_workers"]
+        if n_workers == 0:
+            n_workers = os.cpu_count()
+        # Back to the neutral position, which the sweep needs for the symmetry and warm starts from
+        ms.mooringEq(np.zeros(6), DOFtype="coupled")
+        _, Frestore, Tmax = mooring_offset_sweep(
+            ms,
+            offset,
+            resolution=sweep_options["heading_resolution"],
+            refinement=sweep_options["heading_refinement"],
+            symmetry=sweep_options["heading_symmetry"],
+            n_workers=n_workers,
+        )
 
         # Store the weakest restoring force when the vessel is offset the maximum amount
         outputs["max_surge_restoring_force"] = np.abs(Frestore).min()
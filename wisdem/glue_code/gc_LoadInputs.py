@@ -557,6 +557,8 @@ class WindTurbineOntologyPython(object):
             self.modeling_options["mooring"]["symmetric"] = self.modeling_options["WISDEM"]["FloatingSE"][
                 "symmetric_moorings"
             ]
+            for k in ["heading_resolution", "heading_refinement", "heading_symmetry", "n_workers"]:
+                self.modeling_options["mooring"][k] = self.modeling_options["WISDEM"]["FloatingSE"]["mooring_" + k]
             self.modeling_options["mooring"]["n_nodes"] = n_nodes
             self.modeling_options["mooring"]["n_lines"] = n_lines
             self.modeling_options["mooring"]["n_anchors"] = np.sum(
@@ -2,8 +2,10 @@ import os
 
 import numpy as np
 import openmdao.api as om
+from openmdao.utils.mpi import MPI
 from scipy.interpolate import PchipInterpolator
 from wisdem.optimization_drivers.nsga2_driver import NSGA2Driver
+from wisdem.optimization_drivers.parallel_fd import approx_totals
 
 class PoseOptimization(object):
     def __init__(self, wt_init, modeling_options, analysis_options):
@@ -94,6 +96,15 @@ class PoseOptimization(object):
 
         return wt_opt
 
+    def _set_cache_file(self, wt_opt):
+        """
+        Point the driver's design-point cache to a file in the output folder, if requested.
+        """
+        opt_options = self.opt["driver"]["optimization"]
+        if "cache_file" in opt_options and opt_options["cache_file"] != "None":
+            folder_output = self.opt["general"]["folder_output"]
+            wt_opt.driver.options["cache_file"] = os.path.join(folder_output, opt_options["cache_file"])
+
     def set_driver(self, wt_opt):
         folder_output = self.opt["general"]["folder_output"]
 
@@ -105,7 +116,11 @@ class PoseOptimization(object):
                 step_calc = None
             else:
                 step_calc = opt_options["step_calc"]
-            wt_opt.model.approx_totals(method="fd", step=step_size, form=opt_options["form"], step_calc=step_calc)
+            # Under MPI, run_wisdem spreads the finite differencing with num_par_fd instead
+            fd_workers = 0 if MPI else opt_options["fd_workers"]
+            approx_totals(
+                wt_opt.model, fd_workers, method="fd", step=step_size, form=opt_options["form"], step_calc=step_calc
+            )
 
             # Set optimization solver and options. First, Scipy's SLSQP and COBYLA
             if opt_options["solver"] in self.scipy_methods:
@@ -184,14 +199,22 @@ class PoseOptimization(object):
                     "pop_size",
                     "run_parallel",
                     "procs_per_model",
+                    "mpi_schedule",
                     "penalty_parameter",
                     "penalty_exponent",
                     "Pc",
                     "eta_c",
                     "Pm",
                     "eta_m",
+                    "cache_size",
+                    "restart",
                 ]
                 wt_opt = self._set_optimizer_properties(wt_opt, options_keys)
+                self._set_cache_file(wt_opt)
+                # Under MPI, run_parallel spreads the individuals instead. run_wisdem supplies
+                # the problem_factory building the models of the worker processes.
+                if not MPI:
+                    wt_opt.driver.options["num_workers"] = opt_options["num_workers"]
 
             elif opt_options["solver"] == "GA":
                 wt_opt.driver = om.SimpleGADriver()
@@ -244,9 +267,10 @@ class PoseOptimization(object):
 
                 wt_opt.driver = NLoptDriver()
                 wt_opt.driver.options["optimizer"] = opt_options["solver"]
-                options_keys = ["tol", "xtol", "max_iter", "max_time", "numgen"]
+                options_keys = ["tol", "xtol", "max_iter", "max_time", "numgen", "cache_size"]
                 mapped_keys = {"max_iter": "maxiter", "max_time": "maxtime"}
                 wt_opt = self._set_optimizer_properties(wt_opt, options_keys, mapped_keys=mapped_keys)
+                self._set_cache_file(wt_opt)
 
             else:
                 raise ValueError(f"The {self.opt['driver']['optimization']['solver']} optimizer is not yet supported!")
@@ -6,7 +6,8 @@ import openmdao.api as om
 from moorpy.helpers import getLineProps
 from scipy.interpolate import PchipInterpolator
 
-from wisdem.ccblade.Polar import Polar
+from wisdem.ccblade.Polar import cl_linear_slope, correction3D_batch
+from wisdem.ccblade.ccblade import KeyedLRUCache, content_key
 from wisdem.commonse.utilities import arc_length, arc_length_deriv
 from wisdem.rotorse.parametrize_rotor import ComputeReynolds, ParametrizeBladeAero, ParametrizeBladeStruct
 from wisdem.rotorse.geometry_tools.geometry import remap2grid, trailing_edge_smoothing
@@ -1112,20 +1113,19 @@ class Blade_Lofted_Shape(om.ExplicitComponent):
         )
 
     def compute(self, inputs, outputs):
-        k = 0
-        for i in range(self.n_span):
-            for j in range(self.n_xy):
-                outputs["3D_shape"][k, :] = np.array(
-                    [k, inputs["coord_xy_dim_twisted"][i, j, 1], inputs["coord_xy_dim_twisted"][i, j, 0], 0.0]
-                ) + np.hstack([0, inputs["ref_axis"][i, :]])
-                k = k + 1
+        # point number, then the twisted airfoil coordinates (y along x, x along y) shifted to the reference axis
+        shape_3d = np.zeros((self.n_span, self.n_xy, 4))
+        shape_3d[:, :, 0] = np.arange(self.n_span * self.n_xy).reshape((self.n_span, self.n_xy))
+        shape_3d[:, :, 1:3] = inputs["coord_xy_dim_twisted"][:, :, ::-1]
+        shape_3d[:, :, 1:] += inputs["ref_axis"][:, np.newaxis, :]
+        outputs["3D_shape"] = shape_3d.reshape((-1, 4))
 
-            # Debug output
-            np.savetxt(
-                "3d_xyz_blade_lofted.dat",
-                outputs["3D_shape"],
-                header="\t point number [-]\t\t\t\t x [m] \t\t\t\t\t y [m]  \t\t\t\t z [m] \t\t\t\t The coordinate system follows the BeamDyn one.",
-            )
+        # Debug output
+        np.savetxt(
+            "3d_xyz_blade_lofted.dat",
+            outputs["3D_shape"],
+            header="\t point number [-]\t\t\t\t x [m] \t\t\t\t\t y [m]  \t\t\t\t z [m] \t\t\t\t The coordinate system follows the BeamDyn one.",
+        )
 
 
 class Blade_Structure(om.Group):
@@ -1396,26 +1396,17 @@ class Place_Webs_Caps(om.ExplicitComponent):
                     webs_do_not_fit = False
             
             outputs["layer_width_adjusted"] = inputs["layer_width"]
+            chord = te_coord - le_coord
             for j in range(self.n_layers):
                 if discrete_inputs["build_layer"][j] in [1, 2]: # from offset and rotation
                     outputs["layer_offset_adjusted"][j, :] = x_tmax_interp
 
-                    # Check the layers fit within the blade profile with a 5% chord margin from the leading and trailing edge. If not, reduce the width to 50% of chord
-                    for i in range(self.n_span):
-                        caps_fit = True
-                        k = 1
-                        chord = te_coord[i] - le_coord[i]
-                        while caps_fit:
-                            k *=0.9
-                            if outputs["layer_offset_adjusted"][j, i] - 0.5 * outputs["layer_width_adjusted"][j, i] < le_coord[i] + 0.05*chord:
-                                outputs["layer_width_adjusted"][j, i] = k*chord
-                                caps_fit = False
-                            elif outputs["layer_offset_adjusted"][j, i] + 0.5 * outputs["layer_width_adjusted"][j, i] > te_coord[i] - 0.05*chord:
-                                outputs["layer_width_adjusted"][j, i] = k*chord
-                                caps_fit = False
-                            if k < 0.1:
-                                logger.debug("The layer width of the spar caps has been reduced to less than 10pc of the chord and it still does not fit within the blade profile. Please adjust the input parameters.")
-                                break
+                    # Check the layers fit within the blade profile with a 5% chord margin from the leading and trailing edge. If not, reduce the width to 90% of chord
+                    width = outputs["layer_width_adjusted"][j, :]
+                    caps_do_not_fit = (x_tmax_interp - 0.5 * width < le_coord + 0.05 * chord) | (
+                        x_tmax_interp + 0.5 * width > te_coord - 0.05 * chord
+                    )
+                    outputs["layer_width_adjusted"][j, :] = np.where(caps_do_not_fit, 0.9 * chord, width)
         else:
             outputs["web_offset_adjusted"] = inputs["web_offset"]
             outputs["layer_offset_adjusted"] = inputs["layer_offset"]
@@ -1533,21 +1524,28 @@ class Compute_Blade_Structure(om.ExplicitComponent):
         layer_start_nd = np.zeros((self.n_layers, self.n_span))
         layer_end_nd = np.zeros((self.n_layers, self.n_span))
 
+        # Arc length along each profile and leading edge index, shared by the webs and layers
+        xy_coord = inputs["coord_xy_dim"]
+        xy_arc = np.zeros((self.n_span, self.n_xy))
+        xy_arc[:, 1:] = np.cumsum(np.sqrt(np.sum(np.diff(xy_coord, axis=1) ** 2, axis=2)), axis=1)
+        arc_L = xy_arc[:, -1]
+        idx_le = np.argmin(xy_coord[:, :, 0], axis=1)
+        suction_side = np.arange(self.n_xy)[np.newaxis, :] < idx_le[:, np.newaxis]
+        span = np.arange(self.n_span)
+
+        def closest_point(rotation, offset, side):
+            # index of the point of each profile, rotated by rotation, on the given side closest to offset along x
+            theta = np.deg2rad(rotation)
+            x_rotated = xy_coord[:, :, 0] * np.cos(theta) - xy_coord[:, :, 1] * np.sin(theta)
+            return np.argmin(np.where(side, np.abs(x_rotated - offset[:, np.newaxis]), np.inf), axis=1)
+
         # Compute the start and end points of the webs
         for j in range(self.n_webs):
-            for i in range(self.n_span):
-
-                xy_coord_i = inputs["coord_xy_dim"][i, :, :]
-                idx_le = np.argmin(xy_coord_i[:, 0])
-                theta = np.deg2rad(inputs["web_rotation"][j])
-                rotation_matrix = np.array([[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]])
-                xy_coord_rotated = xy_coord_i @ rotation_matrix.T
-                web_offset = inputs["web_offset_adjusted"][j, i]
-                idx_web_ss = np.argmin(abs(xy_coord_rotated[:idx_le, 0] - web_offset))
-                idx_web_ps = np.argmin(abs(xy_coord_rotated[idx_le:, 0] - web_offset)) + idx_le
-                xy_arc_i = arc_length(xy_coord_i)
-                web_start_nd[j, i] = xy_arc_i[idx_web_ss] / xy_arc_i[-1]
-                web_end_nd[j, i] = xy_arc_i[idx_web_ps] / xy_arc_i[-1]
+            web_offset = inputs["web_offset_adjusted"][j, :]
+            idx_web_ss = closest_point(inputs["web_rotation"][j], web_offset, suction_side)
+            idx_web_ps = closest_point(inputs["web_rotation"][j], web_offset, ~suction_side)
+            web_start_nd[j, :] = xy_arc[span, idx_web_ss] / arc_L
+            web_end_nd[j, :] = xy_arc[span, idx_web_ps] / arc_L
 
         if np.any(web_start_nd < 0):
             logger.debug("Web start points must be larger than 0. Setting the value to 0.")
@@ -1567,61 +1565,29 @@ class Compute_Blade_Structure(om.ExplicitComponent):
 
         # Compute the start and end points of the layers
         for j in range(self.n_layers):
+            width = inputs["layer_width_adjusted"][j, :]
             if discrete_inputs["build_layer"][j] == 0:
                 layer_start_nd[j, :] = inputs["layer_start_nd_yaml"][j, :]
                 layer_end_nd[j, :] = inputs["layer_end_nd_yaml"][j, :]
 
             elif discrete_inputs["build_layer"][j] == 1 or discrete_inputs["build_layer"][j] == 2:
-                for i in range(self.n_span):
-
-                    xy_coord_i = inputs["coord_xy_dim"][i, :, :]
-                    idx_le = np.argmin(xy_coord_i[:, 0])
-                    theta = np.deg2rad(inputs["layer_rotation"][j])
-                    rotation_matrix = np.array([[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]])
-                    xy_coord_rotated = xy_coord_i @ rotation_matrix.T
-                    layer_offset = inputs["layer_offset_adjusted"][j, i]
-                    if discrete_inputs["build_layer"][j] == 1:  # suction side
-                        idx_layer = np.argmin(abs(xy_coord_rotated[:idx_le, 0] - layer_offset))
-                    else:  # pressure side
-                        idx_layer = np.argmin(abs(xy_coord_rotated[idx_le:, 0] - layer_offset)) + idx_le
-                    xy_arc_i = arc_length(xy_coord_i)
-                    arc_L_i = xy_arc_i[-1]
-                    width_i = inputs["layer_width_adjusted"][j, i]
-
-                    layer_start_nd[j, i] = (xy_arc_i[idx_layer] - 0.5 * width_i) / arc_L_i
-                    layer_end_nd[j, i] = (xy_arc_i[idx_layer] + 0.5 * width_i) / arc_L_i
+                side = suction_side if discrete_inputs["build_layer"][j] == 1 else ~suction_side
+                idx_layer = closest_point(inputs["layer_rotation"][j], inputs["layer_offset_adjusted"][j, :], side)
+                layer_start_nd[j, :] = (xy_arc[span, idx_layer] - 0.5 * width) / arc_L
+                layer_end_nd[j, :] = (xy_arc[span, idx_layer] + 0.5 * width) / arc_L
 
             elif discrete_inputs["build_layer"][j] == 3:
-                for i in range(self.n_span):
-                    xy_coord_i = inputs["coord_xy_dim"][i, :, :]
-                    xy_arc_i = arc_length(xy_coord_i)
-                    arc_L_i = xy_arc_i[-1]
-                    idx_le = np.argmin(xy_coord_i[:, 0])
-                    LE_loc_i = xy_arc_i[idx_le]
-                    width_i = inputs["layer_width_adjusted"][j, i]
-
-                    layer_start_nd[j, i] = (LE_loc_i - 0.5 * width_i) / arc_L_i
-                    layer_end_nd[j, i] = (LE_loc_i + 0.5 * width_i) / arc_L_i
+                LE_loc = xy_arc[span, idx_le]
+                layer_start_nd[j, :] = (LE_loc - 0.5 * width) / arc_L
+                layer_end_nd[j, :] = (LE_loc + 0.5 * width) / arc_L
 
             elif discrete_inputs["build_layer"][j] == 4:
-                for i in range(self.n_span):
-                    xy_coord_i = inputs["coord_xy_dim"][i, :, :]
-                    xy_arc_i = arc_length(xy_coord_i)
-                    arc_L_i = xy_arc_i[-1]
-                    width_i = inputs["layer_width_adjusted"][j, i]
-
-                    layer_start_nd[j, i] = 0.0
-                    layer_end_nd[j, i] = width_i / arc_L_i
+                layer_start_nd[j, :] = 0.0
+                layer_end_nd[j, :] = width / arc_L
 
             elif discrete_inputs["build_layer"][j] == 5:
-                for i in range(self.n_span):
-                    xy_coord_i = inputs["coord_xy_dim"][i, :, :]
-                    xy_arc_i = arc_length(xy_coord_i)
-                    arc_L_i = xy_arc_i[-1]
-                    width_i = inputs["layer_width_adjusted"][j, i]
-
-                    layer_start_nd[j, i] = 1.0 - width_i / arc_L_i
-                    layer_end_nd[j, i] = 1.0
+                layer_start_nd[j, :] = 1.0 - width / arc_L
+                layer_end_nd[j, :] = 1.0
 
             elif discrete_inputs["build_layer"][j] == 6:
                 # start a layer from the end of another layer, and end where the other starts
@@ -3275,35 +3241,65 @@ class Airfoil3DCorrection(om.ExplicitComponent):
             desc="Moment coefficient corrected with CCblade.Polar.",
         )
 
+        # Lift slope and zero-lift angle of the polars, keyed on their content, and the key and outputs
+        # of the last evaluation, which is repeated as is when none of the inputs changed
+        self.linear_params = KeyedLRUCache(4 * n_span * n_Re)
+        self.last_key = None
+        self.last_outputs = {}
+
     def compute(self, inputs, outputs):
-        cl_corrected = np.zeros((self.n_span, self.n_aoa, self.n_Re))
-        cd_corrected = np.zeros((self.n_span, self.n_aoa, self.n_Re))
-        cm_corrected = np.zeros((self.n_span, self.n_aoa, self.n_Re))
-        for i in range(self.n_span):
-            if (
-                inputs["rthick"][i] < 0.7 and self.af_correction
-            ):  # Only apply 3D correction to airfoils thinner than 70% to avoid numerical problems at blade root
+        key = content_key(
+            inputs["aoa"],
+            inputs["cl"],
+            inputs["cd"],
+            inputs["cm"],
+            inputs["rated_TSR"],
+            inputs["r_blade"],
+            inputs["rotor_diameter"],
+            inputs["rthick"],
+            inputs["chord"],
+        )
+        if key == self.last_key:
+            for k in self.last_outputs:
+                outputs[k] = self.last_outputs[k]
+            return
+
+        cl_corrected = inputs["cl"].copy()
+        cd_corrected = inputs["cd"].copy()
+        cm_corrected = inputs["cm"].copy()
+        # Only apply 3D correction to airfoils thinner than 70% to avoid numerical problems at blade root
+        icorr = np.flatnonzero(inputs["rthick"] < 0.7) if self.af_correction else []
+        if len(icorr) > 0:
+            for i in icorr:
                 logger.info("3D correction applied to airfoil polars for section " + str(i))
-                for j in range(self.n_Re):
-                    polar = Polar(
-                        Re=inputs["Re"][j],
-                        alpha=inputs["aoa"],
-                        cl=inputs["cl"][i, :, j],
-                        cd=inputs["cd"][i, :, j],
-                        cm=inputs["cm"][i, :, j],
-                    )
-                    polar3d = polar.correction3D(
-                        inputs["r_blade"][i] / (inputs["rotor_diameter"][0] / 2),
-                        inputs["chord"][i] / inputs["r_blade"][i],
-                        inputs["rated_TSR"],
-                    )
-                    cl_corrected[i, :, j] = PchipInterpolator(polar3d.alpha, polar3d.cl)(inputs["aoa"])
-                    cd_corrected[i, :, j] = PchipInterpolator(polar3d.alpha, polar3d.cd)(inputs["aoa"])
-                    cm_corrected[i, :, j] = PchipInterpolator(polar3d.alpha, polar3d.cm)(inputs["aoa"])
-            else:
-                cl_corrected[i, :, :] = inputs["cl"][i, :, :]
-                cd_corrected[i, :, :] = inputs["cd"][i, :, :]
-                cm_corrected[i, :, :] = inputs["cm"][i, :, :]
+            # All polars to correct at once, with the angles of attack along the last axis
+            aoa = inputs["aoa"]
+            cl = np.moveaxis(inputs["cl"][icorr], 1, -1)
+            cd = np.moveaxis(inputs["cd"][icorr], 1, -1)
+            cl_slope = np.zeros(cl.shape[:-1])
+            alpha0 = np.zeros(cl.shape[:-1])
+            for k in np.ndindex(cl_slope.shape):
+                cl_slope[k], alpha0[k] = self.get_linear_params(aoa, cl[k])
+            r_blade = inputs["r_blade"][icorr]
+            cl_3d, cd_3d = correction3D_batch(
+                aoa,
+                cl,
+                cd,
+                (r_blade / (inputs["rotor_diameter"][0] / 2))[:, np.newaxis],
+                (inputs["chord"][icorr] / r_blade)[:, np.newaxis],
+                inputs["rated_TSR"][0],
+                cl_slope=cl_slope,
+                alpha0=alpha0,
+            )
+            cl_corrected[icorr] = np.moveaxis(cl_3d, -1, 1)
+            cd_corrected[icorr] = np.moveaxis(cd_3d, -1, 1)
         outputs["cl_corrected"] = cl_corrected
         outputs["cd_corrected"] = cd_corrected
         outputs["cm_corrected"] = cm_corrected
+
+        self.last_key = key
+        self.last_outputs = {"cl_corrected": cl_corrected, "cd_corrected": cd_corrected, "cm_corrected": cm_corrected}
+
+    def get_linear_params(self, aoa, cl):
+        # Lift slope and zero-lift angle of a polar as found by Polar.linear_region, only fitted for new polars
+        return self.linear_params.lookup(content_key(aoa, cl), lambda: cl_linear_slope(aoa, cl, method="optim"))
@@ -14,6 +14,7 @@ from wisdem.glue_code.gc_WT_DataStruc import WindTurbineOntologyOpenMDAO
 from wisdem.nrelcsm.nrel_csm_cost_2015 import Turbine_CostsSE_2015
 from wisdem.commonse.turbine_constraints import TurbineConstraints
 from wisdem.plant_financese.plant_finance import PlantFinance
+from wisdem.optimization_drivers.input_cache import cache_unchanged_outputs
 from wisdem.landbosse.landbosse_omdao.landbosse import LandBOSSE
 
 
@@ -1134,3 +1135,9 @@ class WindPark(om.Group):
             self.connect("financese.lcoe", "outputs_2_screen.lcoe")
             self.connect("rotorse.blade_mass", "outputs_2_screen.blade_mass")
             self.connect("rotorse.rs.tip_pos.tip_deflection", "outputs_2_screen.tip_deflection")
+
+    def configure(self):
+        # Subsystems listed in the modeling options keep their outputs when their inputs are unchanged
+        general = self.options["modeling_options"]["General"]
+        if "input_cache" in general:
+            cache_unchanged_outputs(self, general["input_cache"])
@@ -15,6 +15,9 @@ from wisdem.glue_code.glue_code import WindPark
 from wisdem.glue_code.gc_LoadInputs import WindTurbineOntologyPython
 from wisdem.glue_code.gc_WT_InitModel import yaml2openmdao
 from wisdem.glue_code.gc_PoseOptimization import PoseOptimization
+from wisdem.optimization_drivers.design_cache import input_key
+from wisdem.optimization_drivers.input_cache import input_cache_report
+from wisdem.optimization_drivers.nsga2_driver import NSGA2Driver
 
 # Numpy deprecation warnings
 warnings.filterwarnings("ignore", category=np.exceptions.VisibleDeprecationWarning)
@@ -30,8 +33,6 @@ def run_wisdem(fname_wt_input, fname_modeling_options, fname_opt_options, overri
     wt_initial = WindTurbineOntologyPython(fname_wt_input, fname_modeling_options, fname_opt_options)
     wt_init, modeling_options, opt_options = wt_initial.get_input_data()
 
-    myopt = PoseOptimization(wt_init, modeling_options, opt_options)
-
     folder_output = opt_options["general"]["folder_output"]
 
     os.makedirs(folder_output, exist_ok=True)
@@ -63,49 +64,13 @@ def run_wisdem(fname_wt_input, fname_modeling_options, fname_opt_options, overri
     logger.addHandler(hf)
     logger.info("Started")
 
-    if MPI and opt_options["opt_flag"] and not run_only:
-        # Parallel settings for OpenMDAO
-        wt_opt = om.Problem(model=om.Group(num_par_fd=max_cores), reports=False)
-        wt_opt.model.add_subsystem(
-            "comp", WindPark(modeling_options=modeling_options, opt_options=opt_options), promotes=["*"]
-        )
-    else:
-        # Sequential finite differencing
-        wt_opt = om.Problem(
-            model=WindPark(modeling_options=modeling_options, opt_options=opt_options), reports=False
-        )
-
-    # If at least one of the design variables is active, setup an optimization
-    if opt_options["opt_flag"] and not run_only:
-        wt_opt = myopt.set_driver(wt_opt)
-        wt_opt = myopt.set_objective(wt_opt)
-        wt_opt = myopt.set_design_variables(wt_opt, wt_init)
-        wt_opt = myopt.set_constraints(wt_opt)
-        wt_opt = myopt.set_recorders(wt_opt)
-
-    if modeling_options["General"]["verbosity"] == False:
-        wt_opt.set_solver_print(level=-1)
-
-    # Set working directory and setup openmdao problem
-    wt_opt.options['work_dir'] = folder_output
-    wt_opt.setup()
+    wt_opt = setup_wisdem(wt_init, modeling_options, opt_options, overridden_values, run_only)
 
-    # Load initial wind turbine data from wt_initial to the openmdao problem
-    wt_opt = yaml2openmdao(wt_opt, modeling_options, wt_init, opt_options)
-    wt_opt = myopt.set_initial(wt_opt, wt_init)
-
-    # If the user provides values in this dict, they overwrite
-    # whatever values have been set by the yaml files.
-    # This is useful for performing black-box wrapped optimization without
-    # needing to modify the yaml files.
-    if overridden_values is not None:
-        for key in overridden_values:
-            wt_opt[key] = overridden_values[key]
-
-    # Place the last design variables from a previous run into the problem.
-    # This needs to occur after the above setup() and yaml2openmdao() calls
-    # so these values are correctly placed in the problem.
-    wt_opt = myopt.set_restart(wt_opt)
+    # The local worker processes of NSGA2 build their own models from the same inputs
+    if isinstance(wt_opt.driver, NSGA2Driver) and wt_opt.driver.options["num_workers"] > 0:
+        wt_opt.driver.options["problem_factory"] = NSGA2ProblemFactory(
+            fname_wt_input, fname_modeling_options, fname_opt_options, overridden_values
+        )
 
     if "check_totals" in opt_options["driver"] and not run_only:
         if opt_options["driver"]["check_totals"]:
@@ -154,7 +119,17 @@ def run_wisdem(fname_wt_input, fname_modeling_options, fname_opt_options, overri
     wt_initial.write_outputs(froot_out)
 
     # Save data to numpy and matlab arrays
-    fileIO.save_data(froot_out, wt_opt)
+    save_options = opt_options["general"]["save_data"]
+    fileIO.save_data(
+        froot_out,
+        wt_opt,
+        npz_file=save_options["npz_file"],
+        mat_file=save_options["mat_file"],
+        xls_file=save_options["xls_file"],
+        col_file=save_options["col_file"],
+        includes=save_options["includes"] or None,
+        excludes=save_options["excludes"] or None,
+    )
 
     t1 = time.time()
     if MPI:
@@ -162,12 +137,97 @@ def run_wisdem(fname_wt_input, fname_modeling_options, fname_opt_options, overri
     else:
         rank = 0
     if rank == 0:
+        cache_report = input_cache_report(wt_opt.model)
+        if cache_report:
+            print("Evaluations of the components with an input cache:")
+            print("\n".join(cache_report))
         print("WISDEM run completed in,", t1-t0, "seconds")
 
     return wt_opt, modeling_options, opt_options
 
 
-def load_wisdem(frootin):
+def setup_wisdem(wt_init, modeling_options, opt_options, overridden_values=None, run_only=False):
+    """
+    Set up the WISDEM problem of validated inputs, with its optimization driver if requested, and load the initial values.
+    """
+    myopt = PoseOptimization(wt_init, modeling_options, opt_options)
+
+    folder_output = opt_options["general"]["folder_output"]
+
+    if MPI and opt_options["opt_flag"] and not run_only:
+        # Parallel settings for OpenMDAO
+        wt_opt = om.Problem(model=om.Group(num_par_fd=max_cores), reports=False)
+        wt_opt.model.add_subsystem(
+            "comp", WindPark(modeling_options=modeling_options, opt_options=opt_options), promotes=["*"]
+        )
+    else:
+        # Sequential finite differencing, or on forked workers if driver:optimization:fd_workers > 1
+        wt_opt = om.Problem(
+            model=WindPark(modeling_options=modeling_options, opt_options=opt_options), reports=False
+        )
+
+    # If at least one of the design variables is active, setup an optimization
+    if opt_options["opt_flag"] and not run_only:
+        wt_opt = myopt.set_driver(wt_opt)
+        wt_opt = myopt.set_objective(wt_opt)
+        wt_opt = myopt.set_design_variables(wt_opt, wt_init)
+        wt_opt = myopt.set_constraints(wt_opt)
+        wt_opt = myopt.set_recorders(wt_opt)
+
+        # a design-point cache file saved for other inputs is not reused
+        if "cache_file" in wt_opt.driver.options and wt_opt.driver.options["cache_file"] is not None:
+            wt_opt.driver.options["cache_inputs_key"] = input_key(wt_init, modeling_options, overridden_values)
+
+    if modeling_options["General"]["verbosity"] == False:
+        wt_opt.set_solver_print(level=-1)
+
+    # Set working directory and setup openmdao problem
+    wt_opt.options['work_dir'] = folder_output
+    wt_opt.setup()
+
+    # Load initial wind turbine data from wt_initial to the openmdao problem
+    wt_opt = yaml2openmdao(wt_opt, modeling_options, wt_init, opt_options)
+    wt_opt = myopt.set_initial(wt_opt, wt_init)
+
+    # If the user provides values in this dict, they overwrite
+    # whatever values have been set by the yaml files.
+    # This is useful for performing black-box wrapped optimization without
+    # needing to modify the yaml files.
+    if overridden_values is not None:
+        for key in overridden_values:
+            wt_opt[key] = overridden_values[key]
+
+    # Place the last design variables from a previous run into the problem.
+    # This needs to occur after the above setup() and yaml2openmdao() calls
+    # so these values are correctly placed in the problem.
+    wt_opt = myopt.set_restart(wt_opt)
+
+    return wt_opt
+
+
+class NSGA2ProblemFactory:
+    """
+    Builder of the WISDEM problem of a set of input files, for the worker processes of NSGA2Driver.
+
+    The workers evaluate their individuals one at a time and record nothing,
+    the driver's process records all evaluations.
+    """
+
+    def __init__(self, fname_wt_input, fname_modeling_options, fname_opt_options, overridden_values=None):
+        self.fname_wt_input = fname_wt_input
+        self.fname_modeling_options = fname_modeling_options
+        self.fname_opt_options = fname_opt_options
+        self.overridden_values = overridden_values
+
+    def __call__(self):
+        wt_initial = WindTurbineOntologyPython(self.fname_wt_input, self.fname_modeling_options, self.fname_opt_options)
+        wt_init, modeling_options, opt_options = wt_initial.get_input_data()
+        opt_options["driver"]["optimization"]["num_workers"] = 0
+        opt_options["recorder"]["flag"] = False
+        return setup_wisdem(wt_init, modeling_options, opt_options, self.overridden_values)
+
+
+def load_wisdem(frootin, includes=None, excludes=None):
     froot,fext = os.path.splitext(frootin)
     if fext not in ['.yaml','.pkl']:
         froot = frootin
@@ -175,6 +235,7 @@ def load_wisdem(frootin):
     fmodel = froot + "-modeling.yaml"
     fopt = froot + "-analysis.yaml"
     fpkl = froot + ".pkl"
+    fcol = froot + fileIO.COLUMN_SUFFIX
 
     # Load all yaml inputs and validate (also fills in defaults)
     wt_initial = WindTurbineOntologyPython(fgeom, fmodel, fopt)
@@ -183,6 +244,27 @@ def load_wisdem(frootin):
     wt_opt = om.Problem(model=WindPark(modeling_options=modeling_options, opt_options=opt_options), reports=False)
     wt_opt.setup()
 
-    wt_opt = fileIO.load_data(fpkl, wt_opt)
+    # The column archive, if saved, is read lazily so only the requested variables are loaded
+    fdata = fcol if os.path.exists(fcol) else fpkl
+    wt_opt = fileIO.load_data(fdata, wt_opt, includes=includes, excludes=excludes)
 
     return wt_opt, modeling_options, opt_options
+
+
+def open_wisdem(frootin, mmap_mode="r"):
+    """
+    Open the saved variables of a WISDEM run without building the OpenMDAO problem.
+
+    Needs the column archive of the run (analysis option general:save_data:col_file).
+    The variables are read, or memory-mapped, one at a time when accessed, e.g.
+    open_wisdem("outputs/blade_out")["rotorse.rp.AEP"].
+    """
+    froot,fext = os.path.splitext(frootin)
+    if frootin.endswith(fileIO.COLUMN_SUFFIX):
+        froot = frootin[:-len(fileIO.COLUMN_SUFFIX)]
+    elif fext not in ['.yaml','.pkl']:
+        froot = frootin
+    fcol = froot + fileIO.COLUMN_SUFFIX
+    if not os.path.exists(fcol):
+        raise FileNotFoundError(f"No column archive {fcol}, rerun with general:save_data:col_file set to True.")
+    return fileIO.ColumnArchive(fcol, mmap_mode=mmap_mode)
@@ -1,5 +1,8 @@
 import os
+import re
 import copy
+import hashlib
+from collections import OrderedDict
 import numpy as np
 import jsonschema as json
 import jsonmerge
@@ -8,7 +11,7 @@ import operator
 from openmdao.utils.mpi import MPI
 import windIO.schemas as windio
 from windIO.yaml import load_yaml, write_yaml
-from windIO.validator import _enforce_no_additional_properties, _jsonschema_validate_modified
+from windIO.validator import _enforce_no_additional_properties, _jsonschema_validate_modified, schema_validation_error_formatter
 from pathlib import Path
 from referencing import Registry, Resource
 from referencing.exceptions import NoSuchResource
@@ -114,8 +117,9 @@ def extend_with_default(validator_class):
 
     def set_defaults(validator, properties, instance, schema):
         for property, subschema in properties.items():
-            if "default" in subschema:
-                instance.setdefault(property, subschema["default"])
+            if "default" in subschema and property not in instance:
+                # copy, so filling nested defaults never modifies the (cached) schema
+                instance[property] = copy.deepcopy(subschema["default"])
 
         for error in validate_properties(validator, properties, instance, schema):
             yield error
@@ -156,13 +160,113 @@ def MPI_load_yaml(fname):
 
     return dict_yaml
 
+# ---------------------
+# Parsed schemas, compiled validators and validated inputs are kept between
+# calls, so batch runs only parse and validate what changed
+_schema_cache = {}
+_validator_cache = {}
+_validated_cache = OrderedDict()
+validated_cache_size = 32
+
+
+def _file_stamp(fname):
+    # Identify a file version without reading it
+    st = os.stat(fname)
+    return (os.path.realpath(fname), st.st_mtime_ns, st.st_size)
+
+
+_include_pattern = re.compile(rb"!include\s+['\"]?([^\s'\"#]+)")
+
+
+def _input_key(finput):
+    """
+    Hash of the contents of a yaml file and of the files it includes, recursively.
+
+    Included yaml files are hashed with their contents, other included files,
+    e.g. netCDF data, by their modification time and size.
+
+    Args:
+        finput (str): Path to the YAML file.
+
+    Returns:
+        str: Hex digest, or None if a file cannot be read.
+    """
+    h = hashlib.sha256()
+    pending = [os.path.abspath(finput)]
+    seen = set()
+    try:
+        while pending:
+            fname = pending.pop()
+            if fname in seen:
+                continue
+            seen.add(fname)
+            h.update(fname.encode())
+            if os.path.splitext(fname)[1].lower() not in [".yaml", ".yml"]:
+                h.update(repr(_file_stamp(fname)).encode())
+                continue
+            with open(fname, "rb") as f:
+                contents = f.read()
+            h.update(contents)
+            # windIO resolves includes relative to the including file
+            for finclude in _include_pattern.findall(contents):
+                pending.append(os.path.abspath(os.path.join(os.path.dirname(fname), finclude.decode())))
+    except OSError:
+        return None
+    return h.hexdigest()
+
+
+def _load_schema(fschema, restrictive=False, rank_0=False):
+    """
+    Parsed schema of a file, or of several files merged in order, cached until the files change.
+
+    Args:
+        fschema (str or tuple): Path to the schema file, or paths of the schema files to merge.
+        restrictive (bool, optional): Flag to disallow properties that are not in the schema
+        rank_0 (bool, optional): As for _validate
+
+    Returns:
+        tuple: Cache key of the schema and the schema dictionary, which must not be modified.
+    """
+    fschemas = (fschema,) if isinstance(fschema, str) else tuple(fschema)
+    key = (tuple(_file_stamp(f) for f in fschemas), restrictive)
+    if key not in _schema_cache:
+        load = MPI_load_yaml if (MPI and rank_0 == False) else load_yaml
+        schema_dict = reduce(jsonmerge.merge, [load(f) for f in fschemas])
+        if restrictive:
+            schema_dict = _enforce_no_additional_properties(schema_dict)
+        _schema_cache[key] = schema_dict
+    return key, _schema_cache[key]
+
+
+def _get_validator(schema_key, schema_dict, cls):
+    # Compiled validator of a cached schema, checked against its metaschema once
+    key = (schema_key, cls)
+    if key not in _validator_cache:
+        cls.check_schema(schema_dict)
+        _validator_cache[key] = cls(schema_dict, registry=registry)
+    return _validator_cache[key]
+
+
+def clear_validation_cache():
+    """
+    Forget the cached schemas, validators and validated inputs.
+    """
+    _schema_cache.clear()
+    _validator_cache.clear()
+    _validated_cache.clear()
+
+
 def _validate(finput, fschema, defaults=True, removal=False, restrictive=False, rank_0 = False):
     """
     Validates a dictionary against a schema and returns the validated dictionary.
 
+    Schemas given as files are parsed and compiled once. Inputs given as files
+    are only validated again when their contents, or those of the files they
+    include, change.
+
     Args:
         finput (dict or str): Dictionary or path to the YAML file to be validated.
-        fschema (dict or str): Dictionary or path to the schema file to validate against.
+        fschema (dict or str or tuple): Dictionary or path to the schema file to validate against, or paths of schema files to merge.
         defaults (bool, optional): Flag to indicate if default values should be integrated.
         removal (bool, optional): Flag to indicate if entries outside of the schema should be removed
         restrictive (bool, optional): Flag to indicate if strict adherence to schema (no additions)
@@ -172,14 +276,31 @@ def _validate(finput, fschema, defaults=True, removal=False, restrictive=False,
     Returns:
         dict: Validated dictionary.
     """
+    if defaults:
+        cls = DefaultValidatingDraft7Validator
+    elif removal:
+        cls = RemovalValidatingDraft7Validator
+    else:
+        cls = json.Draft7Validator
+
     # Read schema as dictionary
     if isinstance(fschema, dict):
-        schema_dict = fschema
+        schema_key = None
+        schema_dict = copy.deepcopy(fschema) if restrictive else fschema
+        if restrictive:
+            schema_dict = _enforce_no_additional_properties(schema_dict)
     else:
-        schema_dict = MPI_load_yaml(fschema) if (MPI and rank_0 == False) else load_yaml(fschema)
-        
-    if restrictive:
-        schema_dict = _enforce_no_additional_properties(schema_dict)
+        schema_key, schema_dict = _load_schema(fschema, restrictive, rank_0)
+
+    # Fast path for an input file already validated against this schema
+    input_key = None
+    if schema_key is not None and isinstance(finput, str) and not (MPI and rank_0 == False):
+        contents_key = _input_key(finput)
+        if contents_key is not None:
+            input_key = (contents_key, schema_key, cls)
+        if input_key in _validated_cache:
+            _validated_cache.move_to_end(input_key)
+            return deep_copy_without_shared_refs(_validated_cache[input_key])
 
     # Read input file as dictionary
     if isinstance(finput, dict):
@@ -191,12 +312,11 @@ def _validate(finput, fschema, defaults=True, removal=False, restrictive=False,
     unique_input_dict = deep_copy_without_shared_refs(input_dict)
 
     # WindIO way
-    if defaults:
-        _jsonschema_validate_modified(unique_input_dict, schema_dict, cls=DefaultValidatingDraft7Validator, registry=registry)
-    elif removal:
-        _jsonschema_validate_modified(unique_input_dict, schema_dict, cls=RemovalValidatingDraft7Validator, registry=registry)
+    if schema_key is None:
+        _jsonschema_validate_modified(unique_input_dict, schema_dict, cls=cls, registry=registry)
     else:
-        _jsonschema_validate_modified(unique_input_dict, schema_dict, registry=registry)
+        validator = _get_validator(schema_key, schema_dict, cls)
+        schema_validation_error_formatter(validator.iter_errors(unique_input_dict), schema_dict["$id"])
 
     
     # New deep copy to ensure no shared references from yaml pointers and anchors
@@ -206,6 +326,12 @@ def _validate(finput, fschema, defaults=True, removal=False, restrictive=False,
     #validator = DefaultValidatingDraft7Validator if defaults else json.Draft7Validator
     #validator(schema_dict).validate(unique_input_dict)
 
+    if input_key is not None:
+        _validated_cache[input_key] = unique_input_dict
+        while len(_validated_cache) > validated_cache_size:
+            _validated_cache.popitem(last=False)
+        unique_input_dict = deep_copy_without_shared_refs(unique_input_dict)
+
     return unique_input_dict
 
 def deep_copy_without_shared_refs(obj):
@@ -221,14 +347,11 @@ def deep_copy_without_shared_refs(obj):
 
 # ---------------------
 def get_geometry_schema():
-    windio_schema = load_yaml(fschema_windio)
-    wisdem_schema = load_yaml(fschema_geom)
-    merged_schema = jsonmerge.merge(windio_schema, wisdem_schema)
-    return merged_schema
+    _, merged_schema = _load_schema((fschema_windio, fschema_geom))
+    return copy.deepcopy(merged_schema)
 
 def load_geometry_yaml(finput):
-    merged_schema = get_geometry_schema()
-    return _validate(finput, merged_schema, restrictive=False) #True)
+    return _validate(finput, (fschema_windio, fschema_geom), restrictive=False) #True)
 
 
 def load_modeling_yaml(finput):
@@ -240,8 +363,7 @@ def load_analysis_yaml(finput):
 
 
 def write_geometry_yaml(instance, foutput):
-    merged_schema = get_geometry_schema()
-    _validate(instance, merged_schema, restrictive=False, removal=False, defaults=False)
+    _validate(instance, (fschema_windio, fschema_geom), restrictive=False, removal=False, defaults=False)
     sfx_str = '.yaml'
     if foutput[-5:] == sfx_str:
         sfx_str = ''
@@ -0,0 +1,289 @@
+"""
+Bounded memoization cache of model evaluations at design points.
+
+Optimizers often revisit a design point: genetic algorithms carry elite and
+duplicate individuals from one generation to the next, and gradient-based
+optimizers re-evaluate points during line searches.  The drivers look the
+design vector up here before running the model.
+"""
+
+import os
+import pickle
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+
+class DesignPointCache:
+    """
+    Least-recently-used cache of evaluation results keyed on design vectors.
+
+    Design vectors are quantized to multiples of `tol` before hashing, so
+    points that differ by round-off share an entry.  Each entry is a dict of
+    results, e.g. objectives, constraints and gradients.
+
+    Parameters
+    ----------
+    max_entries : int
+        Maximum number of design points kept.
+    max_bytes : int or None
+        Maximum total size of the cached arrays in bytes, None for no limit.
+    tol : float
+        Quantization step of the design vector entries.
+    path : str or None
+        File to load the cache from, if it exists, and to save it to.
+    save_every : int
+        Number of new entries between saves to `path`.
+    writable : bool
+        False to only read `path`, e.g. on all but one MPI rank.
+    fingerprint : str or None
+        Identifier of the evaluated model, see model_fingerprint.  It is saved
+        with the entries, and a file saved for another model is not loaded.
+    """
+
+    def __init__(
+        self, max_entries=1000, max_bytes=None, tol=1e-12, path=None, save_every=10, writable=True, fingerprint=None
+    ):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}.")
+        if tol <= 0.0:
+            raise ValueError(f"tol must be positive, got {tol}.")
+
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.tol = tol
+        self.path = path
+        self.save_every = save_every
+        self.writable = writable
+        self.fingerprint = fingerprint
+
+        self._entries = OrderedDict()
+        self._nbytes = {}
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._unsaved = 0
+
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, x):
+        return self.key(x) in self._entries
+
+    def key(self, x):
+        """
+        Hashable key of a design vector.
+        """
+        # adding 0.0 folds -0.0 into 0.0
+        return (np.round(np.asarray(x, dtype=np.float64).ravel() / self.tol) + 0.0).tobytes()
+
+    def get(self, x, require=()):
+        """
+        Look up the results at design vector x, counting the hit or miss.
+
+        Parameters
+        ----------
+        x : np.ndarray
+            design vector
+        require : tuple[str]
+            results the entry must hold to count as a hit, e.g. ("grad",)
+
+        Returns
+        -------
+        dict or None
+            the cached results, or None if x has not been evaluated
+        """
+        k = self.key(x)
+        entry = self._entries.get(k)
+        if entry is None or any(name not in entry for name in require):
+            self.misses += 1
+            return None
+        self._entries.move_to_end(k)
+        self.hits += 1
+        return entry
+
+    def put(self, x, **results):
+        """
+        Store the results at design vector x, merged into any existing entry.
+        """
+        k = self.key(x)
+        entry = self._entries.pop(k, {})
+        self.nbytes -= self._nbytes.pop(k, 0)
+        entry.update({name: _copy(value) for name, value in results.items()})
+
+        self._entries[k] = entry
+        self._nbytes[k] = sum(_sizeof(value) for value in entry.values())
+        self.nbytes += self._nbytes[k]
+        self._evict()
+
+        self._unsaved += 1
+        if self.path is not None and self.writable and self._unsaved >= self.save_every:
+            self.save()
+
+    def _evict(self):
+        # drop least recently used entries, but always keep the newest one
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_entries or (self.max_bytes is not None and self.nbytes > self.max_bytes)
+        ):
+            k, _ = self._entries.popitem(last=False)
+            self.nbytes -= self._nbytes.pop(k)
+
+    def clear(self):
+        """
+        Drop all entries and reset the statistics.
+        """
+        self._entries.clear()
+        self._nbytes.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_rate(self):
+        """fraction of lookups that found a cached result"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def report(self):
+        """
+        One-line summary of the cache statistics.
+        """
+        return (
+            f"design cache: {self.hits} hits, {self.misses} misses, hit rate {100 * self.hit_rate:.1f}%, "
+            f"{len(self)} entries, {self.nbytes / 2**20:.2f} MB"
+        )
+
+    def save(self, path=None):
+        """
+        Write the entries to disk, atomically replacing the previous file.
+        """
+        path = self.path if path is None else path
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            data = {"tol": self.tol, "fingerprint": self.fingerprint, "entries": self._entries}
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self._unsaved = 0
+
+    def load(self, path=None):
+        """
+        Read entries saved by a previous run, if they used the same quantization and model.
+        """
+        path = self.path if path is None else path
+        with open(path, "rb") as f:
+            data = pickle.load(f)
+        if data["tol"] != self.tol or data.get("fingerprint") != self.fingerprint:
+            if self.writable:
+                print(f"design cache: {path} was saved for another model or quantization and is not reused")
+            return
+        for k, entry in data["entries"].items():
+            self._entries[k] = entry
+            self._nbytes[k] = sum(_sizeof(value) for value in entry.values())
+            self.nbytes += self._nbytes[k]
+        self._evict()
+
+
+def _copy(value):
+    if isinstance(value, dict):
+        return {k: _copy(v) for k, v in value.items()}
+    if isinstance(value, np.ndarray):
+        return value.copy()
+    return value
+
+
+def _sizeof(value):
+    if isinstance(value, dict):
+        return sum(_sizeof(v) for v in value.values())
+    return np.asarray(value).nbytes
+
+
+def input_key(*data):
+    """
+    Hash of model input data, e.g. the validated yaml inputs, or None if it cannot be pickled.
+    """
+    try:
+        return hashlib.sha256(pickle.dumps(data, protocol=4)).hexdigest()
+    except (pickle.PicklingError, TypeError, AttributeError):
+        return None
+
+
+def model_fingerprint(driver, inputs_key=None):
+    """
+    Identifier of the model evaluated by a driver, for DesignPointCache.
+
+    Combines the names, sizes and scaling of the design variables, the names
+    of the objectives and constraints, and the key of the model inputs.
+    """
+
+    def scaling(value):
+        return None if value is None else np.asarray(value, dtype=np.float64).tobytes()
+
+    desvars = [
+        (name, meta["size"], scaling(meta["scaler"]), scaling(meta["adder"]))
+        for name, meta in driver._designvars.items()
+    ]
+    data = (desvars, list(driver._objs), list(driver._cons), inputs_key)
+    return hashlib.sha256(pickle.dumps(data, protocol=4)).hexdigest()
+
+
+def declare_cache_options(options):
+    """
+    Declare the design-point cache options of a driver.
+    """
+    options.declare(
+        "cache_size",
+        types=int,
+        default=0,
+        lower=0,
+        desc="Maximum number of design points whose evaluations are cached. Set to 0 to disable the cache.",
+    )
+    options.declare(
+        "cache_bytes",
+        types=int,
+        default=None,
+        allow_none=True,
+        lower=0,
+        desc="Maximum total size in bytes of the cached evaluations, None for no limit.",
+    )
+    options.declare(
+        "cache_tol",
+        types=float,
+        default=1e-12,
+        lower=0.0,
+        desc="Design vectors are quantized to multiples of this step before the cache lookup.",
+    )
+    options.declare(
+        "cache_file",
+        types=str,
+        default=None,
+        allow_none=True,
+        desc="File the cache is loaded from at the start of a run and saved to during it.",
+    )
+    options.declare(
+        "cache_inputs_key",
+        types=str,
+        default=None,
+        allow_none=True,
+        desc="Key of the model inputs, e.g. from input_key. A cache file saved for other inputs is not loaded.",
+    )
+
+
+def cache_from_options(driver, writable=True):
+    """
+    Build the design-point cache of a driver from its options, or None if it is disabled.
+    """
+    options = driver.options
+    if options["cache_size"] == 0:
+        return None
+    return DesignPointCache(
+        max_entries=options["cache_size"],
+        max_bytes=options["cache_bytes"],
+        tol=options["cache_tol"],
+        path=options["cache_file"],
+        writable=writable,
+        fingerprint=model_fingerprint(driver, options["cache_inputs_key"]),
+    )
@@ -0,0 +1,182 @@
+"""
+Reuse of the outputs of explicit components whose inputs have not changed.
+
+Between driver iterations, and between the perturbed points of a finite
+difference, many components of a model run again on exactly the same
+inputs, e.g. the tower, balance of station and plant finance models in a
+blade-only optimization.  The cache here fingerprints the continuous and
+discrete inputs of a component before each compute and restores the outputs
+of the previous evaluation when the fingerprint matches.  Unlike
+IntermittentComponent, outputs are only reused for bitwise identical inputs,
+so the results are unchanged.
+"""
+
+import copy
+import time
+import pickle
+import hashlib
+from fnmatch import fnmatch
+
+import openmdao.api as om
+
+
+class InputCache:
+    """
+    Outputs of the last evaluation of a component, keyed on a fingerprint of its inputs.
+
+    Only the last evaluation is kept, so any state a component keeps from its
+    last compute, e.g. for its partial derivatives, matches the restored outputs.
+
+    Attributes
+    ----------
+    computes : int
+        Number of evaluations that ran the component.
+    skips : int
+        Number of evaluations that restored the outputs.
+    compute_time : float
+        Time spent running the component, in seconds.
+    overhead_time : float
+        Time spent fingerprinting inputs and storing or restoring outputs, in seconds.
+    """
+
+    def __init__(self):
+        self.key = None
+        self.outputs = None
+        self.discrete_outputs = None
+        self.computes = 0
+        self.skips = 0
+        self.compute_time = 0.0
+        self.overhead_time = 0.0
+
+    @staticmethod
+    def fingerprint(inputs, discrete_inputs=None):
+        """
+        Hash of the values of the continuous and discrete inputs.
+        """
+        h = hashlib.sha1()
+        values = inputs.asarray()
+        h.update(str(values.dtype).encode())
+        h.update(values.tobytes())
+        if discrete_inputs:
+            for name, val in discrete_inputs.items():
+                h.update(name.encode())
+                try:
+                    h.update(pickle.dumps(val, protocol=pickle.HIGHEST_PROTOCOL))
+                except Exception:
+                    h.update(repr(val).encode())
+        return h.digest()
+
+    @property
+    def time_saved(self):
+        """estimate of the time saved by the restored evaluations, net of the overhead, in seconds"""
+        if self.computes == 0:
+            return -self.overhead_time
+        return self.skips * self.compute_time / self.computes - self.overhead_time
+
+    def clear(self):
+        """
+        Drop the stored outputs and reset the statistics.
+        """
+        self.__init__()
+
+
+def cache_unchanged_outputs(system, patterns):
+    """
+    Reuse the last outputs of the explicit components of the matching subsystems when their inputs are unchanged.
+
+    Call from the configure method of a group, once its subsystems are set up.
+    Components computing only on some processors, or whose outputs depend on
+    anything else than their inputs, e.g. random numbers or files, should not
+    be cached.
+
+    Parameters
+    ----------
+    system : Group
+        group whose subsystems are searched
+    patterns : list[str]
+        glob patterns matched against the names of the subsystems and their
+        paths relative to `system`, e.g. ["drivese", "towerse", "financese"].
+        All explicit components in a matching subsystem are cached.
+
+    Returns
+    -------
+    list[str]
+        paths of the cached components, relative to `system`
+    """
+    if not patterns:
+        return []
+
+    cached = []
+    prefix = len(system.pathname) + 1 if system.pathname else 0
+    for comp in system.system_iter(recurse=True, typ=om.ExplicitComponent):
+        relpath = comp.pathname[prefix:]
+        parts = relpath.split(".")
+        ancestors = [".".join(parts[: i + 1]) for i in range(len(parts))]
+        if not any(fnmatch(path, p) or fnmatch(path.split(".")[-1], p) for path in ancestors for p in patterns):
+            continue
+        if comp.comm.size > 1 or hasattr(comp, "_input_cache"):
+            continue
+        comp._input_cache = InputCache()
+        comp.compute = _cached_compute(comp, comp.compute)
+        cached.append(relpath)
+    return cached
+
+
+def _cached_compute(comp, compute):
+    cache = comp._input_cache
+
+    def cached_compute(inputs, outputs, *discrete):
+        # discrete holds the discrete inputs and outputs, if the component has any
+        if comp.under_complex_step:
+            return compute(inputs, outputs, *discrete)
+
+        t0 = time.perf_counter()
+        key = cache.fingerprint(inputs, *discrete[:1])
+        if key == cache.key:
+            outputs.set_val(cache.outputs)
+            if discrete:
+                for name, val in cache.discrete_outputs.items():
+                    discrete[1][name] = copy.deepcopy(val)
+            cache.skips += 1
+            cache.overhead_time += time.perf_counter() - t0
+            return
+
+        t1 = time.perf_counter()
+        cache.key = None  # in case compute fails
+        compute(inputs, outputs, *discrete)
+        t2 = time.perf_counter()
+        cache.outputs = outputs.asarray(copy=True)
+        cache.discrete_outputs = copy.deepcopy(dict(discrete[1].items())) if discrete else None
+        cache.key = key
+        cache.computes += 1
+        cache.compute_time += t2 - t1
+        cache.overhead_time += (t1 - t0) + (time.perf_counter() - t2)
+
+    return cached_compute
+
+
+def input_cache_report(system):
+    """
+    Lines summarizing the computed and restored evaluations of the cached components under a system.
+
+    Components are listed by decreasing time saved, followed by the totals.
+    """
+    prefix = len(system.pathname) + 1 if system.pathname else 0
+    caches = [
+        (comp.pathname[prefix:], comp._input_cache)
+        for comp in system.system_iter(recurse=True, typ=om.ExplicitComponent)
+        if hasattr(comp, "_input_cache")
+    ]
+    if not caches:
+        return []
+
+    caches.sort(key=lambda x: -x[1].time_saved)
+    width = max(len(name) for name, _ in caches)
+    lines = [f"{'Component':<{width}}  {'computed':>8}  {'skipped':>8}  {'time saved [s]':>14}"]
+    for name, cache in caches:
+        lines.append(f"{name:<{width}}  {cache.computes:>8d}  {cache.skips:>8d}  {cache.time_saved:>14.3f}")
+    computes = sum(cache.computes for _, cache in caches)
+    skips = sum(cache.skips for _, cache in caches)
+    saved = sum(cache.time_saved for _, cache in caches)
+    lines.append(f"{'Total':<{width}}  {computes:>8d}  {skips:>8d}  {saved:>14.3f}")
+    return lines
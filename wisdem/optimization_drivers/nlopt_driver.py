@@ -9,6 +9,8 @@ from openmdao.core.driver import Driver, RecordingDebugging
 from openmdao.core.constants import INF_BOUND
 from openmdao.utils.mpi import MPI
 
+from wisdem.optimization_drivers.design_cache import cache_from_options, declare_cache_options
+
 try:
     from openmdao.utils.class_util import weak_method_wrapper as weak_method_wrapper
 except ImportError:
@@ -107,6 +109,10 @@ class NLoptDriver(Driver):
         Copy of _designvars.
     _lincongrad_cache : np.ndarray
         Pre-calculated gradients of linear constraints.
+    _cache : DesignPointCache or None
+        Objective, constraint and gradient values at the design points visited so far.
+    _x_model : ndarray or None
+        Design point of the latest model run.
     """
 
     def __init__(self, **kwargs):
@@ -142,6 +148,8 @@ class NLoptDriver(Driver):
         self._obj_and_nlcons = None
         self._dvlist = None
         self._lincongrad_cache = None
+        self._cache = None
+        self._x_model = None
         self.iter_count = 0
         self._exc_info = None
 
@@ -176,6 +184,7 @@ class NLoptDriver(Driver):
             + "relative function value change. Uses the "
             + "method `set_xtol_rel()` from NLOpt.",
         )
+        declare_cache_options(self.options)
 
     def _get_name(self):
         """
@@ -228,6 +237,9 @@ class NLoptDriver(Driver):
         self._total_jac = None
         self._total_jac_linear = None
         self._desvar_array_cache = None
+        # all ranks hold the same cache, but only the root writes it to disk
+        self._cache = cache_from_options(self, writable=problem.comm.rank == 0)
+        self._x_model = None
 
         self._check_for_missing_objective()
         self._check_for_invalid_desvar_values()
@@ -394,7 +406,13 @@ class NLoptDriver(Driver):
                 opt_prob.set_maxeval(int(self.options["maxiter"]))
                 opt_prob.set_maxtime(self.options["maxtime"])
                 opt_prob.set_population(int(self.options["maxiter"] / self.options["numgen"]))
-                opt_prob.optimize(x_init)
+                x_opt = opt_prob.optimize(x_init)
+
+                # cache hits leave the model at the last point it ran, so bring it to the optimum
+                if self._cache is not None and (
+                    self._x_model is None or self._cache.key(x_opt) != self._cache.key(self._x_model)
+                ):
+                    self._objfunc(x_opt, np.empty(0), use_cache=False)
 
             else:
                 msg = 'Optimizer "{}" is not implemented yet. Choose from: {}'
@@ -410,8 +428,13 @@ class NLoptDriver(Driver):
         if self._exc_info is not None:
             self._reraise()
 
-            
-    def _objfunc(self, x_new, grad):
+        if self._cache is not None:
+            if self._cache.path is not None and self._cache.writable:
+                self._cache.save()
+            if problem.comm.rank == 0:
+                print(self._cache.report())
+
+    def _objfunc(self, x_new, grad, use_cache=True):
         """
         Evaluate and return the objective function.
 
@@ -424,6 +447,8 @@ class NLoptDriver(Driver):
         grad : ndarray
             Empty array that is modified in-place with gradient information for
             the new design point.
+        use_cache : bool
+            False to run the model even if the design point is in the cache.
 
         Returns
         -------
@@ -442,6 +467,17 @@ class NLoptDriver(Driver):
                 model.comm.Bcast(x_new, root=0)
                 model.comm.Bcast(grad, root=0)
 
+            # Reuse the results of an earlier evaluation at the same point
+            entry = None
+            if self._cache is not None and use_cache:
+                entry = self._cache.get(x_new, require=("grad",) if grad.size > 0 else ())
+            if entry is not None:
+                self._con_cache = entry["cons"]
+                if grad.size > 0:
+                    self._grad_cache = entry["grad"]
+                    grad[:] = self._grad_cache[0, :]
+                return float(entry["obj"][0])
+
             # Update the cached design variable vector
             dv_vec.set_data(x_new, driver_scaling=True)
 
@@ -452,6 +488,7 @@ class NLoptDriver(Driver):
                 self.iter_count += 1
                 self._run_solve_nonlinear()
                 self._model_ran = True
+                self._x_model = x_new.copy()
 
             # Get the objective function evaluations
             f_new = list(self.get_objective_values().values())[0]
@@ -478,6 +515,12 @@ class NLoptDriver(Driver):
         except Exception as msg:
             self._exc_info = msg
 
+        if self._cache is not None and self._exc_info is None:
+            results = {"obj": np.atleast_1d(f_new), "cons": self._con_cache}
+            if grad.size > 0:
+                results["grad"] = self._grad_cache
+            self._cache.put(x_new, **results)
+
         return float(f_new[0])
 
     def _confunc(self, x_new, grad, name, dbl, idx):
@@ -1,11 +1,14 @@
+import json
 import time
 from itertools import islice
+from concurrent.futures import Executor
 
 import numpy as np
 from numpy.typing import ArrayLike
 
 from openmdao.utils.mpi import MPI
 
+from wisdem.optimization_drivers.design_cache import DesignPointCache
 from wisdem.optimization_drivers.nsga2.fast_nondom_sort import fast_nondom_sort
 from wisdem.optimization_drivers.nsga2.crowding_distance_assignment import crowding_distance_assignment
 from wisdem.optimization_drivers.nsga2.genetic_functions import (
@@ -14,6 +17,10 @@ from wisdem.optimization_drivers.nsga2.genetic_functions import (
     simulated_binary_crossover,
 )
 
+# message tags for the dynamic MPI schedule
+_TAG_TASK = 71
+_TAG_RESULT = 72
+
 
 class NSGA2:
 
@@ -46,6 +53,11 @@ class NSGA2:
         comm_mpi: MPI.Comm = None  # MPI communicator for parallel evaluation
     model_mpi: tuple[int, int] = None  # parallelization model: size, color
     # follows the format used by openmdao/openmdao/utils/concurrent_utils.py
+    mpi_schedule: str = "static"  # MPI work distribution: "static" round-robin or "dynamic" master/worker
+    executor: Executor = None  # local process/thread pool for parallel evaluation without MPI
+    fun_executor: callable = None  # evaluated by the executor in place of fun_combined
+    collect: callable = None  # applied in this process to each result returned by the executor
+    cache: DesignPointCache = None  # memoized evaluations at previously seen design points
 
     rng_seed: int = None  # a random number generator seed
     accelerated: bool = True  # should we use numba acceleration
@@ -63,8 +75,14 @@ class NSGA2:
         params_override=(None, None, None, None),  # override params for NSGA-II
         comm_mpi = None,  # communicator for parallel implementation, comm_mpi should be MPI.Comm
         model_mpi: tuple[int, int] = None,  # model for spreading work across processes
+        mpi_schedule: str = "static",  # how work is spread across processes under MPI
+        executor: Executor = None,  # local pool for spreading work across processes without MPI
+        fun_executor: callable = None,  # function evaluated by the executor, if not fun_combined
+        collect: callable = None,  # hook for the results returned by the executor
+        cache: DesignPointCache = None,  # cache of evaluations at design points
         verbose: bool = False,  # verbose outputs
         rng_seed: int = None,  # rng seed
+        state: dict = None,  # state from get_state to resume from, instead of evaluating
     ):
         """
         initialize NSGA2 optimizer and its population
@@ -82,6 +100,28 @@ class NSGA2:
             lower bounds on the design variables, if None, defaults to -inf, by default None
         design_vars_u : _type_, optional
             upper bounds on the design variables, if None, defaults to inf, by default None
+        mpi_schedule : str, optional
+            "static" deals the individuals out round-robin by color, "dynamic"
+            has rank 0 hand them out on demand to the other model groups, by
+            default "static"
+        executor : concurrent.futures.Executor or WorkerPool, optional
+            pool used to evaluate the individuals when no MPI communicator is
+            given; the evaluated function must then be picklable.  If a
+            WorkerPool is unavailable or fails, the individuals are evaluated
+            serially with fun_combined from then on, by default None
+        fun_executor : callable, optional
+            function evaluated by the executor in place of fun_combined, by
+            default None
+        collect : callable, optional
+            called in this process as collect(design_vars, result) on the
+            result of each individual evaluated by the executor, in the order
+            of the individuals, and returning its objectives and constraints,
+            e.g. to record evaluations run elsewhere, by default None
+        cache : DesignPointCache, optional
+            cache consulted before evaluating an individual, by default None
+        state : dict, optional
+            state returned by get_state, to resume a run from without
+            evaluating design_vars_init again, by default None
         """
 
         # install provided settings
@@ -95,6 +135,17 @@ class NSGA2:
             self.eta_m = params_override[3]
         self.comm_mpi = comm_mpi
         self.model_mpi = model_mpi
+        if mpi_schedule not in ("static", "dynamic"):
+            raise ValueError(f"Unknown mpi_schedule {mpi_schedule}, expected 'static' or 'dynamic'.")
+        self.mpi_schedule = mpi_schedule
+        self._comm_model_group = None  # communicator within a model group, built on first use
+        self.utilization_history = []  # per-rank busy fractions of each dynamic evaluation
+        if (executor is not None) and (comm_mpi is not None):
+            raise ValueError("An executor cannot be combined with an MPI communicator.")
+        self.executor = executor
+        self.fun_executor = fun_combined if fun_executor is None else fun_executor
+        self.collect = collect
+        self.cache = cache
         self.verbose = verbose
 
         # take in an initial population of design variables
@@ -121,7 +172,8 @@ class NSGA2:
 
         # install evaluation functions for objectives and constraints
         self.fun_combined = fun_combined
-        self.update_data()  # now that there are functions, update values
+        if state is None:
+            self.update_data()  # now that there are functions, update values
 
         design_vars_l = np.array(design_vars_l)  # convert to np.array
         design_vars_u = np.array(design_vars_u)  # convert to np.array
@@ -140,6 +192,65 @@ class NSGA2:
         if self.comm_mpi is not None:
             self._rng_seed_generator = self.comm_mpi.bcast(self._rng_seed_generator, root=0)
 
+        if state is not None:
+            self.set_state(state)
+
+    def get_state(self):
+        """
+        Get the evolving state of the optimizer as a dict of arrays.
+
+        Returns
+        -------
+        dict
+            population, objectives, constraints, front map and random number
+            generator state, enough for set_state to continue the run
+        """
+
+        idx_fronts = [] if self.idx_fronts is None else self.idx_fronts
+        return {
+            "design_vars_population": np.array(self.design_vars_population),
+            "objs_population": np.array(self.objs_population),
+            "constrs_population": np.array(self.constrs_population).reshape(self.N_population, self.N_constr),
+            "needs_recompute": np.array(self.needs_recompute, dtype=bool),
+            "idx_fronts": np.array([i for f in idx_fronts for i in f], dtype=np.int64),
+            "size_fronts": np.array([len(f) for f in idx_fronts], dtype=np.int64),
+            "rng_state": np.array(json.dumps(self._rng_seed_generator.bit_generator.state)),
+        }
+
+    def set_state(self, state: dict):
+        """
+        Resume the optimizer from a state returned by get_state.
+
+        Parameters
+        ----------
+        state : dict
+            the state to install
+        """
+
+        design_vars = np.array(state["design_vars_population"])
+        if design_vars.shape != (self.N_population, self.N_DV):
+            raise ValueError(
+                f"State population size mismatch: expected ({self.N_population}, {self.N_DV}), got {design_vars.shape}."
+            )
+        self.design_vars_population = design_vars
+        self.objs_population = np.array(state["objs_population"])
+        self.constrs_population = np.array(state["constrs_population"])
+        self.needs_recompute = np.array(state["needs_recompute"]).tolist()
+        self.update_feasibility()
+
+        # rebuild the front map and drop the stale front data
+        if len(state["size_fronts"]):
+            offsets = np.cumsum(state["size_fronts"])[:-1]
+            self.idx_fronts = [f.tolist() for f in np.split(np.array(state["idx_fronts"]), offsets)]
+        else:
+            self.idx_fronts = None
+        self.design_vars_fronts = None
+        self.objs_fronts = None
+        self.constrs_fronts = None
+        self.feasibility_fronts = None
+
+        self._rng_seed_generator.bit_generator.state = json.loads(str(state["rng_state"]))
+
     def next_seed(self):
         """
         Returns repeatable pseudo-random integers to use as seed using the class RNG
@@ -219,48 +330,13 @@ class NSGA2:
 
         # evaluate in batch if possible, else fallback to single
         if args_to_eval:
-            if self.comm_mpi is None:
-                results_combo = [self.fun_combined(arg) for arg in args_to_eval]
-                results_obj = [v[:N_obj] for v in results_combo]
-                if N_constr:
-                    results_constr = [v[N_obj : (N_obj + N_constr)] for v in results_combo]
+            if self.cache is None:
+                results_combo = self._evaluate(args_to_eval)
             else:
-                # distribute the evaluation across MPI processes
-                comm = self.comm_mpi
-                rank = comm.rank
-
-                if self.model_mpi is not None:  # i.e.: parallelization model is specified
-                    size, color = self.model_mpi
-                    local_args = islice(args_to_eval, color, None, size)  # slice by color
-                else:
-                    size = comm.size
-                    local_args = islice(args_to_eval, rank, None, size)  # slice by rank
-
-                # scatter the indices to all processes
-                local_results_combo = [self.fun_combined(arg) for arg in local_args]
-                local_results_obj = [v[:N_obj] for v in local_results_combo]
-                if self.N_constr:
-                    local_results_constr = [v[N_obj : (N_obj + N_constr)] for v in local_results_combo]
-
-                # allgather all results
-                gathered_results_obj = comm.allgather(local_results_obj)
-                if self.N_constr:
-                    gathered_results_constr = comm.allgather(local_results_constr)
-
-                # flatten the gathered results on rank 0
-                if rank == 0:
-                    results_obj = [item for sublist in gathered_results_obj for item in sublist]
-                    if self.N_constr:
-                        results_constr = [item for sublist in gathered_results_constr for item in sublist]
-                else:
-                    results_obj = None
-                    if self.N_constr:
-                        results_constr = None
-
-                # broadcast results to all processes
-                results_obj = comm.bcast(results_obj, root=0)
-                if self.N_constr:
-                    results_constr = comm.bcast(results_constr, root=0)
+                results_combo = self._evaluate_cached(args_to_eval)
+            results_obj = [v[:N_obj] for v in results_combo]
+            if N_constr:
+                results_constr = [v[N_obj : (N_obj + N_constr)] for v in results_combo]
 
             # assign results across processors
             v2w = [results_obj]
@@ -289,6 +365,193 @@ class NSGA2:
 
         return tuple(rv)
 
+    def _evaluate(self, args_to_eval):
+        """
+        Evaluate the combined objectives and constraints of a set of individuals.
+
+        Parameters
+        ----------
+        args_to_eval : list[np.ndarray]
+            design variables of the individuals to evaluate
+
+        Returns
+        -------
+        list[np.ndarray]
+            the combined objective and constraint values, in order, on all ranks
+        """
+
+        if self.comm_mpi is None:
+            if self.executor is None:
+                return [self.fun_combined(arg) for arg in args_to_eval]
+            # one task per individual, so idle workers pick up the next
+            # pending individual as soon as they finish their current one
+            results = self.executor.map(self.fun_executor, args_to_eval)
+            if results is None:
+                # the WorkerPool cannot be used
+                self.executor = None
+                return [self.fun_combined(arg) for arg in args_to_eval]
+            if self.collect is None:
+                return list(results)
+            return [self.collect(arg, result) for arg, result in zip(args_to_eval, results)]
+
+        if self.mpi_schedule == "dynamic" and self._get_num_worker_groups() > 0:
+            # hand the individuals out on demand, then share them with all ranks
+            return self._evaluate_dynamic_mpi(args_to_eval)
+
+        # distribute the evaluation across MPI processes
+        comm = self.comm_mpi
+        if self.model_mpi is not None:  # i.e.: parallelization model is specified
+            size, color = self.model_mpi  # slice by color
+        else:
+            size, color = comm.size, comm.rank  # slice by rank
+        local_results_combo = [self.fun_combined(arg) for arg in islice(args_to_eval, color, None, size)]
+
+        # allgather all results and put them back in order
+        results_combo = [None] * len(args_to_eval)
+        for color_other, results_other in comm.allgather((color, local_results_combo)):
+            results_combo[color_other::size] = results_other
+        return results_combo
+
+    def _evaluate_cached(self, args_to_eval):
+        """
+        Evaluate a set of individuals, looking each one up in the cache first.
+
+        Individuals repeated within the set are evaluated once.
+
+        Parameters
+        ----------
+        args_to_eval : list[np.ndarray]
+            design variables of the individuals to evaluate
+
+        Returns
+        -------
+        list[np.ndarray]
+            the combined objective and constraint values, in order, on all ranks
+        """
+
+        keys = [self.cache.key(arg) for arg in args_to_eval]
+        results = {}
+        args_new = {}
+        for key, arg in zip(keys, args_to_eval):
+            if (key in results) or (key in args_new):
+                continue
+            entry = self.cache.get(arg)
+            if entry is None:
+                args_new[key] = arg
+            else:
+                results[key] = entry["values"]
+
+        if args_new:
+            for (key, arg), value in zip(args_new.items(), self._evaluate(list(args_new.values()))):
+                self.cache.put(arg, values=value)
+                results[key] = value
+
+        return [results[key] for key in keys]
+
+    def _get_model_group_comm(self):
+        """
+        Get the communicator of the ranks that run one model together.
+
+        Returns
+        -------
+        MPI.Comm
+            the communicator of this rank's model group, of size one if no
+            parallelization model is specified
+        """
+
+        if self._comm_model_group is None:
+            if self.model_mpi is None:
+                self._comm_model_group = MPI.COMM_SELF
+            else:
+                size, color = self.model_mpi
+                self._comm_model_group = self.comm_mpi.Split(color, self.comm_mpi.rank)
+            # the root of each model group talks to the dispatcher on rank 0
+            is_root = self._comm_model_group.rank == 0
+            roots = self.comm_mpi.allgather(self.comm_mpi.rank if is_root else None)
+            self._ranks_group_root = [r for r in roots if (r is not None) and (r != 0)]
+
+        return self._comm_model_group
+
+    def _get_num_worker_groups(self):
+        """get the number of model groups that evaluate under the dynamic schedule"""
+        self._get_model_group_comm()
+        return len(self._ranks_group_root)
+
+    def _evaluate_dynamic_mpi(self, args_to_eval):
+        """
+        Evaluate individuals with a dynamic master/worker schedule.
+
+        Rank 0 only dispatches: it sends the next pending individual to the
+        root of whichever model group returns a result first, so the wall time
+        follows the mean cost of an evaluation instead of the slowest group's
+        share. The model group of rank 0 sits out; the other groups evaluate.
+
+        Parameters
+        ----------
+        args_to_eval : list[np.ndarray]
+            design variables of the individuals to evaluate
+
+        Returns
+        -------
+        list[np.ndarray]
+            the combined objective and constraint values, in order, on all ranks
+        """
+
+        comm = self.comm_mpi
+        comm_group = self._get_model_group_comm()
+        tm_st = time.time()
+        tm_busy = 0.0
+
+        if comm.rank == 0:
+            results_combo = [None] * len(args_to_eval)
+            queue = iter(enumerate(args_to_eval))
+
+            # prime every worker group, sending the stop signal to any left over
+            N_active = 0
+            for rank_root in self._ranks_group_root:
+                task = next(queue, None)
+                comm.send(task, dest=rank_root, tag=_TAG_TASK)
+                N_active += task is not None
+
+            # refill each group as it reports back
+            status = MPI.Status()
+            while N_active:
+                idx, value = comm.recv(source=MPI.ANY_SOURCE, tag=_TAG_RESULT, status=status)
+                results_combo[idx] = value
+                task = next(queue, None)
+                comm.send(task, dest=status.Get_source(), tag=_TAG_TASK)
+                N_active -= task is None
+        elif self.model_mpi is None or self.model_mpi[1] != 0:
+            # worker group: the root receives tasks, the rest of the group follows along
+            while True:
+                task = comm.recv(source=0, tag=_TAG_TASK) if comm_group.rank == 0 else None
+                task = comm_group.bcast(task, root=0)
+                if task is None:
+                    break
+                idx, arg = task
+                tm_task = time.time()
+                value = self.fun_combined(arg)
+                tm_busy += time.time() - tm_task
+                if comm_group.rank == 0:
+                    comm.send((idx, value), dest=0, tag=_TAG_RESULT)
+            results_combo = None
+        else:
+            results_combo = None  # the dispatcher's model group waits for the results
+
+        # log the fraction of the wall time each rank spent evaluating
+        busy = comm.gather(tm_busy, root=0)
+        if comm.rank == 0:
+            utilization = np.array(busy) / max(time.time() - tm_st, np.finfo(float).tiny)
+            self.utilization_history.append(utilization)
+            if self.verbose:
+                print(
+                    f" RANK UTILIZATION: {np.array2string(utilization, precision=2)}.",
+                    end="",
+                    flush=True,
+                )
+
+        return comm.bcast(results_combo, root=0)
+
     def update_data(self):
         """
         Update the internal objectives.
@@ -356,9 +619,8 @@ class NSGA2:
         # first, update any objectives and constraints
         self.update_data_external(design_vars_in, objs_in, needs_recompute, constrs_p=constrs_in)
 
-        # create a list to pass to the sorting algorithm
-        objs_tosort = list(map(tuple, objs_in))
-        # TODO: figure out how to pass the map object and still have it work
+        # the vectorized sort takes the array, the reference one a list of tuples
+        objs_tosort = np.asarray(objs_in) if self.accelerated else list(map(tuple, objs_in))
 
         if self.verbose:  # if verbose, print and start timer
             print("COMPUTING THE PARETO FRONTS...", end="", flush=True)
@@ -626,14 +888,14 @@ class NSGA2:
         # get the global/local ranking of the points
         D_front = self.get_crowding_distance_data(objs_front_in)
 
-        count_front = ([0] + [len(f) for f in D_front])[:-1]  # get the front sizes
-        localR_front = [np.argsort(-D).tolist() for D in D_front]  # sort on crowding distance within fronts
+        offset_front = np.cumsum([0] + [len(f) for f in D_front])[:-1]  # get the front offsets
+        localR_front = [np.argsort(-D) for D in D_front]  # sort on crowding distance within fronts
 
         if local:
-            return localR_front  # we're done if we just want intra-front ranking
+            return [R.tolist() for R in localR_front]  # we're done if we just want intra-front ranking
 
         # continue on and return global ranking
-        R_front = [(R + np.cumsum(count_front)[i]).tolist() for i, R in enumerate(localR_front)]
+        R_front = [(R + offset_front[i]).tolist() for i, R in enumerate(localR_front)]
         return R_front
 
     def get_rank(
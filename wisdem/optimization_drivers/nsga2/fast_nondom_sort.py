@@ -1,3 +1,5 @@
+from bisect import bisect_left
+
 import numpy as np
 
 try:
@@ -7,6 +9,10 @@ try:
 except ImportError:
     compile_numba = False
 
+# number of pairwise objective comparisons held in memory at once by the
+# block-wise domination counts, i.e. rows per block times N times M
+block_elements = 2**24
+
 
 def fast_nondom_sort_ranks_python(P):
     """
@@ -78,6 +84,102 @@ else:
     fast_nondom_sort_ranks.function_nojit = fast_nondom_sort_ranks_python
 
 
+def _count_dominating(P_from, P_to):
+    """
+    Count, for each point of P_to, how many points of P_from dominate it.
+
+    Args:
+      P_from (np.ndarray): (K, M) objectives of the candidate dominating points.
+      P_to (np.ndarray): (N, M) objectives of the points to test.
+
+    Returns:
+        counts (np.ndarray): (N,) number of points of P_from dominating each point of P_to.
+    """
+    K, M = P_from.shape
+    N = len(P_to)
+    counts = np.zeros(N, dtype=np.int64)
+    rows = max(1, block_elements // max(1, N * M))
+    for i0 in range(0, K, rows):
+        block = P_from[i0 : i0 + rows]
+        # compare one objective at a time to keep the temporaries two-dimensional
+        from_better = np.zeros((len(block), N), dtype=bool)
+        to_better = np.zeros((len(block), N), dtype=bool)
+        for m in range(M):
+            from_better |= block[:, m, None] < P_to[None, :, m]
+            to_better |= P_to[None, :, m] < block[:, m, None]
+        counts += np.count_nonzero(from_better & ~to_better, axis=0)
+    return counts
+
+
+def fast_nondom_sort_ranks_numpy(P):
+    """
+    Perform non-dominated sorting on population P with block-wise NumPy comparisons.
+
+    Gives the same ranks as fast_nondom_sort_ranks_python. The domination
+    counts are built in blocks of rows so memory stays bounded, then the
+    fronts are peeled off by discounting each front's dominance over the
+    points not yet ranked.
+
+    Args:
+      P (list or np.ndarray): Population, each element is a list/array of objectives.
+
+    Returns:
+        ranks (np.ndarray): Front rank of each solution in P.
+    """
+    P = np.asarray(P, dtype=np.float64)
+    N = len(P)
+    ranks = np.full(N, -1, dtype=np.int64)
+    if N == 0:
+        return ranks
+
+    n = _count_dominating(P, P)
+    remaining = np.arange(N)
+    rank = 0
+    while remaining.size:
+        in_front = n[remaining] == 0
+        front = remaining[in_front]
+        if not front.size:
+            break  # only possible with NaN objectives, as in the reference
+        ranks[front] = rank
+        remaining = remaining[~in_front]
+        if remaining.size:
+            n[remaining] -= _count_dominating(P[front], P[remaining])
+        rank += 1
+    return ranks
+
+
+def fast_nondom_sort_ranks_2d(P):
+    """
+    Perform non-dominated sorting on a two-objective population in O(N log N).
+
+    The points are visited in lexicographic order of (f1, f2), so every
+    point that can dominate a point is visited before it. Each front then
+    has f2 decreasing as f1 increases, and a point is dominated by a front
+    exactly when the (f2, f1) key of the front's latest point is smaller
+    than its own. That test is monotone over the fronts, so the first front
+    not dominating the point is found by bisection.
+
+    Args:
+      P (np.ndarray): (N, 2) objectives, without NaN.
+
+    Returns:
+        ranks (np.ndarray): Front rank of each solution in P.
+    """
+    P = np.asarray(P, dtype=np.float64)
+    N = len(P)
+    ranks = np.full(N, -1, dtype=np.int64)
+    keys_front = []  # (f2, f1) of the latest point added to each front
+    for p in np.lexsort((P[:, 1], P[:, 0])):
+        key = (P[p, 1], P[p, 0])
+        k = bisect_left(keys_front, key)
+        if k == len(keys_front):
+            keys_front.append(key)
+        else:
+            keys_front[k] = key
+        ranks[p] = k
+    return ranks
+
+
 def _fast_nondom_sort(P, compile_numba_local=False):
     """
     Wrapper for fast_nondom_sort_ranks that returns the list-of-lists of indices for each front.
@@ -98,6 +200,30 @@ def _fast_nondom_sort(P, compile_numba_local=False):
     return fronts
 
 
-fast_nondom_sort = lambda P: _fast_nondom_sort(P, compile_numba_local=compile_numba)
-fast_nondom_sort.is_numba = compile_numba
+def fast_nondom_sort_vectorized(P):
+    """
+    Non-dominated sorting into the list-of-lists of indices for each front.
+
+    Uses the O(N log N) sort for two objectives and the block-wise NumPy
+    sort otherwise; the fronts match those of the reference implementation.
+
+    Args:
+      P (list or np.ndarray): Population, each element is a list/array of objectives.
+
+    Returns:
+        fronts (list of lists): Each sublist contains indices of solutions in that front.
+    """
+    P = np.asarray(P, dtype=np.float64)
+    if P.ndim == 2 and P.shape[1] == 2 and not np.isnan(P).any():
+        ranks = fast_nondom_sort_ranks_2d(P)
+    else:
+        ranks = fast_nondom_sort_ranks_numpy(P)
+    order = np.argsort(ranks, kind="stable")
+    order = order[ranks[order] >= 0]
+    offsets = np.flatnonzero(np.diff(ranks[order])) + 1
+    return [f.tolist() for f in np.split(order, offsets)]
+
+
+fast_nondom_sort = fast_nondom_sort_vectorized
+fast_nondom_sort.is_numba = False
 fast_nondom_sort.function_nojit = lambda P: _fast_nondom_sort(P, compile_numba_local=False)
@@ -0,0 +1,123 @@
+import os
+from pathlib import Path
+
+import numpy as np
+
+
+class NSGA2History:
+    """
+    Append-only store of the generations of an NSGA2 run.
+
+    Each generation is written once, as its own binary .npz segment holding
+    the optimizer state (see NSGA2.get_state), so the cost of saving a
+    generation does not grow with the length of the run. The initial
+    population is stored as generation -1.
+    """
+
+    def __init__(self, folder):
+        """
+        Parameters
+        ----------
+        folder : str or Path
+            directory holding the generation segments
+        """
+        self.folder = Path(folder)
+
+    def _path(self, generation: int):
+        return self.folder / f"generation_{generation + 1:06d}.npz"
+
+    @property
+    def generations(self):
+        """sorted list of the stored generations"""
+        if not self.folder.is_dir():
+            return []
+        return sorted(int(p.stem.split("_")[1]) - 1 for p in self.folder.glob("generation_*.npz"))
+
+    def __len__(self):
+        return len(self.generations)
+
+    def append(self, generation: int, optimizer):
+        """
+        Store the state of an NSGA2 optimizer after the given generation.
+
+        Parameters
+        ----------
+        generation : int
+            the generation index, -1 for the initial population
+        optimizer : NSGA2
+            the optimizer to take the state from
+        """
+        os.makedirs(self.folder, exist_ok=True)
+        path = self._path(generation)
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            np.savez(f, generation=generation, **optimizer.get_state())
+        os.replace(tmp, path)  # never leave a partially written segment behind
+
+    def clear(self):
+        """
+        Delete all stored generations.
+        """
+        for generation in self.generations:
+            self._path(generation).unlink()
+
+    def load(self, generation: int = None):
+        """
+        Load the stored state of a generation.
+
+        Parameters
+        ----------
+        generation : int, optional
+            the generation to load, by default the last stored one
+
+        Returns
+        -------
+        dict
+            the arrays of the optimizer state, plus the generation index
+        """
+        if generation is None:
+            generations = self.generations
+            if not generations:
+                raise FileNotFoundError(f"No NSGA2 generations stored in {self.folder}.")
+            generation = generations[-1]
+        with np.load(self._path(generation)) as data:
+            return {k: data[k] for k in data.files}
+
+    def fronts(self, generation: int = None):
+        """
+        Get the non-dominated fronts of a generation.
+
+        Parameters
+        ----------
+        generation : int, optional
+            the generation, by default the last stored one
+
+        Returns
+        -------
+        list[np.ndarray]
+            design variables of each front
+        list[np.ndarray]
+            objective values of each front
+        list[np.ndarray]
+            constraint values of each front
+        """
+        state = self.load(generation)
+        offsets = np.cumsum(state["size_fronts"])[:-1]
+        idx_fronts = np.split(state["idx_fronts"], offsets) if len(state["size_fronts"]) else []
+        return (
+            [state["design_vars_population"][f, :] for f in idx_fronts],
+            [state["objs_population"][f, :] for f in idx_fronts],
+            [state["constrs_population"][f, :] for f in idx_fronts],
+        )
+
+    def design_vars(self, generation: int = None):
+        """design variables of the population of a generation"""
+        return self.load(generation)["design_vars_population"]
+
+    def objectives(self, generation: int = None):
+        """objective values of the population of a generation"""
+        return self.load(generation)["objs_population"]
+
+    def constraints(self, generation: int = None):
+        """constraint values of the population of a generation"""
+        return self.load(generation)["constrs_population"]
@@ -1,24 +1,57 @@
-import os
 import copy
 from pprint import pprint
-from wisdem.inputs.validation import write_yaml
-from wisdem.inputs.validation import simple_types
 
 import numpy as np
 
 from wisdem.optimization_drivers.nsga2.algo_nsga2 import NSGA2 as NSGA2_implementation
+from wisdem.optimization_drivers.nsga2.history import NSGA2History
+from wisdem.optimization_drivers.design_cache import cache_from_options, declare_cache_options
+from wisdem.commonse.worker_pool import WorkerPool
 
 try:
     from pyDOE3 import lhs
 except ModuleNotFoundError:
     lhs = None
 
-from openmdao.core.constants import INF_BOUND
+from openmdao.core.constants import INF_BOUND, _SetupStatus
 from openmdao.core.driver import Driver, RecordingDebugging
 from openmdao.utils.concurrent_utils import concurrent_eval
 from openmdao.utils.mpi import MPI
 from openmdao.core.analysis_error import AnalysisError
 
+# the problem held by each process of the local worker pool
+_pool_problem = None
+
+
+def _init_pool_worker(problem_factory):
+    """
+    Build the worker's own problem from the factory, once per worker process.
+    """
+    global _pool_problem
+
+    prob = problem_factory()
+    if not isinstance(prob.driver, NSGA2Driver):
+        raise TypeError(
+            f"problem_factory must return a Problem driven by NSGA2Driver, got {type(prob.driver).__name__}."
+        )
+    if prob._metadata["setup_status"] == _SetupStatus.PRE_SETUP:
+        prob.setup()
+    prob.final_setup()
+    prob.driver._setup_desvar_idx()
+    _pool_problem = prob
+
+
+def _evaluate_on_pool_worker(x):
+    """
+    Evaluate one individual on the worker's problem.
+
+    Along with the objectives and constraints, the model's outputs and inputs
+    are returned so the driver's process can record the evaluation.
+    """
+    values = _pool_problem.driver.objective_callback(x)
+    model = _pool_problem.model
+    return values, model._outputs.asarray(copy=True), model._inputs.asarray(copy=True)
+
 
 class NSGA2Driver(Driver):
     """
@@ -91,6 +124,10 @@ class NSGA2Driver(Driver):
 
         self._nfit = 0  # Number of successful function evaluations
 
+        self._pool = None  # local worker pool, alive only while the generations run
+        self._cache = None  # design-point cache of the current run
+        self.history = None  # store of the generations of the current run
+
     def _declare_options(self):
         """
         Declare options before kwargs are processed in the init method.
@@ -117,6 +154,30 @@ class NSGA2Driver(Driver):
             lower=1,
             desc="Number of processors to give each model under MPI.",
         )
+        self.options.declare(
+            "mpi_schedule",
+            default="static",
+            values=["static", "dynamic"],
+            desc="How the points in a generation are spread across the models under MPI: "
+            "'static' deals them out round-robin, 'dynamic' has rank 0 hand them out on demand "
+            "to the other models, which balances uneven run times.",
+        )
+        self.options.declare(
+            "num_workers",
+            types=int,
+            default=0,
+            lower=0,
+            desc="Number of local worker processes evaluating the individuals, not used under MPI. "
+            "Set to 0 to evaluate them in the driver's own process.",
+        )
+        self.options.declare(
+            "problem_factory",
+            default=None,
+            allow_none=True,
+            recordable=False,
+            desc="Callable returning a new Problem for the same model, driven by an "
+            "NSGA2Driver; each worker process calls it once. Required when num_workers > 0.",
+        )
         self.options.declare(
             "penalty_parameter",
             default=0.0,
@@ -151,6 +212,14 @@ class NSGA2Driver(Driver):
             lower=0.0,
             desc="Distribution index for mutation.",
         )
+        self.options.declare(
+            "restart",
+            types=bool,
+            default=False,
+            desc="Resume from the last generation stored in the nsga2_history folder of the outputs "
+            "directory, instead of starting from a new initial population.",
+        )
+        declare_cache_options(self.options)
 
     def _setup_driver(self, problem):
         """
@@ -284,6 +353,32 @@ class NSGA2Driver(Driver):
         """
         return "NSGA2"
 
+    def _setup_desvar_idx(self):
+        """
+        Map each design variable to its slice of the flat design vector.
+
+        Returns
+        -------
+        int
+            Total size of the flat design vector.
+        """
+        desvar_vals = self.get_design_var_values()
+
+        count = 0
+        for name, meta in self._designvars.items():
+            if name in self._designvars_discrete:
+                val = desvar_vals[name]
+                if np.ndim(val) == 0:
+                    size = 1
+                else:
+                    size = len(val)
+            else:
+                size = meta["size"]
+            self._desvar_idx[name] = (count, count + size)
+            count += size
+
+        return count
+
     def run(self):
         """
         Execute the genetic algorithm.
@@ -314,19 +409,7 @@ class NSGA2Driver(Driver):
         # size design variables
         desvars = self._designvars
         desvar_vals = self.get_design_var_values()
-
-        count = 0
-        for name, meta in desvars.items():
-            if name in self._designvars_discrete:
-                val = desvar_vals[name]
-                if np.ndim(val) == 0:
-                    size = 1
-                else:
-                    size = len(val)
-            else:
-                size = meta["size"]
-            self._desvar_idx[name] = (count, count + size)
-            count += size
+        count = self._setup_desvar_idx()
 
         lower_bound = np.empty((count,))
         upper_bound = np.empty((count,))
@@ -369,59 +452,37 @@ class NSGA2Driver(Driver):
         )
         self.population_init = design_vars_init  # save the initial population for inspection
 
-        # create a new NSGA2 instance
-        self.icase = 0
-        self.optimizer_nsga2 = NSGA2_implementation(
-            design_vars_init,
-            self.objective_callback,
-            len(self._objs),
-            len(self._cons),
-            design_vars_l=lower_bound,
-            design_vars_u=upper_bound,
-            params_override=(Pc, eta_c, Pm, eta_m),
-            comm_mpi=(self.config_mpi[0] if MPI and self.options["run_parallel"] else None),
-            model_mpi=self.config_mpi[1],
-            # verbose=True,
-            verbose=False,
-        )
-        self.optimizer_nsga2.get_fronts()  # evaluate the initial fronts
-
-        # get the debug output file for the openmdao nsga2 driver
-        nsga2_output_dir = model.get_outputs_dir()
-        nsga2_debug_collection = dict()
+        # set up the local worker pool, if requested
+        num_workers = self.options["num_workers"]
+        if num_workers > 0:
+            if self.options["problem_factory"] is None:
+                raise ValueError("NSGA2 needs a problem_factory to evaluate the population on num_workers > 0.")
+            self._pool = WorkerPool(
+                num_workers,
+                "NSGA2",
+                initializer=_init_pool_worker,
+                initargs=(self.options["problem_factory"],),
+            )
+            if not self._pool.available:
+                self._pool = None
+        else:
+            self._pool = None
 
-        rv = self.optimizer_nsga2.get_fronts(
-            compute_constrs=True,
-            feasibility_dominates=True,
-        )
-        nsga2_debug_collection[-1] = {
-            "generation": -1,
-            "design_vars_fronts": rv[1],
-            "objs_fronts": rv[2],
-            "constrs_fronts": rv[3],
-        }
-        # create a yaml file at the path
-        os.makedirs(nsga2_output_dir, exist_ok=True)
-        write_yaml(nsga2_debug_collection, nsga2_output_dir / "nsga2_debug.yaml")
+        # all ranks hold the same cache, but only the root writes it to disk
+        self._cache = cache_from_options(self, writable=self._problem().comm.rank == 0)
 
-        # iterate over the specified generations
-        for generation in range(max_gen + 1):
-            # iterate the population
-            self.optimizer_nsga2.iterate_population()
+        try:
+            self._run_generations(design_vars_init, lower_bound, upper_bound, (Pc, eta_c, Pm, eta_m), max_gen)
+        finally:
+            if self._pool is not None:
+                self._pool.shutdown()
+                self._pool = None
 
-            rv = self.optimizer_nsga2.get_fronts(
-                compute_constrs=True,
-                feasibility_dominates=True,
-            )
-            nsga2_debug_collection[generation] = {
-                "generation": generation,
-                "design_vars_fronts": rv[1],
-                "objs_fronts": rv[2],
-                "constrs_fronts": rv[3],
-            }
-            # create a yaml file at the path
-            write_yaml(nsga2_debug_collection, nsga2_output_dir / "nsga2_debug.yaml")
-            print(f"generation: {generation} of {max_gen}")
+        if self._cache is not None:
+            if self._cache.path is not None and self._cache.writable:
+                self._cache.save()
+            if self._problem().comm.rank == 0:
+                print(self._cache.report())
 
         # Save the non-dominated Pareto front — the whole point of NSGA2
         self.optimizer_nsga2.sort_data()
@@ -439,7 +500,7 @@ class NSGA2Driver(Driver):
         desvar_new = design_vars_fronts[0][median_idx, :]
         for name in desvars:
             i, j = self._desvar_idx[name]
-            self.set_design_var(name, desvar_new[i:j])
+            self._set_design_var(name, desvar_new[i:j])
         with RecordingDebugging(self._get_name(), self.iter_count, self) as rec:
             self._run_solve_nonlinear()
             rec.abs = 0.0
@@ -448,6 +509,97 @@ class NSGA2Driver(Driver):
 
         return False
 
+    def _run_generations(self, design_vars_init, lower_bound, upper_bound, params_override, max_gen):
+        """
+        Evaluate the initial population and iterate it over the generations.
+        """
+
+        model = self._problem().model
+
+        # the generation store: resume from its last generation or start it over
+        self.history = NSGA2History(model.get_outputs_dir() / "nsga2_history")
+        state = None
+        generation_first = 0
+        if self.options["restart"] and len(self.history):
+            state = self.history.load()
+            if state["design_vars_population"].shape != design_vars_init.shape:
+                raise ValueError(
+                    f"Cannot restart NSGA2 from {self.history.folder}: the stored population has shape "
+                    f"{state['design_vars_population'].shape}, expected {design_vars_init.shape}."
+                )
+            design_vars_init = state["design_vars_population"]
+            generation_first = int(state["generation"]) + 1
+        elif self._problem().comm.rank == 0:
+            self.history.clear()
+
+        # create a new NSGA2 instance
+        self.icase = 0
+        self.optimizer_nsga2 = NSGA2_implementation(
+            design_vars_init,
+            self.objective_callback,
+            len(self._objs),
+            len(self._cons),
+            design_vars_l=lower_bound,
+            design_vars_u=upper_bound,
+            params_override=params_override,
+            comm_mpi=(self.config_mpi[0] if MPI and self.options["run_parallel"] else None),
+            model_mpi=self.config_mpi[1],
+            mpi_schedule=self.options["mpi_schedule"],
+            executor=self._pool,
+            fun_executor=_evaluate_on_pool_worker,
+            collect=self._record_pool_result,
+            cache=self._cache,
+            # verbose=True,
+            verbose=False,
+            state=state,
+        )
+        self.optimizer_nsga2.get_fronts(compute_constrs=True, feasibility_dominates=True)  # evaluate the fronts
+        if state is None:
+            self._append_history(-1)
+        else:
+            print(f"restarting from generation {generation_first - 1} of {self.history.folder}")
+
+        # iterate over the specified generations
+        for generation in range(generation_first, max_gen + 1):
+            # iterate the population
+            self.optimizer_nsga2.iterate_population()
+
+            self.optimizer_nsga2.get_fronts(
+                compute_constrs=True,
+                feasibility_dominates=True,
+            )
+            self._append_history(generation)
+            print(f"generation: {generation} of {max_gen}")
+            if self.optimizer_nsga2.utilization_history:
+                utilization = self.optimizer_nsga2.utilization_history[-1]
+                print(f"rank utilization: mean {np.mean(utilization):.2f}, min {np.min(utilization):.2f}")
+
+    def _record_pool_result(self, x, result):
+        """
+        Record an individual evaluated on the local worker pool, as objective_callback records its evaluations.
+
+        The outputs and inputs computed by the worker are copied into this
+        process's model first, so the case holds the worker's values.
+        """
+        values, outputs, inputs = result
+        model = self._problem().model
+        if outputs.size != model._outputs.asarray().size or inputs.size != model._inputs.asarray().size:
+            raise RuntimeError("The problem_factory of NSGA2 must build the same model as the driver's problem.")
+        model._outputs.set_val(outputs)
+        model._inputs.set_val(inputs)
+
+        with RecordingDebugging(self._get_name(), self.iter_count, self):
+            self.iter_count += 1
+
+        return values
+
+    def _append_history(self, generation):
+        """
+        Store the population of a generation, from the root process only.
+        """
+        if self._problem().comm.rank == 0:
+            self.history.append(generation, self.optimizer_nsga2)
+
     def objective_callback(self, x):
 
         model = self._problem().model  # get the model
@@ -471,7 +623,7 @@ class NSGA2Driver(Driver):
         out_of_bounds = False
         for name in self._designvars:
             i, j = self._desvar_idx[name]
-            self.set_design_var(name, x[i:j])
+            self._set_design_var(name, x[i:j])
 
             # Check that design variables are within bounds
             if (
@@ -0,0 +1,149 @@
+"""
+Finite-difference total derivatives with the perturbed model runs spread over forked processes.
+
+Without MPI, OpenMDAO runs the perturbed points of every finite-difference
+column of the total Jacobian one after the other.  The scheme here forks
+worker processes that each inherit a copy of the set-up problem at the
+current design point, runs the perturbed points concurrently, and
+assembles the Jacobian columns on the parent process.
+
+The scheme relies on private methods of OpenMDAO's approximation schemes and
+systems, checked against OpenMDAO 3.45.  If any of them is missing or has
+changed its signature, the finite difference runs serially instead.
+"""
+
+import inspect
+import functools
+
+import numpy as np
+from openmdao.core.group import Group
+from openmdao.core.system import System
+from openmdao.approximation_schemes.finite_difference import FiniteDifference
+
+from wisdem.commonse.worker_pool import fork_map, pools_available
+
+# private OpenMDAO methods used by the forked scheme, with their expected parameters
+_OPENMDAO_INTERNALS = [
+    (FiniteDifference, "_uncolored_column_iter", ["self", "system", "approx_groups"]),
+    (FiniteDifference, "_vec_ind_iter", ["self", "vec_ind_list"]),
+    (FiniteDifference, "_run_point", ["self", "system", "idx_info", "data", "results_array", "total", "loc_idx"]),
+    (FiniteDifference, "_transform_result", ["self", "array"]),
+    (FiniteDifference, "_get_total_result", ["self", "outarr", "totarr"]),
+    (FiniteDifference, "apply_directional", ["self", "data", "direction"]),
+    (Group, "_get_approx_scheme", ["self", "method"]),
+    (System, "_get_jac_ofs", ["self"]),
+]
+
+
+@functools.lru_cache(maxsize=None)
+def openmdao_internals_match():
+    """
+    True if the private OpenMDAO methods the forked scheme relies on exist with the expected signatures.
+    """
+    for cls, name, params in _OPENMDAO_INTERNALS:
+        method = getattr(cls, name, None)
+        if not callable(method):
+            return False
+        try:
+            if list(inspect.signature(method).parameters) != params:
+                return False
+        except (TypeError, ValueError):
+            return False
+    return True
+
+
+def _run_fd_task(state, i):
+    # run on a forked worker: perturb the model copy, run it and return the total jacobian column
+    scheme, system, tasks, results_array, tot_result = state
+    wrt, directional, data, vec_ind_info, loc_idx = tasks[i]
+    seeds = wrt if directional else (wrt,)
+    with system._relevance.seeds_active(fwd_seeds=seeds):
+        result = scheme._run_point(system, vec_ind_info, data, results_array, True, loc_idx)
+    result = scheme._transform_result(result)
+    return scheme._get_total_result(result, tot_result).copy()
+
+
+class ForkedFiniteDifference(FiniteDifference):
+    """
+    Finite difference of the total derivatives run on forked worker processes.
+
+    Each Jacobian column is evaluated by a worker holding a copy of the
+    model, forked at the point where the derivatives are taken, so the
+    columns match the serial finite difference.  Falls back to the serial
+    scheme for partial derivatives, colored approximations and where the
+    worker pools of wisdem.commonse.worker_pool cannot be used.
+
+    Parameters
+    ----------
+    num_workers : int
+        Number of worker processes.
+    """
+
+    def __init__(self, num_workers=2):
+        super().__init__()
+        self.num_workers = num_workers
+
+    def _uncolored_column_iter(self, system, approx_groups):
+        if (
+            self.num_workers < 2
+            or system.pathname != ""
+            or system.comm.size > 1
+            or self._progress_out
+            or not pools_available()
+            or not hasattr(getattr(system, "_relevance", None), "seeds_active")
+            or any(len(group) != 6 for group in approx_groups)
+        ):
+            yield from super()._uncolored_column_iter(system, approx_groups)
+            return
+
+        tasks = []
+        columns = []
+        for wrt, data, jcol_idxs, vec_ind_list, directional, direction in approx_groups:
+            app_data = data if direction is None else self.apply_directional(data, direction)
+            for icount, (vec_ind_info, _, loc_idx) in enumerate(self._vec_ind_iter(vec_ind_list)):
+                # the iterator reuses its entry list, so keep a copy
+                tasks.append((wrt, directional, app_data, [list(entry) for entry in vec_ind_info], loc_idx))
+                jinds = jcol_idxs[icount]
+                columns.append(jinds[0] if directional else jinds)
+        if not tasks:
+            return
+
+        n_rows = sum(end - start for _, start, end, _, _ in system._get_jac_ofs())
+        tot_result = np.zeros(n_rows)
+        results_array = system._outputs.asarray(copy=True)
+
+        state = (self, system, tasks, results_array, tot_result)
+        results = fork_map(_run_fd_task, state, len(tasks), self.num_workers, "Finite difference")
+        if results is None:
+            yield from super()._uncolored_column_iter(system, approx_groups)
+            return
+        yield from zip(columns, results)
+
+
+def approx_totals(model, num_workers=0, method="fd", step=None, form=None, step_calc=None):
+    """
+    Approximate the total derivatives of a model, finite differencing on forked workers if requested.
+
+    Parameters
+    ----------
+    model : Group
+        top-level group of the problem
+    num_workers : int
+        number of worker processes for the finite difference, 0 or 1 to run it serially
+    method, step, form, step_calc :
+        as for Group.approx_totals
+    """
+    if method == "fd" and num_workers > 1 and not (openmdao_internals_match() and hasattr(model, "_approx_schemes")):
+        print(" WARNING** This OpenMDAO version does not support the forked finite difference; running it serially")
+    elif method == "fd" and num_workers > 1:
+        # OpenMDAO recreates the scheme whenever it sets up the total jacobian,
+        # so hand out the forked scheme from this model's scheme lookup
+        get_approx_scheme = type(model)._get_approx_scheme
+
+        def _get_approx_scheme(method):
+            if method == "fd" and not isinstance(model._approx_schemes.get(method), ForkedFiniteDifference):
+                model._approx_schemes[method] = ForkedFiniteDifference(num_workers)
+            return get_approx_scheme(model, method)
+
+        model._get_approx_scheme = _get_approx_scheme
+    model.approx_totals(method=method, step=step, form=form, step_calc=step_calc)
@@ -50,6 +50,8 @@ class PreComp:
         sector_idx_strain_spar_ss,
         sector_idx_strain_te_ps,
         sector_idx_strain_te_ss,
+        n_workers=1,
+        pool="process",
     ):
         """Constructor
 
@@ -75,6 +77,10 @@ class PreComp:
         upperCS, lowerCS, websCS : list(:class:`CompositeSection`)
             list of CompositeSection objections defining the properties for upper surface, lower surface,
             and shear webs (if any) for each section
+        n_workers : int, optional
+            number of workers evaluating the sections in parallel, 1 evaluates them serially
+        pool : str, optional
+            'process' or 'thread', type of worker pool used when n_workers > 1
 
         """
 
@@ -96,6 +102,9 @@ class PreComp:
         self.sector_idx_strain_te_ps = sector_idx_strain_te_ps
         self.sector_idx_strain_te_ss = sector_idx_strain_te_ss
 
+        self.n_workers = n_workers
+        self.pool = pool
+
         # twist rate
         #self.th_prime = _precomp.tw_rate(self.r, self.theta)
         self.th_prime = properties.tw_rate(self.r, self.theta)
@@ -106,33 +115,6 @@ class PreComp:
         # radial discretization
         nsec = len(self.r)
 
-        # initialize variables
-        beam_z = self.r
-        beam_EA = np.zeros(nsec)
-        beam_EIxx = np.zeros(nsec)
-        beam_EIyy = np.zeros(nsec)
-        beam_EIxy = np.zeros(nsec)
-        beam_GJ = np.zeros(nsec)
-        beam_EA_EIxx = np.zeros(nsec)
-        beam_EA_EIyy = np.zeros(nsec)
-        beam_EIxx_GJ = np.zeros(nsec)
-        beam_EIyy_GJ = np.zeros(nsec)
-        beam_EA_GJ = np.zeros(nsec)
-        beam_rhoA = np.zeros(nsec)
-        beam_A = np.zeros(nsec)
-        beam_rhoJ = np.zeros(nsec)
-        beam_Tw_iner = np.zeros(nsec)
-
-        beam_flap_iner = np.zeros(nsec)
-        beam_edge_iner = np.zeros(nsec)
-
-        beam_x_sc = np.zeros(nsec)
-        beam_y_sc = np.zeros(nsec)
-        beam_x_tc = np.zeros(nsec)
-        beam_y_tc = np.zeros(nsec)
-        beam_x_cg = np.zeros(nsec)
-        beam_y_cg = np.zeros(nsec)
-
         # distance to elastic center from airfoil nose
         # using profile coordinate system
         self.x_ec_nose = np.zeros(nsec)
@@ -159,9 +141,9 @@ class PreComp:
             nu12[i] = mat[i].nu12
             rho[i] = mat[i].rho
 
+        # gather the inputs of every section, then evaluate all sections together
+        args = [[] for _ in range(25)]
         for i in range(nsec):
-            # print(i)
-
             xnode, ynode = profile[i]._preCompFormat()
             locU, n_laminaU, n_pliesU, tU, thetaU, mat_idxU = csU[i]._preCompFormat()
             locL, n_laminaL, n_pliesL, tL, thetaL, mat_idxL = csL[i]._preCompFormat()
@@ -178,65 +160,43 @@ class PreComp:
                 thetaW = [0]
                 mat_idxW = [0]
 
-            (eifbar,eilbar,gjbar,eabar,eiflbar,
-             sfbar,slbar,sftbar,sltbar,satbar,
-             z_sc,y_sc,ztc_ref,ytc_ref,
-             mass,area,iflap_eta,ilag_zeta,tw_iner,
-             zcm_ref,ycm_ref) = properties.properties(
-                self.chord[i],
-                self.theta[i],
-                self.th_prime[i],
-                self.leLoc[i],
-                xnode,
-                ynode,
-                E1,
-                E2,
-                G12,
-                nu12,
-                rho,
-                locU,
-                n_laminaU,
-                n_pliesU,
-                tU,
-                thetaU,
-                mat_idxU,
-                locL,
-                n_laminaL,
-                n_pliesL,
-                tL,
-                thetaL,
-                mat_idxL,
-                nwebs,
-                locW,
-                n_laminaW,
-                n_pliesW,
-                tW,
-                thetaW,
-                mat_idxW,
-            )
-            
-            beam_EIxx[i] = eilbar  # EI_lag, Section lag (edgewise) bending stiffness about the XE axis (Nm2)
-            beam_EIyy[i] = eifbar  # EI_flap, Section flap bending stiffness about the YE axis (Nm2)
-            beam_GJ[i] = gjbar #  Section torsion stiffness (Nm2)
-            beam_EA[i] = eabar # Section axial stiffness (N)
-            beam_EIxy[i] = eiflbar # Coupled flap-lag stiffness with respect to the XE-YE frame (Nm2)
-            beam_EA_EIxx[i] = slbar # Coupled axial-lag stiffness with respect to the XE-YE frame (Nm.)
-            beam_EA_EIyy[i] = sfbar # Coupled axial-flap stiffness with respect to the XE-YE frame (Nm)
-            beam_EIxx_GJ[i] = sltbar # Coupled lag-torsion stiffness with respect to the XE-YE frame (Nm2)
-            beam_EIyy_GJ[i] = sftbar # Coupled flap-torsion stiffness with respect to the XE-YE frame (Nm2)
-            beam_EA_GJ[i] = satbar # Coupled axial-torsion stiffness (Nm)
-            beam_x_sc[i] = z_sc # X-coordinate of the shear-center offset with respect to the ref axes (m)
-            beam_y_sc[i] = y_sc # Chordwise offset of the section shear-center with respect to the reference frame, XR-YR (m)
-            beam_x_tc[i] = ztc_ref # X-coordinate of the tension-center offset with respect to the XR-YR axes (m)
-            beam_y_tc[i] = ytc_ref # Chordwise offset of the section tension-center with respect to the XR-YR axes (m)
-            beam_rhoA[i] = mass # Section mass per unit length (kg/m)
-            beam_A[i] = area # Cross-Sectional area (m)
-            beam_flap_iner[i] = iflap_eta # Section flap inertia about the YG axis per unit length (kg-m)
-            beam_edge_iner[i] = ilag_zeta # Section lag inertia about the XG axis per unit length (kg-m)
-            beam_Tw_iner[i] = tw_iner # Orientation of the section principal inertia axes with respect the blade reference plane, theta (deg)
-            beam_x_cg[i] = zcm_ref # X-coordinate of the center-of-mass offset with respect to the XR-YR axes (m)
-            beam_y_cg[i] = ycm_ref # Chordwise offset of the section center of mass with respect to the XR-YR axes (m)
+            for arg, val in zip(args, [
+                self.chord[i], self.theta[i], self.th_prime[i], self.leLoc[i], xnode, ynode,
+                locU, n_laminaU, n_pliesU, tU, thetaU, mat_idxU,
+                locL, n_laminaL, n_pliesL, tL, thetaL, mat_idxL,
+                nwebs, locW, n_laminaW, n_pliesW, tW, thetaW, mat_idxW,
+            ]):
+                arg.append(val)
+
+        (eifbar,eilbar,gjbar,eabar,eiflbar,
+         sfbar,slbar,sftbar,sltbar,satbar,
+         z_sc,y_sc,ztc_ref,ytc_ref,
+         mass,area,iflap_eta,ilag_zeta,tw_iner,
+         zcm_ref,ycm_ref) = properties.properties_batch(
+            *args[:6], E1, E2, G12, nu12, rho, *args[6:], n_workers=self.n_workers, pool=self.pool
+        )
 
+        beam_EIxx = eilbar  # EI_lag, Section lag (edgewise) bending stiffness about the XE axis (Nm2)
+        beam_EIyy = eifbar  # EI_flap, Section flap bending stiffness about the YE axis (Nm2)
+        beam_GJ = gjbar #  Section torsion stiffness (Nm2)
+        beam_EA = eabar # Section axial stiffness (N)
+        beam_EIxy = eiflbar # Coupled flap-lag stiffness with respect to the XE-YE frame (Nm2)
+        beam_EA_EIxx = slbar # Coupled axial-lag stiffness with respect to the XE-YE frame (Nm.)
+        beam_EA_EIyy = sfbar # Coupled axial-flap stiffness with respect to the XE-YE frame (Nm)
+        beam_EIxx_GJ = sltbar # Coupled lag-torsion stiffness with respect to the XE-YE frame (Nm2)
+        beam_EIyy_GJ = sftbar # Coupled flap-torsion stiffness with respect to the XE-YE frame (Nm2)
+        beam_EA_GJ = satbar # Coupled axial-torsion stiffness (Nm)
+        beam_x_sc = z_sc # X-coordinate of the shear-center offset with respect to the ref axes (m)
+        beam_y_sc = y_sc # Chordwise offset of the section shear-center with respect to the reference frame, XR-YR (m)
+        beam_x_tc = ztc_ref # X-coordinate of the tension-center offset with respect to the XR-YR axes (m)
+        beam_y_tc = ytc_ref # Chordwise offset of the section tension-center with respect to the XR-YR axes (m)
+        beam_rhoA = mass # Section mass per unit length (kg/m)
+        beam_A = area # Cross-Sectional area (m)
+        beam_flap_iner = iflap_eta # Section flap inertia about the YG axis per unit length (kg-m)
+        beam_edge_iner = ilag_zeta # Section lag inertia about the XG axis per unit length (kg-m)
+        beam_Tw_iner = tw_iner # Orientation of the section principal inertia axes with respect the blade reference plane, theta (deg)
+        beam_x_cg = zcm_ref # X-coordinate of the center-of-mass offset with respect to the XR-YR axes (m)
+        beam_y_cg = ycm_ref # Chordwise offset of the section center of mass with respect to the XR-YR axes (m)
 
         beam_rhoJ = beam_flap_iner + beam_edge_iner  # perpendicular axis theorem
 
@@ -1,20 +1,98 @@
+import atexit
+
 import numpy as np
 
+from wisdem.commonse.worker_pool import WorkerPool
+
 eps = 1e-10
+r2d = 180.0 / np.pi
+executors = {}  # worker pools of properties_batch, by (pool, n_workers)
 
 def properties(chord, tw_aero_d, tw_prime_d, le_loc, xnode, ynode, e1, e2, g12, anu12, density, xsec_nodeU, n_laminaU, n_pliesU, t_lamU, tht_lamU, mat_lamU, xsec_nodeL, n_laminaL, n_pliesL, t_lamL, tht_lamL, mat_lamL, nweb, loc_web, n_laminaW, n_pliesW, t_lamW, tht_lamW, mat_lamW):
 
+    q11, q22, q12, q66 = material_q(e1, e2, g12, anu12)
+
+    seg = section_segments(chord, tw_aero_d, tw_prime_d, le_loc, xnode, ynode, xsec_nodeU, n_laminaU, n_pliesU, t_lamU, tht_lamU, mat_lamU, xsec_nodeL, n_laminaL, n_pliesL, t_lamL, tht_lamL, mat_lamL, nweb, loc_web, n_laminaW, n_pliesW, t_lamW, tht_lamW, mat_lamW)
+
+    return tuple(v[0] for v in section_integrals([seg], q11, q22, q12, q66, density))
+
+def properties_batch(chord, tw_aero_d, tw_prime_d, le_loc, xnode, ynode, e1, e2, g12, anu12, density, xsec_nodeU, n_laminaU, n_pliesU, t_lamU, tht_lamU, mat_lamU, xsec_nodeL, n_laminaL, n_pliesL, t_lamL, tht_lamL, mat_lamL, nweb, loc_web, n_laminaW, n_pliesW, t_lamW, tht_lamW, mat_lamW, n_workers=1, pool="process"):
+    # Same as properties, for all spanwise stations at once.  The material properties (e1, e2, g12, anu12, density)
+    # are shared by all stations, every other input is a sequence with one entry per station.  The laminate and
+    # segment integrals of all stations are evaluated together, and each output is an array with one entry per station.
+    # With n_workers > 1 the stations are split in contiguous blocks that are evaluated on a "process" or "thread"
+    # WorkerPool and reassembled in station order.  Where the pool cannot be used, the stations are evaluated serially.
+
+    q11, q22, q12, q66 = material_q(e1, e2, g12, anu12)
+
+    stations = list(zip(chord, tw_aero_d, tw_prime_d, le_loc, xnode, ynode,
+                        xsec_nodeU, n_laminaU, n_pliesU, t_lamU, tht_lamU, mat_lamU,
+                        xsec_nodeL, n_laminaL, n_pliesL, t_lamL, tht_lamL, mat_lamL,
+                        nweb, loc_web, n_laminaW, n_pliesW, t_lamW, tht_lamW, mat_lamW))
+
+    n_workers = min(n_workers, len(stations))
+    if n_workers > 1:
+        blocks = [stations[k[0]:k[-1]+1] for k in np.array_split(np.arange(len(stations)), n_workers)]
+        results = get_executor(pool, n_workers).map(properties_block, [(q11, q22, q12, q66, density)] * n_workers, blocks)
+        if results is not None:
+            return tuple(np.concatenate(out) for out in zip(*results))
+
+    return properties_block((q11, q22, q12, q66, density), stations)
+
+def properties_block(materials, stations):
+    # properties_batch for a block of stations, each station being the tuple of its section_segments inputs
+    q11, q22, q12, q66, density = materials
+    return section_integrals([section_segments(*station) for station in stations], q11, q22, q12, q66, density)
+
+def get_executor(pool, n_workers):
+    # Pools are kept alive between calls since starting one costs about as much as a PreComp run
+    key = (pool, n_workers)
+    if key not in executors:
+        if pool not in ["process", "thread"]:
+            raise ValueError(f"Unknown PreComp pool {pool}, expected 'process' or 'thread'")
+        executors[key] = WorkerPool(n_workers, f"PreComp {pool}", threads=pool == "thread")
+    return executors[key]
+
+def shutdown_executor(pool, n_workers):
+    executor = executors.pop((pool, n_workers), None)
+    if executor is not None:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+@atexit.register
+def shutdown_executors():
+    # Stop all pools kept alive between calls, at the latest when the interpreter exits
+    for pool, n_workers in list(executors):
+        shutdown_executor(pool, n_workers)
+
+def material_q(e1, e2, g12, anu12):
+    # Check the material properties and return the reduced stiffnesses q11, q22, q12, q66
+    e1 = np.array(e1)
+    e2 = np.array(e2)
+    g12 = np.array(g12)
+    anu12 = np.array(anu12)
+
+    if np.any(anu12 > np.sqrt(e1/e2)):
+        idx = np.where(anu12 > np.sqrt(e1/e2))[0]
+        raise ValueError(f'**ERROR** material {idx+1} properties not consistent')
+
+    anud = 1.0 - anu12 * anu12 * e2 / e1
+    q11 = e1 / anud
+    q22 = e2 / anud
+    q12 = anu12 * e2 / anud
+    q66 = g12
+
+    return q11, q22, q12, q66
+
+def section_segments(chord, tw_aero_d, tw_prime_d, le_loc, xnode, ynode, xsec_nodeU, n_laminaU, n_pliesU, t_lamU, tht_lamU, mat_lamU, xsec_nodeL, n_laminaL, n_pliesL, t_lamL, tht_lamL, mat_lamL, nweb, loc_web, n_laminaW, n_pliesW, t_lamW, tht_lamW, mat_lamW):
+    # Check the geometry of one section and break it into segments (upper surface, lower surface, webs), each
+    # carrying its laminate stack padded with zero-thickness laminae to a common number of laminae
+
     chord = np.array(chord)
     tw_aero_d = np.array(tw_aero_d)
     tw_prime_d = np.array(tw_prime_d)
     le_loc = np.array(le_loc)
     xnode = np.array(xnode)
     ynode = np.array(ynode)
-    e1 = np.array(e1)
-    e2 = np.array(e2)
-    g12 = np.array(g12)
-    anu12 = np.array(anu12)
-    density = np.array(density)
     xsec_nodeU = np.array(xsec_nodeU)
     t_lamU = np.array(t_lamU)
     tht_lamU = np.array(tht_lamU)
@@ -24,7 +102,7 @@ def properties(chord, tw_aero_d, tw_prime_d, le_loc, xnode, ynode, e1, e2, g12,
     loc_web = np.array(loc_web)
     t_lamW = np.array(t_lamW)
     tht_lamW = np.array(tht_lamW)
-    
+
     n_laminaU = np.array(n_laminaU, dtype=np.int_)
     n_pliesU = np.array(n_pliesU, dtype=np.int_)
     mat_lamU = np.array(mat_lamU, dtype=np.int_)
@@ -39,22 +117,15 @@ def properties(chord, tw_aero_d, tw_prime_d, le_loc, xnode, ynode, e1, e2, g12,
     max_laminatesUL = np.int_(np.max([n_laminaU.max(), n_laminaL.max()]))
     max_laminatesW = np.int_(np.max(n_laminaW.max()))
 
-    n_materials = len(e1)
     n_af_nodes = len(xnode)
     n_sctU = len(n_laminaU)
     n_sctL = len(n_laminaL)
-    
-    r2d = 180.0 / np.pi
 
     webs_exist = nweb > 0
 
     if le_loc < 0.0:
         print(' WARNING** leading edge aft of reference axis **')
 
-    if np.any(anu12 > np.sqrt(e1/e2)):
-        idx = np.where(anu12 > np.sqrt(e1/e2))[0]
-        raise ValueError(f'**ERROR** material {idx+1} properties not consistent')
-
     if n_af_nodes <= 2:
         raise ValueError(' ERROR** min 3 nodes reqd to define airfoil geom')
 
@@ -118,41 +189,18 @@ def properties(chord, tw_aero_d, tw_prime_d, le_loc, xnode, ynode, e1, e2, g12,
     if np.any(np.diff(xsec_nodeL) <= 0.0):
         raise ValueError(' ERROR** lower sector nodal x-locations not in ascending order')
 
-    n_weblams = n_laminaW    
-    n_laminas = np.zeros((2, max_sectors), dtype=np.int_)
-    n_laminas[0,:n_laminaU.size] = n_laminaU
-    n_laminas[1,:n_laminaL.size] = n_laminaL
-    
-    tht_lam = np.zeros((2, max_sectors, max_laminatesUL))
-    tlam = np.zeros((2, max_sectors, max_laminatesUL))
-    mat_id = np.zeros((2, max_sectors, max_laminatesUL), dtype=np.int_)
-    wmat_id = np.zeros((nweb, max_laminatesW), dtype=np.int_)
-    tht_wlam = np.zeros((nweb, max_laminatesW))
-    twlam = np.zeros((nweb, max_laminatesW))
-
-    k = 0
-    for i in range(n_sctU):
-        for j in range(n_laminaU[i]):
-            tlam[0, i, j] = n_pliesU[k] * t_lamU[k]
-            tht_lam[0, i, j] = tht_lamU[k] / r2d
-            mat_id[0, i, j] = mat_lamU[k] - 1 # Input is 1-based indexing for Fortran
-            k += 1
-
-    k = 0
-    for i in range(n_sctL):
-        for j in range(n_laminaL[i]):
-            tlam[1, i, j] = n_pliesL[k] * t_lamL[k]
-            tht_lam[1, i, j] = tht_lamL[k] / r2d
-            mat_id[1, i, j] = mat_lamL[k] - 1 # Input is 1-based indexing for Fortran
-            k += 1
-
-    k = 0
-    for i in range(nweb):
-        for j in range(n_laminaW[i]):
-            twlam[i, j] = n_pliesW[k] * t_lamW[k]
-            tht_wlam[i, j] = tht_lamW[k] / r2d
-            wmat_id[i, j] = mat_lamW[k] - 1 # Input is 1-based indexing for Fortran
-            k += 1
+    # Laminate stacks of each sector and web, in radians and 0-based material indices
+    n_lam = max(max_laminatesUL, max_laminatesW)
+    tlam = np.zeros((2, max_sectors, n_lam))
+    tht_lam = np.zeros((2, max_sectors, n_lam))
+    mat_id = np.zeros((2, max_sectors, n_lam), dtype=np.int_)
+    twlam = np.zeros((nweb, n_lam))
+    tht_wlam = np.zeros((nweb, n_lam))
+    wmat_id = np.zeros((nweb, n_lam), dtype=np.int_)
+
+    tlam[0], tht_lam[0], mat_id[0] = stack_laminae(n_laminaU[:n_sctU], n_pliesU, t_lamU, tht_lamU, mat_lamU, max_sectors, n_lam)
+    tlam[1], tht_lam[1], mat_id[1] = stack_laminae(n_laminaL[:n_sctL], n_pliesL, t_lamL, tht_lamL, mat_lamL, max_sectors, n_lam)
+    twlam[:], tht_wlam[:], wmat_id[:] = stack_laminae(n_laminaW[:nweb], n_pliesW, t_lamW, tht_lamW, mat_lamW, nweb, n_lam)
 
     xu1 = xsec_node[0, 0]
     xu2 = xsec_node[0, n_sctU]
@@ -162,7 +210,7 @@ def properties(chord, tw_aero_d, tw_prime_d, le_loc, xnode, ynode, e1, e2, g12,
     xl2 = xsec_node[1, n_sctL]
     if xl2 > xnode_l[-1]:
         raise ValueError(f' ERROR** lower-surf last sector node out of bounds {xl2} {xnode_l[-1]}')
-            
+
     # Vectorize the embed
     yinterp_u = np.interp(xsec_nodeU, xnode_u, ynode_u)
     xnode_u, idx = np.unique(np.r_[xnode_u, xsec_nodeU], return_index=True)
@@ -184,7 +232,7 @@ def properties(chord, tw_aero_d, tw_prime_d, le_loc, xnode, ynode, e1, e2, g12,
     nseg_l = ndl2 - ndl1
     nseg_p = nseg_u + nseg_l
     nseg = nseg_p + nweb if webs_exist else nseg_p
-    
+
     if np.abs(xu1 - xl1) > eps:
         print(' WARNING** the leading edge may be open; check closure')
     else:
@@ -213,436 +261,233 @@ def properties(chord, tw_aero_d, tw_prime_d, le_loc, xnode, ynode, e1, e2, g12,
         if loc_web[-1] > xu2 or loc_web[-1] > xl2:
             print(' ERROR** last web out of sectors-bounded airfoil')
 
-    # Begin segment calculations
-    tw_aero = tw_aero_d / r2d
-    tw_prime = tw_prime_d / r2d
-    tphip = tw_prime
+    isur, idsect, yseg, zseg, wseg, sthseg, cthseg, s2thseg, c2thseg = seg_info(chord, le_loc, nseg, nseg_u, nseg_p, xnode_u, ynode_u, xnode_l, ynode_l, ndl1, ndu1, loc_web, weby_u, weby_l, n_scts, xsec_node)
 
-    anud = 1.0 - anu12 * anu12 * e2 / e1
-    q11 = e1 / anud
-    q22 = e2 / anud
-    q12 = anu12 * e2 / anud
-    q66 = g12
+    # Laminate stack of every segment
+    skin = isur >= 0
+    t = np.zeros((nseg, n_lam))
+    thp = np.zeros((nseg, n_lam))
+    mat = np.zeros((nseg, n_lam), dtype=np.int_)
+    t[skin] = tlam[isur[skin], idsect[skin]]
+    thp[skin] = tht_lam[isur[skin], idsect[skin]]
+    mat[skin] = mat_id[isur[skin], idsect[skin]]
+    t[~skin] = twlam[idsect[~skin]]
+    thp[~skin] = tht_wlam[idsect[~skin]]
+    mat[~skin] = wmat_id[idsect[~skin]]
+
+    return {"tw_aero": tw_aero_d / r2d,
+            "tphip": tw_prime_d / r2d,
+            "isur": isur,
+            "yseg": yseg,
+            "zseg": zseg,
+            "wseg": wseg,
+            "sthseg": sthseg,
+            "cthseg": cthseg,
+            "s2thseg": s2thseg,
+            "c2thseg": c2thseg,
+            "t": t,
+            "thp": thp,
+            "mat": mat}
+
+def stack_laminae(n_lamina, n_plies, t_lam, tht_lam, mat_lam, n_rows, n_cols):
+    # Unpack the flat lamina lists of consecutive sectors (or webs) into (sector, lamina) arrays of
+    # thickness, ply angle (rad) and 0-based material index, padded with zero-thickness laminae
+    n_tot = n_lamina.sum()
+    isct = np.repeat(np.arange(n_lamina.size), n_lamina)
+    ilam = np.arange(n_tot) - np.repeat(np.cumsum(n_lamina) - n_lamina, n_lamina)
+
+    t = np.zeros((n_rows, n_cols))
+    thp = np.zeros((n_rows, n_cols))
+    mat = np.zeros((n_rows, n_cols), dtype=np.int_)
+    t[isct, ilam] = n_plies[:n_tot] * t_lam[:n_tot]
+    thp[isct, ilam] = tht_lam[:n_tot] / r2d
+    mat[isct, ilam] = mat_lam[:n_tot] - 1 # Input is 1-based indexing for Fortran
+
+    return t, thp, mat
+
+def section_integrals(segs, q11, q22, q12, q66, density):
+    # Laminate and segment integrals of a list of sections from section_segments.  The segments of all sections
+    # are stacked into one (segment, lamina) array so that the q-bar/q-tilda matrices and the lamina sums are
+    # evaluated for every station at once; per-station sums are accumulated in segment order with bincount.
 
-    isur, idsect, yseg, zseg, wseg, sthseg, cthseg, s2thseg, c2thseg = seg_info(chord, le_loc, nseg, nseg_u, nseg_p, xnode_u, ynode_u, xnode_l, ynode_l, ndl1, ndu1, loc_web, weby_u, weby_l, n_scts, xsec_node)
+    density = np.array(density)
+    nsec = len(segs)
+    nseg = np.array([seg["wseg"].size for seg in segs])
+    n_lam = max(seg["t"].shape[1] for seg in segs)
+    isec = np.repeat(np.arange(nsec), nseg)
+
+    def stack(key):
+        return np.concatenate([seg[key] for seg in segs])
+
+    def stack_lam(key, dtype=float):
+        out = np.zeros((nseg.sum(), n_lam), dtype=dtype)
+        k = 0
+        for seg in segs:
+            out[k:k+seg[key].shape[0], :seg[key].shape[1]] = seg[key]
+            k += seg[key].shape[0]
+        return out
+
+    def sec_sum(x, mask=None):
+        if mask is None:
+            return np.bincount(isec, weights=x, minlength=nsec)
+        return np.bincount(isec[mask], weights=x[mask], minlength=nsec)
+
+    tw_aero = np.array([seg["tw_aero"] for seg in segs])
+    tphip = np.array([seg["tphip"] for seg in segs])[isec][:, np.newaxis]
+    isur = stack("isur")
+    ysg = stack("yseg")[:, np.newaxis]
+    zsg = stack("zseg")[:, np.newaxis]
+    w = stack("wseg")
+    sths = stack("sthseg")[:, np.newaxis]
+    cths = stack("cthseg")[:, np.newaxis]
+    s2ths = stack("s2thseg")[:, np.newaxis]
+    c2ths = stack("c2thseg")[:, np.newaxis]
+    t = stack_lam("t")            # thickness
+    thp = stack_lam("thp")        # ply angle
+    mat = stack_lam("mat", np.int_)  # material no.
+
+    skin = isur >= 0
+    sgn = np.where(isur == 0, -1.0, 1.0)[:, np.newaxis]  # (-1)**(ks+1) on the upper and lower surfaces
+
+    tcum = np.cumsum(t, axis=1)
+    tbar = np.zeros(t.shape)
+    tbar[:, 1:] = tcum[:, :-1]
+    tbar = tbar + (t / 2.0) # Just need half of the current increment
+
+    qbar11, qbar22, qbar12, qbar16, qbar26, qbar66 = q_bars(thp, q11[mat], q22[mat], q12[mat], q66[mat])
+    qtil = q_tildas(qbar11.ravel(), qbar22.ravel(), qbar12.ravel(), qbar16.ravel(), qbar26.ravel(), qbar66.ravel())
+    qtil = qtil.reshape((2, 2) + t.shape)
+
+    qtil11t = qtil[0, 0] * t
+    q11t = np.sum(qtil11t, axis=1)
+
+    #---------------- section sc -----------
+    y0 = ysg - sgn * tbar * sths
+    z0 = zsg + sgn * tbar * cths
+
+    sigma = sec_sum(w * np.abs(zsg[:, 0] + sgn[:, 0] * 0.5 * tcum[:, -1] * cths[:, 0]) * cths[:, 0], skin)
+    eabar = sec_sum(q11t * w, skin)
+    q11ya = sec_sum(np.sum(qtil11t * y0, axis=1) * w, skin)
+    q11za = sec_sum(np.sum(qtil11t * z0, axis=1) * w, skin)
 
-    # Initialize variables
-    sigma = 0.0
-    eabar = 0.0
-    q11ya = 0.0
-    q11za = 0.0
-    
-    #   segments loop for sc
-    for iseg in range(nseg_p):
-        # Initialize segment properties
-        ks = isur[iseg]
-        idsec = idsect[iseg]
-        ysg = yseg[iseg]
-        zsg = zseg[iseg]
-        w = wseg[iseg]
-        sths = sthseg[iseg]
-        cths = cthseg[iseg]
-        nlam = n_laminas[ks, idsec]
-
-        # initialization for seg (sc)
-        tbar = 0.0
-        q11t = 0.0
-        q11yt_u = 0.0
-        q11zt_u = 0.0
-        q11yt_l = 0.0
-        q11zt_l = 0.0
-        
-        # Vectorized
-        t = tlam[ks, idsec, :]       # thickness
-        thp = tht_lam[ks, idsec, :]  # ply angle
-        mat = mat_id[ks, idsec, :]   # material no.
-        tbar = np.cumsum(np.r_[0, t[:-1]]) + (t / 2.0) # Just need half of the current increment
-        y0 = ysg - ((-1.0) ** (ks+1)) * tbar * sths
-        z0 = zsg + ((-1.0) ** (ks+1)) * tbar * cths
-        
-        qbar11, qbar22, qbar12, qbar16, qbar26, qbar66 = q_bars(thp, q11[mat], q22[mat], q12[mat], q66[mat])
-        qtil = q_tildas(qbar11, qbar22, qbar12, qbar16, qbar26, qbar66)
-
-        qtil11t = np.squeeze(qtil[0, 0, :] * t)
-        q11t = np.sum(qtil11t)
-
-        if iseg < nseg_u:
-            q11yt_u = np.sum(qtil11t * y0)
-            q11zt_u = np.sum(qtil11t * z0)
-        else:
-            q11yt_l = np.sum(qtil11t * y0)
-            q11zt_l = np.sum(qtil11t * z0)
-
-        tbar = t.sum() # Now need the full thing
-        '''
-        # Original python port with inner loop
-        for ilam in range(nlam):
-            t = tlam[ks, idsec, ilam]       # thickness
-            thp = tht_lam[ks, idsec, ilam]  # ply angle
-            mat = mat_id[ks, idsec, ilam]   # material no.
-
-            tbar = tbar + t / 2.0
-            y0 = ysg - ((-1.0) ** (ks+1)) * tbar * sths
-            z0 = zsg + ((-1.0) ** (ks+1)) * tbar * cths
-
-            # Call function q_bars and q_tildas
-            qbar11, qbar22, qbar12, qbar16, qbar26, qbar66 = q_bars(thp, q11[mat], q22[mat], q12[mat], q66[mat])
-            qtil = q_tildas(qbar11, qbar22, qbar12, qbar16, qbar26, qbar66)
-
-            qtil11t = qtil[0, 0] * t
-            q11t = q11t + qtil11t
-
-            if iseg < nseg_u:
-                q11yt_u = q11yt_u + qtil11t * y0
-                q11zt_u = q11zt_u + qtil11t * z0
-            else:
-                q11yt_l = q11yt_l + qtil11t * y0
-                q11zt_l = q11zt_l + qtil11t * z0
-
-            tbar = tbar + t / 2.0
-        '''
-
-        # add seg contributions (sc)
-        sigma = sigma + w * np.abs(zsg + ((-1.0) ** (ks+1)) * 0.5 * tbar * cths) * cths
-        eabar = eabar + q11t * w
-        q11ya = q11ya + (q11yt_u + q11yt_l) * w
-        q11za = q11za + (q11zt_u + q11zt_l) * w
-
-    # get section sc
     y_sc = q11ya / eabar
     z_sc = q11za / eabar
     #---------------- end section sc -----------
 
-    #   initializations for section (properties)
-    eabar = 0.0
-    q11ya = 0.0
-    q11za = 0.0
-    ap = 0.0
-    bp = 0.0
-    cp = 0.0
-    dp = 0.0
-    ep = 0.0
-    q11ysqa = 0.0
-    q11zsqa = 0.0
-    q11yza = 0.0
-    mass = 0.0
-    area = 0.0
-    rhoya = 0.0
-    rhoza = 0.0
-    rhoysqa = 0.0
-    rhozsqa = 0.0
-    rhoyza = 0.0
-    
-    #   segments loop (for properties)
-    for iseg in range(nseg):
-        # Initialize segment properties
-        ks = isur[iseg]
-        idsec = idsect[iseg]
-        ysg = yseg[iseg]
-        zsg = zseg[iseg]
-        w = wseg[iseg]
-        sths = sthseg[iseg]
-        cths = cthseg[iseg]
-        s2ths = s2thseg[iseg]
-        c2ths = c2thseg[iseg]
-
-        nlam = n_laminas[ks, idsec] if ks >= 0 else n_weblams[idsec]
-
-        tbar = 0.0
-        q11t = 0.0
-        q11yt = 0.0
-        q11zt = 0.0
-        dtbar = 0.0
-        q2bar = 0.0
-        zbart = 0.0
-        ybart = 0.0
-        tbart = 0.0
-        q11ysqt = 0.0
-        q11zsqt = 0.0
-        q11yzt = 0.0
-        rhot = 0.0
-        rhoyt = 0.0
-        rhozt = 0.0
-        rhoysqt = 0.0
-        rhozsqt = 0.0
-        rhoyzt = 0.0
-
-        # Vectorized
-        if ks >= 0:
-            t = tlam[ks, idsec, :]       # thickness
-            thp = tht_lam[ks, idsec, :]  # ply angle
-            mat = mat_id[ks, idsec, :]   # material no.
-            tbar = np.cumsum(np.r_[0, t[:-1]]) + (t / 2.0) # Just need half of the current increment
-            y0 = ysg - ((-1.0) ** (ks+1)) * tbar * sths - y_sc
-            z0 = zsg + ((-1.0) ** (ks+1)) * tbar * cths - z_sc
-        else:
-            t = twlam[idsec, :]
-            thp = tht_wlam[idsec, :]
-            mat = wmat_id[idsec, :]
-            tbar = np.cumsum(np.r_[0, t[:-1]]) + (t / 2.0) # Just need half of the current increment
-            y0 = ysg - tbar / 2.0 - y_sc
-            z0 = zsg - z_sc
-
-        y0sq = y0 * y0
-        z0sq = z0 * z0
-
-        qbar11, qbar22, qbar12, qbar16, qbar26, qbar66 = q_bars(thp, q11[mat], q22[mat], q12[mat], q66[mat])
-        qtil = q_tildas(qbar11, qbar22, qbar12, qbar16, qbar26, qbar66)
-
-        ieta1 = (t ** 2) / 12.0
-        izeta1 = (w ** 2) / 12.0
-        iepz = 0.5 * (ieta1 + izeta1)
-        iemz = 0.5 * (ieta1 - izeta1)
-        ipp = iepz + iemz * c2ths
-        iqq = iepz - iemz * c2ths
-        ipq = iemz * s2ths
-        qtil11t = np.squeeze(qtil[0, 0, :] * t)
-        rot = density[mat] * t
-
-        if ks >= 0:
-            qtil12t = np.squeeze(qtil[0, 1, :]) * t
-            qtil22t = np.squeeze(qtil[1, 1, :]) * t
-
-            q11t = np.sum(qtil11t)
-            q11yt = np.sum(qtil11t * y0)
-            q11zt = np.sum(qtil11t * z0)
-            dtbar = np.sum(qtil12t * (y0sq + z0sq) * tphip * t)
-            q2bar = np.sum(qtil22t)
-            zbart = np.sum(z0 * qtil12t)
-            ybart = np.sum(y0 * qtil12t)
-            tbart = np.sum(qtil12t)
-            q11ysqt = np.sum(qtil11t * (y0sq + iqq))
-            q11zsqt = np.sum(qtil11t * (z0sq + ipp))
-            q11yzt = np.sum(qtil11t * (y0 * z0 + ipq))
-            rhot = np.sum(rot)
-            rhoyt = np.sum(rot * y0)
-            rhozt = np.sum(rot * z0)
-            rhoysqt = np.sum(rot * (y0sq + iqq))
-            rhozsqt = np.sum(rot * (z0sq + ipp))
-            rhoyzt = np.sum(rot * (y0 * z0 + ipq))
-        else:
-            q11t = np.sum(qtil11t)
-            q11yt = np.sum(qtil11t * y0)
-            q11zt = np.sum(qtil11t * z0)
-            q11ysqt = np.sum(qtil11t * (y0sq + iqq))
-            q11zsqt = np.sum(qtil11t * (z0sq + ipp))
-            q11yzt = np.sum(qtil11t * (y0 * z0 + ipq))
-            rhot = np.sum(rot)
-            rhoyt = np.sum(rot * y0)
-            rhozt = np.sum(rot * z0)
-            rhoysqt = np.sum(rot * (y0sq + iqq))
-            rhozsqt = np.sum(rot * (z0sq + ipp))
-            rhoyzt = np.sum(rot * (y0 * z0 + ipq))
-            
-        tbar = t.sum() # Now need the full thing
-
-        # Loop over laminates
-        '''
-        for ilam in range(nlam):
-            if ks >= 0:
-                t = tlam[ks, idsec, ilam]
-                thp = tht_lam[ks, idsec, ilam]
-                mat = mat_id[ks, idsec, ilam]
-                tbar = tbar + t / 2.0
-                y0 = ysg - ((-1.0) ** (ks+1)) * tbar * sths - y_sc
-                z0 = zsg + ((-1.0) ** (ks+1)) * tbar * cths - z_sc
-            else:
-                t = twlam[idsec, ilam]
-                thp = tht_wlam[idsec, ilam]
-                mat = wmat_id[idsec, ilam]
-                tbar = tbar + t / 2.0
-                y0 = ysg - tbar / 2.0 - y_sc
-                z0 = zsg - z_sc
-
-            y0sq = y0 * y0
-            z0sq = z0 * z0
-
-            # Call function q_bars and q_tildas
-            qbar11, qbar22, qbar12, qbar16, qbar26, qbar66 = q_bars(thp, q11[mat], q22[mat], q12[mat], q66[mat])
-            qtil = q_tildas(qbar11, qbar22, qbar12, qbar16, qbar26, qbar66)
-
-            ieta1 = (t ** 2) / 12.0
-            izeta1 = (w ** 2) / 12.0
-            iepz = 0.5 * (ieta1 + izeta1)
-            iemz = 0.5 * (ieta1 - izeta1)
-            ipp = iepz + iemz * c2ths
-            iqq = iepz - iemz * c2ths
-            ipq = iemz * s2ths
-            qtil11t = qtil[0, 0] * t
-            rot = density[mat] * t
-
-            if ks >= 0:
-                qtil12t = qtil[0, 1] * t
-                qtil22t = qtil[1, 1] * t
-
-                q11t = q11t + qtil11t
-                q11yt = q11yt + qtil11t * y0
-                q11zt = q11zt + qtil11t * z0
-                dtbar = dtbar + qtil12t * (y0sq + z0sq) * tphip * t
-                q2bar = q2bar + qtil22t
-                zbart = zbart + z0 * qtil12t
-                ybart = ybart + y0 * qtil12t
-                tbart = tbart + qtil12t
-                q11ysqt = q11ysqt + qtil11t * (y0sq + iqq)
-                q11zsqt = q11zsqt + qtil11t * (z0sq + ipp)
-                q11yzt = q11yzt + qtil11t * (y0 * z0 + ipq)
-                rhot = rhot + rot
-                rhoyt = rhoyt + rot * y0
-                rhozt = rhozt + rot * z0
-                rhoysqt = rhoysqt + rot * (y0sq + iqq)
-                rhozsqt = rhozsqt + rot * (z0sq + ipp)
-                rhoyzt = rhoyzt + rot * (y0 * z0 + ipq)
-            else:
-                q11t = q11t + qtil11t
-                q11yt = q11yt + qtil11t * y0
-                q11zt = q11zt + qtil11t * z0
-                q11ysqt = q11ysqt + qtil11t * (y0sq + iqq)
-                q11zsqt = q11zsqt + qtil11t * (z0sq + ipp)
-                q11yzt = q11yzt + qtil11t * (y0 * z0 + ipq)
-                rhot = rhot + rot
-                rhoyt = rhoyt + rot * y0
-                rhozt = rhozt + rot * z0
-                rhoysqt = rhoysqt + rot * (y0sq + iqq)
-                rhozsqt = rhozsqt + rot * (z0sq + ipp)
-                rhoyzt = rhoyzt + rot * (y0 * z0 + ipq)
-
-            tbar = tbar + t / 2.0
-        '''
-
-        eabar = eabar + q11t * w
-        q11ya = q11ya + q11yt * w
-        q11za = q11za + q11zt * w
-        q11ysqa = q11ysqa + q11ysqt * w
-        q11zsqa = q11zsqa + q11zsqt * w
-        q11yza = q11yza + q11yzt * w
-
-        if ks >= 0:
-            wdq2bar = w / q2bar
-            ap = ap + wdq2bar
-            bp = bp + wdq2bar * tbart
-            cp = cp + wdq2bar * dtbar
-            dp = dp + wdq2bar * zbart
-            ep = ep + wdq2bar * ybart
-
-        area = area + w
-        mass = mass + rhot * w
-        rhoya = rhoya + rhoyt * w
-        rhoza = rhoza + rhozt * w
-        rhoysqa = rhoysqa + rhoysqt * w
-        rhozsqa = rhozsqa + rhozsqt * w
-        rhoyza = rhoyza + rhoyzt * w
+    #   segment properties
+    y0 = np.where(skin[:, np.newaxis], ysg - sgn * tbar * sths, ysg - tbar / 2.0) - y_sc[isec][:, np.newaxis]
+    z0 = np.where(skin[:, np.newaxis], zsg + sgn * tbar * cths, zsg) - z_sc[isec][:, np.newaxis]
+    y0sq = y0 * y0
+    z0sq = z0 * z0
+
+    ieta1 = (t ** 2) / 12.0
+    izeta1 = (w[:, np.newaxis] ** 2) / 12.0
+    iepz = 0.5 * (ieta1 + izeta1)
+    iemz = 0.5 * (ieta1 - izeta1)
+    ipp = iepz + iemz * c2ths
+    iqq = iepz - iemz * c2ths
+    ipq = iemz * s2ths
+    rot = density[mat] * t
+    qtil12t = qtil[0, 1] * t
+    qtil22t = qtil[1, 1] * t
+
+    q11yt = np.sum(qtil11t * y0, axis=1)
+    q11zt = np.sum(qtil11t * z0, axis=1)
+    q11ysqt = np.sum(qtil11t * (y0sq + iqq), axis=1)
+    q11zsqt = np.sum(qtil11t * (z0sq + ipp), axis=1)
+    q11yzt = np.sum(qtil11t * (y0 * z0 + ipq), axis=1)
+    rhot = np.sum(rot, axis=1)
+    rhoyt = np.sum(rot * y0, axis=1)
+    rhozt = np.sum(rot * z0, axis=1)
+    rhoysqt = np.sum(rot * (y0sq + iqq), axis=1)
+    rhozsqt = np.sum(rot * (z0sq + ipp), axis=1)
+    rhoyzt = np.sum(rot * (y0 * z0 + ipq), axis=1)
+
+    # Shear flow terms, upper and lower surfaces only
+    dtbar = np.sum(qtil12t[skin] * (y0sq[skin] + z0sq[skin]) * tphip[skin] * t[skin], axis=1)
+    q2bar = np.sum(qtil22t[skin], axis=1)
+    zbart = np.sum(z0[skin] * qtil12t[skin], axis=1)
+    ybart = np.sum(y0[skin] * qtil12t[skin], axis=1)
+    tbart = np.sum(qtil12t[skin], axis=1)
+    wdq2bar = w[skin] / q2bar
+
+    eabar = sec_sum(q11t * w)
+    q11ya = sec_sum(q11yt * w)
+    q11za = sec_sum(q11zt * w)
+    q11ysqa = sec_sum(q11ysqt * w)
+    q11zsqa = sec_sum(q11zsqt * w)
+    q11yza = sec_sum(q11yzt * w)
+
+    isec_skin = isec[skin]
+    ap = np.bincount(isec_skin, weights=wdq2bar, minlength=nsec)
+    bp = np.bincount(isec_skin, weights=wdq2bar * tbart, minlength=nsec)
+    cp = np.bincount(isec_skin, weights=wdq2bar * dtbar, minlength=nsec)
+    dp = np.bincount(isec_skin, weights=wdq2bar * zbart, minlength=nsec)
+    ep = np.bincount(isec_skin, weights=wdq2bar * ybart, minlength=nsec)
+
+    area = sec_sum(w)
+    mass = sec_sum(rhot * w)
+    rhoya = sec_sum(rhoyt * w)
+    rhoza = sec_sum(rhozt * w)
+    rhoysqa = sec_sum(rhoysqt * w)
+    rhozsqa = sec_sum(rhozsqt * w)
+    rhoyza = sec_sum(rhoyzt * w)
 
     y_tc = q11ya / eabar
     z_tc = q11za / eabar
-    
+
     sfbar = q11za
     slbar = q11ya
     eifbar = q11zsqa
     eilbar = q11ysqa
     eiflbar = q11yza
-    
+
     sigm2 = sigma*2.0
     gjbar = sigm2*(sigm2+cp)/ap
     sftbar = -sigm2*dp/ap
     sltbar = -sigm2*ep/ap
     satbar = sigm2*bp/ap
-    
+
     ycm_sc =   rhoya/mass #wrt sc
     zcm_sc =   rhoza/mass #wrt sc
-    
+
     iflap_sc = rhozsqa #wrt sc
     ilag_sc = rhoysqa   #wrt sc
     ifl_sc = rhoyza     #wrt sc
-    
+
     # get section tc and cm
-    
+
     ytc_ref =  y_tc + y_sc  #wrt the ref axes
     ztc_ref =  z_tc + z_sc  #wrt the ref axes
-    
+
     ycm_ref =  ycm_sc + y_sc    #wrt the ref axes
     zcm_ref =  zcm_sc + z_sc    #wrt the ref axes
-    
+
     # moments of inertia # about ref_parallel axes at cm
-    
+
     iflap_cm = iflap_sc - mass*zcm_sc**2
     ilag_cm = ilag_sc - mass*ycm_sc**2
     ifl_cm = ifl_sc - mass*ycm_sc*zcm_sc
-    
+
     # inertia principal axes orientation and moments of inertia
-    
+
     m_inertia = 0.5*(ilag_cm + iflap_cm)
     r_inertia = np.sqrt(0.25*((ilag_cm-iflap_cm)**2) + ifl_cm**2)
-    
-    if (iflap_cm <= ilag_cm):
-        iflap_eta = m_inertia - r_inertia
-        ilag_zeta = m_inertia + r_inertia
-    else:
-        iflap_eta = m_inertia + r_inertia
-        ilag_zeta = m_inertia - r_inertia
 
-    if (ilag_cm == iflap_cm):
-        th_pa = np.pi/4.0
-        if (np.abs(ifl_cm/iflap_cm) < 1e-6):
-            th_pa = 0.0
-    else:
-        th_pa = 0.5*np.abs(np.arctan(2.0*ifl_cm/(ilag_cm-iflap_cm)))
+    iflap_eta = np.where(iflap_cm <= ilag_cm, m_inertia - r_inertia, m_inertia + r_inertia)
+    ilag_zeta = np.where(iflap_cm <= ilag_cm, m_inertia + r_inertia, m_inertia - r_inertia)
 
-    if (np.abs(ifl_cm) < eps):
-        th_pa = 0.0
-    else:
-        if (iflap_cm >= ilag_cm and ifl_cm > 0.):
-            th_pa = -th_pa
-        if (iflap_cm >= ilag_cm and ifl_cm < 0.):
-            th_pa = th_pa
-        if (iflap_cm < ilag_cm and ifl_cm > 0.):
-            th_pa = th_pa
-        if (iflap_cm < ilag_cm and ifl_cm < 0.):
-            th_pa = -th_pa
-
-    # elastic principal axes orientation and principal bending stiffneses
-
-    em_stiff = 0.5*(eilbar + eifbar)
-    er_stiff = np.sqrt(0.25*((eilbar-eifbar)**2) + eiflbar**2)
-    
-    if (eifbar <= eilbar):
-        pflap_stff = em_stiff - er_stiff
-        plag_stff = em_stiff + er_stiff
-    else:
-        pflap_stff = em_stiff + er_stiff
-        plag_stff = em_stiff - er_stiff
-
-    if (eilbar == eifbar):
-        the_pa = np.pi/4.0
-    else:
-        the_pa = 0.5*np.abs(np.arctan(2.0*eiflbar/(eilbar-eifbar)))
-
-    if (np.abs(eiflbar) < eps):
-        the_pa = 0.0
-    else:
-        if (eifbar >= eilbar and eiflbar > 0.):
-            the_pa = -the_pa
-        if (eifbar >= eilbar and eiflbar < 0.):
-            the_pa = the_pa
-        if (eifbar < eilbar and eiflbar > 0.):
-            the_pa = the_pa
-        if (eifbar < eilbar and eiflbar < 0.):
-            the_pa = -the_pa
+    th_pa = principal_angle(ilag_cm, iflap_cm, ifl_cm)
+    th_pa[(ilag_cm == iflap_cm) & (np.abs(ifl_cm) < 1e-6*np.abs(iflap_cm))] = 0.0
 
     #---------------- end properties computation -----------
 
     # ---------- prepare outputs --------------
-    id_form = 1  # hardwired for wt's
-
-    if (id_form == 1):
-        tw_iner = tw_aero - th_pa
-        str_tw =  tw_aero - the_pa
-        y_sc = -y_sc
-        ytc_ref = -ytc_ref
-        ycm_ref = -ycm_ref
-    else:         # for h/c
-        #       note: for h/c, th_aero input is +ve acc to h/c convention
-        tw_iner = tw_aero + th_pa
-        str_tw =  tw_aero + the_pa
+    # id_form = 1, hardwired for wt's
+    tw_iner = tw_aero - th_pa
+    y_sc = -y_sc
+    ytc_ref = -ytc_ref
+    ycm_ref = -ycm_ref
 
     # conversions
     eiflbar = -eiflbar
@@ -652,6 +497,14 @@ def properties(chord, tw_aero_d, tw_prime_d, le_loc, xnode, ynode, e1, e2, g12,
 
     return (eifbar, eilbar, gjbar, eabar, eiflbar, sfbar, slbar, sftbar, sltbar, satbar, z_sc, y_sc, ztc_ref, ytc_ref, mass, area, iflap_eta, ilag_zeta, tw_iner, zcm_ref, ycm_ref)
 
+def principal_angle(i22, i11, i12):
+    # Orientation of the principal axes of the symmetric tensor [[i11, i12], [i12, i22]]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        th = np.where(i22 == i11, np.pi/4.0, 0.5*np.abs(np.arctan(2.0*i12/(i22-i11))))
+    th = np.where((i11 >= i22) == (i12 > 0.), -th, th)
+    th[np.abs(i12) < eps] = 0.0
+    return th
+
 def seg_info(ch, rle, nseg, nseg_u, nseg_p, xnode_u, ynode_u, xnode_l, ynode_l, ndl1, ndu1, loc_web, weby_u, weby_l, n_scts, xsec_node):
     # NOTE: coord transformation from xaf-yaf to yre-zref and seg info
 
@@ -666,27 +519,28 @@ def seg_info(ch, rle, nseg, nseg_u, nseg_p, xnode_u, ynode_u, xnode_l, ynode_l,
     # real(dbp), dimension(2, nsecnode) :: xsec_node  # x coord of sect-i lhs on 's' surf
 
     # outputs
-    '''
+    # seg numbering from le clockwise: upper surface segs, lower surface segs, webs
     isur = -1 * np.ones(nseg, dtype=np.int_)  # surf id
-    thseg = -np.pi / 2.0 * np.ones(nseg)
-
-    # Vectorized
-    iseg = np.arange(nseg, dtype=np.int_)
-    isur[iseg < nseg_p] = 1 # Do this first
-    isur[iseg < nseg_u] = 0
-    nd_a = np.zeros(nseg, dtype=np.int_)
-    nd_a[iseg < nseg_p] = ndl1 + iseg[iseg < nseg_p] - nseg_u
-    nd_a[iseg < nseg_u] = ndu1 + iseg[iseg < nseg_u]
-    xa = xnode_u[nd_a]
-    ya = ynode_u[nd_a]
-    xb = xnode_u[nd_a + 1]
-    yb = ynode_u[nd_a + 1]
-    
-    iweb = iseg[iseg >= nseg_p] - nseg_p
-    xa[iseg >= nseg_p] = loc_web[iweb]
-    xb[iseg >= nseg_p] = xa[iseg >= nseg_p]
-    ya[iseg >= nseg_p] = weby_u[iweb]
-    yb[iseg >= nseg_p] = weby_l[iweb]
+    isur[:nseg_p] = 1
+    isur[:nseg_u] = 0
+
+    nd_u = ndu1 + np.arange(nseg_u)
+    nd_l = ndl1 + np.arange(nseg_p - nseg_u)
+    iweb = np.arange(nseg - nseg_p)
+    xa = np.r_[xnode_u[nd_u], xnode_l[nd_l], loc_web[iweb]]  # xref of node toward le (in a/f ref frame)
+    ya = np.r_[ynode_u[nd_u], ynode_l[nd_l], weby_u[iweb]]  # yref of node toward le (in new ref frame)
+    xb = np.r_[xnode_u[nd_u + 1], xnode_l[nd_l + 1], loc_web[iweb]]  # xref of node toward te (in a/f ref frame)
+    yb = np.r_[ynode_u[nd_u + 1], ynode_l[nd_l + 1], weby_l[iweb]]  # yref of node toward te (in new ref frame)
+
+    # id associated sect number (first sector bounding the segment) or web number
+    ks = isur[:nseg_p]
+    xsec = xsec_node[ks]
+    isct = np.arange(xsec_node.shape[1] - 1)
+    inside = ((xa[:nseg_p, np.newaxis] > (xsec[:, :-1] - eps)) & (xb[:nseg_p, np.newaxis] < (xsec[:, 1:] + eps))
+              & (isct[np.newaxis, :] < n_scts[ks][:, np.newaxis]))
+    if not np.all(inside.any(axis=1)):
+        print('ERROR** unknown, contact NREL')
+    idsect = np.r_[np.argmax(inside, axis=1), iweb]  # associated sect or web number
 
     xba = xb - xa
     yba = ya - yb
@@ -694,78 +548,8 @@ def seg_info(ch, rle, nseg, nseg_u, nseg_p, xnode_u, ynode_u, xnode_l, ynode_l,
     zseg = ch * (ya + yb) / 2.0  # zref coord of mid-seg pt (in r-frame)
     wseg = ch * np.sqrt(xba ** 2 + yba ** 2)
 
-    thseg[isur >= 0] = np.arctan(yba[isur >= 0] / xba[isur >= 0])  # thseg +ve in new y-z ref frame
-    
-    idsect = np.zeros(nseg, dtype=np.int_)  # associated sect or web number
-    idsect[iseg >= nseg_p] = iweb
-    for iseg in range(nseg_p):  # seg numbering from le clockwise
-        ks = isur[iseg]
-        for i in range(n_scts[ks]):
-            if xa[iseg] > (xsec_node[ks, i] - eps) and xb[iseg] < (xsec_node[ks, i + 1] + eps):
-                idsect[iseg] = i
-                break
-
-    '''
-    isur = np.zeros(nseg, dtype=np.int_)  # surf id
-    thseg = np.zeros(nseg)
-    idsect = np.zeros(nseg, dtype=np.int_)  # associated sect or web number
-    yseg = np.zeros(nseg)  # y-ref of mid-seg point
-    zseg = np.zeros(nseg)  # z-ref of mid-seg point
-    wseg = np.zeros(nseg)  # seg width
-    
-    for iseg in range(nseg):  # seg numbering from le clockwise
-        ks = -2
-        if iseg < nseg_u:  # upper surface segs
-            nd_a = ndu1 + iseg
-            xa = xnode_u[nd_a]
-            ya = ynode_u[nd_a]
-            xb = xnode_u[nd_a + 1]
-            yb = ynode_u[nd_a + 1]
-            ks = 0
-        elif iseg < nseg_p:  # lower surface segs
-            nd_a = ndl1 + iseg - nseg_u
-            xa = xnode_l[nd_a]  # xref of node toward le (in a/f ref frame)
-            ya = ynode_l[nd_a]  # yref of node toward le (in new ref frame)
-            xb = xnode_l[nd_a + 1]  # xref of node toward te (in a/f ref frame)
-            yb = ynode_l[nd_a + 1]  # yref of node toward te (in new ref frame)
-            ks = 1
-        else:
-            iweb = iseg - nseg_p
-            xa = loc_web[iweb]
-            xb = xa
-            ya = weby_u[iweb]
-            yb = weby_l[iweb]
-            ks = -1
-
-        if ks == -2:
-            print(f'iseg={iseg}')
-            raise ValueError('ERROR** unknown, contact NREL')
-
-        isur[iseg] = ks
-
-        if ks >= 0:  # id associated sect number
-            icheck = True
-            for i in range(n_scts[ks]):
-                if xa > (xsec_node[ks, i] - eps) and xb < (xsec_node[ks, i + 1] + eps):
-                    idsect[iseg] = i
-                    icheck = False
-                    break
-
-            if icheck:
-                print('ERROR** unknown, contact NREL')
-        else:
-            idsect[iseg] = iweb  # id associated web number
-
-        xba = xb - xa
-        yba = ya - yb
-        yseg[iseg] = ch * (2. * rle - xa - xb) / 2.0  # yref coord of mid-seg pt (in r-frame)
-        zseg[iseg] = ch * (ya + yb) / 2.0  # zref coord of mid-seg pt (in r-frame)
-        wseg[iseg] = ch * np.sqrt(xba ** 2 + yba ** 2)
-
-        if ks >= 0:  # id associated sect number
-            thseg[iseg] = np.arctan(yba / xba)  # thseg +ve in new y-z ref frame
-        else:
-            thseg[iseg] = -np.pi / 2.0
+    thseg = -np.pi / 2.0 * np.ones(nseg)
+    thseg[:nseg_p] = np.arctan(yba[:nseg_p] / xba[:nseg_p])  # thseg +ve in new y-z ref frame
 
     sthseg = np.sin(thseg)
     cthseg = np.cos(thseg)
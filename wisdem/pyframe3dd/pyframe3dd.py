@@ -11,8 +11,9 @@ from __future__ import print_function
 
 import os
 import math
+import hashlib
 from sys import platform
-from ctypes import POINTER, Structure, c_int, pointer, c_double
+from ctypes import POINTER, Structure, c_int, pointer, c_double, c_void_p
 from collections import namedtuple
 
 import numpy as np
@@ -97,7 +98,7 @@ class C_Elements(Structure):
 
 
 class C_OtherElementData(Structure):
-    _fields_ = [("shear", c_int), ("geom", c_int), ("exagg_static", c_double), ("dx", c_double)]
+    _fields_ = [("shear", c_int), ("geom", c_int), ("exagg_static", c_double), ("dx", c_double), ("sparse", c_int)]
 
 
 # --------------
@@ -350,7 +351,7 @@ ReactionData = namedtuple("ReactionData", ["node", "Kx", "Ky", "Kz", "Ktx", "Kty
 ElementData = namedtuple(
     "ElementData", ["element", "N1", "N2", "Ax", "Asy", "Asz", "Jx", "Iy", "Iz", "E", "G", "roll", "density"]
 )
-Options = namedtuple("Options", ["shear", "geom", "dx"])
+Options = namedtuple("Options", ["shear", "geom", "dx", "sparse"], defaults=[False])
 
 
 # outputs
@@ -366,8 +367,15 @@ Modes = namedtuple("Modes", ["freq", "xmpf", "ympf", "zmpf", "node", "xdsp", "yd
 
 
 class Frame(object):
-    def __init__(self, nodes, reactions, elements, options):
-        """docstring"""
+    def __init__(self, nodes, reactions, elements, options, persistent=False):
+        """Frame3DD model of nodes, reactions, and frame elements.
+
+        With persistent=True the assembled and factored stiffness matrix, and the mass matrix
+        and modes of a linear frame (options.geom False), are kept between calls of run().
+        Later runs that only add or change load cases are back-substitutions; any change to the
+        nodes, reactions, elements, options, extra masses, or dynamics settings is detected and
+        the stiffness matrix is assembled and factored again.
+        """
 
         self.nodes = nodes
         self.elements = elements
@@ -428,7 +436,7 @@ class Frame(object):
 
         # options
         exagg_static = 1.0  # not used
-        self.c_other = C_OtherElementData(options.shear, options.geom, exagg_static, options.dx)
+        self.c_other = C_OtherElementData(options.shear, options.geom, exagg_static, options.dx, int(options.sparse))
 
         # leave off dynamics by default
         self.nM = 0  # number of desired dynamic modes of vibration (below only necessary if nM > 0)
@@ -472,10 +480,46 @@ class Frame(object):
             POINTER(POINTER(C_InternalForces)),
             POINTER(C_MassResults),
             POINTER(C_ModalResults),
+            c_void_p,
         ]
 
         self._pyframe3dd.run.restype = c_int
 
+        # stiffness matrix factors and modes kept from one run to the next
+        self.persistent = persistent
+        self._factors = None
+        self._factors_key = None
+        if persistent:
+            self._pyframe3dd.alloc_factors.restype = c_void_p
+            self._pyframe3dd.clear_factors.argtypes = [c_void_p]
+            self._pyframe3dd.free_factors.argtypes = [c_void_p]
+            self._factors = c_void_p(self._pyframe3dd.alloc_factors())
+
+    def __del__(self):
+        if getattr(self, "_factors", None) is not None:
+            self._pyframe3dd.free_factors(self._factors)
+            self._factors = None
+
+    def _structure_key(self):
+        """Fingerprint of every input of the stiffness and mass matrices (but not of the loads)"""
+        h = hashlib.blake2b(digest_size=16)
+        nodes = [self.nnode, self.nx, self.ny, self.nz, self.nr]
+        reactions = [self.rnode, self.rKx, self.rKy, self.rKz, self.rKtx, self.rKty, self.rKtz]
+        elements = [self.eelement, self.eN1, self.eN2, self.eAx, self.eAsy, self.eAsz, self.eJx, self.eIy, self.eIz]
+        materials = [self.eE, self.eG, self.eroll, self.edensity]
+        node_masses = [self.ENMnode, self.ENMmass, self.ENMIxx, self.ENMIyy, self.ENMIzz, self.ENMIxy, self.ENMIxz]
+        node_masses += [self.ENMIyz, self.ENMrhox, self.ENMrhoy, self.ENMrhoz]
+        element_masses = [self.EEMelement, self.EEMmass]
+        condensation = [self.NC, self.cx, self.cy, self.cz, self.cxx, self.cyy, self.czz, self.mC]
+        for x in nodes + reactions + elements + materials + node_masses + element_masses + condensation:
+            h.update(np.ascontiguousarray(x).tobytes())
+            h.update(b"|")
+        options = (self.c_reactions.rigid, self.c_condensation.Cmethod)
+        options += (self.c_other.shear, self.c_other.geom, self.c_other.sparse)
+        options += (self.nM, self.Mmethod, self.lump, self.tol, self.shift)
+        h.update(repr(options).encode())
+        return h.digest()
+
     def set_reactions(self, reactions):
         # reactions
         self.reactions = reactions
@@ -907,6 +951,13 @@ class Frame(object):
         exagg_modal = 1.0  # not used
         c_dynamicData = C_DynamicData(self.nM, self.Mmethod, self.lump, self.tol, self.shift, exagg_modal)
 
+        # refactor only if the structure changed since the last run
+        if self.persistent:
+            key = self._structure_key()
+            if key != self._factors_key:
+                self._pyframe3dd.clear_factors(self._factors)
+                self._factors_key = key
+
         exitCode = self._pyframe3dd.run(
             self.c_nodes,
             self.c_reactions,
@@ -924,6 +975,7 @@ class Frame(object):
             c_internalForces,
             c_massResults,
             c_modalResults,
+            self._factors,
         )
 
         # put mass values back in since tuple is read only
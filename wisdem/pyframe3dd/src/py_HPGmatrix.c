@@ -36,6 +36,7 @@
 #define _USE_MATH_DEFINES // For windows to get M_PI
 #include <math.h>
 #include <stdio.h>
+#include <stdlib.h>
 
 #include "py_HPGmatrix.h"
 #include "NRutil.h"
@@ -547,6 +548,226 @@ void ldl_mprove_pm (
 }
 
 
+/*
+ * ALLOC_SKYLINE - allocate a symmetric Skyline matrix with profile first[1..n]
+ * 2026-10-17
+ */
+Skyline *alloc_skyline ( int n, int *first )
+{
+	Skyline	*S;
+	int	j;
+
+	S = (Skyline *) malloc ( sizeof(Skyline) );
+	S->n = n;
+	S->first = ivector(1,n);
+	S->ptr = (long *) malloc ( (n+2) * sizeof(long) );
+	S->ptr[1] = 0;
+	for (j=1; j<=n; j++) {
+		S->first[j] = first[j];
+		S->ptr[j+1] = S->ptr[j] + (j - first[j] + 1);
+	}
+	S->K = (double *) calloc ( S->ptr[n+1], sizeof(double) );
+	S->L = (double *) calloc ( S->ptr[n+1], sizeof(double) );
+	S->d = dvector(1,n);
+
+	return S;
+}
+
+
+/*
+ * FREE_SKYLINE - free the memory of a Skyline matrix
+ * 2026-10-17
+ */
+void free_skyline ( Skyline *S )
+{
+	if ( S == NULL ) return;
+	free_ivector ( S->first, 1, S->n );
+	free ( S->ptr );
+	free ( S->K );
+	free ( S->L );
+	free_dvector ( S->d, 1, S->n );
+	free ( S );
+}
+
+
+/*
+ * SKY_PROD - {y_i} += [A_ij]{x_j} for rows with p[i] and columns with s[j]
+ * only the upper-triangle profile of [A] is stored; p or s may be NULL
+ * 2026-10-17
+ */
+void sky_prod ( Skyline *S, double *x, double *y, int *p, int *s )
+{
+	double	*Kj, Kij;
+	int	i, j, n = S->n;
+
+	for (j=1; j<=n; j++) {
+		Kj = S->K + S->ptr[j] - S->first[j];	/* Kj[i] = A[i][j] */
+		if ( (p == NULL || p[j]) && (s == NULL || s[j]) )
+			y[j] += Kj[j] * x[j];
+		for (i=S->first[j]; i < j; i++) {
+			Kij = Kj[i];
+			if ( Kij == 0.0 ) continue;
+			if ( (p == NULL || p[i]) && (s == NULL || s[j]) )
+				y[i] += Kij * x[j];
+			if ( (p == NULL || p[j]) && (s == NULL || s[i]) )
+				y[j] += Kij * x[i];
+		}
+	}
+}
+
+
+/*
+ * LDL_DCMP_SKY  -  Solves partitioned matrix equations as ldl_dcmp_pm does,
+ * for a symmetric matrix stored in Skyline form.
+ *
+ * Row i of L in the L D L' decomposition is stored in the profile of
+ * column i of S->L, so every loop of the reduction and of the
+ * substitutions is bounded by the skyline of the matrix.
+ * 2026-10-17
+ */
+void ldl_dcmp_sky (
+	Skyline *S,	/**< the system matrix and its L D L' decomp.	*/
+	double *b,	/**< the right hand side vector			*/
+	double *x,	/**< part of the solution vector		*/
+	double *c,	/**< the part of the solution vector in the rhs */
+	int *q,		/**< q[j]=1 if  b[j] is known; q[j]=0 otherwise	*/
+	int *r,		/**< r[j]=1 if  x[j] is known; r[j]=0 otherwise	*/
+	int reduce,	/**< 1: do a forward reduction of A; 0: don't	*/
+	int solve,	/**< 1: do a back substitution for {x}; 0: don't */
+	int *pd		/**< 1: definite matrix and successful L D L' decomp'n*/
+){
+	double	*Kj, *Lj, *Li, *d = S->d, s;
+	int	i, j, k, m, mk, n = S->n;
+	*pd = 0;	/* number of negative elements on the diagonal of D */
+
+	if ( reduce ) {		/* forward column-wise reduction of [A]	*/
+
+	    for (j=1; j<=n; j++) {
+
+	      d[j] = 0.0;
+	      m  = S->first[j];
+	      Kj = S->K + S->ptr[j] - m;	/* Kj[i] = A[i][j] */
+	      Lj = S->L + S->ptr[j] - m;	/* Lj[i] = L[j][i] */
+
+	      if ( q[j] ) { /* reduce column j, except where q[i]==0	*/
+
+		for (i=m; i < j; i++) {
+		    Lj[i] = 0.0;
+		    if ( q[i] ) {
+			Li = S->L + S->ptr[i] - S->first[i];
+			mk = ( S->first[i] > m ) ? S->first[i] : m;
+			s = Kj[i];
+			for (k=mk; k < i; k++)
+				if ( q[k] )
+					s -= Lj[k]*Li[k];
+			Lj[i] = s;
+		    }
+		}
+
+		d[j] = Kj[j];
+	    	for (i=m; i < j; i++) if ( q[i] ) d[j] -= Lj[i]*Lj[i]/d[i];
+	    	for (i=m; i < j; i++) if ( q[i] ) Lj[i] /= d[i];
+
+		if ( d[j] == 0.0 ) {
+		 fprintf(stderr," ldl_dcmp_sky(): zero found on diagonal ...\n");
+		 fprintf(stderr," d[%d] = %11.4e\n", j, d[j] );
+		 return;
+		}
+		if ( d[j] < 0.0 ) (*pd)--;
+	      }
+	    }
+
+	}		/* the forward reduction of [A] is now complete	*/
+
+	if ( solve ) {		/* back substitution to solve for {x}   */
+
+	    for (i=1; i <= n; i++)	if ( q[i] )	x[i] = b[i];
+	    for (i=1; i <= n; i++)	if ( q[i] )	x[i] = -x[i];
+	    sky_prod ( S, x, x, q, r );	/* x_q = -b_q + A_qr x_r	*/
+	    for (i=1; i <= n; i++)	if ( q[i] )	x[i] = -x[i];
+
+		/* {x} is run through the same forward reduction as was [A] */
+	    for (i=1; i <= n; i++) {
+		if ( q[i] ) {
+			Li = S->L + S->ptr[i] - S->first[i];
+			for (j=S->first[i]; j < i; j++) if ( q[j] ) x[i] -= Li[j]*x[j];
+		}
+	    }
+
+	    for (i=1; i <= n; i++)	if ( q[i] )	x[i] /= d[i];
+
+	    /* now back substitution is conducted on {x};  [A] is preserved */
+
+	    for (i=n; i > 1; i--) {
+		if ( q[i] ) {
+			Li = S->L + S->ptr[i] - S->first[i];
+			for (j=S->first[i]; j < i; j++) if ( q[j] ) x[j] -= Li[j]*x[i];
+		}
+	    }
+
+	    /* finally, evaluate c_r	*/
+
+	    for (i=1; i<=n; i++)	c[i] = r[i] ? -b[i] : 0.0;
+	    sky_prod ( S, x, c, r, NULL );
+
+	}
+	return;
+}
+
+
+/*
+ * LDL_MPROVE_SKY  -  Improves a solution of partitioned matrix equations
+ * as ldl_mprove_pm does, for a Skyline matrix factored by ldl_dcmp_sky
+ * 2026-10-17
+ */
+void ldl_mprove_sky (
+	Skyline *S,	/**< the system matrix and its L D L' decomp.	*/
+	double *b,	/**< the right hand side vector			*/
+	double *x,	/**< part of the solution vector		*/
+	double *c,	/**< the part of the solution vector in the rhs */
+	int *q,		/**< q[j]=1 if  b[j] is known; q[j]=0 otherwise */
+	int *r,		/**< r[j]=1 if  x[j] is known; r[j]=0 otherwise */
+	double *rms_resid, /**< root-mean-square of residual error	*/
+	int *ok		/**< 1: >10% reduction in rms_resid; 0: not	*/
+){
+	double  *dx,		// the residual error
+		*dc,		// update to partial r.h.s. vector, c
+		rms_resid_new=0.0; // the RMS error of the mprvd solution
+	int	i, n = S->n, pd;
+
+	dx  = dvector(1,n);
+	dc  = dvector(1,n);
+
+	// calculate the r.h.s. of ...
+	//  [A_qq]{dx_q} = {b_q} - [A_qq]*{x_q} - [A_qr]*{x_r}
+	//  {dx_r} is left unchanged at 0.0;
+	for (i=1;i<=n;i++)	dx[i] = 0.0;
+	sky_prod ( S, x, dx, q, NULL );
+	for (i=1;i<=n;i++)	if ( q[i] )	dx[i] = b[i] - dx[i];
+
+	// solve for the residual error term, A is already factored
+	ldl_dcmp_sky ( S, dx, dx, dc, q,r, 0, 1, &pd );
+
+	for (i=1;i<=n;i++) if ( q[i] )	rms_resid_new += dx[i]*dx[i];
+
+	rms_resid_new = sqrt ( rms_resid_new / (double) n );
+
+	*ok = 0;
+	if ( rms_resid_new / *rms_resid < 0.90 ) { /*  enough improvement    */
+		for (i=1;i<=n;i++) {	/*  update the solution */
+		    	if ( q[i] )	x[i] += dx[i];
+			if ( r[i] )	c[i] += dc[i];
+		}
+		*rms_resid = rms_resid_new;	/* return the new residual   */
+		*ok = 1;			/* the solution has improved */
+	}
+
+	free_dvector(dx,1,n);
+	free_dvector(dc,1,n);
+	return;
+}
+
+
 /*
  * PSB_UPDATE
  * Update secant stiffness matrix via the Powell-Symmetric-Broyden update eqn.
@@ -34,6 +34,9 @@
     along with HPGmatrix.  If not, see <http://www.gnu.org/licenses/>.
 */
 
+#ifndef FRAME_PY_HPGMATRIX_H
+#define FRAME_PY_HPGMATRIX_H
+
 /*
  * GAUSSJ
  * Linear equation solution by Gauss-Jordan elimination, [A][X]=[B] above. A[1..n][1..n]
@@ -179,6 +182,68 @@ void ldl_mprove_pm (
         int *ok );      /**< 1: >10% reduction in rms_resid; 0: not     */
 
 
+/*
+ * SKYLINE
+ * Symmetric matrix [1..n][1..n] stored by its upper-triangle profile.
+ * Column j holds rows first[j] .. j contiguously, so that
+ * A[i][j] = K[ptr[j] + i - first[j]] for first[j] <= i <= j and zero above.
+ * L holds the transpose of L from the L D L' decomposition with the same
+ * profile, and d holds the diagonal of D.
+ */
+typedef struct {
+	int	n;	/**< the dimension of the matrix		*/
+	int	*first;	/**< first row of the profile of each column	*/
+	long	*ptr;	/**< offset of the first row of each column	*/
+	double	*K;	/**< the profile of the upper triangle of [A]	*/
+	double	*L;	/**< the profile of L' of the L D L' decomp'n	*/
+	double	*d;	/**< diagonal of D in the  L D L' - decomp'n	*/
+} Skyline;
+
+/*
+ * ALLOC_SKYLINE - allocate a Skyline matrix with the profile first[1..n]
+ * FREE_SKYLINE - free a Skyline matrix
+ */
+Skyline *alloc_skyline ( int n, int *first );
+void free_skyline ( Skyline *S );
+
+/*
+ * SKY_PROD - {y_i} += [A_ij]{x_j} for rows with p[i] and columns with s[j]
+ * p or s may be NULL to include all rows or all columns
+ */
+void sky_prod ( Skyline *S, double *x, double *y, int *p, int *s );
+
+/*
+ * LDL_DCMP_SKY
+ * Same as ldl_dcmp_pm for a Skyline matrix.  The factorization only visits
+ * the profile, so its cost is set by the profile rather than by n^3.
+ * [A] is preserved in S->K; L' and D are stored in S->L and S->d.
+ */
+void ldl_dcmp_sky (
+	Skyline *S,	/**< the system matrix and its L D L' decomp.	*/
+	double *b,	/**< the right hand side vector			*/
+	double *x,	/**< part of the solution vector		*/
+	double *c,	/**< the part of the solution vector in the rhs */
+	int *q,		/**< q[j]=1 if  b[j] is known; q[j]=0 otherwise	*/
+	int *r,		/**< r[j]=1 if  x[j] is known; r[j]=0 otherwise	*/
+	int reduce,	/**< 1: do a forward reduction of A; 0: don't	*/
+	int solve,	/**< 1: do a back substitution for {x}; 0: don't */
+	int *pd );	/**< 1: definite matrix and successful L D L' decomp'n*/
+
+/*
+ * LDL_MPROVE_SKY
+ * Same as ldl_mprove_pm for a Skyline matrix factored by ldl_dcmp_sky.
+ */
+void ldl_mprove_sky (
+	Skyline *S,	/**< the system matrix and its L D L' decomp.	*/
+	double *b,	/**< the right hand side vector			*/
+	double *x,	/**< part of the solution vector		*/
+	double *c,	/**< the part of the solution vector in the rhs */
+	int *q,		/**< q[j]=1 if  b[j] is known; q[j]=0 otherwise */
+	int *r,		/**< r[j]=1 if  x[j] is known; r[j]=0 otherwise */
+	double *rms_resid, /**< root-mean-square of residual error	*/
+	int *ok );	/**< 1: >10% reduction in rms_resid; 0: not	*/
+
+
 /*
  * PSB_UPDATE
  * Update secant stiffness matrix via the Powell-Symmetric-Broyden update eqn.
@@ -265,3 +330,5 @@ double relative_norm( double *N, double *D, int n );
  * compute matrices of the Legendre polynomials and its first two derivitives
  */
 void Legendre( int order, float *t, int n, float **P, float **Pp, float **Ppp );
+
+#endif /* FRAME_PY_HPGMATRIX_H */
@@ -66,6 +66,15 @@ static void frame_element_force(
 	int shear, int geom, double *axial_strain
 );
 
+static void sky_residual(
+	Skyline *S, int *pos, double *dF, double *F, double *D, int DoF, int *p
+);
+
+static void solve_system_sky(
+	Skyline *S, int *pos, double *D, double *F, double *R, int DoF,
+	int *q, int *r, int *ok, double *rms_resid, int reduce
+);
+
 static void lumped_M(
 	double **m, vec3 *xyz,
 	double L, int n1, int n2,
@@ -94,7 +103,8 @@ void assemble_K(
 	float *E, float *G, float *p,
 	int shear, int geom, double **Q, int debug,
 	float *EKx, float *EKy, float *EKz,
-	float *EKtx, float *EKty, float *EKtz
+	float *EKtx, float *EKty, float *EKtz,
+	Skyline *S, int *pos
 		){
 	double	**k;		/* element stiffness matrix in global coord */
 	int	**ind,		/* member-structure DoF index table	*/
@@ -102,7 +112,11 @@ void assemble_K(
 		i, j, ii, jj, l, ll;
 	char	stiffness_fn[FILENMAX];
 
-	for (i=1; i<=DoF; i++)	for (j=1; j<=DoF; j++)	K[i][j] = 0.0;
+	if ( S ) {	/* skyline storage of the renumbered coordinates */
+		for (i=0; i < S->ptr[DoF+1]; i++)	S->K[i] = 0.0;
+	} else {
+		for (i=1; i<=DoF; i++)	for (j=1; j<=DoF; j++)	K[i][j] = 0.0;
+	}
 
 	k   =  dmatrix(1,12,1,12);
 	ind = imatrix(1,12,1,nE);
@@ -133,6 +147,18 @@ void assemble_K(
 			save_dmatrix(stiffness_fn,k,1,12,1,12,0, "w");
 		}
 
+		if ( S ) {	/* upper triangle only */
+			for ( l=1; l <= 12; l++ ) {
+				ii = pos[ind[l][i]];
+				for ( ll=1; ll <= 12; ll++ ) {
+					jj = pos[ind[ll][i]];
+					if ( ii <= jj )
+						S->K[S->ptr[jj] + ii - S->first[jj]] += k[l][ll];
+				}
+			}
+			continue;
+		}
+
 		for ( l=1; l <= 12; l++ ) {
 			ii = ind[l][i];
 			for ( ll=1; ll <= 12; ll++ ) {
@@ -144,6 +170,15 @@ void assemble_K(
 
 	for ( j = 1; j <= nN; j++ ) {		// add extra stiffness
 	  i = 6*(j-1);
+	  if ( S ) {
+	    for ( l=1; l <= 6; l++ ) {
+	      ii = pos[i+l];
+	      S->K[S->ptr[ii] + ii - S->first[ii]] +=
+		(l==1) ? EKx[j] : (l==2) ? EKy[j] : (l==3) ? EKz[j] :
+		(l==4) ? EKtx[j] : (l==5) ? EKty[j] : EKtz[j];
+	    }
+	    continue;
+	  }
 	  K[i+1][i+1] += EKx[j];
 	  K[i+2][i+2] += EKy[j];
 	  K[i+3][i+3] += EKz[j];
@@ -361,20 +396,24 @@ int	r;
 /*
  * SOLVE_SYSTEM  -  solve {F} =   [K]{D} via L D L' decomposition        27dec01
  * Prescribed displacements are "mechanical loads" not "temperature loads"
+ * with reduce == 0 the L D L' factors from a previous call are re-used  2026-10-17
  */
 void solve_system(
 	double **K, double *D, double *F, double *R, int DoF, int *q, int *r,
-	int *ok, int verbose, double *rms_resid
+	int *ok, int verbose, double *rms_resid, Skyline *S, int *pos,
+	double *diag, int reduce
 ){
-	double	*diag;		/* diagonal vector of the L D L' decomp. */
-
 	verbose = 0;		/* suppress verbose output		*/
 
-	diag = dvector ( 1, DoF );
+	if ( S ) {
+		solve_system_sky ( S, pos, D, F, R, DoF, q, r, ok, rms_resid, reduce );
+		return;
+	}
 
 	/*  L D L' decomposition of K[q,q] into lower triangle of K[q,q] and diag[q] */
 	/*  vectors F and D are unchanged */
-	ldl_dcmp_pm ( K, DoF, diag, F, D, R, q,r, 1, 0, ok );
+	*ok = 0;
+	if ( reduce ) ldl_dcmp_pm ( K, DoF, diag, F, D, R, q,r, 1, 0, ok );
 	if ( *ok < 0 ) {
 	  //fprintf(stderr," Make sure that all six");
 	  //fprintf(stderr," rigid body translations are restrained!\n");
@@ -389,8 +428,6 @@ void solve_system(
 		} while ( *ok );
 	        if ( verbose ) fprintf(stdout,"\n");
 	}
-
-	free_dvector( diag, 1, DoF );
 }
 
 
@@ -400,7 +437,8 @@ void solve_system(
  * return ||dF||/||F||
  * 2014-05-16
  */
-double equilibrium_error( double *dF, double *F, double **K, double *D, int DoF, int *q, int *r )
+double equilibrium_error( double *dF, double *F, double **K, double *D, int DoF, int *q, int *r,
+			  Skyline *S, int *pos )
 {
 	double	ss_dF = 0.0,	//  sum of squares of dF
 		ss_F  = 0.0,	//  sum of squares of F
@@ -408,6 +446,10 @@ double equilibrium_error( double *dF, double *F, double **K, double *D, int DoF,
 	int	i,j;
 
 	// compute equilibrium error at free coord's (q)
+	if ( S ) {
+		sky_residual ( S, pos, dF, F, D, DoF, q );
+		for (i=1; i<=DoF; i++) if (!q[i]) dF[i] = 0.0;
+	} else
 	for (i=1; i<=DoF; i++) {
 		errF = 0.0;
 		if (q[i]) {
@@ -669,10 +711,17 @@ int nE, int DoF,
  * 2012-10-12  , 2014-05-16
  */
 void compute_reaction_forces(
-	 double *R, double *F, double **K, double *D, int DoF, int *r
+	 double *R, double *F, double **K, double *D, int DoF, int *r,
+	 Skyline *S, int *pos
 ){
 	int	i,j;
 
+	if ( S ) {	// R(r) = -( F(r) - [K(r,:)]*{D} )
+		sky_residual ( S, pos, R, F, D, DoF, r );
+		for (i=1; i<=DoF; i++) R[i] = r[i] ? -R[i] : 0.0;
+		return;
+	}
+
 	for (i=1; i<=DoF; i++) {
 		R[i] = 0;
 		if (r[i]) {		// coordinate "i" is a reaction coord.
@@ -684,6 +733,180 @@ void compute_reaction_forces(
 }
 
 
+/*
+ * ALLOC_K_SKY - renumber the nodes by the reverse Cuthill-McKee ordering of
+ * the element connectivity to reduce the profile of the stiffness matrix,
+ * and allocate the skyline of the renumbered stiffness matrix.
+ * pos[i] is the renumbered index of structural coordinate i.
+ * 2026-10-17
+ */
+Skyline *alloc_K_sky( int DoF, int nN, int nE, int *N1, int *N2, int *pos )
+{
+	Skyline	*S;
+	int	*deg,		/* number of element ends connected to each node */
+		*start, *adj,	/* node adjacency lists, start[n] .. start[n+1]-1 */
+		*order,		/* Cuthill-McKee order of the nodes	*/
+		*seen,		/* 1: node already in order; 0: not	*/
+		*first,		/* first row of each column of the skyline */
+		head=0, tail=0, nxt, a, b, i, j, k, n, lo;
+
+	deg   = ivector(1,nN);
+	start = ivector(1,nN+1);
+	adj   = ivector(1,2*nE+1);
+	order = ivector(1,nN);
+	seen  = ivector(1,nN);
+	first = ivector(1,DoF);
+
+	for (n=1; n<=nN; n++)	deg[n] = seen[n] = 0;
+	for (i=1; i<=nE; i++) {
+		if ( N1[i] == N2[i] ) continue;
+		deg[N1[i]]++;	deg[N2[i]]++;
+	}
+	start[1] = 1;
+	for (n=1; n<=nN; n++)	start[n+1] = start[n] + deg[n];
+	for (n=1; n<=nN; n++)	deg[n] = 0;
+	for (i=1; i<=nE; i++) {
+		a = N1[i];	b = N2[i];
+		if ( a == b ) continue;
+		adj[start[a] + deg[a]++] = b;
+		adj[start[b] + deg[b]++] = a;
+	}
+
+	while ( tail < nN ) {
+		/* an unnumbered node of least degree starts each component */
+		for (a=0, n=1; n<=nN; n++)
+			if ( !seen[n] && ( a == 0 || deg[n] < deg[a] ) ) a = n;
+		order[++tail] = a;	seen[a] = 1;
+
+		while ( head < tail ) {
+			n = order[++head];
+			nxt = tail + 1;
+			for (k=start[n]; k < start[n+1]; k++) {
+				a = adj[k];
+				if ( !seen[a] ) { order[++tail] = a; seen[a] = 1; }
+			}
+			/* neighbors are numbered by increasing degree */
+			for (i=nxt+1; i<=tail; i++) {
+				a = order[i];
+				for (j=i-1; j >= nxt && deg[order[j]] > deg[a]; j--)
+					order[j+1] = order[j];
+				order[j+1] = a;
+			}
+		}
+	}
+
+	/* reverse the Cuthill-McKee order, seen[n] is the new node number */
+	for (i=1; i<=nN; i++)	seen[order[i]] = nN - i + 1;
+
+	for (n=1; n<=nN; n++) {
+		lo = seen[n];
+		for (k=start[n]; k < start[n+1]; k++)
+			if ( seen[adj[k]] < lo ) lo = seen[adj[k]];
+		for (k=1; k<=6; k++) {
+			pos[6*(n-1)+k] = 6*(seen[n]-1) + k;
+			first[6*(seen[n]-1)+k] = 6*(lo-1) + 1;
+		}
+	}
+
+	S = alloc_skyline ( DoF, first );
+
+	free_ivector(deg,1,nN);
+	free_ivector(start,1,nN+1);
+	free_ivector(adj,1,2*nE+1);
+	free_ivector(order,1,nN);
+	free_ivector(seen,1,nN);
+	free_ivector(first,1,DoF);
+
+	return S;
+}
+
+
+/*
+ * SKY_RESIDUAL - {dF_p} = {F_p} - [K(p,:)]{D} for the coordinates with p[i],
+ * for a stiffness matrix in skyline storage of the renumbered coordinates
+ * 2026-10-17
+ */
+static void sky_residual(
+	Skyline *S, int *pos, double *dF, double *F, double *D, int DoF, int *p
+){
+	double	*x, *y;
+	int	*ps, i;
+
+	x  = dvector(1,DoF);
+	y  = dvector(1,DoF);
+	ps = ivector(1,DoF);
+	for (i=1; i<=DoF; i++) {
+		x[pos[i]]  = D[i];
+		y[i]       = 0.0;
+		ps[pos[i]] = p[i];
+	}
+	sky_prod ( S, x, y, ps, NULL );
+	for (i=1; i<=DoF; i++)	if ( p[i] ) dF[i] = F[i] - y[pos[i]];
+
+	free_dvector(x,1,DoF);
+	free_dvector(y,1,DoF);
+	free_ivector(ps,1,DoF);
+}
+
+
+/*
+ * SOLVE_SYSTEM_SKY - solve_system() for a stiffness matrix in skyline
+ * storage of the renumbered coordinates
+ * 2026-10-17
+ */
+static void solve_system_sky(
+	Skyline *S, int *pos, double *D, double *F, double *R, int DoF,
+	int *q, int *r, int *ok, double *rms_resid, int reduce
+){
+	double	*Ds, *Fs, *Rs;	/* renumbered D, F, R */
+	int	*qs, *rs, i;	/* renumbered q, r */
+
+	Ds = dvector(1,DoF);	Fs = dvector(1,DoF);	Rs = dvector(1,DoF);
+	qs = ivector(1,DoF);	rs = ivector(1,DoF);
+	for (i=1; i<=DoF; i++) {
+		Ds[pos[i]] = D[i];	Fs[pos[i]] = F[i];	Rs[pos[i]] = R[i];
+		qs[pos[i]] = q[i];	rs[pos[i]] = r[i];
+	}
+
+	/*  L D L' decomposition of K[q,q] */
+	*ok = 0;
+	if ( reduce ) ldl_dcmp_sky ( S, Fs, Ds, Rs, qs, rs, 1, 0, ok );
+	if ( *ok >= 0 ) {	/* LDL'  back-substitution for D[q] and R[r] */
+		ldl_dcmp_sky ( S, Fs, Ds, Rs, qs, rs, 0, 1, ok );
+		*rms_resid = *ok = 1;
+		do {	/* improve solution for D[q] and R[r] */
+			ldl_mprove_sky ( S, Fs, Ds, Rs, qs, rs, rms_resid, ok );
+		} while ( *ok );
+	}
+
+	for (i=1; i<=DoF; i++) {
+		D[i] = Ds[pos[i]];	R[i] = Rs[pos[i]];
+	}
+
+	free_dvector(Ds,1,DoF);	free_dvector(Fs,1,DoF);	free_dvector(Rs,1,DoF);
+	free_ivector(qs,1,DoF);	free_ivector(rs,1,DoF);
+}
+
+
+/*
+ * SKY_TO_DENSE - copy the skyline stiffness matrix of the renumbered
+ * coordinates into the full matrix K[1..DoF][1..DoF] in structural coordinates
+ * 2026-10-17
+ */
+void sky_to_dense( Skyline *S, int *pos, double **K, int DoF )
+{
+	int	i, j, a, b;
+
+	for (i=1; i<=DoF; i++) {
+		for (j=1; j<=DoF; j++) {
+			a = pos[i];	b = pos[j];
+			if ( a > b ) { a = pos[j]; b = pos[i]; }
+			K[i][j] = ( a < S->first[b] ) ? 0.0 : S->K[S->ptr[b] + a - S->first[b]];
+		}
+	}
+}
+
+
 /*
  * ASSEMBLE_M  -  assemble global mass matrix from element mass & inertia  24nov98
  */
@@ -1154,7 +1377,7 @@ void deallocate(
 	free_dvector(dF,1,DoF);
 
 // printf("..H.. K & Q\n"); /* debug */
-	free_dmatrix(K,1,DoF,1,DoF);
+	if ( K )	free_dmatrix(K,1,DoF,1,DoF);
 	free_dmatrix(Q,1,nE,1,12);
 
 // printf("..I.. D  dD R dR \n"); /* debug */
@@ -1197,7 +1420,7 @@ void deallocate(
 	free_vector(EKtz,1,nN);
 
 // printf("..L.. M f V\n"); /* debug */
-	if ( nM > 0 ) {
+	if ( nM > 0 && M ) {
 		free_dmatrix(M,1,DoF,1,DoF);
 		free_dvector(f,1,nM);
 		free_dmatrix(V,1,DoF,1,DoF);
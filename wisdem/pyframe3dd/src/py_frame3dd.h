@@ -30,10 +30,32 @@
 /* for Micro-Stran compatability, structure for cartesian vectors */
 #include "microstran/vec3.h"
 
+/* skyline storage of the stiffness matrix */
+#include "py_HPGmatrix.h"
+
 /* maximum number of load cases */
 #define _NL_ 32
 
 
+/** stiffness matrix factors and modal results kept from one run() to the next,
+ *  valid as long as the frame, its reactions, masses, and options are unchanged */
+typedef struct {
+	int	DoF;		/**< number of degrees of freedom, 0: empty	*/
+	int	sparse;		/**< 1: S holds the stiffness matrix, 0: K	*/
+	double	**K;		/**< full stiffness matrix and its factors	*/
+	double	*diag;		/**< diagonal of the L D L' factors of K	*/
+	Skyline	*S;		/**< skyline stiffness matrix and its factors	*/
+	int	*pos;		/**< renumbered index of each coordinate in S	*/
+	int	factored;	/**< 1: K or S holds the factored unloaded stiffness */
+	int	nM;		/**< number of modes in M, f, V; 0: none	*/
+	double	**M;		/**< mass matrix with reactions applied	*/
+	double	*f;		/**< natural frequencies, Hz			*/
+	double	**V;		/**< mode shapes				*/
+	int	iter;		/**< number of iterations of the modal solution	*/
+	int	ok;		/**< status of the modal solution		*/
+} Factors;
+
+
 /** form the global stiffness matrix */
 void assemble_K(
 	double **K,		/**< stiffness matrix			*/
@@ -53,10 +75,32 @@ void assemble_K(
 	double **Q,		/**< frame element end forces		*/
 	int debug,		/**< 1: write element stiffness matrices*/
 	float *EKx, float *EKy, float *EKz,  // extra nodal stiffness
-	float *EKtx, float *EKty, float *EKtz
+	float *EKtx, float *EKty, float *EKtz,
+	Skyline *S,		/**< skyline stiffness matrix, or NULL to use K */
+	int *pos		/**< renumbered index of each coordinate in S */
 		);
 
 
+/** renumber the nodes to reduce the profile of the stiffness matrix
+ *  and allocate its skyline storage */
+Skyline *alloc_K_sky(
+	int DoF,		/**< number of degrees of freedom	*/
+	int nN,			/**< number of frame nodes		*/
+	int nE,			/**< number of frame elements		*/
+	int *N1, int *N2,	/**< node connectivity			*/
+	int *pos		/**< renumbered index of each coordinate */
+);
+
+
+/** copy the skyline stiffness matrix into a full matrix */
+void sky_to_dense(
+	Skyline *S,		/**< skyline stiffness matrix		*/
+	int *pos,		/**< renumbered index of each coordinate in S */
+	double **K,		/**< full stiffness matrix		*/
+	int DoF			/**< number of degrees of freedom	*/
+);
+
+
 /** solve {F} =   [K]{D} via L D L' decomposition */
 void solve_system(
 	double **K,	/**< stiffness matrix for the restrained frame	*/
@@ -68,7 +112,11 @@ void solve_system(
 	int *r,		/**< 0: not a reaction; 1: a reaction coordinate */
 	int *ok,	/**< indicates positive definite stiffness matrix */
 	int verbose,	/**< 1: copious screen output; 0: none		*/
-	double *rms_resid /**< the RMS error of the solution residual */
+	double *rms_resid, /**< the RMS error of the solution residual */
+	Skyline *S,	/**< skyline stiffness matrix, or NULL to use K	*/
+	int *pos,	/**< renumbered index of each coordinate in S	*/
+	double *diag,	/**< diagonal of the L D L' factors of K	*/
+	int reduce	/**< 1: factor K (or S); 0: re-use its factors	*/
 );
 
 
@@ -83,7 +131,9 @@ void compute_reaction_forces(
 	double **K,	/**< stiffness matrix for the solved system	*/
 	double *D,	/**< displacement vector for the solved system	*/
 	int DoF,	/**< number of structural coordinates		*/
-	int *r		/**< 0: not a reaction; 1: a reaction coordinate */
+	int *r,		/**< 0: not a reaction; 1: a reaction coordinate */
+	Skyline *S,	/**< skyline stiffness matrix, or NULL to use K	*/
+	int *pos	/**< renumbered index of each coordinate in S	*/
 );
 
 
@@ -117,7 +167,9 @@ double equilibrium_error(
 	double *D,	/**< displacement vector to be solved           */
 	int DoF,	/**< number of degrees of freedom               */
 	int *q,		/**< 1: not a reaction; 0: a reaction coordinate */
-	int *r		/**< 0: not a reaction; 1: a reaction coordinate */
+	int *r,		/**< 0: not a reaction; 1: a reaction coordinate */
+	Skyline *S,	/**< skyline stiffness matrix, or NULL to use K	*/
+	int *pos	/**< renumbered index of each coordinate in S	*/
 );
 
 
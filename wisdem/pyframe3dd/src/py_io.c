@@ -184,12 +184,13 @@ int read_frame_element_data (Elements *elements,
   Oct 31, 2013
   ------------------------------------------------------------------------------*/
 
-int read_run_data (OtherElementData *other, int *shear, int *geom, double *exagg_static, float *dx){
+int read_run_data (OtherElementData *other, int *shear, int *geom, double *exagg_static, float *dx, int *sparse){
 
   *shear = other->shear;
   *geom = other->geom;
   *exagg_static = other->exagg_static;
   *dx = other->dx;
+  *sparse = other->sparse;
 
   if (*shear != 0 && *shear != 1) {
     errorMsg(" Rember to specify shear deformations with a 0 or a 1 \n after the frame element property info.\n");
@@ -211,6 +212,11 @@ int read_run_data (OtherElementData *other, int *shear, int *geom, double *exagg
     return 74;
   }
 
+  if (*sparse != 0 && *sparse != 1) {
+    errorMsg(" Remember to specify the sparse stiffness matrix option with a 0 or a 1.\n");
+    return 75;
+  }
+
   return 0;
 }
 
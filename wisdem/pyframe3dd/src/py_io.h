@@ -51,7 +51,8 @@ int read_run_data (
     int *shear, /**< 1: include shear deformations, 0: don't    */
     int *geom,  /**< 1: include geometric stiffness, 0: don't   */
     double *exagg_static,/**< factor for static displ. exaggeration */
-    float *dx  /**< frame element increment for internal forces*/
+    float *dx,  /**< frame element increment for internal forces*/
+    int *sparse /**< 1: skyline stiffness matrix, 0: full matrix */
 );
 
 
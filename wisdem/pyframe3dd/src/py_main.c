@@ -73,12 +73,56 @@
 void init_pyframe3dd() { }
 void PyInit__pyframe3dd() { }
 
+/*
+ * ALLOC_FACTORS - allocate an empty set of stiffness matrix factors and modes
+ * to be kept between calls of run()
+ * 2026-10-17
+ */
+ALLOW_DLL_CALL Factors *alloc_factors ( void )
+{
+  return (Factors *) calloc ( 1, sizeof(Factors) );
+}
+
+
+/*
+ * CLEAR_FACTORS - free the stiffness matrix factors and modes kept in KF,
+ * the next call of run() assembles and factors the stiffness matrix again
+ * 2026-10-17
+ */
+ALLOW_DLL_CALL void clear_factors ( Factors *KF )
+{
+  if ( KF == NULL ) return;
+  if ( KF->K )	free_dmatrix ( KF->K, 1, KF->DoF, 1, KF->DoF );
+  if ( KF->diag )	free_dvector ( KF->diag, 1, KF->DoF );
+  if ( KF->S )	free_skyline ( KF->S );
+  if ( KF->pos )	free_ivector ( KF->pos, 1, KF->DoF );
+  if ( KF->nM > 0 ) {
+    free_dmatrix ( KF->M, 1, KF->DoF, 1, KF->DoF );
+    free_dvector ( KF->f, 1, KF->nM );
+    free_dmatrix ( KF->V, 1, 2*KF->DoF, 1, KF->nM );
+  }
+  memset ( KF, 0, sizeof(Factors) );
+}
+
+
+/*
+ * FREE_FACTORS - free KF and everything kept in it
+ * 2026-10-17
+ */
+ALLOW_DLL_CALL void free_factors ( Factors *KF )
+{
+  clear_factors ( KF );
+  free ( KF );
+}
+
+
 ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
 		       OtherElementData* other, int nL, LoadCase* loadcases,
 		       DynamicData *dynamic, ExtraInertia *extraInertia, ExtraMass *extraMass,
 		       Condensation *condensation, // end of inputs, rest are outputs
 		       Displacements* displacements, Forces* forces, ReactionForces* reactionForces,
-		       InternalForces** internalForces, MassResults *massResults, ModalResults *modalResults){
+		       InternalForces** internalForces, MassResults *massResults, ModalResults *modalResults,
+		       Factors *KF){
 
 
   char	errMsg[MAXL];		// the text of an error message
@@ -107,7 +151,10 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
     scale=1.0,	// zoom scale for 3D plotting in Gnuplot
     dx=1.0;		// x-increment for internal force data
 
+  Skyline	*S=NULL;	// skyline of the equilibrium stiffness matrix
+
   double	**K=NULL,	// equilibrium stiffness matrix
+    *diag=NULL,	// diagonal of the L D L' factors of K
     // **Ks=NULL,	// Broyden secant stiffness matrix
     traceK = 0.0,	// trace of the global stiffness matrix
     **M = NULL,	// global mass matrix
@@ -161,6 +208,11 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
     *N1, *N2,	// begin and end node numbers
     shear=0,	// indicates shear deformation
     geom=0,		// indicates  geometric nonlinearity
+    sparse=0,	// 1: skyline stiffness matrix, 0: full matrix
+    *pos=NULL,	// renumbered index of each coordinate in S
+    Kunloaded=0,	// 1: K holds the stiffness of the unloaded frame
+    Kfactored=0,	// 1: K holds its own L D L' factors
+    modes_kept=0,	// 1: modes of the previous run in KF are re-used
     anlyz=1,	// 1: stiffness analysis, 0: data check
     *q=NULL,*r=NULL,sumR,	// reaction data, total no. of reactions
     nM=0,		// number of desired modes
@@ -208,7 +260,7 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
   DoF = 6*nN;		/* total number of degrees of freedom	*/
 
   // andrewng: read this first because want geom for check in read_reaction_data
-  ExitCode += read_run_data ( other, &shear, &geom, &exagg_static, &dx);
+  ExitCode += read_run_data ( other, &shear, &geom, &exagg_static, &dx, &sparse);
 
   q   = ivector(1,DoF);	/* allocate memory for reaction data ... */
   r   = ivector(1,DoF);	/* allocate memory for reaction data ... */
@@ -284,7 +336,22 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
   eqF_mech =  D3dmatrix(1,nL,1,nE,1,12); /* eqF due to mech loads */
   eqF_temp =  D3dmatrix(1,nL,1,nE,1,12); /* eqF due to temp loads */
 
-  K   = dmatrix(1,DoF,1,DoF);	/* global stiffness matrix	*/
+  if ( KF && ( KF->DoF != DoF || KF->sparse != sparse ) )
+    clear_factors ( KF );	/* not the same frame as in the previous run */
+  if ( KF && KF->DoF ) {	/* re-use the stiffness matrix of the previous run */
+    K = KF->K;	diag = KF->diag;	S = KF->S;	pos = KF->pos;
+    Kunloaded = Kfactored = KF->factored;
+  } else if ( sparse ) {	/* skyline stiffness matrix of renumbered nodes */
+    pos = ivector(1,DoF);
+    S   = alloc_K_sky ( DoF, nN, nE, N1, N2, pos );
+  } else {
+    K   = dmatrix(1,DoF,1,DoF);	/* global stiffness matrix	*/
+    diag = dvector(1,DoF);	/* diagonal of its L D L' factors */
+  }
+  if ( KF && !KF->DoF ) {	/* keep the stiffness matrix for the next run */
+    KF->DoF = DoF;	KF->sparse = sparse;
+    KF->K = K;	KF->diag = diag;	KF->S = S;	KF->pos = pos;
+  }
   Q   = dmatrix(1,nE,1,12);	/* end forces for each member	*/
 
   D   = dvector(1,DoF);	/* displacments of each node		*/
@@ -373,10 +440,14 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
     for (i=1; i<=nE; i++)	for (j=1;j<=12;j++)	Q[i][j] = 0.0;
 
     /*  elastic stiffness matrix  [K({D}^(i))], {D}^(0)={0} (i=0) */
-    assemble_K ( K, DoF, nE, nN, xyz, rj, L, Le, N1, N2,
-		 Ax, Asy, Asz, Jx,Iy,Iz, E, G, p,
-		 shear, geom, Q, debug,
-		 EKx, EKy, EKz, EKtx, EKty, EKtz);
+    /*  is the same for every load case, and is factored only once */
+    if ( !Kunloaded ) {
+      assemble_K ( K, DoF, nE, nN, xyz, rj, L, Le, N1, N2,
+		   Ax, Asy, Asz, Jx,Iy,Iz, E, G, p,
+		   shear, geom, Q, debug,
+		   EKx, EKy, EKz, EKtx, EKty, EKtz, S, pos);
+      Kunloaded = 1;	Kfactored = 0;
+    }
 
 #ifdef MATRIX_DEBUG
     save_dmatrix ( "Ku", K, 1,DoF, 1,DoF, 0, "w" ); // unloaded stiffness matrix
@@ -388,7 +459,8 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
 	fprintf(stdout," Linear Elastic Analysis ... Temperature Loads\n");
 
       /*  solve {F_t} = [K({D=0})] * {D_t} */
-      solve_system(K,dD,F_temp[lc],dR,DoF,q,r,&ok,verbose,&rms_resid);
+      solve_system(K,dD,F_temp[lc],dR,DoF,q,r,&ok,verbose,&rms_resid,S,pos,diag,!Kfactored);
+      Kfactored = ( ok >= 0 );
 
       /* increment {D_t} = {0} + {D_t} temp.-induced displ */
       for (i=1; i<=DoF; i++)	if (q[i]) D[i] += dD[i];
@@ -406,7 +478,8 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
 	assemble_K ( K, DoF, nE, nN, xyz, rj, L, Le, N1, N2,
 		     Ax,Asy,Asz, Jx,Iy,Iz, E, G, p,
 		     shear,geom, Q, debug,
-		     EKx, EKy, EKz, EKtx, EKty, EKtz);
+		     EKx, EKy, EKz, EKtx, EKty, EKtz, S, pos);
+	Kunloaded = Kfactored = 0;
       }
     }
 
@@ -419,7 +492,8 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
       for (i=1; i<=DoF; i++)	if (r[i]) dD[i] = Dp[lc][i];
 
       /*  solve {F_m} = [K({D_t})] * {D_m}	*/
-      solve_system(K,dD,F_mech[lc],dR,DoF,q,r,&ok,verbose,&rms_resid);
+      solve_system(K,dD,F_mech[lc],dR,DoF,q,r,&ok,verbose,&rms_resid,S,pos,diag,!Kfactored);
+      Kfactored = ( ok >= 0 );
 
       /* combine {D} = {D_t} + {D_m}	*/
       for (i=1; i<=DoF; i++) {
@@ -441,7 +515,7 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
 			 &axial_strain_warning );
 
     /*  check the equilibrium error	*/
-    error = equilibrium_error ( dF, F, K, D, DoF, q,r );
+    error = equilibrium_error ( dF, F, K, D, DoF, q,r, S,pos );
 
     if ( geom && verbose )
       fprintf(stdout,"\n Non-Linear Elastic Analysis ...\n");
@@ -467,19 +541,20 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
       assemble_K ( K, DoF, nE, nN, xyz, rj, L, Le, N1, N2,
 		   Ax,Asy,Asz, Jx,Iy,Iz, E, G, p,
 		   shear,geom, Q, debug,
-		   EKx, EKy, EKz, EKtx, EKty, EKtz);
+		   EKx, EKy, EKz, EKtx, EKty, EKtz, S, pos);
+      Kunloaded = Kfactored = 0;
 
 
       /*  compute equilibrium error, {dF}, at iteration i   */
       /*  {dF}^(i) = {F} - [K({D}^(i))]*{D}^(i)	      */
       /*  convergence criteria = || {dF}^(i) ||  /  || F || */
-      error = equilibrium_error ( dF, F, K, D, DoF, q,r );
+      error = equilibrium_error ( dF, F, K, D, DoF, q,r, S,pos );
 
       /*  Powell-Symmetric-Broyden secant stiffness update  */
       // PSB_update ( Ks, dF, dD, DoF );  /* not helpful?   */
 
       /*  solve {dF}^(i) = [K({D}^(i))] * {dD}^(i)	      */
-      solve_system(K,dD,dF,dR,DoF,q,r,&ok,verbose,&rms_resid);
+      solve_system(K,dD,dF,dR,DoF,q,r,&ok,verbose,&rms_resid,S,pos,diag,1);
 
       if ( ok < 0 ) {	/*  K is not positive definite	      */
 	fprintf(stderr,"   The stiffness matrix is not pos-def. \n");
@@ -509,12 +584,12 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
     /*   strain limit _and_ buckling failure ... */
     if (axial_strain_warning > 0 && ExitCode == 181) ExitCode = 183;
 
-    if ( geom )	compute_reaction_forces( R,F,K, D, DoF, r );
+    if ( geom )	compute_reaction_forces( R,F,K, D, DoF, r, S,pos );
 
     /*  dealocate Broyden secant stiffness matrix, Ks */
     // if ( geom )	free_dmatrix(Ks, 1, DoF, 1, DoF );
 
-    if ( write_matrix )	/* write static stiffness matrix */
+    if ( write_matrix && K )	/* write static stiffness matrix */
       save_ut_dmatrix ( "Ks", K, DoF, "w" );
 
     /*  display RMS equilibrium error */
@@ -583,11 +658,43 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
      }
   */
 
+  nM_calc = (nM+8)<(2*nM) ? nM+8 : 2*nM;		/* Bathe */
+  modes_kept = KF && nM > 0 && KF->nM == nM_calc && !geom && nC == 0;
+
+  if ( KF ) {	/* K and its factors are kept, modes work on a copy */
+    KF->factored = Kunloaded && Kfactored;
+    if ( modes_kept )
+      K = NULL;
+    else if ( sparse && ( nM > 0 || nC > 0 ) ) {
+      K = dmatrix(1,DoF,1,DoF);
+      sky_to_dense ( S, pos, K, DoF );
+    } else if ( nM > 0 || nC > 0 ) {
+      K = dmatrix(1,DoF,1,DoF);
+      for (i=1; i<=DoF; i++) for (j=i; j<=DoF; j++) K[i][j] = K[j][i] = KF->K[i][j];
+    } else
+      K = NULL;
+    S = NULL;	pos = NULL;	diag = NULL;
+  }
+  if ( sparse && ( nM > 0 || nC > 0 ) && S ) { /* full K for modes and condensation */
+    K = dmatrix(1,DoF,1,DoF);
+    sky_to_dense ( S, pos, K, DoF );
+  }
+  if ( S ) {
+    free_skyline ( S );
+    free_ivector ( pos, 1, DoF );
+  }
+  if ( diag )	free_dvector ( diag, 1, DoF );
+
   if ( nM > 0 ) { /* carry out modal analysis */
 
     if(verbose & anlyz) fprintf(stdout,"\n\n Modal Analysis ...\n");
 
-    nM_calc = (nM+8)<(2*nM) ? nM+8 : 2*nM;		/* Bathe */
+    if ( modes_kept ) {	/* modes of the previous run */
+      write_modal_results ( massResults, modalResults,
+			    nN, nE, nI, DoF, KF->M, KF->f, KF->V,
+			    total_mass, struct_mass,
+			    KF->iter, sumR, nM, shift, lump, tol, KF->ok );
+    } else {
 
     M   = dmatrix(1,DoF,1,DoF);
     f   = dvector(1,nM_calc);
@@ -639,6 +746,14 @@ ALLOW_DLL_CALL int run(Nodes* nodes, Reactions* reactions, Elements* elements,
 	total_mass, struct_mass,
 	iter, sumR, nM, shift, lump, tol, ok );
       */
+
+      /* the modes do not depend on the loads of a linear frame, keep them */
+      if ( KF && !geom && nC == 0 && ExitCode == 0 ) {
+	KF->nM = nM_calc;	KF->M = M;	KF->f = f;	KF->V = V;
+	KF->iter = iter;	KF->ok = ok;
+	M = NULL;	f = NULL;	V = NULL;
+      }
+    }
     }
   }
 
@@ -41,6 +41,7 @@ typedef struct {
 
     int shear, geom;
     double exagg_static, dx;
+    int sparse;
 
 } OtherElementData;
 
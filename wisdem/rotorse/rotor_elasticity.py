@@ -1,3 +1,4 @@
+import os
 import copy
 
 import numpy as np
@@ -702,6 +703,17 @@ class RunPreComp(ExplicitComponent):
             None if regs == None else regs[int(len(regs) / 2)] for regs in region_loc_ps[self.te_ps_var]
         ]
 
+        # Optional parallel evaluation of the spanwise stations
+        rotorse_options = self.options["modeling_options"]["WISDEM"]["RotorSE"]
+        n_workers = 1
+        if "precomp_n_workers" in rotorse_options:
+            n_workers = rotorse_options["precomp_n_workers"]
+            if n_workers == 0:
+                n_workers = os.cpu_count()
+        pool = "process"
+        if "precomp_pool" in rotorse_options:
+            pool = rotorse_options["precomp_pool"]
+
         # Get Beam Properties
         beam = PreComp(
             inputs["r"],
@@ -719,6 +731,8 @@ class RunPreComp(ExplicitComponent):
             sector_idx_spar_cap_ss,
             sector_idx_te_ps,
             sector_idx_te_ss,
+            n_workers=n_workers,
+            pool=pool,
         )
         (
             EIxx,
@@ -12,8 +12,8 @@ from openmdao.api import Group, ExplicitComponent
 from scipy.optimize import brentq, minimize, minimize_scalar
 from scipy.interpolate import PchipInterpolator
 
-from wisdem.ccblade.Polar import Polar
-from wisdem.ccblade.ccblade import CCBlade, CCAirfoil
+from wisdem.ccblade.Polar import Polar, stall_angles_batch
+from wisdem.ccblade.ccblade import CCBlade, KeyedLRUCache, _brentq_vec, content_key, airfoil_cache
 from wisdem.commonse.utilities import smooth_abs, smooth_min, linspace_with_deriv
 from wisdem.commonse.distribution import WeibullWithMeanCDF
 
@@ -153,6 +153,12 @@ class ComputePowerCurve(ExplicitComponent):
         self.fix_pitch_regI12 = modeling_options["WISDEM"]["RotorSE"]["fix_pitch_regI12"]
         self.n_pc = modeling_options["WISDEM"]["RotorSE"]["n_pc"]
         self.n_pc_spline = modeling_options["WISDEM"]["RotorSE"]["n_pc_spline"]
+        self.vectorized_bem = False
+        if "vectorized_bem" in modeling_options["WISDEM"]["RotorSE"]:
+            self.vectorized_bem = modeling_options["WISDEM"]["RotorSE"]["vectorized_bem"]
+        self.airfoil_lookup_table = False
+        if "airfoil_lookup_table" in modeling_options["WISDEM"]["RotorSE"]:
+            self.airfoil_lookup_table = modeling_options["WISDEM"]["RotorSE"]["airfoil_lookup_table"]
 
         # parameters
         self.add_input("v_min", val=0.0, units="m/s", desc="cut-in wind speed")
@@ -327,12 +333,13 @@ class ComputePowerCurve(ExplicitComponent):
         # Create Airfoil class instances
         af = [None] * self.n_span
         for i in range(self.n_span):
-            af[i] = CCAirfoil(
+            af[i] = airfoil_cache.get(
                 inputs["airfoils_aoa"],
                 inputs["airfoils_Re"],
                 inputs["airfoils_cl"][i, :, :],
                 inputs["airfoils_cd"][i, :, :],
                 inputs["airfoils_cm"][i, :, :],
+                table=self.airfoil_lookup_table,
             )
 
         self.ccblade = CCBlade(
@@ -359,6 +366,7 @@ class ComputePowerCurve(ExplicitComponent):
             discrete_inputs["hubloss"],
             discrete_inputs["wakerotation"],
             discrete_inputs["usecd"],
+            vectorized=self.vectorized_bem,
         )
 
         # JPJ: what is this grid for? Seems to be a special distribution of velocities
@@ -718,9 +726,74 @@ class ComputePowerCurve(ExplicitComponent):
                 P_i = P_aero_i * eff_i
                 return 1e-4 * (P_i[0] - P_rated)
 
+            # Same residual for a set j of the Region 3 wind speeds, in a single CCBlade call
+            def rated_power_dist_vec(pitch_j, j):
+                myout, _ = self.ccblade.evaluate(Uhub[i3[j]], Omega_rpm[i3[j]], pitch_j, coefficients=False)
+                eff_j = np.interp(Omega_rpm[i3[j]], lss_rpm, driveEta)
+                return 1e-4 * (myout["P"] * eff_j - P_rated)
+
+            # Vectorized brentq for the Region 3 wind speeds j from brackets [lo, hi], which are first
+            # widened away from the root, doubling each step, until they hold a sign change
+            def solve_pitch_regIII(j, lo, hi):
+                f_j = lambda x, k: rated_power_dist_vec(x, j[k])
+                k_all = np.arange(len(j))
+                flo = f_j(lo, k_all)
+                fhi = f_j(hi, k_all)
+                for _ in range(8):
+                    need = np.signbit(flo) == np.signbit(fhi)
+                    up = need & (fhi > 0.0)
+                    down = need & (flo < 0.0) & (lo > pitch_floor)
+                    if not np.any(up | down):
+                        break
+                    width = hi - lo
+                    lo[up], flo[up], hi[up] = hi[up], fhi[up], hi[up] + 2.0 * width[up]
+                    hi[down], fhi[down], lo[down] = lo[down], flo[down], np.maximum(pitch_floor, lo[down] - 2.0 * width[down])
+                    k = k_all[up | down]
+                    f_k = f_j(np.where(up, hi, lo)[k], k)
+                    fhi[k[up[k]]] = f_k[up[k]]
+                    flo[k[down[k]]] = f_k[down[k]]
+
+                return _brentq_vec(f_j, lo, hi, xtol=1e-1 * TOL, rtol=1e-2 * TOL, maxiter=40, fa=flo, fb=fhi)
+
             # Solve for Region 3 pitch
-            if self.regulation_reg_III:
-                for i in range(i_3, self.n_pc):
+            i3 = np.arange(i_3, self.n_pc)
+            if self.regulation_reg_III and not peak_thrust_shaving and len(i3) > 0:
+                # Pitch rises with wind speed above rated, so the rated pitch bounds every Region 3
+                # solution from below.  A coarse pass over every 8th wind speed gives the pitch
+                # schedule that warm starts narrow brackets for all of them.
+                pitch_floor = pitch[i_3 - 1]
+                j_all = np.arange(len(i3))
+                j = np.unique(np.r_[j_all[::8], j_all[-1]])
+                pitch_j, bracketed = solve_pitch_regIII(j, np.full(len(j), pitch_floor), np.full(len(j), pitch_floor + 15.0))
+                U_sched, pitch_sched = Uhub[i3[j[bracketed]]], pitch_j[bracketed]
+                guess = np.interp(Uhub[i3], U_sched, pitch_sched) if len(U_sched) > 0 else np.full(len(i3), pitch_floor)
+                pitch[i3], bracketed = solve_pitch_regIII(
+                    j_all, np.maximum(pitch_floor, guess - 0.25), np.maximum(pitch_floor, guess) + 0.25
+                )
+
+                # Any point without a sign change in its bracket falls back to the
+                # one-at-a-time search from the pitch of the wind speed below it
+                for i in i3[~bracketed]:
+                    pitch0 = pitch[i - 1]
+                    pitch[i] = minimize_scalar(
+                        lambda x: np.abs(rated_power_dist(x, Uhub[i], Omega_rpm[i])),
+                        bounds=[pitch0, pitch0 + 15.0],
+                        method="bounded",
+                        options={"disp": False, "xatol": TOL, "maxiter": 40},
+                    )["x"]
+
+                myout, _ = self.ccblade.evaluate(Uhub[i3], Omega_rpm[i3], pitch[i3], coefficients=True)
+                P_aero[i3], T[i3], Q[i3], M[i3], Cp_aero[i3], Ct_aero[i3], Cq_aero[i3], Cm_aero[i3] = [
+                    myout[key] for key in ["P", "T", "Q", "Mb", "CP", "CT", "CQ", "CMb"]
+                ]
+                eff[i3] = np.interp(Omega_rpm[i3], lss_rpm, driveEta)
+                P[i3] = P_aero[i3] * eff[i3]
+                Cp[i3] = Cp_aero[i3] * eff[i3]
+
+            elif self.regulation_reg_III:
+                # With peak thrust shaving, the shaved pitch of each wind speed is the lower
+                # bracket of the next one, so the points are solved one at a time
+                for i in i3:
                     pitch0 = pitch[i - 1]
                     bnds = ([pitch0, pitch0 + 15.0],)
                     try:
@@ -820,24 +893,22 @@ class ComputePowerCurve(ExplicitComponent):
         self.ccblade.induction_inflow = True
         tsr_vec = Omega_rpm / 30.0 * np.pi * Rtip_cone / Uhub
         id_regII = np.argmin(abs(tsr_vec - inputs["tsr_operational"][0]))
-        ax_induct_rotor = np.zeros_like(Uhub)
-        for i in range(len(Uhub)):
-            loads, _ = self.ccblade.distributedAeroLoads(Uhub[i], Omega_rpm[i], pitch[i], 0.0)
-            try:
-                # Numpy v1/2 clash
-                ax_induct_rotor[i] = 2. / inputs["r"][-1]**2. * np.trapezoid(loads['a'] * inputs["r"], inputs["r"])
-            except AttributeError:
-                ax_induct_rotor[i] = 2. / inputs["r"][-1]**2. * np.trapz(loads['a'] * inputs["r"], inputs["r"])
-            if i == id_regII:
-                # outputs
-                outputs["ax_induct_regII"] = loads["a"]
-                outputs["tang_induct_regII"] = loads["ap"]
-                outputs["aoa_regII"] = loads["alpha"]
-                outputs["cl_regII"] = loads["Cl"]
-                outputs["cd_regII"] = loads["Cd"]
-                outputs["L_D"] = loads["Cl"] / loads["Cd"]
-                outputs["Cp_regII"] = Cp_aero[i]
-                outputs["Ct_regII"] = Ct_aero[i]
+        # Distributed loads at all wind speeds in one batched solve
+        loads = self.ccblade.distributedAeroLoadsSweep(Uhub, Omega_rpm, pitch, 0.0)
+        try:
+            # Numpy v1/2 clash
+            ax_induct_rotor = 2. / inputs["r"][-1]**2. * np.trapezoid(loads['a'] * inputs["r"], inputs["r"], axis=1)
+        except AttributeError:
+            ax_induct_rotor = 2. / inputs["r"][-1]**2. * np.trapz(loads['a'] * inputs["r"], inputs["r"], axis=1)
+        # outputs
+        outputs["ax_induct_regII"] = loads["a"][id_regII]
+        outputs["tang_induct_regII"] = loads["ap"][id_regII]
+        outputs["aoa_regII"] = loads["alpha"][id_regII]
+        outputs["cl_regII"] = loads["Cl"][id_regII]
+        outputs["cd_regII"] = loads["Cd"][id_regII]
+        outputs["L_D"] = loads["Cl"][id_regII] / loads["Cd"][id_regII]
+        outputs["Cp_regII"] = Cp_aero[id_regII]
+        outputs["Ct_regII"] = Ct_aero[id_regII]
         outputs["ax_induct_rotor"] = ax_induct_rotor
 
 class ComputeSplines(ExplicitComponent):
@@ -901,6 +972,9 @@ class NoStallConstraint(ExplicitComponent):
     def initialize(self):
         self.options.declare("modeling_options")
 
+        # stall angles of the polars already seen, keyed on their content
+        self.stall_angles = KeyedLRUCache()
+
     def setup(self):
         modeling_options = self.options["modeling_options"]
         self.n_span = n_span = modeling_options["WISDEM"]["RotorSE"]["n_span"]
@@ -937,14 +1011,10 @@ class NoStallConstraint(ExplicitComponent):
         i_min = np.argmin(np.abs(inputs["min_s"] - inputs["s"]))
         n_span = len(inputs["s"])
 
+        outputs["stall_angle_along_span"] = self.get_stall_angles(
+            inputs["airfoils_aoa"], inputs["airfoils_cl"][:, :, 0], inputs["airfoils_cd"][:, :, 0]
+        )
         for i in range(n_span):
-            unsteady = eval_unsteady(
-                inputs["airfoils_aoa"],
-                inputs["airfoils_cl"][i, :, 0],
-                inputs["airfoils_cd"][i, :, 0],
-                inputs["airfoils_cm"][i, :, 0],
-            )
-            outputs["stall_angle_along_span"][i] = unsteady["alpha1"]
             if outputs["stall_angle_along_span"][i] == 0:
                 outputs["stall_angle_along_span"][i] = 1e-6  # To avoid nan
 
@@ -960,6 +1030,20 @@ class NoStallConstraint(ExplicitComponent):
                 "Blade is violating the minimum margin to stall at span location %.2f %%" % (inputs["s"][i] * 100.0)
             )
 
+    def get_stall_angles(self, aoa, cl, cd):
+        # alpha1 of Polar.unsteadyParams for each station, computed together for the polars not cached
+        keys = [content_key(aoa, cl[i], cd[i]) for i in range(cl.shape[0])]
+        missing = [i for i, key in enumerate(keys) if key not in self.stall_angles]
+        stall_angles = np.array([self.stall_angles.peek(key) if key in self.stall_angles else 0.0 for key in keys])
+        if missing:
+            stall_angles[missing], _, _ = stall_angles_batch(aoa, cl[missing], cd[missing])
+
+        # all values are read before any is stored, as storing evicts the least recently used entries
+        self.stall_angles.maxsize = 4 * len(keys)  # room for the polars of a few designs
+        for key, angle in zip(keys, stall_angles):
+            self.stall_angles.put(key, angle)
+        return stall_angles
+
 
 class AEP(ExplicitComponent):
     def initialize(self):
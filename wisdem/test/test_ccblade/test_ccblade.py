@@ -19,7 +19,7 @@ from wisdem.inputs.validation import load_geometry_yaml
 
 import numpy as np
 
-from wisdem.ccblade.ccblade import CCBlade, CCAirfoil
+from wisdem.ccblade.ccblade import CCBlade, CCAirfoil, AirfoilCache, KeyedLRUCache, content_key
 
 
 class TestNREL5MW(unittest.TestCase):
@@ -288,6 +288,182 @@ class TestNREL5MW(unittest.TestCase):
         np.testing.assert_allclose(P[idx] / 1e6, Pref[idx] / 1e3, atol=0.2)  # within 0.2 of 1MW
         np.testing.assert_allclose(T[idx] / 1e6, Tref[idx] / 1e3, atol=0.15)
 
+    def test_vectorized_solver(self):
+        Uinf = [4.0, 8.0, 11.0, 18.0, 25.0]
+        Omega = [7.2, 9.2, 11.9, 12.1, 12.1]
+        pitch = [0.0, 0.0, 0.0, 14.9, 23.5]
+
+        for derivatives in [False, True]:
+            self.rotor.derivatives = derivatives
+            for U, Om, p in zip(Uinf, Omega, pitch):
+                for azimuth in [0.0, 90.0]:
+                    self.rotor.vectorized = False
+                    loads, derivs = self.rotor.distributedAeroLoads(U, Om, p, azimuth)
+                    self.rotor.vectorized = True
+                    loads_vec, derivs_vec = self.rotor.distributedAeroLoads(U, Om, p, azimuth)
+
+                    for key in loads:
+                        np.testing.assert_allclose(loads_vec[key], loads[key], rtol=1e-10, atol=1e-10)
+                    for key in derivs:
+                        for key2 in derivs[key]:
+                            np.testing.assert_allclose(derivs_vec[key][key2], derivs[key][key2], rtol=1e-10, atol=1e-10)
+
+        # non-rotating
+        self.rotor.derivatives = False
+        self.rotor.vectorized = False
+        loads, _ = self.rotor.distributedAeroLoads(10.0, 0.0, 0.0, 0.0)
+        self.rotor.vectorized = True
+        loads_vec, _ = self.rotor.distributedAeroLoads(10.0, 0.0, 0.0, 0.0)
+        for key in loads:
+            np.testing.assert_allclose(loads_vec[key], loads[key], rtol=1e-10, atol=1e-10)
+
+    def test_vectorized_evaluate(self):
+        Uinf = np.array([4.0, 8.0, 11.0, 18.0, 25.0, 10.0])
+        Omega = np.array([7.2, 9.2, 11.9, 12.1, 12.1, 0.0])
+        pitch = np.array([0.0, 0.0, 0.0, 14.9, 23.5, 0.0])
+
+        for derivatives in [False, True]:
+            self.rotor.derivatives = derivatives
+            self.rotor.vectorized = False
+            outputs, derivs = self.rotor.evaluate(Uinf, Omega, pitch, coefficients=True)
+            self.rotor.vectorized = True
+            outputs_vec, derivs_vec = self.rotor.evaluate(Uinf, Omega, pitch, coefficients=True)
+
+            for key in outputs:
+                np.testing.assert_allclose(outputs_vec[key], outputs[key], rtol=1e-10, atol=1e-8)
+            for key in derivs:
+                for key2 in derivs[key]:
+                    np.testing.assert_allclose(derivs_vec[key][key2], derivs[key][key2], rtol=1e-10, atol=1e-8)
+
+    def test_distributed_loads_sweep(self):
+        Uinf = np.array([4.0, 8.0, 11.0, 18.0, 25.0, 10.0])
+        Omega = np.array([7.2, 9.2, 11.9, 12.1, 12.1, 0.0])
+        pitch = np.array([0.0, 0.0, 0.0, 14.9, 23.5, 0.0])
+
+        loads_sweep = self.rotor.distributedAeroLoadsSweep(Uinf, Omega, pitch, 30.0)
+        for k in range(len(Uinf)):
+            loads, _ = self.rotor.distributedAeroLoads(Uinf[k], Omega[k], pitch[k], 30.0)
+            for key in loads:
+                np.testing.assert_allclose(loads_sweep[key][k], loads[key], rtol=1e-10, atol=1e-10)
+
+    def test_airfoil_table(self):
+        Uinf = np.array([4.0, 8.0, 11.0, 18.0, 25.0])
+        Omega = np.array([7.2, 9.2, 11.9, 12.1, 12.1])
+        pitch = np.array([0.0, 0.0, 0.0, 14.9, 23.5])
+        outputs, _ = self.rotor.evaluate(Uinf, Omega, pitch, coefficients=True)
+
+        alpha = np.deg2rad(np.linspace(-179.9, 179.9, 1001))
+        Re = 1e6 * np.ones_like(alpha)
+        for af in set(self.rotor.af):
+            cl, cd, cm = af.evaluate(alpha, Re, return_cm=True)
+            error = af.compile_table()
+            self.assertLess(max(error.values()), 1e-4)
+
+            # table stays within the reported error of the splines
+            cl_t, cd_t, cm_t = af.evaluate(alpha, Re, return_cm=True)
+            np.testing.assert_array_less(np.abs(cl_t - cl), 2 * error["cl"] + 1e-12)
+            np.testing.assert_array_less(np.abs(cd_t - cd), 2 * error["cd"] + 1e-12)
+            np.testing.assert_array_less(np.abs(cm_t - cm), 2 * error["cm"] + 1e-12)
+
+            # scalar lookup matches the vectorized one, derivatives match finite differences
+            for a in alpha[::100]:
+                np.testing.assert_allclose(af.evaluate(a, 1e6), af.evaluate(np.array(a), np.array(1e6)), atol=1e-14)
+                dcl_dalpha, _, dcd_dalpha, _ = af.derivatives(a, 1e6)
+                cl_p, cd_p = af.evaluate(a + 1e-7, 1e6)
+                cl_m, cd_m = af.evaluate(a - 1e-7, 1e6)
+                self.assertAlmostEqual(dcl_dalpha, (cl_p - cl_m) / 2e-7, delta=1e-5 * max(1.0, abs(dcl_dalpha)))
+                self.assertAlmostEqual(dcd_dalpha, (cd_p - cd_m) / 2e-7, delta=1e-5 * max(1.0, abs(dcd_dalpha)))
+
+        # same rotor performance from the tables, per station or vectorized
+        for vectorized in [False, True]:
+            self.rotor.vectorized = vectorized
+            outputs_table, _ = self.rotor.evaluate(Uinf, Omega, pitch, coefficients=True)
+            for key in ["P", "T", "Q", "CP", "CT"]:
+                np.testing.assert_allclose(outputs_table[key], outputs[key], rtol=1e-5)
+
+
+class TestAirfoilCache(unittest.TestCase):
+    def test_lru(self):
+        alpha = np.linspace(-180.0, 180.0, 73)
+        Re = [1e6]
+        cl = 2 * np.pi * np.sin(np.deg2rad(alpha))[:, np.newaxis]
+        cd = 0.01 + 1.0 - np.cos(np.deg2rad(alpha))[:, np.newaxis]
+
+        cache = AirfoilCache(maxsize=2)
+        af1 = cache.get(alpha, Re, cl, cd)
+        self.assertIs(cache.get(alpha, Re, cl.copy(), cd), af1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        np.testing.assert_equal(af1.evaluate(0.1, 1e6), CCAirfoil(alpha, Re, cl, cd).evaluate(0.1, 1e6))
+
+        # new data, or a lookup table, is a separate entry
+        af2 = cache.get(alpha, Re, 0.9 * cl, cd)
+        af3 = cache.get(alpha, Re, cl, cd, table=True)
+        self.assertIsNot(af2, af1)
+        self.assertIsNone(af1.table)
+        self.assertIsNotNone(af3.table)
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+
+        # least recently used entry (af1) was evicted
+        self.assertEqual(len(cache), 2)
+        self.assertIsNot(cache.get(alpha, Re, cl, cd), af1)
+        self.assertIs(cache.get(alpha, Re, cl, cd, table=True), af3)
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_keyed_lru(self):
+        x = np.linspace(0.0, 1.0, 5)
+        self.assertEqual(content_key(x, 2 * x), content_key(list(x), 2 * x))
+        self.assertNotEqual(content_key(x, 2 * x), content_key(x[:, np.newaxis], 2 * x))
+
+        builds = []
+
+        def build(value):
+            builds.append(value)
+            return value
+
+        cache = KeyedLRUCache(maxsize=2)
+        self.assertEqual(cache.lookup("a", lambda: build(1)), 1)
+        self.assertEqual(cache.lookup("b", lambda: build(2)), 2)
+        self.assertEqual(cache.lookup("a", lambda: build(3)), 1)
+        self.assertEqual(cache.lookup("c", lambda: build(4)), 4)
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+        self.assertEqual(builds, [1, 2, 4])
+        self.assertEqual((len(cache), cache.hits, cache.misses), (2, 1, 3))
+
+    def test_max_bytes(self):
+        alpha = np.linspace(-180.0, 180.0, 73)
+        Re = [1e6]
+        cl = 2 * np.pi * np.sin(np.deg2rad(alpha))[:, np.newaxis]
+        cd = 0.01 + 1.0 - np.cos(np.deg2rad(alpha))[:, np.newaxis]
+
+        cache = AirfoilCache()
+        af1 = cache.get(alpha, Re, cl, cd)
+        af2 = cache.get(alpha, Re, cl, cd, table=True)
+        self.assertGreater(cache.sizeof(af2), cache.sizeof(af1) + af2.table.f.nbytes)
+        self.assertEqual(cache.nbytes, cache.sizeof(af1) + cache.sizeof(af2))
+
+        # room for a single table: the newest one is kept, and the airfoils without tables fit beside it
+        cache = AirfoilCache(max_bytes=cache.sizeof(af2) + 2 * cache.sizeof(af1))
+        af2 = cache.get(alpha, Re, cl, cd, table=True)
+        af3 = cache.get(alpha, Re, 0.9 * cl, cd, table=True)
+        self.assertNotIn(cache.key(alpha, Re, cl, cd, table=True), cache)
+        self.assertIs(cache.get(alpha, Re, 0.9 * cl, cd, table=True), af3)
+        cache.get(alpha, Re, cl, cd)
+        cache.get(alpha, Re, 0.9 * cl, cd)
+        self.assertEqual(len(cache), 3)
+        self.assertLessEqual(cache.nbytes, cache.max_bytes)
+
+        # a single entry larger than the limit is still cached
+        cache = AirfoilCache(max_bytes=1)
+        self.assertIs(cache.get(alpha, Re, cl, cd, table=True), cache.get(alpha, Re, cl, cd, table=True))
+        self.assertEqual(len(cache), 1)
+
+        cache.clear()
+        self.assertEqual((len(cache), cache.nbytes), (0, 0))
+
 
 if __name__ == "__main__":
     unittest.main()
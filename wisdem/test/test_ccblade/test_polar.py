@@ -3,7 +3,7 @@ from math import pi
 
 import numpy as np
 
-from wisdem.ccblade.Polar import Polar, blend
+from wisdem.ccblade.Polar import Polar, blend, correction3D_batch, stall_angles_batch
 
 
 class TestBlend(unittest.TestCase):
@@ -2072,6 +2072,51 @@ class TestMisc(unittest.TestCase):
         np.testing.assert_allclose(slope, 0.11745309755638363)
         np.testing.assert_allclose(alpha0, -0.32307692307692304)
 
+    def test_correction3D_batch(self):
+        alpha = self.polar.alpha
+        cl = np.array([self.polar.cl, 1.1 * self.polar.cl, self.polar.cl + 0.1])
+        cd = np.array([self.polar.cd] * 3)
+        r_over_R = np.array([[0.1], [0.25], [0.6]])
+        chord_over_r = np.array([[0.5], [0.3], [0.1]])
+        tsr = 7.5
+
+        for lift_method in ["DuSelig", "Snel"]:
+            for drag_method in ["None", "Eggers"]:
+                cl_3d, cd_3d = correction3D_batch(
+                    alpha,
+                    cl[np.newaxis, :, :],
+                    cd[np.newaxis, :, :],
+                    r_over_R,
+                    chord_over_r,
+                    tsr,
+                    lift_method=lift_method,
+                    drag_method=drag_method,
+                )
+                self.assertEqual(cl_3d.shape, (3, 3, len(alpha)))
+                for i in range(3):
+                    for j in range(3):
+                        polar3d = Polar(Re=1, alpha=alpha, cl=cl[j], cd=cd[j]).correction3D(
+                            r_over_R[i, 0], chord_over_r[i, 0], tsr, lift_method=lift_method, drag_method=drag_method
+                        )
+                        np.testing.assert_allclose(cl_3d[i, j], polar3d.cl, rtol=1e-12, atol=1e-14)
+                        np.testing.assert_allclose(cd_3d[i, j], polar3d.cd, rtol=1e-12, atol=1e-14)
+
+    def test_stall_angles_batch(self):
+        alpha = self.polar.alpha
+        cl = np.array([self.polar.cl, 1.1 * self.polar.cl, self.polar.cl + 0.1, np.zeros_like(alpha)])
+        cd = np.array([self.polar.cd] * 4)
+
+        alpha1, alpha2, cnSlope = stall_angles_batch(alpha, cl[np.newaxis, :, :], cd[np.newaxis, :, :])
+        self.assertEqual(alpha1.shape, (1, 4))
+        np.testing.assert_allclose(alpha1[0, 0], 9.552811766400268)
+        np.testing.assert_allclose(alpha2[0, 0], -6.897960464135163)
+        np.testing.assert_allclose(cnSlope[0, 0], 6.274086123213817)
+        for j in range(4):
+            _, alpha1_ref, _, cnSlope_ref, _, _, _, _ = Polar(Re=1, alpha=alpha, cl=cl[j], cd=cd[j]).unsteadyParams()
+            np.testing.assert_allclose(alpha1[0, j], alpha1_ref, rtol=1e-12, atol=1e-14)
+            np.testing.assert_allclose(cnSlope[0, j], cnSlope_ref, rtol=1e-12, atol=1e-14)
+        self.assertEqual(alpha1[0, 3], 0.0)
+
 
 def suite():
     suite = [
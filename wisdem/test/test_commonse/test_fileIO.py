@@ -10,7 +10,7 @@ from wisdem.commonse import fileIO
 
 
 def clear_files():
-    flist = glob.glob("test.*")
+    flist = glob.glob("test.*") + glob.glob("test-columns.*")
     for f in flist:
         os.remove(f)
 
@@ -168,6 +168,73 @@ class TestFileIO(unittest.TestCase):
         self.assertEqual(newprob["list_in"], ["empty"] * 3)
         self.assertEqual(newprob["list_out"], ["empty"] * 3 + ["full"] * 3)
 
+    def testLoadFile_columns(self):
+        clear_files()
+        fileIO.save_data("test", self.prob, npz_file=False, xls_file=False, col_file=True)
+        self.assertTrue(os.path.exists("test-columns.npz"))
+        self.assertFalse(os.path.exists("test.xlsx"))
+
+        newprob = fileIO.load_data("test-columns.npz", self.prob)
+        self.assertEqual(newprob["float_in"], 5.0)
+        self.assertEqual(newprob["float_out"], 6.0)
+        self.assertEqual(newprob["fraction_out"], 0.1)
+        npt.assert_equal(newprob["array_out"], np.ones(3))
+        self.assertEqual(newprob["int_out"], 1)
+        self.assertEqual(newprob["string_out"], "empty_full")
+        self.assertEqual(newprob["list_out"], ["empty"] * 3 + ["full"] * 3)
+
+        # Check lazy per-variable reads and metadata
+        with fileIO.ColumnArchive("test-columns.npz") as archive:
+            self.assertEqual(len(archive), 12)
+            npt.assert_equal(archive["array_in"], np.zeros(3))
+            self.assertEqual(archive["string_in"], "empty")
+            self.assertEqual(archive["list_in"], ["empty"] * 3)
+            self.assertEqual(archive.units("float_in"), "N")
+            self.assertEqual(archive.units("fraction_in"), "")
+            self.assertEqual(archive.type("float_out"), "output")
+            self.assertEqual(archive.type("float_in"), "input")
+            self.assertRaises(KeyError, archive.__getitem__, "not_a_variable")
+
+    def testIncludesExcludes(self):
+        clear_files()
+        fileIO.save_data("test", self.prob, col_file=True, includes=["*_out"], excludes=["list*"])
+        npzdat = np.load("test.npz", allow_pickle=True)
+        self.assertEqual(sorted(npzdat.files), ["array_out_m", "float_out_N", "fraction_out", "int_out", "string_out"])
+        with fileIO.ColumnArchive("test-columns.npz") as archive:
+            self.assertEqual(
+                sorted(archive.keys()), ["array_out", "float_out", "fraction_out", "int_out", "string_out"]
+            )
+
+    def testLoadFile_select(self):
+        clear_files()
+        fileIO.save_data("test", self.prob, col_file=True)
+        newprob = om.Problem(reports=False, model=MyGroup())
+        newprob.setup()
+        for fname in ["test-columns.npz", "test.pkl", "test.csv"]:
+            newprob["float_in"] = 0.0
+            newprob["array_out"] = np.zeros(3)
+            newprob["list_out"] = ["x"]
+            fileIO.load_data(fname, newprob, includes=["*_out"], excludes=["array*"])
+            self.assertEqual(newprob["float_in"], 0.0)
+            npt.assert_equal(newprob["array_out"], np.zeros(3))
+            self.assertEqual(newprob["float_out"], 6.0)
+            self.assertEqual(newprob["list_out"], ["empty"] * 3 + ["full"] * 3)
+
+    def testColumnArchive_mmap(self):
+        clear_files()
+        fileIO.save_data("test", self.prob, npz_file=False, xls_file=False, col_file=True)
+        with fileIO.ColumnArchive("test-columns.npz", mmap_mode="r") as archive:
+            value = archive["array_out"]
+            self.assertIsInstance(value, np.memmap)
+            npt.assert_equal(value, np.ones(3))
+            self.assertEqual(archive["float_out"], 6.0)
+            self.assertEqual(archive["list_out"], ["empty"] * 3 + ["full"] * 3)
+            self.assertEqual(archive.select("array_*"), ["array_in", "array_out"])
+            self.assertEqual(
+                sorted(archive.select(excludes=["*_in"])), sorted(k for k in archive.keys() if k.endswith("_out"))
+            )
+        del value
+
 
 if __name__ == "__main__":
     unittest.main()
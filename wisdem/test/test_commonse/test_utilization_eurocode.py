@@ -0,0 +1,80 @@
+import unittest
+
+import numpy as np
+import numpy.testing as npt
+
+import wisdem.commonse.utilization_eurocode as util_euro
+
+
+class TestShellBuckling(unittest.TestCase):
+    def setUp(self):
+        self.d = np.array([8.0, 7.5, 7.0, 6.5, 6.0])
+        self.t = np.array([0.05, 0.04, 0.03, 0.02])
+        self.sigma_z = np.array([-2e8, 1.5e8, -1e8, 5e7])
+        self.sigma_t = np.array([3e7, -2e7, 1e7, 5e6])
+        self.tau_zt = np.array([2e7, 1e7, -1e7, 5e6])
+        self.L = np.array([30.0, 10.0, 3.0, 60.0])
+        self.E = 2e11 * np.ones(4)
+        self.sigma_y = 3.45e8 * np.ones(4)
+
+    def testShellBuckling(self):
+        util = util_euro.shellBucklingEurocode(
+            self.d, self.t, self.sigma_z, self.sigma_t, self.tau_zt, self.L, self.E, self.sigma_y
+        )
+        npt.assert_allclose(util, [2.173218373443456, 0.8013727336775424, 0.3347755978252863, 1.6737709768653355])
+
+    def testShellBucklingGrid(self):
+        # sections x load cases in one call match one call per load case and per section
+        n_dlc = 3
+        scale = np.array([1.0, -0.5, 2.0])
+        args = [
+            np.tile(self.d, (n_dlc, 1)).T,
+            np.tile(self.t, (n_dlc, 1)).T,
+            np.outer(self.sigma_z, scale),
+            np.outer(self.sigma_t, scale),
+            np.outer(self.tau_zt, scale),
+            np.tile(self.L, (n_dlc, 1)).T,
+            np.tile(self.E, (n_dlc, 1)).T,
+            np.tile(self.sigma_y, (n_dlc, 1)).T,
+        ]
+        grid = util_euro.shellBucklingEurocode(*args)
+        self.assertEqual(grid.shape, (4, n_dlc))
+        for k in range(n_dlc):
+            col = util_euro.shellBucklingEurocode(*[x[:, k] for x in args])
+            npt.assert_equal(grid[:, k], col)
+            for i in range(4):
+                one = util_euro.shellBucklingEurocode(args[0][i : i + 2, k], *[x[i : i + 1, k] for x in args[1:]])
+                npt.assert_allclose(one, grid[i, k], rtol=1e-14)
+
+    def testSmoothingContinuity(self):
+        # smoothed piecewise factors are continuous across every breakpoint
+        # (for r/t large enough that the hoop stress breakpoints are ordered)
+        for rovert in [20.0, 50.0, 250.0]:
+            Cxb = 6.0
+            for fun, pts in [
+                (
+                    lambda w: util_euro._cxsmooth(w, rovert),
+                    [
+                        1.45,
+                        1.95,
+                        0.5 * rovert - 1,
+                        0.5 * rovert + 1,
+                        (0.5 + Cxb) * rovert - 1,
+                        (0.5 + Cxb) * rovert + 1,
+                    ],
+                ),
+                (lambda w: util_euro._sigmasmooth(w, 2e11, rovert), [30.0, 2.445 * rovert - 1, 2.445 * rovert + 1]),
+                (lambda w: util_euro._tausmooth(w, rovert), [9.0, 11.0, 8.7 * rovert - 1, 8.7 * rovert + 1]),
+            ]:
+                pts = np.array(pts)
+                npt.assert_allclose(fun(pts - 1e-9), fun(pts + 1e-9), rtol=1e-6)
+
+        lam = np.array([0.36, 0.44, np.sqrt(0.65 / 0.4)])
+        chi = lambda x: util_euro._buckling_reduction_factor(0.65, 0.6, 1.0, 0.4, x)
+        npt.assert_allclose(chi(lam - 1e-9), chi(lam + 1e-9), rtol=1e-6)
+        npt.assert_equal(chi(np.array([0.1, 0.3])), 1.0)
+        npt.assert_allclose(chi(np.array([2.0, 3.0])), 0.65 / np.array([2.0, 3.0]) ** 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
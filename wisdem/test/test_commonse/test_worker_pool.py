@@ -0,0 +1,78 @@
+import os
+import unittest
+from unittest import mock
+
+import numpy.testing as npt
+
+from wisdem.commonse import worker_pool
+
+
+def square(x):
+    return x * x
+
+
+def square_or_fail(x):
+    if x == 3:
+        raise ValueError("bad value")
+    return x * x
+
+
+def square_or_exit(x):
+    # losing a worker breaks the pool
+    if x == 3:
+        os._exit(1)
+    return x * x
+
+
+def forked_task(state, i):
+    values, parent = state
+    values.append(i)  # only changes the worker's copy
+    return values[0] * i, os.getpid() != parent
+
+
+@unittest.skipUnless(worker_pool.pools_available(), "processes cannot be forked on this platform")
+class TestWorkerPool(unittest.TestCase):
+    def test_map(self):
+        for threads in [False, True]:
+            pool = worker_pool.WorkerPool(2, "Test", threads=threads)
+            self.assertTrue(pool.available)
+            self.assertEqual(pool.map(square, range(6)), [0, 1, 4, 9, 16, 25])
+            self.assertEqual(pool.map(divmod, [7, 9], [2, 4]), [(3, 1), (2, 1)])
+            pool.shutdown()
+            self.assertFalse(pool.available)
+            self.assertIsNone(pool.map(square, range(6)))
+
+    def test_failures(self):
+        pool = worker_pool.WorkerPool(2, "Test")
+        # exceptions of the evaluated function propagate, the pool stays usable
+        self.assertRaises(ValueError, pool.map, square_or_fail, range(6))
+        self.assertEqual(pool.map(square, range(3)), [0, 1, 4])
+
+        # a broken pool is reported and not used again
+        with mock.patch("builtins.print") as mock_print:
+            self.assertIsNone(pool.map(square_or_exit, range(6)))
+        self.assertIn("Test pool failed", mock_print.call_args[0][0])
+        self.assertFalse(pool.available)
+        self.assertIsNone(pool.map(square, range(3)))
+
+    def test_mpi(self):
+        with mock.patch.object(worker_pool, "MPI", True):
+            self.assertFalse(worker_pool.pools_available())
+            self.assertFalse(worker_pool.pools_available(threads=True))
+            self.assertFalse(worker_pool.WorkerPool(2, "Test", threads=True).available)
+            self.assertIsNone(worker_pool.fork_map(forked_task, ([2], os.getpid()), 4, 2, "Test"))
+
+    def test_fork_map(self):
+        values = [2]
+        results = worker_pool.fork_map(forked_task, (values, os.getpid()), 5, 3, "Test")
+        npt.assert_equal(results, [(0, True), (2, True), (4, True), (6, True), (8, True)])
+        self.assertEqual(values, [2])
+        self.assertIsNone(worker_pool._fork_state)
+
+        # no pool for a single worker or task
+        self.assertIsNone(worker_pool.fork_map(forked_task, (values, os.getpid()), 5, 1, "Test"))
+        self.assertIsNone(worker_pool.fork_map(forked_task, (values, os.getpid()), 1, 3, "Test"))
+
+
+if __name__ == "__main__":
+    unittest.main()
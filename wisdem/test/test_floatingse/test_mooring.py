@@ -1,11 +1,59 @@
 import unittest
 
 import numpy as np
+import moorpy as mp
 import numpy.testing as npt
 
 import wisdem.floatingse.mooring as mm
 
 
+def make_system(n_attach, n_anchors, line_length=350.0):
+    # MoorPy system with the fairlead and anchor layout of Mooring
+    config = {"water_depth": 200.0, "points": [], "lines": []}
+    angles = np.linspace(0, 2 * np.pi, n_attach + 1)[:n_attach]
+    angles -= np.mean(angles)
+    for k, a in enumerate(angles):
+        config["points"].append(
+            {"name": f"fairlead{k}", "type": "vessel", "location": [11 * np.cos(a), 11 * np.sin(a), -10.0]}
+        )
+    angles = np.linspace(0, 2 * np.pi, n_anchors + 1)[:n_anchors]
+    angles -= np.mean(angles)
+    for k, a in enumerate(angles):
+        config["points"].append(
+            {"name": f"anchor{k}", "type": "fixed", "location": [250 * np.cos(a), 250 * np.sin(a), -200.0]}
+        )
+    for k in range(n_anchors):
+        config["lines"].append(
+            {
+                "name": f"line{k}",
+                "endA": f"fairlead{k // (n_anchors // n_attach)}",
+                "endB": f"anchor{k}",
+                "type": "myline",
+                "length": np.broadcast_to(line_length, n_anchors)[k],
+            }
+        )
+    config["line_types"] = [
+        {
+            "name": "myline",
+            "diameter": 0.1,
+            "mass_density": 150.0,
+            "stiffness": 2e9,
+            "breaking_load": 1e7,
+            "cost": 1.0,
+            "transverse_added_mass": 0.0,
+            "tangential_added_mass": 0.0,
+            "transverse_drag": 0.0,
+            "tangential_drag": 0.0,
+        }
+    ]
+    ms = mp.System()
+    ms.parseYAML(config)
+    ms.bodyList[0].type = -1
+    ms.initialize()
+    ms.mooringEq(np.zeros(6), DOFtype="coupled")
+    return ms
+
+
 class TestMooring(unittest.TestCase):
     def setUp(self):
         self.inputs = {}
@@ -89,6 +137,65 @@ class TestMooring(unittest.TestCase):
         npt.assert_almost_equal(self.outputs["mooring_mass"], 6 * 270 * 61.72839506 + 6 * 0, 3)
         npt.assert_almost_equal(self.outputs["mooring_cost"], 6 * 270 * 159.5679012345679, 3)
 
+    def testRunMap_SweepOptions(self):
+        self.mymap.compute(self.inputs, self.outputs)
+        F_ref = self.outputs["max_surge_restoring_force"].copy()
+        T_ref = self.outputs["constr_axial_load"].copy()
+
+        for sweep in [{"heading_symmetry": False}, {"heading_refinement": 2, "n_workers": 2}]:
+            opt = dict(self.mymap.options["options"])
+            opt.update(sweep)
+            mymap = mm.Mooring(options=opt, gamma=1.35)
+            mymap.compute(self.inputs, self.outputs)
+            npt.assert_allclose(self.outputs["max_surge_restoring_force"], F_ref, rtol=1e-5)
+            npt.assert_allclose(self.outputs["constr_axial_load"], T_ref, rtol=1e-5)
+
+
+class TestMooringSweep(unittest.TestCase):
+    def testSymmetry(self):
+        self.assertEqual(mm.mooring_symmetry(make_system(3, 6)), (3, True))
+        self.assertEqual(mm.mooring_symmetry(make_system(4, 4)), (4, True))
+        self.assertEqual(mm.mooring_symmetry(make_system(3, 3, [350.0, 360.0, 350.0])), (1, True))
+        self.assertEqual(mm.mooring_symmetry(make_system(3, 3, [360.0, 350.0, 350.0])), (1, False))
+        self.assertEqual(mm.mooring_symmetry(make_system(3, 6, [360.0, 350.0] * 3)), (3, False))
+
+    def testSweepSymmetry(self):
+        ms = make_system(3, 6)
+        headings, Frestore, Tmax = mm.mooring_offset_sweep(ms, 20.0)
+        npt.assert_allclose(headings, np.deg2rad(np.arange(0.0, 61.0, 5.0)))
+
+        ms = make_system(3, 6)
+        headings_full, Frestore_full, Tmax_full = mm.mooring_offset_sweep(ms, 20.0, symmetry=False)
+        self.assertEqual(headings_full.size, 72)
+        npt.assert_allclose(np.abs(Frestore).min(), np.abs(Frestore_full).min(), rtol=1e-5)
+        npt.assert_allclose(Tmax.max(), Tmax_full.max(), rtol=1e-5)
+        npt.assert_allclose(Frestore, Frestore_full[: headings.size], rtol=1e-4)
+        npt.assert_allclose(Frestore, Frestore_full[2 * headings.size - 2 : headings.size - 2 : -1], rtol=1e-4)
+
+    def testSweepTension(self):
+        # The tension is the largest of all lines, not that of the first one
+        ms = make_system(3, 3)
+        _, Tmax = mm.sweep_offsets(ms, 20.0, [np.pi])
+        T = [max(line.TA, line.TB) for line in ms.lineList]
+        self.assertEqual(Tmax[0], max(T))
+        self.assertGreater(Tmax[0], T[0])
+
+    def testSweepRefinement(self):
+        ms = make_system(3, 3)
+        headings, Frestore, _ = mm.mooring_offset_sweep(ms, 20.0, resolution=20.0)
+        ms = make_system(3, 3)
+        headings_fine, Frestore_fine, _ = mm.mooring_offset_sweep(ms, 20.0, resolution=20.0, refinement=3)
+        self.assertEqual(headings_fine.size, headings.size + 6)
+        self.assertTrue(np.all(np.diff(headings_fine) > 0.0))
+        self.assertLessEqual(np.abs(Frestore_fine).min(), np.abs(Frestore).min())
+
+    def testSweepWorkers(self):
+        headings = np.deg2rad(np.arange(0.0, 360.0, 30.0))
+        Frestore, Tmax = mm.sweep_offsets(make_system(3, 6), 20.0, headings)
+        Frestore_pool, Tmax_pool = mm.sweep_offsets(make_system(3, 6), 20.0, headings, n_workers=3)
+        npt.assert_allclose(Frestore_pool, Frestore, rtol=1e-5)
+        npt.assert_allclose(Tmax_pool, Tmax, rtol=1e-5)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,168 @@
+import os
+import unittest
+
+import numpy as np
+import openmdao.api as om
+import numpy.testing as npt
+from scipy.interpolate import PchipInterpolator
+
+from wisdem.ccblade.Polar import Polar
+from wisdem.commonse.utilities import arc_length
+from wisdem.glue_code.gc_WT_DataStruc import Blade_Lofted_Shape, Airfoil3DCorrection, Compute_Blade_Structure
+
+
+class TestAirfoil3DCorrection(unittest.TestCase):
+    def setUp(self):
+        n_span, n_aoa, n_Re = 5, 145, 2
+        rotorse_options = {"3d_af_correction": True, "n_span": n_span, "n_aoa": n_aoa, "n_Re": n_Re}
+        self.prob = om.Problem(reports=False)
+        self.prob.model.add_subsystem("af_3d", Airfoil3DCorrection(rotorse_options=rotorse_options), promotes=["*"])
+        self.prob.setup()
+
+        aoa = np.linspace(-180.0, 180.0, n_aoa)
+        a = np.deg2rad(aoa)
+        cl = np.zeros((n_span, n_aoa, n_Re))
+        for i in range(n_span):
+            for j in range(n_Re):
+                x = a + np.deg2rad(2.0 + i)
+                cl_max = 1.2 + 0.1 * i + 0.1 * j
+                lin = 2 * np.pi * x
+                cl[i, :, j] = np.where(np.abs(lin) < cl_max, lin, np.sign(x) * cl_max * np.abs(np.cos(x)) ** 0.3)
+        self.prob["aoa"] = aoa
+        self.prob["Re"] = [1e6, 1e7]
+        self.prob["cl"] = cl
+        self.prob["cd"] = 0.01 + 1.2 * np.sin(a)[np.newaxis, :, np.newaxis] ** 2 * np.ones_like(cl)
+        self.prob["cm"] = -0.1 * np.sin(a)[np.newaxis, :, np.newaxis] * np.ones_like(cl)
+        self.prob["rated_TSR"] = 9.0
+        self.prob["r_blade"] = np.linspace(3.0, 60.0, n_span)
+        self.prob["rotor_diameter"] = 126.0
+        self.prob["rthick"] = np.linspace(1.0, 0.18, n_span)
+        self.prob["chord"] = [3.5, 4.5, 3.5, 2.5, 1.5]
+
+    def reference(self):
+        # correction with a Polar object for each section and Reynolds number
+        prob = self.prob
+        cl_ref = prob["cl"].copy()
+        cd_ref = prob["cd"].copy()
+        for i in np.flatnonzero(prob["rthick"] < 0.7):
+            for j in range(prob["cl"].shape[2]):
+                polar = Polar(
+                    Re=prob["Re"][j],
+                    alpha=prob["aoa"],
+                    cl=prob["cl"][i, :, j],
+                    cd=prob["cd"][i, :, j],
+                    cm=prob["cm"][i, :, j],
+                )
+                polar3d = polar.correction3D(
+                    prob["r_blade"][i] / (prob["rotor_diameter"][0] / 2),
+                    prob["chord"][i] / prob["r_blade"][i],
+                    prob["rated_TSR"],
+                )
+                cl_ref[i, :, j] = PchipInterpolator(polar3d.alpha, polar3d.cl)(prob["aoa"])
+                cd_ref[i, :, j] = PchipInterpolator(polar3d.alpha, polar3d.cd)(prob["aoa"])
+        return cl_ref, cd_ref
+
+    def testCorrection(self):
+        self.prob.run_model()
+        cl_ref, cd_ref = self.reference()
+        npt.assert_allclose(self.prob["cl_corrected"], cl_ref, rtol=1e-12, atol=1e-14)
+        npt.assert_allclose(self.prob["cd_corrected"], cd_ref, rtol=1e-12, atol=1e-14)
+        npt.assert_equal(self.prob["cm_corrected"], self.prob["cm"])
+        npt.assert_equal(self.prob["cl_corrected"][:2], self.prob["cl"][:2])
+        self.assertGreater(np.abs(self.prob["cl_corrected"] - self.prob["cl"]).max(), 1e-2)
+
+    def testMemoization(self):
+        comp = self.prob.model.af_3d
+        self.prob.run_model()
+        key = comp.last_key
+        self.assertEqual(len(comp.linear_params), 6)
+        cl_ref, _ = self.reference()
+
+        # unchanged inputs reuse the last outputs
+        comp.last_outputs["cl_corrected"] = comp.last_outputs["cl_corrected"] + 1.0
+        self.prob.run_model()
+        self.assertEqual(comp.last_key, key)
+        npt.assert_allclose(self.prob["cl_corrected"], cl_ref + 1.0, rtol=1e-12, atol=1e-14)
+
+        # a new TSR reuses the fits of the linear regions
+        self.prob["rated_TSR"] = 8.0
+        self.prob.run_model()
+        self.assertNotEqual(comp.last_key, key)
+        self.assertEqual(len(comp.linear_params), 6)
+        cl_ref, _ = self.reference()
+        npt.assert_allclose(self.prob["cl_corrected"], cl_ref, rtol=1e-12, atol=1e-14)
+
+
+class TestBladeGeometry(unittest.TestCase):
+    def setUp(self):
+        self.n_span, self.n_xy = n_span, n_xy = 4, 41
+        self.rotorse_options = {"n_span": n_span, "n_xy": n_xy, "n_webs": 2, "n_layers": 5}
+
+        # elliptic profiles from the trailing edge over the suction side, leading edge at x=0
+        theta = np.linspace(0.0, 2 * np.pi, n_xy)
+        chord = np.linspace(4.0, 1.0, n_span)[:, np.newaxis]
+        self.coord_xy_dim = np.zeros((n_span, n_xy, 2))
+        self.coord_xy_dim[:, :, 0] = chord * (0.5 + 0.5 * np.cos(theta)) - 0.3 * chord
+        self.coord_xy_dim[:, :, 1] = chord * 0.1 * np.sin(theta)
+
+    def tearDown(self):
+        if os.path.exists("3d_xyz_blade_lofted.dat"):
+            os.remove("3d_xyz_blade_lofted.dat")
+
+    def testLoftedShape(self):
+        prob = om.Problem(reports=False)
+        prob.model.add_subsystem("loft", Blade_Lofted_Shape(rotorse_options=self.rotorse_options), promotes=["*"])
+        prob.setup()
+        prob["coord_xy_dim_twisted"] = self.coord_xy_dim
+        ref_axis = np.zeros((self.n_span, 3))
+        ref_axis[:, 0] = np.linspace(0.0, -2.0, self.n_span)
+        ref_axis[:, 2] = np.linspace(0.0, 50.0, self.n_span)
+        prob["ref_axis"] = ref_axis
+        prob.run_model()
+
+        k = 0
+        for i in range(self.n_span):
+            for j in range(self.n_xy):
+                xy = self.coord_xy_dim[i, j]
+                npt.assert_equal(prob["3D_shape"][k], np.r_[k, xy[1], xy[0], 0.0] + np.r_[0, prob["ref_axis"][i]])
+                k += 1
+
+    def testLayerPlacement(self):
+        prob = om.Problem(reports=False)
+        struct = Compute_Blade_Structure(rotorse_options=self.rotorse_options)
+        prob.model.add_subsystem("struct", struct, promotes=["*"])
+        prob.setup()
+        prob["coord_xy_dim"] = self.coord_xy_dim
+        prob["web_offset_adjusted"] = [[-0.5] * self.n_span, [0.5] * self.n_span]
+        prob["web_rotation"] = [0.0, 10.0]
+        prob["layer_offset_adjusted"] = 0.2
+        prob["layer_rotation"] = [5.0, -5.0, 0.0, 0.0, 0.0]
+        prob["layer_width_adjusted"] = 0.6
+        prob["build_layer"] = np.array([1, 2, 3, 4, 5])
+        prob.run_model()
+
+        for i in range(self.n_span):
+            xy = self.coord_xy_dim[i]
+            arc = arc_length(xy) / arc_length(xy)[-1]
+            width = 0.6 / arc_length(xy)[-1]
+            i_le = np.argmin(xy[:, 0])
+
+            def closest(rotation, offset, suction_side):
+                a = np.deg2rad(rotation)
+                x = xy[:, 0] * np.cos(a) - xy[:, 1] * np.sin(a)
+                if suction_side:
+                    return np.argmin(np.abs(x[:i_le] - offset))
+                return i_le + np.argmin(np.abs(x[i_le:] - offset))
+
+            for j, (rotation, offset) in enumerate([(0.0, -0.5), (10.0, 0.5)]):
+                self.assertEqual(prob["web_start_nd"][j, i], arc[closest(rotation, offset, True)])
+                self.assertEqual(prob["web_end_nd"][j, i], arc[closest(rotation, offset, False)])
+            npt.assert_allclose(prob["layer_start_nd"][0, i], arc[closest(5.0, 0.2, True)] - 0.5 * width)
+            npt.assert_allclose(prob["layer_end_nd"][1, i], arc[closest(-5.0, 0.2, False)] + 0.5 * width)
+            npt.assert_allclose(prob["layer_start_nd"][2, i], arc[i_le] - 0.5 * width)
+            npt.assert_allclose(prob["layer_end_nd"][3, i], width)
+            npt.assert_allclose(prob["layer_start_nd"][4, i], 1.0 - width)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -38,6 +39,57 @@ class TestValidation(unittest.TestCase):
         obj2p = val.load_yaml(ftemp2)
 
         self.assertEqual(obj1p, obj2p)
-        
+
+    def test_validation_cache(self):
+        val.clear_validation_cache()
+        with tempfile.TemporaryDirectory() as tmp:
+            fopt = os.path.join(tmp, "analysis.yaml")
+            val.write_yaml({"general": {"folder_output": "out1"}}, fopt)
+
+            opt1 = val.load_analysis_yaml(fopt)
+            self.assertEqual(opt1["general"]["folder_output"], "out1")
+            self.assertEqual(opt1["driver"]["optimization"]["solver"], "SLSQP")
+            self.assertEqual(len(val._validated_cache), 1)
+
+            # unchanged file is served from the cache, as an independent copy
+            opt1["general"]["folder_output"] = "modified"
+            opt1["driver"]["optimization"]["solver"] = "COBYLA"
+            opt2 = val.load_analysis_yaml(fopt)
+            self.assertEqual(opt2["general"]["folder_output"], "out1")
+            self.assertEqual(opt2["driver"]["optimization"]["solver"], "SLSQP")
+            self.assertEqual(len(val._validated_cache), 1)
+
+            # changed contents are validated again, with clean defaults
+            val.write_yaml({"general": {"folder_output": "out2"}}, fopt)
+            opt3 = val.load_analysis_yaml(fopt)
+            self.assertEqual(opt3["general"]["folder_output"], "out2")
+            self.assertEqual(opt3["driver"]["optimization"]["solver"], "SLSQP")
+            self.assertEqual(len(val._validated_cache), 2)
+
+            val.write_yaml({"general": {"folder_output": "out2", "not_an_option": 1}}, fopt)
+            self.assertRaises(val.json.exceptions.ValidationError, val.load_analysis_yaml, fopt)
+
+    def test_validation_cache_include(self):
+        val.clear_validation_cache()
+        with tempfile.TemporaryDirectory() as tmp:
+            fopt = os.path.join(tmp, "analysis.yaml")
+            fgeneral = os.path.join(tmp, "general.yaml")
+            with open(fopt, "w") as f:
+                f.write("general: !include general.yaml\n")
+            val.write_yaml({"folder_output": "out1"}, fgeneral)
+            self.assertEqual(val.load_analysis_yaml(fopt)["general"]["folder_output"], "out1")
+            self.assertEqual(val.load_analysis_yaml(fopt)["general"]["folder_output"], "out1")
+            self.assertEqual(len(val._validated_cache), 1)
+
+            # a change of the included file only is seen by the cache
+            val.write_yaml({"folder_output": "out2"}, fgeneral)
+            self.assertEqual(val.load_analysis_yaml(fopt)["general"]["folder_output"], "out2")
+            self.assertEqual(len(val._validated_cache), 2)
+
+            # a missing included file is not cached
+            os.remove(fgeneral)
+            self.assertRaises(FileNotFoundError, val.load_analysis_yaml, fopt)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,129 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import openmdao.api as om
+import numpy.testing as npt
+
+from wisdem.optimization_drivers.design_cache import DesignPointCache, input_key, model_fingerprint
+
+
+class TestDesignPointCache(unittest.TestCase):
+    def test_hit_miss(self):
+        cache = DesignPointCache(max_entries=10, tol=1e-9)
+        x = np.array([1.0, -0.0, 2.5])
+        self.assertIsNone(cache.get(x))
+        cache.put(x, obj=np.array([3.0]), cons={"c": np.array([1.0, 2.0])})
+
+        # round-off and signed zeros land on the same entry
+        entry = cache.get(x + np.array([1e-12, 0.0, -1e-12]))
+        npt.assert_equal(entry["obj"], [3.0])
+        npt.assert_equal(entry["cons"]["c"], [1.0, 2.0])
+        self.assertIsNotNone(cache.get(np.array([1.0, 0.0, 2.5])))
+        self.assertIsNone(cache.get(x + 1e-6))
+        self.assertEqual((cache.hits, cache.misses), (2, 2))
+        self.assertAlmostEqual(cache.hit_rate, 0.5)
+
+    def test_stored_values_are_copies(self):
+        cache = DesignPointCache()
+        obj = np.array([1.0])
+        cache.put(np.zeros(2), obj=obj)
+        obj[0] = 2.0
+        npt.assert_equal(cache.get(np.zeros(2))["obj"], [1.0])
+
+    def test_require(self):
+        cache = DesignPointCache()
+        x = np.ones(3)
+        cache.put(x, obj=np.array([1.0]))
+        self.assertIsNone(cache.get(x, require=("grad",)))
+        cache.put(x, grad=np.ones((1, 3)))
+        entry = cache.get(x, require=("grad",))
+        npt.assert_equal(entry["obj"], [1.0])
+        npt.assert_equal(entry["grad"], np.ones((1, 3)))
+
+    def test_lru_entries(self):
+        cache = DesignPointCache(max_entries=2)
+        for k in range(3):
+            if k == 2:
+                cache.get(np.array([0.0]))  # refresh the oldest entry
+            cache.put(np.array([float(k)]), obj=np.array([k]))
+        self.assertEqual(len(cache), 2)
+        self.assertIn(np.array([0.0]), cache)
+        self.assertNotIn(np.array([1.0]), cache)
+        self.assertIn(np.array([2.0]), cache)
+
+    def test_lru_bytes(self):
+        cache = DesignPointCache(max_entries=100, max_bytes=3 * 800)
+        for k in range(5):
+            cache.put(np.array([float(k)]), values=np.zeros(100))
+        self.assertEqual(len(cache), 3)
+        self.assertEqual(cache.nbytes, 3 * 800)
+        self.assertNotIn(np.array([1.0]), cache)
+
+    def test_persistence(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "cache.pkl")
+            cache = DesignPointCache(path=path, save_every=2)
+            cache.put(np.array([1.0]), obj=np.array([1.0]))
+            self.assertFalse(os.path.exists(path))
+            cache.put(np.array([2.0]), obj=np.array([4.0]))
+            self.assertTrue(os.path.exists(path))
+
+            restart = DesignPointCache(path=path)
+            self.assertEqual(len(restart), 2)
+            npt.assert_equal(restart.get(np.array([2.0]))["obj"], [4.0])
+
+            # read-only copies never write, and other quantizations start empty
+            reader = DesignPointCache(path=path, save_every=1, writable=False)
+            reader.put(np.array([3.0]), obj=np.array([9.0]))
+            self.assertEqual(len(DesignPointCache(path=path)), 2)
+            self.assertEqual(len(DesignPointCache(path=path, tol=1e-6)), 0)
+
+    def test_fingerprint(self):
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "cache.pkl")
+            cache = DesignPointCache(path=path, fingerprint="model1")
+            cache.put(np.array([1.0]), obj=np.array([1.0]))
+            cache.save()
+
+            # a file saved for another model, or without a fingerprint, is discarded
+            self.assertEqual(len(DesignPointCache(path=path, fingerprint="model1")), 1)
+            self.assertEqual(len(DesignPointCache(path=path, fingerprint="model2", writable=False)), 0)
+            self.assertEqual(len(DesignPointCache(path=path, writable=False)), 0)
+
+            # and overwritten by the new model
+            cache = DesignPointCache(path=path, fingerprint="model2", save_every=1)
+            cache.put(np.array([2.0]), obj=np.array([4.0]))
+            self.assertEqual(len(DesignPointCache(path=path, fingerprint="model2")), 1)
+            self.assertEqual(len(DesignPointCache(path=path, fingerprint="model1", writable=False)), 0)
+
+    def test_model_fingerprint(self):
+        def driver(desvars, constraints=("c",), scaler=None):
+            prob = om.Problem(reports=False)
+            comp = om.ExecComp(["f = x[0] + y", "c = x[1] - y"], x=np.ones(2))
+            prob.model.add_subsystem("comp", comp, promotes=["*"])
+            for name in desvars:
+                prob.model.add_design_var(name, lower=-1.0, upper=1.0, scaler=scaler)
+            prob.model.add_objective("f")
+            for name in constraints:
+                prob.model.add_constraint(name, upper=0.0)
+            prob.setup()
+            prob.final_setup()
+            return prob.driver
+
+        reference = model_fingerprint(driver(["x", "y"]), "inputs")
+        self.assertEqual(model_fingerprint(driver(["x", "y"]), "inputs"), reference)
+        self.assertNotEqual(model_fingerprint(driver(["x", "y"]), "other inputs"), reference)
+        self.assertNotEqual(model_fingerprint(driver(["x"]), "inputs"), reference)
+        self.assertNotEqual(model_fingerprint(driver(["x", "y"], constraints=()), "inputs"), reference)
+        self.assertNotEqual(model_fingerprint(driver(["x", "y"], scaler=2.0), "inputs"), reference)
+
+        inputs = {"blade": {"chord": np.linspace(1.0, 4.0, 10)}}
+        self.assertEqual(input_key(inputs, None), input_key({"blade": {"chord": np.linspace(1.0, 4.0, 10)}}, None))
+        self.assertNotEqual(input_key(inputs, None), input_key({"blade": {"chord": np.linspace(1.0, 4.5, 10)}}, None))
+        self.assertIsNone(input_key(lambda x: x))
+
+
+if __name__ == "__main__":
+    unittest.main()
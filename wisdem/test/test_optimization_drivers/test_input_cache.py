@@ -0,0 +1,121 @@
+import unittest
+
+import numpy as np
+import openmdao.api as om
+import numpy.testing as npt
+
+from wisdem.optimization_drivers.input_cache import input_cache_report, cache_unchanged_outputs
+
+
+class Paraboloid(om.ExplicitComponent):
+    def setup(self):
+        self.add_input("x", np.ones(3))
+        self.add_output("f", 0.0)
+        self.add_output("g", np.zeros(3))
+        self.declare_partials("*", "*", method="fd")
+        self.n_compute = 0
+
+    def compute(self, inputs, outputs):
+        self.n_compute += 1
+        outputs["f"] = np.sum((inputs["x"] - 1.0) ** 2)
+        outputs["g"] = 2.0 * inputs["x"]
+
+
+class Weight(om.ExplicitComponent):
+    def setup(self):
+        self.add_input("y", 1.0)
+        self.add_discrete_input("material", "steel")
+        self.add_output("w", 0.0)
+        self.add_discrete_output("label", "")
+        self.declare_partials("w", "y", method="fd")
+        self.n_compute = 0
+
+    def compute(self, inputs, outputs, discrete_inputs, discrete_outputs):
+        self.n_compute += 1
+        density = {"steel": 7850.0, "glass": 1940.0}[discrete_inputs["material"]]
+        outputs["w"] = density * inputs["y"] ** 2
+        discrete_outputs["label"] = f"{discrete_inputs['material']}-{self.n_compute}"
+
+
+class Model(om.Group):
+    def initialize(self):
+        self.options.declare("patterns", default=[])
+
+    def setup(self):
+        sub = self.add_subsystem("sub", om.Group(), promotes=["*"])
+        sub.add_subsystem("parab", Paraboloid(), promotes=["*"])
+        self.add_subsystem("weight", Weight(), promotes=["*"])
+        self.add_subsystem("obj", om.ExecComp("obj = f + 1e-4 * w"), promotes=["*"])
+
+    def configure(self):
+        self.cached = cache_unchanged_outputs(self, self.options["patterns"])
+
+
+def _make_problem(patterns):
+    prob = om.Problem(model=Model(patterns=patterns), reports=False)
+    prob.model.add_design_var("x", lower=-2.0, upper=2.0)
+    prob.model.add_design_var("y", lower=0.1, upper=2.0)
+    prob.model.add_objective("obj")
+    prob.model.add_constraint("g", upper=1.8)
+    prob.model.approx_totals(method="fd")
+    prob.driver = om.ScipyOptimizeDriver(optimizer="SLSQP", tol=1e-9, disp=False)
+    prob.setup()
+    prob.set_val("x", [0.0, 0.5, 2.0])
+    prob.set_val("y", 1.5)
+    return prob
+
+
+class TestInputCache(unittest.TestCase):
+    def test_patterns(self):
+        self.assertEqual(_make_problem(["sub"]).model.cached, ["sub.parab"])
+        self.assertEqual(_make_problem(["sub.*"]).model.cached, ["sub.parab"])
+        self.assertEqual(_make_problem(["weight", "parab"]).model.cached, ["sub.parab", "weight"])
+        self.assertEqual(_make_problem(["drivese"]).model.cached, [])
+        self.assertEqual(_make_problem([]).model.cached, [])
+
+    def test_unchanged_inputs(self):
+        prob = _make_problem(["parab", "weight"])
+        parab, weight = prob.model.sub.parab, prob.model.weight
+        prob.run_model()
+        prob.run_model()
+        self.assertEqual((parab.n_compute, weight.n_compute), (1, 1))
+        self.assertEqual(prob.get_val("label"), "steel-1")
+
+        # a change of a discrete input is seen by the cache
+        prob.set_val("material", "glass")
+        prob.run_model()
+        self.assertEqual((parab.n_compute, weight.n_compute), (1, 2))
+        self.assertEqual(prob.get_val("label"), "glass-2")
+        npt.assert_equal(prob.get_val("w"), 1940.0 * 1.5**2)
+
+        # the restored outputs are those of the unchanged inputs
+        prob.set_val("x", [1.0, 1.0, 1.0])
+        prob.run_model()
+        prob.set_val("x", [1.0, 1.0, 1.0])
+        prob.run_model()
+        self.assertEqual((parab.n_compute, weight.n_compute), (2, 2))
+        npt.assert_equal(prob.get_val("f"), 0.0)
+        self.assertEqual((parab._input_cache.computes, parab._input_cache.skips), (2, 3))
+        self.assertEqual((weight._input_cache.computes, weight._input_cache.skips), (2, 3))
+
+    def test_optimization(self):
+        ref = _make_problem([])
+        ref.run_driver()
+        prob = _make_problem(["*"])
+        prob.run_driver()
+
+        for name in ["x", "y", "obj", "g", "w"]:
+            npt.assert_equal(prob.get_val(name), ref.get_val(name))
+        for comp, comp_ref in [(prob.model.sub.parab, ref.model.sub.parab), (prob.model.weight, ref.model.weight)]:
+            self.assertLess(comp.n_compute, comp_ref.n_compute)
+            self.assertEqual(comp._input_cache.computes, comp.n_compute)
+            self.assertEqual(comp._input_cache.computes + comp._input_cache.skips, comp_ref.n_compute)
+
+        report = input_cache_report(prob.model)
+        self.assertEqual(len(report), 5)
+        self.assertEqual(report[-1].split()[0], "Total")
+        self.assertEqual(input_cache_report(ref.model), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -232,6 +232,37 @@ class TestNLoptDriver(unittest.TestCase):
         assert_near_equal(prob["x"], 7.16667, 1e-6)
         assert_near_equal(prob["y"], -7.833334, 1e-6)
 
+    def test_simple_paraboloid_cache(self):
+        prob = om.Problem(reports=False)
+        model = prob.model
+
+        model.add_subsystem("p1", om.IndepVarComp("x", 50.0), promotes=["*"])
+        model.add_subsystem("p2", om.IndepVarComp("y", 50.0), promotes=["*"])
+        model.add_subsystem("comp", Paraboloid(), promotes=["*"])
+        model.add_subsystem("con", om.ExecComp("c = - x + y"), promotes=["*"])
+
+        prob.set_solver_print(level=0)
+
+        prob.driver = NLoptDriver()
+        prob.driver.options["optimizer"] = "LD_SLSQP"
+        prob.driver.options["tol"] = 1e-9
+        prob.driver.options["cache_size"] = 100
+
+        model.add_design_var("x", lower=-50.0, upper=50.0)
+        model.add_design_var("y", lower=-50.0, upper=50.0)
+        model.add_objective("f_xy")
+        model.add_constraint("c", upper=-15.0)
+
+        prob.setup()
+
+        failed = prob.run_driver()
+
+        # Minimum should be at (7.166667, -7.833334), with the model left there
+        assert_near_equal(prob["x"], 7.16667, 1e-6)
+        assert_near_equal(prob["y"], -7.833334, 1e-6)
+        assert_near_equal(prob["c"], -15.0, 1e-6)
+        self.assertGreater(len(prob.driver._cache), 0)
+
     def test_simple_paraboloid_lower(self):
         prob = om.Problem(reports=False)
         model = prob.model
@@ -0,0 +1,96 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from wisdem.commonse.worker_pool import WorkerPool
+from wisdem.optimization_drivers.design_cache import DesignPointCache
+from wisdem.optimization_drivers.nsga2.algo_nsga2 import NSGA2
+
+
+def fun_two_obj(x):
+    # two objectives and one constraint, picklable for the worker pool
+    return np.array([np.sum(x**2), np.sum((x - 2.0) ** 2), 2.5 - x[0]])
+
+
+def fun_exit(x):
+    # losing a worker breaks the pool
+    os._exit(1)
+
+
+def run_nsga2(fun=fun_two_obj, executor=None, fun_executor=None, cache=None, N_gen=3):
+    rng = np.random.default_rng(1234)
+    optimizer = NSGA2(
+        rng.uniform(0.0, 3.0, (12, 2)),
+        fun,
+        2,
+        1,
+        design_vars_l=np.zeros(2),
+        design_vars_u=3.0 * np.ones(2),
+        executor=executor,
+        fun_executor=fun_executor,
+        cache=cache,
+        rng_seed=5678,
+    )
+    optimizer.get_fronts()
+    for _ in range(N_gen):
+        optimizer.iterate_population()
+    return optimizer
+
+
+def test_executor_matches_serial():
+    """
+    evaluating the population on a process pool reproduces the serial run
+    """
+
+    serial = run_nsga2()
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        pooled = run_nsga2(executor=executor)
+
+    np.testing.assert_equal(pooled.design_vars_population, serial.design_vars_population)
+    np.testing.assert_equal(pooled.objs_population, serial.objs_population)
+    np.testing.assert_equal(pooled.constrs_population, serial.constrs_population)
+    assert pooled.idx_fronts == serial.idx_fronts
+
+
+def test_worker_pool_fallback():
+    """
+    a worker pool that breaks is replaced by serial evaluations, which reproduce the serial run
+    """
+
+    serial = run_nsga2()
+    pool = WorkerPool(2, "NSGA2")
+    pooled = run_nsga2(executor=pool, fun_executor=fun_exit)
+    assert pooled.executor is None
+    assert not pool.available
+
+    np.testing.assert_equal(pooled.design_vars_population, serial.design_vars_population)
+    np.testing.assert_equal(pooled.objs_population, serial.objs_population)
+    np.testing.assert_equal(pooled.constrs_population, serial.constrs_population)
+
+
+def test_cache_skips_repeated_individuals():
+    """
+    the design-point cache reproduces the uncached run, and a warm cache
+    replays it without evaluating the model
+    """
+
+    calls = []
+
+    def fun_counted(x):
+        calls.append(tuple(x))
+        return fun_two_obj(x)
+
+    reference = run_nsga2()
+    cache = DesignPointCache()
+    for N_calls_expected in [None, 0]:
+        calls.clear()
+        cached = run_nsga2(fun_counted, cache=cache)
+        np.testing.assert_equal(cached.design_vars_population, reference.design_vars_population)
+        np.testing.assert_equal(cached.objs_population, reference.objs_population)
+        np.testing.assert_equal(cached.constrs_population, reference.constrs_population)
+        if N_calls_expected is None:
+            assert len(set(calls)) == len(calls) == len(cache)
+        else:
+            assert len(calls) == N_calls_expected
+    assert cache.hits == cache.misses == len(cache)
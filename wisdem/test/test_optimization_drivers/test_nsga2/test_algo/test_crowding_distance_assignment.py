@@ -104,3 +104,19 @@ def test_crowding_distance_assignment_line_2D_exponential():
 
     # assert that these are correct
     assert np.allclose(crowding_distances[1:-1], 2 * CD_ref)
+
+
+def test_crowding_distance_assignment_matches_reference():
+
+    # the vectorized distances match the reference loop, including fronts
+    # with a degenerate objective and fronts of one and two points
+    rng = np.random.default_rng(1357)
+    for N_samples in [1, 2, 3, 40]:
+        for dim in [1, 2, 3]:
+            vec = rng.random((N_samples, dim))
+            if dim > 1:
+                vec[:, 1] = 0.5  # degenerate objective
+            np.testing.assert_array_equal(
+                cda.crowding_distance_assignment(vec),
+                cda.crowding_distance_assignment.function_nojit(vec),
+            )
@@ -109,3 +109,30 @@ def test_fast_nondom_sort_cube():
     # verify that the computed fronts match reference values
     for idx_front, front_ref in enumerate(fronts_ref):
         assert np.allclose(fronts[idx_front], front_ref)
+
+
+def test_fast_nondom_sort_matches_reference():
+    """
+    the vectorized sorts give the same fronts as the reference double loop
+
+    covers the two-objective special case and the block-wise general case,
+    with ties and duplicate points, and with blocks smaller than the population
+    """
+
+    rng = np.random.default_rng(2468)
+    block_elements = fns.block_elements
+    try:
+        for dim in [2, 3, 4]:
+            for N_samples in [1, 2, 50, 300]:
+                # integer-valued objectives force ties and duplicates
+                vec = rng.integers(0, 6, (N_samples, dim)).astype(float)
+                vec2list = [tuple(v) for v in vec]
+                fronts_ref = fns.fast_nondom_sort.function_nojit(vec2list)
+                for fns.block_elements in [2**24, 7 * dim]:
+                    assert fns.fast_nondom_sort(vec) == fronts_ref
+                    assert fns.fast_nondom_sort(vec2list) == fronts_ref
+                if dim == 2:
+                    ranks_numpy = fns.fast_nondom_sort_ranks_numpy(vec)
+                    assert np.array_equal(fns.fast_nondom_sort_ranks_2d(vec), ranks_numpy)
+    finally:
+        fns.block_elements = block_elements
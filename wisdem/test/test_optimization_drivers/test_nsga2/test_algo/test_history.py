@@ -0,0 +1,88 @@
+import numpy as np
+
+from wisdem.optimization_drivers.nsga2.history import NSGA2History
+from wisdem.optimization_drivers.nsga2.algo_nsga2 import NSGA2
+
+
+def fun_two_obj(x):
+    return np.array([np.sum(x**2), np.sum((x - 2.0) ** 2), 2.5 - x[0]])
+
+
+def make_nsga2(fun=fun_two_obj, state=None):
+    rng = np.random.default_rng(4321)
+    return NSGA2(
+        rng.uniform(0.0, 3.0, (10, 3)),
+        fun,
+        2,
+        1,
+        design_vars_l=np.zeros(3),
+        design_vars_u=3.0 * np.ones(3),
+        rng_seed=8765,
+        state=state,
+    )
+
+
+def test_history_append_and_read(tmp_path):
+    """
+    each generation is stored once and reads back as written
+    """
+
+    history = NSGA2History(tmp_path / "history")
+    assert len(history) == 0
+
+    optimizer = make_nsga2()
+    optimizer.get_fronts()
+    history.append(-1, optimizer)
+    for generation in range(3):
+        optimizer.iterate_population()
+        optimizer.get_fronts()
+        history.append(generation, optimizer)
+
+    assert history.generations == [-1, 0, 1, 2]
+    assert int(history.load()["generation"]) == 2
+    np.testing.assert_equal(history.design_vars(), optimizer.design_vars_population)
+    np.testing.assert_equal(history.objectives(2), optimizer.objs_population)
+    np.testing.assert_equal(history.constraints(2), optimizer.constrs_population)
+    design_vars_fronts, objs_fronts, constrs_fronts = history.fronts()
+    assert len(objs_fronts) == len(optimizer.objs_fronts)
+    for a, b in zip(objs_fronts, optimizer.objs_fronts):
+        np.testing.assert_equal(a, b)
+    for a, b in zip(design_vars_fronts, optimizer.design_vars_fronts):
+        np.testing.assert_equal(a, b)
+
+    history.clear()
+    assert len(history) == 0
+
+
+def test_restart_matches_uninterrupted(tmp_path):
+    """
+    resuming from a stored generation continues exactly like the original run
+    """
+
+    history = NSGA2History(tmp_path)
+    reference = make_nsga2()
+    reference.get_fronts()
+    for generation in range(4):
+        reference.iterate_population()
+        reference.get_fronts()
+        if generation == 1:
+            history.append(generation, reference)
+
+    calls = []
+
+    def fun_counted(x):
+        calls.append(x)
+        return fun_two_obj(x)
+
+    state = history.load()
+    restarted = make_nsga2(fun_counted, state)
+    assert not calls  # the stored population is not evaluated again
+    restarted.get_fronts()
+    for generation in range(int(state["generation"]) + 1, 4):
+        restarted.iterate_population()
+        restarted.get_fronts()
+
+    np.testing.assert_equal(restarted.design_vars_population, reference.design_vars_population)
+    np.testing.assert_equal(restarted.objs_population, reference.objs_population)
+    np.testing.assert_equal(restarted.constrs_population, reference.constrs_population)
+    assert restarted.idx_fronts == reference.idx_fronts
@@ -1,5 +1,7 @@
 """Tests for the NSGA2Driver and its integration with gc_PoseOptimization schema fields."""
 
+import os
+import tempfile
 import unittest
 import numpy as np
 import openmdao.api as om
@@ -7,7 +9,7 @@ import openmdao.api as om
 from wisdem.optimization_drivers.nsga2_driver import NSGA2Driver
 
 
-def _make_two_obj_problem():
+def _make_two_obj_problem(name=None):
     """Build a simple 2-objective OpenMDAO problem for testing NSGA2Driver.
 
     Minimize f1 = x^2  and  f2 = (x - 2)^2  subject to x in [0, 3].
@@ -25,7 +27,7 @@ def _make_two_obj_problem():
             outputs["f1"] = x ** 2
             outputs["f2"] = (x - 2.0) ** 2
 
-    prob = om.Problem()
+    prob = om.Problem(name=name)
     prob.model.add_subsystem("comp", TwoObj(), promotes=["*"])
     prob.model.add_design_var("x", lower=0.0, upper=3.0)
     prob.model.add_objective("f1")
@@ -33,6 +35,12 @@ def _make_two_obj_problem():
     return prob
 
 
+def _make_pool_problem():
+    """Problem factory for the worker processes of the local pool."""
+    prob = _make_two_obj_problem()
+    prob.driver = NSGA2Driver()
+    return prob
+
 
 class TestNSGA2DriverRun(unittest.TestCase):
     """Integration tests: run the driver on a minimal 2-objective problem."""
@@ -91,6 +99,97 @@ class TestNSGA2DriverRun(unittest.TestCase):
             self.assertGreaterEqual(row[0], 0.0 - 1e-8)
             self.assertLessEqual(row[0], 3.0 + 1e-8)
 
+    def test_process_pool(self):
+        """Driver runs to completion with the individuals evaluated on a local worker pool."""
+        prob = _make_two_obj_problem()
+        prob.driver = NSGA2Driver()
+        prob.driver.options["pop_size"] = 12
+        prob.driver.options["max_gen"] = 2
+        prob.driver.options["num_workers"] = 2
+        prob.driver.options["problem_factory"] = _make_pool_problem
+        prob.setup()
+        prob.run_driver()
+        driver = prob.driver
+        self.assertGreater(len(driver.obj_nd), 0)
+        self.assertTrue(np.all(np.isfinite(driver.obj_nd)))
+        self.assertTrue(np.all((driver.desvar_nd >= 0.0) & (driver.desvar_nd <= 3.0)))
+        self.assertIsNone(driver._pool)
+
+    def test_process_pool_recording(self):
+        """Every individual evaluated on the local worker pool is recorded by the driver's process."""
+        with tempfile.TemporaryDirectory() as tmp:
+            prob = _make_two_obj_problem()
+            prob.driver = NSGA2Driver()
+            prob.driver.options["pop_size"] = 10
+            prob.driver.options["max_gen"] = 1
+            prob.driver.options["num_workers"] = 2
+            prob.driver.options["problem_factory"] = _make_pool_problem
+            fname = os.path.join(tmp, "cases.sql")
+            prob.driver.add_recorder(om.SqliteRecorder(fname))
+            prob.setup()
+            prob.run_driver()
+            prob.cleanup()
+
+            cases = om.CaseReader(fname).get_cases("driver")
+            self.assertEqual(len(cases), prob.driver.iter_count)
+            self.assertGreater(len(cases), 10)
+            for case in cases:
+                x = case.get_design_vars()["x"]
+                np.testing.assert_allclose(case.get_objectives()["f1"], x**2)
+                np.testing.assert_allclose(case.get_objectives()["f2"], (x - 2.0) ** 2)
+
+    def test_process_pool_needs_factory(self):
+        """num_workers > 0 without a problem_factory raises a ValueError."""
+        prob = _make_two_obj_problem()
+        prob.driver = NSGA2Driver()
+        prob.driver.options["pop_size"] = 10
+        prob.driver.options["num_workers"] = 2
+        prob.setup()
+        with self.assertRaises(ValueError):
+            prob.run_driver()
+
+
+class TestNSGA2DriverHistory(unittest.TestCase):
+    """The generation store and restarting from it."""
+
+    def setUp(self):
+        self.cwd = os.getcwd()
+        self.tmp = tempfile.TemporaryDirectory()
+        os.chdir(self.tmp.name)
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        self.tmp.cleanup()
+
+    def _run(self, max_gen, restart):
+        prob = _make_two_obj_problem(name="nsga2_history")
+        prob.driver = NSGA2Driver()
+        prob.driver.options["pop_size"] = 10
+        prob.driver.options["max_gen"] = max_gen
+        prob.driver.options["restart"] = restart
+        prob.setup()
+        prob.run_driver()
+        return prob.driver
+
+    def test_restart(self):
+        """A restarted run only evaluates the generations missing from the store."""
+        driver = self._run(max_gen=1, restart=False)
+        self.assertEqual(driver.history.generations, [-1, 0, 1])
+        n_eval_first = driver.iter_count
+
+        # a restart beyond the stored generations appends the new ones
+        driver = self._run(max_gen=3, restart=True)
+        self.assertEqual(driver.history.generations, [-1, 0, 1, 2, 3])
+        self.assertLess(driver.iter_count, n_eval_first)
+        np.testing.assert_equal(
+            np.sort(driver.history.design_vars(), axis=0),
+            np.sort(driver.optimizer_nsga2.design_vars_population, axis=0),
+        )
+
+        # without restart, the store starts over
+        driver = self._run(max_gen=0, restart=False)
+        self.assertEqual(driver.history.generations, [-1, 0])
+
 
 class TestNSGA2PoseOptimizationIntegration(unittest.TestCase):
     """Verify that gc_PoseOptimization._set_optimizer_properties correctly maps
@@ -134,6 +233,31 @@ class TestNSGA2PoseOptimizationIntegration(unittest.TestCase):
         self.assertAlmostEqual(prob.driver.options["Pc"], 0.75)
         self.assertAlmostEqual(prob.driver.options["Pm"], 0.05)
 
+    def test_set_driver_num_workers(self):
+        """set_driver passes num_workers from the analysis options to the NSGA2Driver."""
+        from wisdem.glue_code.gc_PoseOptimization import PoseOptimization
+
+        opt = {
+            "general": {"folder_output": "outputs"},
+            "driver": {
+                "optimization": {
+                    "flag": True,
+                    "solver": "NSGA2",
+                    "form": "central",
+                    "step_calc": "None",
+                    "fd_workers": 0,
+                    "debug_print": False,
+                    "pop_size": 10,
+                    "num_workers": 3,
+                },
+            },
+        }
+
+        pose = PoseOptimization(wt_init={}, modeling_options={}, analysis_options=opt)
+        prob = pose.set_driver(_make_two_obj_problem())
+        self.assertIsInstance(prob.driver, NSGA2Driver)
+        self.assertEqual(prob.driver.options["num_workers"], 3)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,96 @@
+import os
+import unittest
+from unittest import mock
+
+import numpy as np
+import openmdao.api as om
+import numpy.testing as npt
+
+from wisdem.commonse.worker_pool import pools_available
+from wisdem.optimization_drivers import parallel_fd
+from wisdem.optimization_drivers.parallel_fd import ForkedFiniteDifference, approx_totals
+
+
+class Model(om.ExplicitComponent):
+    def setup(self):
+        self.add_input("x", np.ones(5))
+        self.add_input("y", 1.0)
+        self.add_output("f", 0.0)
+        self.add_output("g", np.zeros(3))
+        self.add_output("pid", 0.0)
+
+    def compute(self, inputs, outputs):
+        x, y = inputs["x"], inputs["y"]
+        outputs["f"] = np.sum(x**3) + y**2 * x[0]
+        outputs["g"] = np.sin(x[:3]) * y
+        outputs["pid"] = os.getpid()
+
+
+def _make_problem(num_workers, form):
+    prob = om.Problem(reports=False)
+    prob.model.add_subsystem("comp", Model(), promotes=["*"])
+    prob.model.add_design_var("x", lower=-2.0, upper=2.0)
+    prob.model.add_design_var("y", lower=-2.0, upper=2.0)
+    prob.model.add_objective("f")
+    prob.model.add_constraint("g", upper=0.0)
+    approx_totals(prob.model, num_workers, step=1e-6, form=form)
+    prob.setup()
+    prob.set_val("x", np.linspace(0.1, 1.0, 5))
+    prob.set_val("y", 2.0)
+    prob.run_model()
+    return prob
+
+
+@unittest.skipUnless(pools_available(), "processes cannot be forked on this platform")
+class TestForkedFiniteDifference(unittest.TestCase):
+    def test_matches_serial(self):
+        for form in ["forward", "central"]:
+            serial = _make_problem(0, form).compute_totals()
+            prob = _make_problem(3, form)
+            forked = prob.compute_totals()
+            self.assertIsInstance(prob.model._approx_schemes["fd"], ForkedFiniteDifference)
+            self.assertEqual(serial.keys(), forked.keys())
+            for key in serial:
+                npt.assert_equal(forked[key], serial[key])
+
+            # the parent model is left at the unperturbed point
+            self.assertEqual(prob.get_val("pid")[0], os.getpid())
+            npt.assert_equal(prob.get_val("x"), np.linspace(0.1, 1.0, 5))
+
+    def test_driver(self):
+        prob = _make_problem(2, "central")
+        prob.driver = om.ScipyOptimizeDriver(optimizer="SLSQP", tol=1e-8, disp=False)
+        prob.model.add_constraint("y", lower=1.0)
+        prob.setup()
+        prob.set_val("x", np.linspace(0.1, 1.0, 5))
+        prob.set_val("y", 2.0)
+        prob.run_driver()
+        self.assertIsInstance(prob.model._approx_schemes["fd"], ForkedFiniteDifference)
+        npt.assert_array_less(prob.get_val("g"), 1e-6)
+
+    def test_serial_default(self):
+        prob = _make_problem(0, "forward")
+        prob.compute_totals()
+        self.assertNotIsInstance(prob.model._approx_schemes["fd"], ForkedFiniteDifference)
+
+    def test_openmdao_internals(self):
+        self.assertTrue(parallel_fd.openmdao_internals_match())
+
+        # a changed private signature falls back to the serial scheme
+        internals = parallel_fd._OPENMDAO_INTERNALS + [(om.Group, "_get_approx_scheme", ["self", "method", "extra"])]
+        parallel_fd.openmdao_internals_match.cache_clear()
+        try:
+            with mock.patch.object(parallel_fd, "_OPENMDAO_INTERNALS", internals):
+                self.assertFalse(parallel_fd.openmdao_internals_match())
+                serial = _make_problem(0, "forward").compute_totals()
+                prob = _make_problem(3, "forward")
+                totals = prob.compute_totals()
+        finally:
+            parallel_fd.openmdao_internals_match.cache_clear()
+        self.assertNotIsInstance(prob.model._approx_schemes["fd"], ForkedFiniteDifference)
+        for key in serial:
+            npt.assert_equal(totals[key], serial[key])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -119,6 +119,33 @@ class TestPreCompProperties(unittest.TestCase):
 
                         npt.assert_almost_equal(results_fort, results_py, decimal=5)
 
+    def test_properties_batch(self):
+        fnames = ['section_dump_nrel5mw.pkl', 'section_dump_iea15mw.pkl']
+
+        for f in fnames:
+            with self.subTest(f=f):
+                myitems = loadall(f)
+                nsec = myitems.__next__()
+                sections = []
+                results_fort = []
+                for k in range(nsec):
+                    sections.append([myitems.__next__() for _ in range(30)])
+                    results_fort.append(myitems.__next__())
+
+                # Material properties are shared by all sections, the rest is stacked per section
+                args = [list(arg) for arg in zip(*sections)]
+                for i in range(6, 11):
+                    args[i] = args[i][0]
+                results_batch = np.array(prop.properties_batch(*args)).T
+
+                npt.assert_almost_equal(np.array(results_fort), results_batch, decimal=5)
+                for k in range(nsec):
+                    npt.assert_allclose(results_batch[k], prop.properties(*sections[k]), rtol=1e-12, atol=1e-12)
+
+                for pool in ["thread", "process"]:
+                    results_pool = np.array(prop.properties_batch(*args, n_workers=3, pool=pool)).T
+                    npt.assert_allclose(results_pool, results_batch, rtol=1e-12, atol=1e-12)
+
     def test_match_anba(self):
 
         # Stiffness and inertia matrices from https://github.com/WISDEM/SONATA/tree/develop/examples/1_IEA15MW
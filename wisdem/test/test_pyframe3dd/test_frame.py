@@ -11,11 +11,14 @@ import unittest
 from io import StringIO
 
 import numpy as np
+import numpy.testing as npt
 
 from wisdem.pyframe3dd import Frame, Options, NodeData, ElementData, ReactionData, StaticLoadCase
 
 
 class FrameTestEXA(unittest.TestCase):
+    sparse = False
+
     def setUp(self):
         # nodes
         node = np.arange(1, 13)
@@ -56,7 +59,7 @@ class FrameTestEXA(unittest.TestCase):
         shear = False  # 1: include shear deformation
         geom = False  # 1: include geometric stiffness
         dx = 10.0  # x-axis increment for internal forces
-        options = Options(shear, geom, dx)
+        options = Options(shear, geom, dx, self.sparse)
 
         frame = Frame(nodes, reactions, elements, options)
 
@@ -523,6 +526,8 @@ class FrameTestEXA(unittest.TestCase):
 
 
 class FrameTestEXB(unittest.TestCase):
+    sparse = False
+
     def setUp(self):
         # nodes
         string = StringIO(
@@ -584,7 +589,7 @@ class FrameTestEXB(unittest.TestCase):
         shear = True  # 1: include shear deformation
         geom = True  # 1: include geometric stiffness
         dx = 20.0  # x-axis increment for internal forces
-        options = Options(shear, geom, dx)
+        options = Options(shear, geom, dx, self.sparse)
 
         frame = Frame(nodes, reactions, elements, options)
 
@@ -971,10 +976,128 @@ class GravityAdd(unittest.TestCase):
         self.assertAlmostEqual(2 * reactions.Fz[0, 0], reactions.Fz[2, 0])
 
 
+class FrameTestEXASparse(FrameTestEXA):
+    sparse = True
+
+
+class FrameTestEXBSparse(FrameTestEXB):
+    sparse = True
+
+
+def lattice_frame(sparse, geom, persistent=False):
+    # braced lattice tower with scrambled node numbering, so the renumbering matters
+    nlev = 12
+    xy = np.array([[0.0, 0.0], [4.0, 0.0], [4.0, 4.0], [0.0, 4.0]])
+    xyz = np.array([[xy[k, 0], xy[k, 1], 3.0 * i] for i in range(nlev) for k in range(4)])
+    perm = np.random.default_rng(1).permutation(len(xyz))
+    num = np.empty(len(xyz), dtype=int)
+    num[perm] = np.arange(1, len(xyz) + 1)
+
+    nodes = NodeData(np.arange(1, len(xyz) + 1), xyz[perm, 0], xyz[perm, 1], xyz[perm, 2], np.zeros(len(xyz)))
+    rnode = num[:4]
+    reactions = ReactionData(rnode, np.ones(4), np.ones(4), np.ones(4), np.ones(4), np.ones(4), np.ones(4), 1)
+
+    N1, N2 = [], []
+    for i in range(nlev):
+        for k in range(4):
+            a, b = 4 * i + k, 4 * i + (k + 1) % 4
+            N1.append(num[a])
+            N2.append(num[b])
+            if i > 0:
+                N1 += [num[a - 4], num[a - 4]]
+                N2 += [num[a], num[b]]
+    nE = len(N1)
+    one = np.ones(nE)
+    elements = ElementData(
+        np.arange(1, nE + 1),
+        np.array(N1),
+        np.array(N2),
+        0.01 * one,
+        0.005 * one,
+        0.005 * one,
+        2e-4 * one,
+        1e-4 * one,
+        1e-4 * one,
+        2e11 * one,
+        8e10 * one,
+        np.zeros(nE),
+        7850.0 * one,
+    )
+    frame = Frame(nodes, reactions, elements, Options(True, geom, -1, sparse), persistent=persistent)
+    frame.enableDynamics(6, 1, 0, 1e-9, 0.0)
+    return frame, num[-4:]
+
+
+def lattice_loads(frame, top, fxs):
+    frame.clearLoadCases()
+    for fx in fxs:
+        load = StaticLoadCase(0.0, 0.0, -9.81)
+        load.changePointLoads(top, fx * np.ones(4), 0.5 * fx * np.ones(4), -1e5 * np.ones(4), 0 * top, 0 * top, 0 * top)
+        frame.addLoadCase(load)
+
+
+def assert_same_results(a, b, rtol):
+    for k in [0, 1, 2]:  # displacements, forces, reactions
+        for name in a[k]._fields:
+            x, y = getattr(a[k], name), getattr(b[k], name)
+            npt.assert_allclose(y, x, rtol=rtol, atol=rtol * np.abs(x).max())
+    npt.assert_allclose(b[5].freq, a[5].freq, rtol=rtol)
+
+
+class SparseStiffness(unittest.TestCase):
+    def run_lattice(self, sparse, geom):
+        frame, top = lattice_frame(sparse, geom)
+        lattice_loads(frame, top, [1e4, -2e4])
+        return frame.run()
+
+    def test_sparse_matches_dense(self):
+        for geom in [False, True]:
+            dense = self.run_lattice(False, geom)
+            sparse = self.run_lattice(True, geom)
+            assert_same_results(dense, sparse, 1e-9)
+
+
+class PersistentFrame(unittest.TestCase):
+    def test_load_changes(self):
+        # only the loads change between runs: factors and modes are re-used
+        for sparse in [False, True]:
+            for geom in [False, True]:
+                frame, top = lattice_frame(sparse, geom, persistent=True)
+                for fxs in [[1e4], [1e4, -2e4, 3e3], [5e3, 5e3]]:
+                    lattice_loads(frame, top, fxs)
+                    out = frame.run()
+
+                    fresh, top = lattice_frame(sparse, geom)
+                    lattice_loads(fresh, top, fxs)
+                    assert_same_results(fresh.run(), out, 1e-12)
+
+    def test_structure_changes(self):
+        # section properties, reactions, and dynamics changed in place are detected
+        for sparse in [False, True]:
+            frame, top = lattice_frame(sparse, False, persistent=True)
+            lattice_loads(frame, top, [1e4, -2e4])
+            frame.run()
+
+            fresh, _ = lattice_frame(sparse, False)
+            lattice_loads(fresh, top, [1e4, -2e4])
+            for f in [frame, fresh]:
+                f.eIy[:] *= 2.0
+                f.edensity[:] *= 0.5
+            assert_same_results(fresh.run(), frame.run(), 1e-12)
+
+            for f in [frame, fresh]:
+                f.enableDynamics(4, 1, 1, 1e-9, 0.0)
+            assert_same_results(fresh.run(), frame.run(), 1e-12)
+
+
 def suite():
     suite = [
         unittest.TestLoader().loadTestsFromTestCase(FrameTestEXA),
         unittest.TestLoader().loadTestsFromTestCase(FrameTestEXB),
+        unittest.TestLoader().loadTestsFromTestCase(FrameTestEXASparse),
+        unittest.TestLoader().loadTestsFromTestCase(FrameTestEXBSparse),
+        unittest.TestLoader().loadTestsFromTestCase(SparseStiffness),
+        unittest.TestLoader().loadTestsFromTestCase(PersistentFrame),
         unittest.TestLoader().loadTestsFromTestCase(GravityAdd),
     ]
     return unittest.TestSuite(suite)
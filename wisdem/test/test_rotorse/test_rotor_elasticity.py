@@ -148,6 +148,17 @@ class TestRE(unittest.TestCase):
         self.outputs["I_all_blades"]
         '''
         
+    def test_parallel_stations(self):
+        self.run_precomp()
+        serial = {k: np.array(self.outputs[k]) for k in ["EA", "EIxx", "EIyy", "GJ", "rhoA", "x_sc", "y_cg"]}
+
+        for pool in ["thread", "process"]:
+            self.options["WISDEM"]["RotorSE"]["precomp_n_workers"] = 2
+            self.options["WISDEM"]["RotorSE"]["precomp_pool"] = pool
+            self.run_precomp()
+            for k in serial:
+                npt.assert_allclose(self.outputs[k], serial[k], rtol=1e-12, atol=1e-12)
+
     def test_with_pitch(self):
         self.inputs["theta"] = 45 * np.ones(self.inputs["theta"].shape)
         
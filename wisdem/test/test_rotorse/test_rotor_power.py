@@ -135,6 +135,30 @@ class TestServo(unittest.TestCase):
         npt.assert_almost_equal(outputs["no_stall_constraint"], ref_no_stall_constraint)
         npt.assert_almost_equal(outputs["stall_angle_along_span"], ref_stall_angle_along_span)
 
+        # unchanged polars are not processed again, changed ones match the per-station evaluation
+        n_cached = len(myobj.stall_angles)
+        inputs["airfoils_cl"] = NPZFILE["airfoils_cl"].copy()
+        inputs["airfoils_cl"][10] *= 1.1
+        myobj.compute(inputs, outputs)
+        self.assertEqual(len(myobj.stall_angles), n_cached + 1)
+        unsteady = rp.eval_unsteady(
+            inputs["airfoils_aoa"], inputs["airfoils_cl"][10, :, 0], inputs["airfoils_cd"][10, :, 0], np.zeros(n_aoa)
+        )
+        npt.assert_almost_equal(outputs["stall_angle_along_span"][10], unsteady["alpha1"])
+        npt.assert_almost_equal(outputs["stall_angle_along_span"][11:], ref_stall_angle_along_span[11:])
+
+        # polars of the oldest design revisited after the cache has wrapped around
+        aoa, cl, cd = inputs["airfoils_aoa"], NPZFILE["airfoils_cl"][:, :, 0], NPZFILE["airfoils_cd"][:, :, 0]
+        cl = cl + 1e-3 * np.arange(n_span)[:, np.newaxis]  # a distinct polar at each station
+        for offset in [0.01, 0.02, 0.03, 0.04]:
+            myobj.get_stall_angles(aoa, cl + offset, cd)
+        half = n_span // 2
+        cl_revisit = np.r_[cl[:half] + 0.05, cl[: n_span - half] + 0.01]
+        cd_revisit = np.r_[cd[:half], cd[: n_span - half]]
+        stall_angles = myobj.get_stall_angles(aoa, cl_revisit, cd_revisit)
+        self.assertEqual(len(myobj.stall_angles), 4 * n_span)
+        npt.assert_equal(stall_angles, rp.NoStallConstraint().get_stall_angles(aoa, cl_revisit, cd_revisit))
+
     def testRegulationTrajectory(self):
         prob = om.Problem(reports=False)
 
@@ -606,6 +630,43 @@ class TestServo(unittest.TestCase):
         npt.assert_allclose(myCp[Omega_expect == Omega_tsr][:-1], myCp[6])
         npt.assert_allclose(myCp[Omega_expect == Omega_tsr][:-1], prob["Cp"][Omega_expect == Omega_tsr][:-1])
 
+    def testRegulationTrajectory_Repeatable(self):
+        prob = om.Problem(reports=False)
+
+        (n_span, n_aoa, n_Re) = NPZFILE["airfoils_cl"].shape
+        n_pc = 22
+
+        modeling_options = {}
+        modeling_options["WISDEM"] = {}
+        modeling_options["WISDEM"]["RotorSE"] = {}
+        modeling_options["WISDEM"]["RotorSE"]["n_span"] = n_span
+        modeling_options["WISDEM"]["RotorSE"]["n_aoa"] = n_aoa
+        modeling_options["WISDEM"]["RotorSE"]["n_Re"] = n_Re
+        modeling_options["WISDEM"]["RotorSE"]["regulation_reg_III"] = True
+        modeling_options["WISDEM"]["RotorSE"]["fix_pitch_regI12"] = False
+        modeling_options["WISDEM"]["RotorSE"]["n_pc"] = n_pc
+        modeling_options["WISDEM"]["RotorSE"]["n_pc_spline"] = n_pc
+
+        prob.model.add_subsystem(
+            "powercurve", rp.RegulatedPowerCurve(modeling_options=modeling_options), promotes=["*"]
+        )
+        prob = fillprob(prob, n_pc, n_span)
+
+        # The Region 3 pitch only depends on the inputs of the current run, not on earlier runs
+        prob["omega_max"] = 14.0
+        prob["max_allowable_blade_tip_speed"] = 1e5
+        for pts in [1.0, 0.8]:
+            prob["peak_thrust_shaving"] = pts
+            prob["rated_power"] = 5e6
+            prob.run_model()
+            pitch, P = prob["pitch"].copy(), prob["P"].copy()
+            prob["rated_power"] = 3e6
+            prob.run_model()
+            prob["rated_power"] = 5e6
+            prob.run_model()
+            npt.assert_equal(prob["pitch"], pitch)
+            npt.assert_equal(prob["P"], P)
+
     def testRegulationTrajectory_reindex(self):
         prob = om.Problem(reports=False)
 